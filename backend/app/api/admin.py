@@ -1,8 +1,8 @@
 from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Query
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from typing import Dict, Any, List, Optional
 import logging
-import requests
 from bs4 import BeautifulSoup
 import re
 from datetime import datetime, timedelta
@@ -12,8 +12,15 @@ from pydantic import BaseModel
 
 from ..database import get_db
 from ..services.auto_updater import auto_updater
+from ..services.draw_snapshot import draw_history
+from ..services.draw_integrity import delete_checksums, draw_integrity
+from ..services.http_clients import NO_RETRY, http_clients
+from ..services.response_cache import lotto_response_cache
+from ..services.dummy_recommendations import build_dummy_rows, bulk_insert_dummy_rows
+from ..services.number_stats import rebuild_number_stats
+from ..services.recommendation_stats import aggregate_personal, get_public_statistics, refresh_draw_rollup
 from ..models.public_recommendation import PublicRecommendation
-from ..models.saved_recommendation import SavedRecommendation
+from ..models.recommendation_draw_stat import RecommendationDrawStat
 from ..models.lotto import LottoDraw
 
 logger = logging.getLogger(__name__)
@@ -208,7 +215,12 @@ async def get_update_progress(db: Session = Depends(get_db)) -> Dict[str, Any]:
                 'Accept-Language': 'ko-KR,ko;q=0.9,en;q=0.8',
             }
             
-            response = requests.get('https://www.dhlottery.co.kr/gameResult.do?method=byWin', headers=headers, timeout=10)
+            response = await http_clients.get(
+                'https://www.dhlottery.co.kr/gameResult.do?method=byWin',
+                headers=headers,
+                timeout=10,
+                retry=NO_RETRY
+            )
             response.raise_for_status()
             response.encoding = 'euc-kr'
             soup = BeautifulSoup(response.text, 'html.parser')
@@ -474,7 +486,16 @@ async def clear_test_data(db: Session = Depends(get_db)) -> Dict[str, Any]:
         
         # 해당 회차들 삭제
         deleted_count = db.query(LottoDraw).filter(LottoDraw.draw_number.in_(draw_numbers)).delete(synchronize_session=False)
+        delete_checksums(db, draw_numbers)
+        # 삭제된 회차 이후의 마감 회차 롤업도 함께 제거
+        if draw_numbers:
+            db.query(RecommendationDrawStat).filter(
+                RecommendationDrawStat.draw_number >= min(draw_numbers)
+            ).delete(synchronize_session=False)
+        rebuild_number_stats(db, commit=False)
         db.commit()
+        draw_history.invalidate()
+        lotto_response_cache.invalidate()
         
         return {
             "success": True,
@@ -497,74 +518,38 @@ async def get_statistics(
 ) -> Dict[str, Any]:
     """실제 통계 데이터 조회"""
     try:
-        # 공공 추천 데이터 통계 (회차 필터 적용)
-        public_query = db.query(PublicRecommendation)
-        if draw_number:
-            public_query = public_query.filter(PublicRecommendation.draw_number == draw_number)
-        
-        total_public_recommendations = public_query.count()
-        ai_recommendations = public_query.filter(
-            PublicRecommendation.generation_method == "ai"
-        ).count()
-        manual_recommendations = public_query.filter(
-            PublicRecommendation.generation_method == "manual"
-        ).count()
-        member_recommendations = public_query.filter(
-            PublicRecommendation.user_type == "member"
-        ).count()
-        guest_recommendations = public_query.filter(
-            PublicRecommendation.user_type == "guest"
-        ).count()
-        
-        # 개인 저장 데이터 통계 (회차 필터 적용)
-        personal_query = db.query(SavedRecommendation)
-        if draw_number:
-            personal_query = personal_query.filter(SavedRecommendation.target_draw_number == draw_number)
-        
-        total_personal_recommendations = personal_query.count()
-        
-        # 최근 7일간 통계 (회차 필터 적용)
+        # 최근 7일 기준 시각
         week_ago = get_kst_now() - timedelta(days=7)
         
-        recent_public_query = db.query(PublicRecommendation).filter(
-            PublicRecommendation.created_at >= week_ago
-        )
-        if draw_number:
-            recent_public_query = recent_public_query.filter(PublicRecommendation.draw_number == draw_number)
-        recent_public = recent_public_query.count()
+        # 공공 추천 데이터 통계 (분류별 조건부 집계 1회, 전체 조회 시 마감 회차는 롤업 사용)
+        public_stats = get_public_statistics(db, draw_number=draw_number, since=week_ago)
         
-        recent_personal_query = db.query(SavedRecommendation).filter(
-            SavedRecommendation.created_at >= week_ago
-        )
-        if draw_number:
-            recent_personal_query = recent_personal_query.filter(SavedRecommendation.target_draw_number == draw_number)
-        recent_personal = recent_personal_query.count()
+        # 개인 저장 데이터 통계 (전체/최근 7일 조건부 집계 1회)
+        personal_stats = aggregate_personal(db, draw_number=draw_number, since=week_ago)
         
         # 최신 회차 정보
-        from ..models.lotto import LottoDraw
         if draw_number:
             latest_draw_number = draw_number
         else:
-            latest_draw = db.query(LottoDraw).order_by(LottoDraw.draw_number.desc()).first()
-            latest_draw_number = latest_draw.draw_number if latest_draw else 0
+            latest_draw_number = db.query(func.max(LottoDraw.draw_number)).scalar() or 0
         
         return {
             "success": True,
             "data": {
                 "public_recommendations": {
-                    "total": total_public_recommendations,
-                    "ai": ai_recommendations,
-                    "manual": manual_recommendations,
-                    "member": member_recommendations,
-                    "guest": guest_recommendations,
-                    "recent_7days": recent_public
+                    "total": public_stats['total'],
+                    "ai": public_stats['ai'],
+                    "manual": public_stats['manual'],
+                    "member": public_stats['member'],
+                    "guest": public_stats['guest'],
+                    "recent_7days": public_stats['recent']
                 },
                 "personal_recommendations": {
-                    "total": total_personal_recommendations,
-                    "recent_7days": recent_personal
+                    "total": personal_stats['total'],
+                    "recent_7days": personal_stats['recent']
                 },
                 "latest_draw": latest_draw_number,
-                "total_recommendations": total_public_recommendations + total_personal_recommendations
+                "total_recommendations": public_stats['total'] + personal_stats['total']
             },
             "message": "통계 데이터를 조회했습니다."
         }
@@ -622,141 +607,24 @@ async def generate_dummy_recommendations(
         # 미당첨 개수 계산
         no_win_count = request.total_count - total_distributed
         
-        # 간단한 더미 데이터 생성 (테스트용)
-        created_count = 0
-        
         # 실제 당첨번호
         winning_numbers = [draw.number_1, draw.number_2, draw.number_3, draw.number_4, draw.number_5, draw.number_6]
         bonus_number = draw.bonus_number
         
-        # 구매 기간 날짜 생성 (추첨일 기준 일주일 전부터)
-        def get_purchase_dates(draw_date):
-            from datetime import datetime, timedelta
-            import random
-            
-            # 추첨일을 datetime으로 변환
-            if isinstance(draw_date, str):
-                draw_dt = datetime.strptime(draw_date, '%Y-%m-%d')
-            else:
-                draw_dt = draw_date
-            
-            # 일주일 전부터 추첨일까지의 날짜들
-            purchase_dates = []
-            for i in range(7):
-                date = draw_dt - timedelta(days=6-i)
-                purchase_dates.append(date)
-            
-            return purchase_dates
-        
-        purchase_dates = get_purchase_dates(draw.draw_date)
-        
-        # 등수별 데이터 생성
-        for rank, count in request.rank_distribution.items():
-            if count > 0:
-                for i in range(count):
-                    # 등수별 번호 조합 생성 (정확한 당첨번호 매칭)
-                    if rank == 1:
-                        # 1등: 6개 모두 일치
-                        numbers = winning_numbers.copy()
-                        matched_numbers = winning_numbers.copy()
-                        matched_count = 6
-                    elif rank == 2:
-                        # 2등: 5개 일치 + 보너스 번호
-                        base_numbers = random.sample(winning_numbers, 5)
-                        numbers = base_numbers + [bonus_number]
-                        matched_numbers = base_numbers
-                        matched_count = 5
-                    elif rank == 3:
-                        # 3등: 5개 일치 (보너스 번호 제외)
-                        base_numbers = random.sample(winning_numbers, 5)
-                        other_numbers = [n for n in range(1, 46) if n not in winning_numbers and n != bonus_number]
-                        numbers = base_numbers + random.sample(other_numbers, 1)
-                        matched_numbers = base_numbers
-                        matched_count = 5
-                    elif rank == 4:
-                        # 4등: 4개 일치
-                        base_numbers = random.sample(winning_numbers, 4)
-                        other_numbers = [n for n in range(1, 46) if n not in winning_numbers]
-                        numbers = base_numbers + random.sample(other_numbers, 2)
-                        matched_numbers = base_numbers
-                        matched_count = 4
-                    elif rank == 5:
-                        # 5등: 3개 일치
-                        base_numbers = random.sample(winning_numbers, 3)
-                        other_numbers = [n for n in range(1, 46) if n not in winning_numbers]
-                        numbers = base_numbers + random.sample(other_numbers, 3)
-                        matched_numbers = base_numbers
-                        matched_count = 3
-                    else:
-                        # 미당첨: 0-2개 일치
-                        match_count = random.randint(0, 2)
-                        if match_count == 0:
-                            numbers = random.sample([n for n in range(1, 46) if n not in winning_numbers], 6)
-                            matched_numbers = []
-                        else:
-                            base_numbers = random.sample(winning_numbers, match_count)
-                            other_numbers = random.sample([n for n in range(1, 46) if n not in winning_numbers], 6 - match_count)
-                            numbers = base_numbers + other_numbers
-                            matched_numbers = base_numbers
-                        matched_count = match_count
-                    
-                    # 랜덤 구매 날짜 선택
-                    random_purchase_date = random.choice(purchase_dates)
-                    
-                    # 더미 데이터 저장 (정확한 당첨 정보 포함)
-                    dummy_data = PublicRecommendation(
-                        numbers=numbers,
-                        generation_method="ai",
-                        confidence_score=random.randint(70, 95),
-                        analysis_data={"is_dummy": True, "rank": rank},
-                        draw_number=request.draw_number,
-                        user_type="member",
-                        is_dummy=True,
-                        winning_rank=rank,
-                        matched_count=matched_count,
-                        matched_numbers=matched_numbers,
-                        winning_amount=1000000 if rank == 1 else 0,
-                        created_at=random_purchase_date
-                    )
-                    
-                    db.add(dummy_data)
-                    created_count += 1
-        
-        # 미당첨 데이터 생성
-        for i in range(no_win_count):
-            # 미당첨: 0-2개 일치
-            match_count = random.randint(0, 2)
-            if match_count == 0:
-                numbers = random.sample([n for n in range(1, 46) if n not in winning_numbers], 6)
-                matched_numbers = []
-            else:
-                base_numbers = random.sample(winning_numbers, match_count)
-                other_numbers = random.sample([n for n in range(1, 46) if n not in winning_numbers], 6 - match_count)
-                numbers = base_numbers + other_numbers
-                matched_numbers = base_numbers
-            
-            # 랜덤 구매 날짜 선택
-            random_purchase_date = random.choice(purchase_dates)
-            
-            dummy_data = PublicRecommendation(
-                numbers=numbers,
-                generation_method="ai",
-                confidence_score=random.randint(50, 85),
-                analysis_data={"is_dummy": True, "rank": 0},
-                draw_number=request.draw_number,
-                user_type="member",
-                is_dummy=True,
-                winning_rank=None,
-                matched_count=match_count,
-                matched_numbers=matched_numbers,
-                winning_amount=0,
-                created_at=random_purchase_date
-            )
-            
-            db.add(dummy_data)
-            created_count += 1
+        # 더미 데이터 생성 (튜플 행으로 만들어 COPY/다중 행 INSERT로 대량 입력)
+        rows = build_dummy_rows(
+            request.draw_number,
+            winning_numbers,
+            bonus_number,
+            draw.draw_date,
+            request.rank_distribution,
+            no_win_count
+        )
+        created_count = bulk_insert_dummy_rows(db, rows)
         
         db.commit()
+        # 이미 롤업된 마감 회차라면 통계 롤업 재집계
+        refresh_draw_rollup(db, request.draw_number)
         
         return {
             "success": True,
@@ -968,3 +836,53 @@ async def get_auto_dummy_status(
     except Exception as e:
         logger.error(f"자동 더미 데이터 생성 상태 조회 실패: {str(e)}")
         raise HTTPException(status_code=500, detail=f"상태 조회 실패: {str(e)}")
+
+# ✨ 회차 무결성 검사 관련 API
+@router.get("/integrity")
+async def get_integrity_report(
+    latest_draw: Optional[int] = Query(None, ge=1, description="검사 상한 회차 (지정하지 않으면 DB 최신 회차)"),
+    db: Session = Depends(get_db)
+) -> Dict[str, Any]:
+    """회차 무결성 검사 (누락 회차, 체크섬 불일치) 및 마지막 복구 결과 조회"""
+    try:
+        report = draw_integrity.scan(db, latest_draw=latest_draw)
+        
+        return {
+            "success": True,
+            "data": {
+                **report,
+                "last_repair": auto_updater.last_repair
+            },
+            "message": "회차 무결성 검사를 완료했습니다."
+        }
+        
+    except Exception as e:
+        db.rollback()
+        logger.error(f"회차 무결성 검사 실패: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"무결성 검사 실패: {str(e)}")
+
+@router.post("/integrity/repair")
+async def repair_integrity(db: Session = Depends(get_db)) -> Dict[str, Any]:
+    """사이트 최신 회차까지 검사하고 누락 회차만 복구 예약"""
+    try:
+        latest_site_draw = await auto_updater._get_latest_site_draw_number()
+        report = draw_integrity.scan(db, latest_draw=latest_site_draw)
+        repair_scheduled = auto_updater.schedule_gap_repair(report['missing_draws'])
+        
+        return {
+            "success": True,
+            "data": {
+                **report,
+                "repair_scheduled": repair_scheduled,
+                "last_repair": auto_updater.last_repair
+            },
+            "message": (
+                f"누락 회차 {len(report['missing_draws'])}개 복구를 예약했습니다."
+                if repair_scheduled else "복구할 누락 회차가 없거나 복구가 이미 진행 중입니다."
+            )
+        }
+        
+    except Exception as e:
+        db.rollback()
+        logger.error(f"누락 회차 복구 예약 실패: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"복구 예약 실패: {str(e)}")
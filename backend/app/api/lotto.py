@@ -1,16 +1,26 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import List
+from typing import Any, Awaitable, Callable, List, Optional
 from datetime import datetime
 import pytz
-from ..database import get_db
+from ..database import get_async_db
 from ..models.lotto import LottoDraw
 from ..schemas.lotto import LottoNumber, LottoStatistics
 from ..schemas.recommendation import APIResponse
 from ..services.lotto_analyzer import LottoAnalyzer
+from ..services.response_cache import (
+    IMMUTABLE_CACHE_CONTROL, cache_key, etag_matches, lotto_response_cache
+)
 
 router = APIRouter(prefix="/api/v1/lotto", tags=["lotto"])
 
+# 최신 회차 기준 응답 (새 회차 입력 시 바뀌므로 짧게 보관 후 ETag로 재검증)
+LATEST_CACHE_CONTROL = "public, max-age=60, must-revalidate"
+
 def to_kst_string(date_obj):
     """UTC 날짜를 한국시간 문자열로 변환"""
     if not date_obj:
@@ -38,11 +48,83 @@ def to_kst_string(date_obj):
     # 기타 경우 그대로 반환
     return date_obj.strftime('%Y-%m-%d')
 
+async def _fetch_latest_draw(db: AsyncSession):
+    """최신 회차 조회"""
+    result = await db.execute(select(LottoDraw).order_by(LottoDraw.draw_number.desc()).limit(1))
+    return result.scalars().first()
+
+async def _cached_response(
+    request: Request,
+    db: AsyncSession,
+    build: Callable[[], Awaitable[Any]],
+    draw_number: Optional[int] = None
+) -> Response:
+    """
+    최신 회차 기준 응답 캐시를 거쳐 응답 (ETag, If-None-Match → 304, Cache-Control).
+
+    Args:
+        request: 요청 (경로/쿼리로 캐시 키, If-None-Match 확인)
+        db: 세대의 최신 회차를 확인할 때 사용할 세션
+        build: 캐시에 없을 때 응답 본문을 만드는 코루틴 함수
+        draw_number: 특정 회차 응답이면 회차 번호 (최신 회차보다 이전이면 immutable)
+    """
+    generation = lotto_response_cache.current()
+    if not generation.is_resolved:
+        latest_draw = await db.scalar(select(func.max(LottoDraw.draw_number)))
+        if latest_draw is None:
+            # 데이터가 없으면 캐시하지 않음 (build에서 404 처리)
+            return await build()
+        generation = lotto_response_cache.resolve(generation, latest_draw)
+
+    key = cache_key(request.url.path, request.query_params.multi_items())
+    entry = generation.get(key)
+    hit = entry is not None
+    if not hit:
+        payload = await build()
+        entry = generation.put(key, JSONResponse(content=jsonable_encoder(payload)).body)
+
+    if draw_number is not None and draw_number < generation.latest_draw:
+        cache_control = IMMUTABLE_CACHE_CONTROL
+    else:
+        cache_control = LATEST_CACHE_CONTROL
+    headers = {"ETag": entry.etag, "Cache-Control": cache_control}
+
+    not_modified = etag_matches(request.headers.get("if-none-match"), entry.etag)
+    lotto_response_cache.record(hit, not_modified)
+    if not_modified:
+        return Response(status_code=304, headers=headers)
+    return Response(content=entry.body, media_type="application/json", headers=headers)
+
+def _build_statistics(session: Session) -> LottoStatistics:
+    """로또 통계 계산 (AsyncSession.run_sync에서 동기 Session으로 호출)"""
+    analyzer = LottoAnalyzer(session)
+    
+    # 기본 통계
+    total_draws = analyzer.get_total_draws()
+    latest_draw = analyzer.get_latest_draw_number()
+    
+    # 번호별 출현 빈도
+    frequency_stats = analyzer.calculate_frequency_statistics()
+    
+    # 핫/콜드 넘버
+    hot_numbers, cold_numbers = analyzer.get_hot_cold_numbers()
+    
+    return LottoStatistics(
+        total_draws=total_draws,
+        latest_draw=latest_draw,
+        number_frequency=frequency_stats,
+        hot_numbers=hot_numbers,
+        cold_numbers=cold_numbers
+    )
+
 @router.get("/latest", response_model=APIResponse)
-async def get_latest_draw(db: Session = Depends(get_db)):
+async def get_latest_draw(request: Request, db: AsyncSession = Depends(get_async_db)):
     """최신 로또 당첨번호 조회"""
+    return await _cached_response(request, db, lambda: _latest_draw_response(db))
+
+async def _latest_draw_response(db: AsyncSession) -> APIResponse:
     try:
-        latest = db.query(LottoDraw).order_by(LottoDraw.draw_number.desc()).first()
+        latest = await _fetch_latest_draw(db)
         if not latest:
             raise HTTPException(status_code=404, detail="당첨번호 데이터가 없습니다")
         
@@ -83,11 +165,14 @@ async def get_latest_draw(db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail=f"서버 오류: {str(e)}")
 
 @router.get("/current-draw", response_model=APIResponse)
-async def get_current_draw_number(db: Session = Depends(get_db)):
+async def get_current_draw_number(request: Request, db: AsyncSession = Depends(get_async_db)):
     """현재 회차 번호 조회 (추천 생성용)"""
+    return await _cached_response(request, db, lambda: _current_draw_response(db))
+
+async def _current_draw_response(db: AsyncSession) -> APIResponse:
     try:
         # 최신 회차 조회
-        latest = db.query(LottoDraw).order_by(LottoDraw.draw_number.desc()).first()
+        latest = await _fetch_latest_draw(db)
         if not latest:
             raise HTTPException(status_code=404, detail="로또 데이터가 없습니다")
         
@@ -108,20 +193,26 @@ async def get_current_draw_number(db: Session = Depends(get_db)):
 
 @router.get("/draws", response_model=APIResponse)
 async def get_draws(
+    request: Request,
     limit: int = 10,
     offset: int = 0,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """당첨번호 목록 조회"""
+    return await _cached_response(request, db, lambda: _draws_response(db, limit, offset))
+
+async def _draws_response(db: AsyncSession, limit: int, offset: int) -> APIResponse:
     try:
         if limit > 100:
             limit = 100  # 최대 100개로 제한
         
-        draws = db.query(LottoDraw)\
-            .order_by(LottoDraw.draw_number.desc())\
-            .offset(offset)\
-            .limit(limit)\
-            .all()
+        result = await db.execute(
+            select(LottoDraw)
+            .order_by(LottoDraw.draw_number.desc())
+            .offset(offset)
+            .limit(limit)
+        )
+        draws = result.scalars().all()
         
         data = []
         for draw in draws:
@@ -153,28 +244,14 @@ async def get_draws(
         raise HTTPException(status_code=500, detail=f"서버 오류: {str(e)}")
 
 @router.get("/statistics", response_model=APIResponse)
-async def get_statistics(db: Session = Depends(get_db)):
+async def get_statistics(request: Request, db: AsyncSession = Depends(get_async_db)):
     """로또 통계 정보 조회"""
+    return await _cached_response(request, db, lambda: _statistics_response(db))
+
+async def _statistics_response(db: AsyncSession) -> APIResponse:
     try:
-        analyzer = LottoAnalyzer(db)
-        
-        # 기본 통계
-        total_draws = analyzer.get_total_draws()
-        latest_draw = analyzer.get_latest_draw_number()
-        
-        # 번호별 출현 빈도
-        frequency_stats = analyzer.calculate_frequency_statistics()
-        
-        # 핫/콜드 넘버
-        hot_numbers, cold_numbers = analyzer.get_hot_cold_numbers()
-        
-        data = LottoStatistics(
-            total_draws=total_draws,
-            latest_draw=latest_draw,
-            number_frequency=frequency_stats,
-            hot_numbers=hot_numbers,
-            cold_numbers=cold_numbers
-        )
+        # 분석기는 동기 Session 기반이므로 AsyncSession의 greenlet 브리지로 실행
+        data = await db.run_sync(_build_statistics)
         
         return APIResponse(
             success=True,
@@ -187,12 +264,19 @@ async def get_statistics(db: Session = Depends(get_db)):
 
 @router.get("/draw/{draw_number}", response_model=APIResponse)
 async def get_draw_by_number(
+    request: Request,
     draw_number: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """특정 회차 당첨번호 조회 (구매기간 포함)"""
+    return await _cached_response(
+        request, db, lambda: _draw_response(db, draw_number), draw_number=draw_number
+    )
+
+async def _draw_response(db: AsyncSession, draw_number: int) -> APIResponse:
     try:
-        draw = db.query(LottoDraw).filter(LottoDraw.draw_number == draw_number).first()
+        result = await db.execute(select(LottoDraw).where(LottoDraw.draw_number == draw_number))
+        draw = result.scalars().first()
         if not draw:
             raise HTTPException(status_code=404, detail=f"{draw_number}회차 당첨번호를 찾을 수 없습니다")
         
@@ -226,10 +310,14 @@ async def get_draw_by_number(
         raise HTTPException(status_code=500, detail=f"서버 오류: {str(e)}")
 
 @router.get("/recent-draws")
-async def get_recent_draws(db: Session = Depends(get_db)):
+async def get_recent_draws(request: Request, db: AsyncSession = Depends(get_async_db)):
     """최근 10개 회차의 당첨번호 조회"""
+    return await _cached_response(request, db, lambda: _recent_draws_response(db))
+
+async def _recent_draws_response(db: AsyncSession) -> dict:
     try:
-        recent_draws = db.query(LottoDraw).order_by(LottoDraw.draw_number.desc()).limit(10).all()
+        result = await db.execute(select(LottoDraw).order_by(LottoDraw.draw_number.desc()).limit(10))
+        recent_draws = result.scalars().all()
         
         draws_data = []
         for draw in recent_draws:
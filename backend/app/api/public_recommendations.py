@@ -10,6 +10,8 @@ from ..schemas.public_recommendation import (
     PublicRecommendationStats
 )
 from ..schemas.recommendation import APIResponse
+from ..services.recommendation_stats import get_latest_public_markers, get_public_statistics, refresh_draw_rollup
+from ..utils.pagination import InvalidCursorError, keyset_condition, keyset_order, keyset_page
 
 router = APIRouter(prefix="/api/v1/public-recommendations", tags=["공공 추천 데이터"])
 
@@ -34,6 +36,9 @@ async def create_public_recommendation(
         db.commit()
         db.refresh(public_rec)
         
+        # 이미 롤업된 마감 회차라면 통계 롤업 재집계
+        refresh_draw_rollup(db, public_rec.draw_number)
+        
         return APIResponse(
             success=True,
             data=PublicRecommendationResponse.from_orm(public_rec),
@@ -49,11 +54,12 @@ async def get_public_recommendations(
     draw_number: Optional[int] = Query(None, description="회차 번호"),
     user_type: Optional[str] = Query(None, description="사용자 타입 (member/guest)"),
     generation_method: Optional[str] = Query(None, description="생성 방법 (ai/manual)"),
-    limit: int = Query(100, le=1000, description="조회 개수"),
-    offset: int = Query(0, ge=0, description="오프셋"),
+    limit: int = Query(100, ge=1, le=1000, description="조회 개수"),
+    offset: int = Query(0, ge=0, description="(하위 호환) 오프셋 - cursor 사용 권장"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
     db: Session = Depends(get_db)
 ):
-    """공공 추천 데이터 목록 조회"""
+    """공공 추천 데이터 목록 조회 (created_at, id 키셋 페이지네이션)"""
     try:
         query = db.query(PublicRecommendation)
         
@@ -68,17 +74,29 @@ async def get_public_recommendations(
         # 총 개수 조회
         total = query.count()
         
-        # 페이지네이션
-        recommendations = query.order_by(PublicRecommendation.created_at.desc()).offset(offset).limit(limit).all()
+        # 페이지네이션 (커서 이후 limit + 1개 조회로 다음 페이지 여부 판단)
+        if cursor:
+            try:
+                query = query.filter(keyset_condition(PublicRecommendation.created_at, PublicRecommendation.id, cursor))
+            except InvalidCursorError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+        query = query.order_by(*keyset_order(PublicRecommendation.created_at, PublicRecommendation.id))
+        if offset and not cursor:
+            query = query.offset(offset)
+        rows = query.limit(limit + 1).all()
+        recommendations, next_cursor = keyset_page(rows, limit)
         
         return PublicRecommendationList(
             success=True,
             data=[PublicRecommendationResponse.from_orm(rec) for rec in recommendations],
             total=total,
             draw_number=draw_number or 0,
-            message=f"공공 추천 데이터 {len(recommendations)}개를 조회했습니다"
+            message=f"공공 추천 데이터 {len(recommendations)}개를 조회했습니다",
+            next_cursor=next_cursor
         )
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"공공 추천 데이터 조회 실패: {str(e)}")
 
@@ -89,30 +107,20 @@ async def get_public_recommendation_stats(
 ):
     """공공 추천 데이터 통계 조회"""
     try:
-        query = db.query(PublicRecommendation)
-        
-        if draw_number:
-            query = query.filter(PublicRecommendation.draw_number == draw_number)
-        
-        # 통계 계산
-        total_recommendations = query.count()
-        ai_recommendations = query.filter(PublicRecommendation.generation_method == "ai").count()
-        manual_recommendations = query.filter(PublicRecommendation.generation_method == "manual").count()
-        member_recommendations = query.filter(PublicRecommendation.user_type == "member").count()
-        guest_recommendations = query.filter(PublicRecommendation.user_type == "guest").count()
+        # 분류별 통계 (조건부 집계 1회, 전체 조회 시 마감 회차는 롤업 사용)
+        public_stats = get_public_statistics(db, draw_number=draw_number)
         
-        # 최신 회차 조회
-        latest_draw = db.query(PublicRecommendation.draw_number).order_by(PublicRecommendation.draw_number.desc()).first()
-        current_draw = latest_draw.draw_number if latest_draw else 0
+        # 최신 회차 / 최신 생성 시각 (인덱스 MAX 조회)
+        latest = get_latest_public_markers(db)
         
         stats = PublicRecommendationStats(
-            total_recommendations=total_recommendations,
-            ai_recommendations=ai_recommendations,
-            manual_recommendations=manual_recommendations,
-            member_recommendations=member_recommendations,
-            guest_recommendations=guest_recommendations,
-            draw_number=current_draw,
-            created_at=db.query(PublicRecommendation.created_at).order_by(PublicRecommendation.created_at.desc()).first().created_at if total_recommendations > 0 else None
+            total_recommendations=public_stats['total'],
+            ai_recommendations=public_stats['ai'],
+            manual_recommendations=public_stats['manual'],
+            member_recommendations=public_stats['member'],
+            guest_recommendations=public_stats['guest'],
+            draw_number=latest['draw_number'],
+            created_at=latest['created_at'] if public_stats['total'] > 0 else None
         )
         
         return APIResponse(
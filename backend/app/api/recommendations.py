@@ -1,7 +1,9 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from typing import List
-from ..database import get_db
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, selectinload
+from typing import List, Optional
+from ..database import SessionLocal, get_async_db, get_db
 from ..models.user_history import UserHistory
 from ..models.recommendation import Recommendation
 from ..models.session import UserSession
@@ -12,13 +14,36 @@ from ..schemas.recommendation import (
     RecommendationResponse, 
     CombinationDetail, 
     CombinationAnalysis,
-    APIResponse
+    APIResponse,
+    PagedAPIResponse
 )
 from ..services.recommendation_engine import RecommendationEngine
 from ..services.lotto_analyzer import LottoAnalyzer
+from ..services.ml.model_registry import model_registry
+from ..services.public_recommendation_writer import make_entry, public_recommendation_writer
+from ..utils.pagination import InvalidCursorError, keyset_condition, keyset_order, keyset_page
+from ..services.executors import (
+    ExecutorSaturatedError,
+    ExecutorTimeoutError,
+    executor_status,
+    recommendation_executor
+)
 
 router = APIRouter(prefix="/api/v1/recommendations", tags=["recommendations"])
 
+def _generate_combinations_in_worker(use_ml_model: bool = False, **kwargs):
+    """
+    추천 작업 풀 스레드에서 조합 생성.
+
+    세션은 스레드 간에 공유할 수 없으므로 작업 전용 세션을 열고 닫는다.
+    타임아웃으로 요청이 먼저 끝나도 작업 스레드는 요청 세션을 건드리지 않는다.
+    """
+    db = SessionLocal()
+    try:
+        return RecommendationEngine(db, use_ml_model=use_ml_model).generate_combinations(**kwargs)
+    finally:
+        db.close()
+
 def get_current_draw_number(db: Session) -> int:
     """현재 회차 번호 조회 (추천 생성용)"""
     latest = db.query(LottoDraw).order_by(LottoDraw.draw_number.desc()).first()
@@ -86,33 +111,6 @@ def check_user_recommendation_limit(
         # 실패 시 보수적으로 제한 적용
         return False, 5, 0  # 실패 시 제한 있음
 
-def save_public_recommendation(
-    db: Session, 
-    numbers: List[int], 
-    generation_method: str, 
-    confidence_score: float = None,
-    user_type: str = "guest"
-) -> None:
-    """공공 추천 데이터 저장"""
-    try:
-        current_draw = get_current_draw_number(db)
-        
-        public_rec = PublicRecommendation(
-            numbers=sorted(numbers),
-            generation_method=generation_method,
-            confidence_score=int(confidence_score) if confidence_score else None,
-            analysis_data=None,
-            draw_number=current_draw,
-            user_type=user_type
-        )
-        
-        db.add(public_rec)
-        print(f"공공 추천 데이터 저장: {numbers} (회차: {current_draw}, 방법: {generation_method}, 사용자: {user_type})")
-        
-    except Exception as e:
-        print(f"공공 추천 데이터 저장 실패: {str(e)}")
-        # 공공 데이터 저장 실패는 전체 프로세스를 중단시키지 않음
-
 def ensure_session_exists(db: Session, session_id: str) -> str:
     """세션이 존재하지 않으면 자동으로 생성"""
     existing_session = db.query(UserSession).filter(UserSession.session_id == session_id).first()
@@ -183,6 +181,7 @@ async def generate_recommendations(
         
         # 2. 수동 조합 저장
         combinations = []
+        public_entries = []
         for manual_combo in request.manual_combinations:
             recommendation = Recommendation(
                 history_id=history.id,
@@ -194,20 +193,16 @@ async def generate_recommendations(
             combinations.append(recommendation)
             
             # 공공 데이터 자동 저장 (수동 조합)
-            save_public_recommendation(
-                db=db,
-                numbers=manual_combo.numbers,
-                generation_method="manual",
-                confidence_score=None,
-                user_type=user_type
-            )
+            public_entries.append(make_entry(manual_combo.numbers, "manual", None, user_type))
         
         # 3. AI 자동 추천 생성
-        engine = RecommendationEngine(db, use_ml_model=request.use_ml_model)
         auto_count = request.total_count - len(request.manual_combinations)
         
         if auto_count > 0:
-            auto_recommendations = engine.generate_combinations(
+            # 조합 생성은 CPU 작업이므로 recommendation 작업 풀에서 실행 (작업 전용 세션 사용)
+            auto_recommendations = await recommendation_executor.run(
+                _generate_combinations_in_worker,
+                use_ml_model=request.use_ml_model,
                 count=auto_count,
                 preferences=request.preferences,
                 exclude_combinations=[combo.numbers for combo in combinations]
@@ -225,13 +220,16 @@ async def generate_recommendations(
                 combinations.append(recommendation)
                 
                 # 공공 데이터 자동 저장 (AI 추천)
-                save_public_recommendation(
-                    db=db,
-                    numbers=auto_combo.numbers,
-                    generation_method="ai",
-                    confidence_score=float(auto_combo.confidence_score),
-                    user_type=user_type
-                )
+                public_entries.append(make_entry(
+                    auto_combo.numbers, "ai", float(auto_combo.confidence_score), user_type
+                ))
+        
+        # 공공 데이터 기록 (write-behind 큐, sync 모드에서는 이 트랜잭션에 포함)
+        try:
+            public_recommendation_writer.record(db, public_entries)
+        except Exception as e:
+            # 공공 데이터 저장 실패는 전체 프로세스를 중단시키지 않음
+            print(f"공공 추천 데이터 저장 실패: {str(e)}")
         
         db.commit()
         
@@ -267,26 +265,49 @@ async def generate_recommendations(
             message=f"{request.total_count}개의 번호 조합을 성공적으로 생성했습니다"
         )
         
+    except ExecutorSaturatedError as e:
+        db.rollback()
+        raise HTTPException(status_code=503, detail=f"추천 생성 요청이 많습니다. 잠시 후 다시 시도해주세요: {str(e)}")
+    except ExecutorTimeoutError as e:
+        db.rollback()
+        raise HTTPException(status_code=504, detail=f"추천 생성 시간 초과: {str(e)}")
     except Exception as e:
         db.rollback()
         raise HTTPException(status_code=500, detail=f"추천 생성 실패: {str(e)}")
 
 # 중복된 regenerate 함수 제거됨 - 이 함수는 사용하지 않음
 
-@router.get("/history/{session_id}", response_model=APIResponse)
+def _history_page_query(limit: int, cursor: Optional[str], session_id: Optional[str] = None):
+    """추천 기록 키셋 페이지 조회문 (추천 조합은 selectinload로 한 번에 로드)"""
+    query = select(UserHistory).options(selectinload(UserHistory.recommendations))
+    if session_id is not None:
+        query = query.where(UserHistory.session_id == session_id)
+    if cursor:
+        try:
+            query = query.where(keyset_condition(UserHistory.created_at, UserHistory.id, cursor))
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    return query.order_by(*keyset_order(UserHistory.created_at, UserHistory.id)).limit(limit + 1)
+
+def _analyze_combinations(session: Session, combinations: List[List[int]]) -> List[dict]:
+    """조합별 분석 (AsyncSession.run_sync에서 동기 Session으로 호출)"""
+    analyzer = LottoAnalyzer(session)
+    return [analyzer.analyze_combination(numbers) for numbers in combinations]
+
+@router.get("/history/{session_id}", response_model=PagedAPIResponse)
 async def get_recommendation_history(
     session_id: str,
-    db: Session = Depends(get_db)
+    limit: int = Query(50, ge=1, le=200, description="조회할 추천 기록 수"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """사용자 추천 기록 조회"""
+    """사용자 추천 기록 조회 (기록 조회 + 추천 조합 일괄 조회, 쿼리 2회)"""
     try:
-        histories = db.query(UserHistory)\
-            .filter(UserHistory.session_id == session_id)\
-            .order_by(UserHistory.created_at.desc())\
-            .all()
+        result = await db.execute(_history_page_query(limit, cursor, session_id=session_id))
+        histories, next_cursor = keyset_page(result.scalars().all(), limit)
         
         if not histories:
-            return APIResponse(
+            return PagedAPIResponse(
                 success=True,
                 data=[],
                 message="추천 기록이 없습니다"
@@ -294,10 +315,6 @@ async def get_recommendation_history(
         
         data = []
         for history in histories:
-            recommendations = db.query(Recommendation)\
-                .filter(Recommendation.history_id == history.id)\
-                .all()
-            
             history_data = {
                 "id": history.id,
                 "draw_number": history.draw_number,
@@ -314,81 +331,87 @@ async def get_recommendation_history(
                         "confidence_score": float(rec.confidence_score) if rec.confidence_score else None,
                         "win_rank": rec.win_rank,
                         "win_amount": rec.win_amount
-                    } for rec in recommendations
+                    } for rec in sorted(history.recommendations, key=lambda rec: rec.id)
                 ]
             }
             data.append(history_data)
         
-        return APIResponse(
+        return PagedAPIResponse(
             success=True,
             data=data,
+            next_cursor=next_cursor,
             message=f"{len(data)}개의 추천 기록을 성공적으로 조회했습니다"
         )
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"기록 조회 실패: {str(e)}")
 
-@router.get("/history", response_model=APIResponse)
+@router.get("/history", response_model=PagedAPIResponse)
 async def get_all_recommendation_history(
-    limit: int = 50,
-    offset: int = 0,
-    db: Session = Depends(get_db)
+    limit: int = Query(50, ge=1, le=200, description="조회할 추천 기록 수"),
+    offset: int = Query(0, ge=0, description="(하위 호환) 오프셋 - cursor 사용 권장"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """모든 추천 기록 조회 (세션 구분 없이)"""
+    """모든 추천 기록 조회 (세션 구분 없이, 기록 조회 + 추천 조합 일괄 조회)"""
     try:
-        histories = db.query(UserHistory)\
-            .order_by(UserHistory.created_at.desc())\
-            .offset(offset)\
-            .limit(limit)\
-            .all()
+        query = _history_page_query(limit, cursor)
+        if offset and not cursor:
+            query = query.offset(offset)
+        result = await db.execute(query)
+        histories, next_cursor = keyset_page(result.scalars().all(), limit)
         
         if not histories:
-            return APIResponse(
+            return PagedAPIResponse(
                 success=True,
                 data=[],
                 message="추천 기록이 없습니다"
             )
         
+        entries = [
+            (history, rec)
+            for history in histories
+            for rec in sorted(history.recommendations, key=lambda rec: rec.id)
+        ]
+        # 분석기는 동기 Session 기반이므로 AsyncSession의 greenlet 브리지로 한 번에 실행
+        analyses = await db.run_sync(_analyze_combinations, [rec.numbers for _, rec in entries])
+        
         data = []
-        for history in histories:
-            recommendations = db.query(Recommendation)\
-                .filter(Recommendation.history_id == history.id)\
-                .all()
-            
-            # 각 추천을 개별 항목으로 생성
-            for rec in recommendations:
-                # 분석 결과 생성
-                analyzer = LottoAnalyzer(db)
-                analysis = analyzer.analyze_combination(rec.numbers)
-                
-                history_data = {
-                    "id": f"{history.id}_{rec.id}",
-                    "draw_number": history.draw_number,
-                    "session_id": history.session_id,
-                    "combination_type": "수동" if rec.is_manual else "AI",
-                    "numbers": rec.numbers,
-                    "confidence_score": float(rec.confidence_score) if rec.confidence_score else 0.5,
-                    "is_manual": rec.is_manual,
-                    "win_rank": rec.win_rank,
-                    "win_amount": rec.win_amount,
-                    "created_at": history.created_at.isoformat(),
-                    "analysis": {
-                        "hot_numbers": analysis.get("hot_numbers", 0),
-                        "cold_numbers": analysis.get("cold_numbers", 0),
-                        "odd_even_ratio": f"{analysis.get('odd_count', 0)}:{analysis.get('even_count', 0)}",
-                        "sum": analysis.get("sum", 0),
-                        "consecutive_count": analysis.get("consecutive_count", 0),
-                        "range_distribution": f"1-15:{analysis.get('range_1_15', 0)}, 16-30:{analysis.get('range_16_30', 0)}, 31-45:{analysis.get('range_31_45', 0)}"
-                    }
+        # 각 추천을 개별 항목으로 생성
+        for (history, rec), analysis in zip(entries, analyses):
+            history_data = {
+                "id": f"{history.id}_{rec.id}",
+                "draw_number": history.draw_number,
+                "session_id": history.session_id,
+                "combination_type": "수동" if rec.is_manual else "AI",
+                "numbers": rec.numbers,
+                "confidence_score": float(rec.confidence_score) if rec.confidence_score else 0.5,
+                "is_manual": rec.is_manual,
+                "win_rank": rec.win_rank,
+                "win_amount": rec.win_amount,
+                "created_at": history.created_at.isoformat(),
+                "analysis": {
+                    "hot_numbers": analysis.get("hot_numbers", 0),
+                    "cold_numbers": analysis.get("cold_numbers", 0),
+                    "odd_even_ratio": f"{analysis.get('odd_count', 0)}:{analysis.get('even_count', 0)}",
+                    "sum": analysis.get("sum", 0),
+                    "consecutive_count": analysis.get("consecutive_count", 0),
+                    "range_distribution": f"1-15:{analysis.get('range_1_15', 0)}, 16-30:{analysis.get('range_16_30', 0)}, 31-45:{analysis.get('range_31_45', 0)}"
                 }
-                data.append(history_data)
+            }
+            data.append(history_data)
         
-        return APIResponse(
+        return PagedAPIResponse(
             success=True,
             data=data,
+            next_cursor=next_cursor,
             message=f"{len(data)}개의 추천 기록을 성공적으로 조회했습니다"
         )
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"기록 조회 실패: {str(e)}")
 
@@ -481,9 +504,6 @@ async def regenerate_combination(
             raise HTTPException(status_code=400, detail="수동 조합은 재생성할 수 없습니다")
         
         # 4. 새로운 AI 추천 생성
-        print("🤖 AI 추천 엔진 초기화 중...")
-        engine = RecommendationEngine(db)
-        
         # preferences가 딕셔너리이므로 올바른 형태로 변환
         print("🔧 preferences 변환 중...")
         from ..schemas.recommendation import PreferenceSettings
@@ -501,12 +521,19 @@ async def regenerate_combination(
         
         print("🎲 새로운 AI 추천 생성 중...")
         try:
-            new_recommendation = engine.generate_combinations(
+            new_recommendation = (await recommendation_executor.run(
+                _generate_combinations_in_worker,
                 count=1,
                 preferences=preferences_obj,
                 exclude_combinations=exclude_combinations
-            )[0]
+            ))[0]
             print(f"✅ AI 추천 생성 성공: {new_recommendation.numbers}")
+        except ExecutorSaturatedError as e:
+            print(f"⚠️ 추천 작업 풀 포화: {str(e)}")
+            raise HTTPException(status_code=503, detail=f"추천 생성 요청이 많습니다. 잠시 후 다시 시도해주세요: {str(e)}")
+        except ExecutorTimeoutError as e:
+            print(f"⚠️ AI 추천 생성 시간 초과: {str(e)}")
+            raise HTTPException(status_code=504, detail=f"AI 추천 생성 시간 초과: {str(e)}")
         except Exception as e:
             print(f"❌ AI 추천 생성 실패: {str(e)}")
             raise HTTPException(status_code=500, detail=f"AI 추천 생성 실패: {str(e)}")
@@ -557,7 +584,10 @@ async def health_check():
         data={
             "status": "healthy",
             "service": "recommendation_engine",
-            "version": "1.0.0"
+            "version": "1.0.0",
+            "ml_model": model_registry.status(),
+            "executors": executor_status(),
+            "public_recommendation_writer": public_recommendation_writer.status()
         },
         message="추천 시스템이 정상적으로 작동하고 있습니다"
     )
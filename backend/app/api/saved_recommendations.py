@@ -1,16 +1,18 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, desc, asc
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import and_, or_, desc, asc, func, select
 from typing import List, Optional, Dict, Any
 import logging
 from datetime import datetime, timedelta
 import pytz
 
-from ..database import get_db
+from ..database import get_db, get_async_db
 from ..api.auth import get_current_user
 from ..models.user import User
 from ..models.saved_recommendation import SavedRecommendation
 from ..models.lotto import LottoDraw
+from ..utils.pagination import InvalidCursorError, keyset_condition, keyset_order, keyset_page
 from ..schemas.saved_recommendation import (
     SavedRecommendationCreate, SavedRecommendationUpdate, SavedRecommendationResponse,
     SavedRecommendationList, RecommendationFilter, RecommendationSort,
@@ -26,6 +28,13 @@ def get_current_draw_number(db: Session) -> int:
         raise HTTPException(status_code=404, detail="로또 데이터가 없습니다")
     return latest.draw_number + 1
 
+async def get_current_draw_number_async(db: AsyncSession) -> int:
+    """현재 회차 번호 조회 (AsyncSession용)"""
+    latest_draw_number = await db.scalar(select(func.max(LottoDraw.draw_number)))
+    if latest_draw_number is None:
+        raise HTTPException(status_code=404, detail="로또 데이터가 없습니다")
+    return latest_draw_number + 1
+
 router = APIRouter(prefix="/api/v1/saved-recommendations", tags=["저장된 추천번호"])
 
 def get_kst_now():
@@ -151,19 +160,19 @@ async def get_saved_recommendations(
     target_draw: Optional[int] = Query(None, description="목표 회차 필터"),
     sort_field: str = Query("created_at", description="정렬 필드"),
     sort_order: str = Query("desc", description="정렬 순서"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (created_at 정렬에서만 지원)"),
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """사용자의 저장된 추천번호 목록 조회"""
     
     try:
         # 현재 회차 조회 (기본값으로 현재 회차만 보여줌)
-        current_draw = get_current_draw_number(db)
         if not target_draw:
-            target_draw = current_draw
+            target_draw = await get_current_draw_number_async(db)
 
         # 기본 쿼리 (현재 회차 기본 필터 적용)
-        query = db.query(SavedRecommendation).filter(
+        query = select(SavedRecommendation).where(
             and_(
                 SavedRecommendation.user_id == current_user.id,
                 SavedRecommendation.is_active == True,
@@ -173,33 +182,52 @@ async def get_saved_recommendations(
 
         # 필터 적용
         if generation_method:
-            query = query.filter(SavedRecommendation.generation_method == generation_method)
+            query = query.where(SavedRecommendation.generation_method == generation_method)
 
         if is_favorite is not None:
-            query = query.filter(SavedRecommendation.is_favorite == is_favorite)
+            query = query.where(SavedRecommendation.is_favorite == is_favorite)
 
         if is_purchased is not None:
-            query = query.filter(SavedRecommendation.is_purchased == is_purchased)
+            query = query.where(SavedRecommendation.is_purchased == is_purchased)
         
         if is_winner is not None:
             if is_winner:
-                query = query.filter(SavedRecommendation.winning_rank.isnot(None))
+                query = query.where(SavedRecommendation.winning_rank.isnot(None))
             else:
-                query = query.filter(SavedRecommendation.winning_rank.is_(None))
-        
-        # 정렬 적용
-        sort_column = getattr(SavedRecommendation, sort_field, SavedRecommendation.created_at)
-        if sort_order.lower() == "desc":
-            query = query.order_by(desc(sort_column))
-        else:
-            query = query.order_by(asc(sort_column))
+                query = query.where(SavedRecommendation.winning_rank.is_(None))
         
         # 전체 개수
-        total = query.count()
+        total = await db.scalar(select(func.count()).select_from(query.subquery()))
+        
+        # 정렬 적용 (created_at 정렬은 (created_at, id) 키셋 커서로 페이지 처리)
+        descending = sort_order.lower() == "desc"
+        use_keyset = sort_field == "created_at"
+        if use_keyset:
+            if cursor:
+                try:
+                    query = query.where(keyset_condition(
+                        SavedRecommendation.created_at, SavedRecommendation.id, cursor, descending
+                    ))
+                except InvalidCursorError as e:
+                    raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+            query = query.order_by(*keyset_order(SavedRecommendation.created_at, SavedRecommendation.id, descending))
+        else:
+            if cursor:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="커서 페이지네이션은 created_at 정렬에서만 지원합니다"
+                )
+            sort_column = getattr(SavedRecommendation, sort_field, SavedRecommendation.created_at)
+            if descending:
+                query = query.order_by(desc(sort_column), desc(SavedRecommendation.id))
+            else:
+                query = query.order_by(asc(sort_column), asc(SavedRecommendation.id))
         
-        # 페이지네이션 적용
-        offset = (page - 1) * per_page
-        items = query.offset(offset).limit(per_page).all()
+        # 페이지네이션 적용 (limit + 1개 조회로 다음 페이지 여부 판단)
+        offset = 0 if cursor else (page - 1) * per_page
+        result = await db.execute(query.offset(offset).limit(per_page + 1))
+        rows = result.scalars().all()
+        items, next_cursor = keyset_page(rows, per_page)
         
         # 응답 데이터 구성
         response_items = [SavedRecommendationResponse.model_validate(item.to_dict()) for item in items]
@@ -209,10 +237,13 @@ async def get_saved_recommendations(
             total=total,
             page=page,
             per_page=per_page,
-            has_next=offset + per_page < total,
-            has_prev=page > 1
+            has_next=len(rows) > per_page,
+            has_prev=page > 1 or cursor is not None,
+            next_cursor=next_cursor if use_keyset else None
         )
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Get saved recommendations error: {e}")
         raise HTTPException(
@@ -224,16 +255,17 @@ async def get_saved_recommendations(
 async def get_saved_recommendation(
     recommendation_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """특정 저장된 추천번호 상세 정보 조회"""
     
-    saved_rec = db.query(SavedRecommendation).filter(
+    result = await db.execute(select(SavedRecommendation).where(
         and_(
             SavedRecommendation.id == recommendation_id,
             SavedRecommendation.user_id == current_user.id
         )
-    ).first()
+    ))
+    saved_rec = result.scalars().first()
     
     if not saved_rec:
         raise HTTPException(
@@ -371,14 +403,15 @@ async def toggle_favorite(
 @router.get("/stats/summary", response_model=RecommendationStats, summary="추천번호 통계")
 async def get_recommendation_stats(
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """사용자의 추천번호 통계 정보"""
     
     try:
-        saved_recs = db.query(SavedRecommendation).filter(
+        result = await db.execute(select(SavedRecommendation).where(
             SavedRecommendation.user_id == current_user.id
-        ).all()
+        ))
+        saved_recs = result.scalars().all()
         
         total_saved = len(saved_recs)
         checked_recs = [rec for rec in saved_recs if rec.is_checked]
@@ -9,6 +9,7 @@ from typing import Dict, Any, Optional
 from pydantic import BaseModel, EmailStr
 from ....database import get_db
 from ....services.unified_auth_service import UnifiedAuthService
+from ....services.executors import ExecutorSaturatedError, ExecutorTimeoutError, auth_executor
 from ....utils.auth import get_current_user, verify_password, get_password_hash
 from ....models.user import User, SocialProvider
 import logging
@@ -67,6 +68,12 @@ async def email_login(
                 error={"message": "이메일 또는 비밀번호가 올바르지 않습니다."}
             )
             
+    except (ExecutorSaturatedError, ExecutorTimeoutError) as e:
+        logger.warning(f"이메일 로그인 지연: {e}")
+        return AuthResponse(
+            success=False,
+            error={"message": "요청이 많아 처리가 지연되고 있습니다. 잠시 후 다시 시도해주세요."}
+        )
     except Exception as e:
         logger.error(f"이메일 로그인 오류: {e}")
         return AuthResponse(
@@ -95,6 +102,12 @@ async def email_register(
             error=result.get("error")
         )
         
+    except (ExecutorSaturatedError, ExecutorTimeoutError) as e:
+        logger.warning(f"이메일 회원가입 지연: {e}")
+        return AuthResponse(
+            success=False,
+            error={"message": "요청이 많아 처리가 지연되고 있습니다. 잠시 후 다시 시도해주세요."}
+        )
     except Exception as e:
         logger.error(f"이메일 회원가입 오류: {e}")
         return AuthResponse(
@@ -246,14 +259,14 @@ async def change_password(
             )
         
         # 현재 비밀번호 확인
-        if not verify_password(current_password, current_user.password_hash):
+        if not await auth_executor.run(verify_password, current_password, current_user.password_hash):
             return AuthResponse(
                 success=False,
                 error={"message": "현재 비밀번호가 올바르지 않습니다."}
             )
         
         # 새 비밀번호 해시화
-        new_hashed_password = get_password_hash(new_password)
+        new_hashed_password = await auth_executor.run(get_password_hash, new_password)
         current_user.password_hash = new_hashed_password
         
         db.commit()
@@ -263,6 +276,12 @@ async def change_password(
             data={"message": "비밀번호가 성공적으로 변경되었습니다."}
         )
         
+    except (ExecutorSaturatedError, ExecutorTimeoutError) as e:
+        logger.warning(f"비밀번호 변경 지연: {e}")
+        return AuthResponse(
+            success=False,
+            error={"message": "요청이 많아 처리가 지연되고 있습니다. 잠시 후 다시 시도해주세요."}
+        )
     except Exception as e:
         logger.error(f"비밀번호 변경 오류: {e}")
         return AuthResponse(
@@ -1,33 +1,33 @@
+import numpy as np
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
-from typing import List, Optional
-from ..database import get_db
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional, Union
+from ..database import get_async_db
 from ..models.lotto import LottoDraw
 from ..models.public_recommendation import PublicRecommendation
 from ..models.saved_recommendation import SavedRecommendation
 from ..schemas.recommendation import APIResponse
+from ..services.number_mask import NumberMask, winning_grade
+from ..services.winning_comparator import BatchComparison, compare_batch, numbers_to_array
 
 router = APIRouter(prefix="/api/v1/winning-comparison", tags=["당첨 비교"])
 
-def compare_numbers(recommended_numbers: List[int], winning_numbers: List[int], bonus_number: int) -> dict:
-    """추천 번호와 당첨 번호 비교"""
-    # 일치하는 번호 개수 계산
-    matches = len(set(recommended_numbers) & set(winning_numbers))
-    bonus_match = bonus_number in recommended_numbers
-    
-    # 당첨 등급 결정
-    if matches == 6:
-        grade = 1  # 1등
-    elif matches == 5 and bonus_match:
-        grade = 2  # 2등
-    elif matches == 5:
-        grade = 3  # 3등
-    elif matches == 4:
-        grade = 4  # 4등
-    elif matches == 3:
-        grade = 5  # 5등
-    else:
-        grade = 0  # 낙첨
+# 상세 결과 페이지 크기 (등수 집계는 항상 전체 기준)
+DEFAULT_RESULT_LIMIT = 100
+MAX_RESULT_LIMIT = 1000
+
+def compare_numbers(
+    recommended_numbers: Union[List[int], NumberMask],
+    winning_numbers: Union[List[int], NumberMask],
+    bonus_number: int
+) -> dict:
+    """추천 번호와 당첨 번호 비교 (비트마스크 popcount로 일치 개수 계산)"""
+    matches, bonus_match, grade = winning_grade(
+        NumberMask.of(recommended_numbers),
+        NumberMask.of(winning_numbers),
+        bonus_number
+    )
     
     return {
         "matches": matches,
@@ -36,24 +36,58 @@ def compare_numbers(recommended_numbers: List[int], winning_numbers: List[int],
         "is_winner": grade > 0
     }
 
+async def _fetch_winning_draw(db: AsyncSession, draw_number: int) -> Optional[LottoDraw]:
+    """회차 당첨번호 조회"""
+    result = await db.execute(select(LottoDraw).where(LottoDraw.draw_number == draw_number))
+    return result.scalars().first()
+
+async def _fetch_page_records(db: AsyncSession, model, comparison: BatchComparison, page_indexes: List[int]) -> dict:
+    """상세 결과 페이지에 해당하는 레코드만 id → 레코드로 조회"""
+    if not page_indexes:
+        return {}
+    result = await db.execute(
+        select(model).where(model.id.in_([int(comparison.ids[i]) for i in page_indexes]))
+    )
+    return {rec.id: rec for rec in result.scalars().all()}
+
+def _pagination(comparison: BatchComparison, offset: int, limit: int, returned: int) -> dict:
+    """상세 결과 페이지 정보"""
+    return {
+        "offset": offset,
+        "limit": limit,
+        "returned": returned,
+        "has_more": offset + returned < comparison.total
+    }
+
 @router.get("/public/{draw_number}", response_model=APIResponse)
 async def compare_public_recommendations(
     draw_number: int,
-    db: Session = Depends(get_db)
+    offset: int = Query(0, ge=0, description="상세 결과 시작 위치"),
+    limit: int = Query(DEFAULT_RESULT_LIMIT, ge=0, le=MAX_RESULT_LIMIT, description="상세 결과 개수 (집계는 전체 기준)"),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """공공 추천 데이터와 당첨번호 비교"""
     try:
         # 당첨번호 조회
-        winning_draw = db.query(LottoDraw).filter(LottoDraw.draw_number == draw_number).first()
+        winning_draw = await _fetch_winning_draw(db, draw_number)
         if not winning_draw:
             raise HTTPException(status_code=404, detail=f"{draw_number}회차 당첨번호를 찾을 수 없습니다")
         
-        # 해당 회차 공공 추천 데이터 조회
-        public_recommendations = db.query(PublicRecommendation).filter(
-            PublicRecommendation.draw_number == draw_number
-        ).all()
+        # 해당 회차 공공 추천 데이터 조회 (비교에 필요한 컬럼만)
+        result = await db.execute(
+            select(
+                PublicRecommendation.id,
+                PublicRecommendation.numbers,
+                PublicRecommendation.is_dummy,
+                PublicRecommendation.winning_rank,
+                PublicRecommendation.matched_count
+            ).where(
+                PublicRecommendation.draw_number == draw_number
+            ).order_by(PublicRecommendation.id)
+        )
+        rows = result.all()
         
-        if not public_recommendations:
+        if not rows:
             return APIResponse(
                 success=True,
                 data={
@@ -66,25 +100,28 @@ async def compare_public_recommendations(
                 message=f"{draw_number}회차 공공 추천 데이터가 없습니다"
             )
         
-        # 각 추천에 대해 당첨 비교
+        # 전체 추천을 한 번에 비교 (더미 데이터는 저장된 당첨 정보 사용)
+        stored_grades = np.array(
+            [row.winning_rank if row.is_dummy and row.winning_rank is not None else -1 for row in rows],
+            dtype=np.int64
+        )
+        stored_matches = np.array([row.matched_count or 0 for row in rows], dtype=np.int64)
+        comparison = compare_batch(
+            [row.id for row in rows],
+            numbers_to_array(row.numbers for row in rows),
+            winning_draw.numbers,
+            winning_draw.bonus_number,
+            stored_matches=stored_matches,
+            stored_grades=stored_grades
+        )
+        
+        # 요청한 페이지의 상세 결과만 조회/직렬화
+        page_indexes = comparison.page(offset, limit)
+        page_records = await _fetch_page_records(db, PublicRecommendation, comparison, page_indexes)
+        
         results = []
-        for rec in public_recommendations:
-            # 더미 데이터는 저장된 당첨 정보 사용 (당첨번호 매칭 로직 완전 건너뛰기)
-            if rec.is_dummy and rec.winning_rank is not None:
-                comparison = {
-                    "matches": rec.matched_count,
-                    "bonus_match": False,  # 더미 데이터는 보너스 매칭 정보 없음
-                    "grade": rec.winning_rank,
-                    "is_winner": rec.winning_rank > 0
-                }
-            else:
-                # 일반 데이터는 당첨번호 매칭 로직 사용
-                comparison = compare_numbers(
-                    rec.numbers, 
-                    winning_draw.numbers, 
-                    winning_draw.bonus_number
-                )
-            
+        for index in page_indexes:
+            rec = page_records[int(comparison.ids[index])]
             results.append({
                 "id": rec.id,
                 "numbers": rec.numbers,
@@ -92,27 +129,18 @@ async def compare_public_recommendations(
                 "user_type": rec.user_type,
                 "confidence_score": rec.confidence_score,
                 "created_at": rec.created_at.isoformat(),
-                **comparison
+                **comparison.result_for(index)
             })
         
-        # 통계 계산
-        total_recommendations = len(results)
-        winners = [r for r in results if r["is_winner"]]
-        grade_stats = {}
-        for grade in range(1, 6):
-            grade_stats[f"grade_{grade}"] = len([r for r in winners if r["grade"] == grade])
-        
         return APIResponse(
             success=True,
             data={
                 "draw_number": draw_number,
                 "winning_numbers": winning_draw.numbers,
                 "bonus_number": winning_draw.bonus_number,
-                "total_recommendations": total_recommendations,
-                "total_winners": len(winners),
-                "win_rate": len(winners) / total_recommendations if total_recommendations > 0 else 0,
-                "grade_stats": grade_stats,
-                "results": results
+                **comparison.summary(),
+                "results": results,
+                "pagination": _pagination(comparison, offset, limit, len(results))
             },
             message=f"{draw_number}회차 공공 추천 데이터 비교 완료"
         )
@@ -126,26 +154,29 @@ async def compare_public_recommendations(
 async def compare_personal_recommendations(
     draw_number: int,
     user_id: Optional[int] = Query(None, description="사용자 ID (지정하지 않으면 전체)"),
-    db: Session = Depends(get_db)
+    offset: int = Query(0, ge=0, description="상세 결과 시작 위치"),
+    limit: int = Query(DEFAULT_RESULT_LIMIT, ge=0, le=MAX_RESULT_LIMIT, description="상세 결과 개수 (집계는 전체 기준)"),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """개인 저장 데이터와 당첨번호 비교"""
     try:
         # 당첨번호 조회
-        winning_draw = db.query(LottoDraw).filter(LottoDraw.draw_number == draw_number).first()
+        winning_draw = await _fetch_winning_draw(db, draw_number)
         if not winning_draw:
             raise HTTPException(status_code=404, detail=f"{draw_number}회차 당첨번호를 찾을 수 없습니다")
         
-        # 해당 회차 개인 저장 데이터 조회
-        query = db.query(SavedRecommendation).filter(
+        # 해당 회차 개인 저장 데이터 조회 (비교에 필요한 컬럼만)
+        query = select(SavedRecommendation.id, SavedRecommendation.numbers).where(
             SavedRecommendation.target_draw_number == draw_number
         )
         
         if user_id:
-            query = query.filter(SavedRecommendation.user_id == user_id)
+            query = query.where(SavedRecommendation.user_id == user_id)
         
-        personal_recommendations = query.all()
+        result = await db.execute(query.order_by(SavedRecommendation.id))
+        rows = result.all()
         
-        if not personal_recommendations:
+        if not rows:
             return APIResponse(
                 success=True,
                 data={
@@ -158,15 +189,21 @@ async def compare_personal_recommendations(
                 message=f"{draw_number}회차 개인 저장 데이터가 없습니다"
             )
         
-        # 각 추천에 대해 당첨 비교
+        # 전체 추천을 한 번에 비교
+        comparison = compare_batch(
+            [row.id for row in rows],
+            numbers_to_array(row.numbers for row in rows),
+            winning_draw.numbers,
+            winning_draw.bonus_number
+        )
+        
+        # 요청한 페이지의 상세 결과만 조회/직렬화
+        page_indexes = comparison.page(offset, limit)
+        page_records = await _fetch_page_records(db, SavedRecommendation, comparison, page_indexes)
+        
         results = []
-        for rec in personal_recommendations:
-            comparison = compare_numbers(
-                rec.numbers, 
-                winning_draw.numbers, 
-                winning_draw.bonus_number
-            )
-            
+        for index in page_indexes:
+            rec = page_records[int(comparison.ids[index])]
             results.append({
                 "id": rec.id,
                 "user_id": rec.user_id,
@@ -175,27 +212,18 @@ async def compare_personal_recommendations(
                 "generation_method": rec.generation_method,
                 "confidence_score": rec.confidence_score,
                 "created_at": rec.created_at.isoformat(),
-                **comparison
+                **comparison.result_for(index)
             })
         
-        # 통계 계산
-        total_recommendations = len(results)
-        winners = [r for r in results if r["is_winner"]]
-        grade_stats = {}
-        for grade in range(1, 6):
-            grade_stats[f"grade_{grade}"] = len([r for r in winners if r["grade"] == grade])
-        
         return APIResponse(
             success=True,
             data={
                 "draw_number": draw_number,
                 "winning_numbers": winning_draw.numbers,
                 "bonus_number": winning_draw.bonus_number,
-                "total_recommendations": total_recommendations,
-                "total_winners": len(winners),
-                "win_rate": len(winners) / total_recommendations if total_recommendations > 0 else 0,
-                "grade_stats": grade_stats,
-                "results": results
+                **comparison.summary(),
+                "results": results,
+                "pagination": _pagination(comparison, offset, limit, len(results))
             },
             message=f"{draw_number}회차 개인 저장 데이터 비교 완료"
         )
@@ -208,24 +236,28 @@ async def compare_personal_recommendations(
 @router.get("/stats/{draw_number}", response_model=APIResponse)
 async def get_winning_stats(
     draw_number: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """특정 회차 당첨 통계 조회"""
     try:
         # 당첨번호 조회
-        winning_draw = db.query(LottoDraw).filter(LottoDraw.draw_number == draw_number).first()
+        winning_draw = await _fetch_winning_draw(db, draw_number)
         if not winning_draw:
             raise HTTPException(status_code=404, detail=f"{draw_number}회차 당첨번호를 찾을 수 없습니다")
         
         # 공공 데이터 통계
-        public_count = db.query(PublicRecommendation).filter(
-            PublicRecommendation.draw_number == draw_number
-        ).count()
+        public_count = await db.scalar(
+            select(func.count(PublicRecommendation.id)).where(
+                PublicRecommendation.draw_number == draw_number
+            )
+        )
         
         # 개인 저장 데이터 통계
-        personal_count = db.query(SavedRecommendation).filter(
-            SavedRecommendation.target_draw_number == draw_number
-        ).count()
+        personal_count = await db.scalar(
+            select(func.count(SavedRecommendation.id)).where(
+                SavedRecommendation.target_draw_number == draw_number
+            )
+        )
         
         return APIResponse(
             success=True,
@@ -25,6 +25,51 @@ class Settings(BaseSettings):
         ]
     )
     
+    # ML 모델 레지스트리 (새 모델 파일 감시 주기, 초)
+    ml_model_watch_interval: int = 60
+    # ML 학습 방식 (multioutput: 번호별 포레스트 45개, native_multioutput: 45개 타깃을 함께 학습하는 포레스트 1개)
+    ml_training_mode: str = "multioutput"
+
+    # CPU 작업 풀 (동시 실행 수, 최대 대기 작업 수, 작업 타임아웃 초)
+    auth_executor_workers: int = 4
+    auth_executor_queue: int = 64
+    auth_executor_timeout: float = 10.0
+    recommendation_executor_workers: int = 4
+    recommendation_executor_queue: int = 32
+    recommendation_executor_timeout: float = 30.0
+    ml_executor_workers: int = 2
+    ml_executor_queue: int = 16
+    ml_executor_timeout: float = 30.0
+    scraper_executor_workers: int = 2
+    scraper_executor_queue: int = 64
+    scraper_executor_timeout: float = 30.0
+    
+    # 공공 추천 기록 write-behind (async: 큐에 모아 배치 기록, sync: 요청 트랜잭션에서 기록)
+    public_recommendation_durability: str = "async"
+    public_recommendation_batch_size: int = 200
+    public_recommendation_flush_interval_ms: int = 500
+
+    # 인증 사용자 캐시 (토큰 subject별 사용자 행 보관 시간 초, 최대 항목 수)
+    principal_cache_ttl_seconds: float = 30.0
+    principal_cache_max_entries: int = 10000
+
+    # 외부 HTTP 클라이언트 (OAuth, 당첨번호 스크래핑 공유 연결 풀)
+    http_max_connections: int = 20
+    http_max_connections_per_host: int = 6
+    http_keepalive_expiry: float = 30.0
+    http_connect_timeout: float = 5.0
+    http_read_timeout: float = 15.0
+    http_retry_attempts: int = 3
+    http_retry_backoff: float = 0.5
+    http_retry_backoff_max: float = 8.0
+
+    # 당첨번호 스크래퍼 (동시 수집 회차 수, 호스트별 초당 요청 수, 재시도)
+    scraper_concurrency: int = 4
+    scraper_rate_per_second: float = 2.0
+    scraper_max_attempts: int = 4
+    scraper_backoff: float = 1.0
+    scraper_backoff_max: float = 15.0
+
     # 데이터 소스
     lotto_data_url: str = "https://dhlottery.co.kr/gameResult.do?method=byWin"
     
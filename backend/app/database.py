@@ -1,4 +1,6 @@
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from .config import settings
@@ -6,6 +8,23 @@ from .config import settings
 # 데이터베이스 URL 생성 (환경별)
 SQLALCHEMY_DATABASE_URL = settings.database_url_with_fallback
 
+# 동기 드라이버 → asyncio 드라이버 매핑
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "postgres": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+    "sqlite+pysqlite": "sqlite+aiosqlite",
+}
+
+
+def to_async_database_url(url: str) -> str:
+    """동기 DB URL을 asyncio 드라이버 URL로 변환 (이미 async 드라이버면 그대로)"""
+    parsed = make_url(url)
+    driver = ASYNC_DRIVERS.get(parsed.drivername, parsed.drivername)
+    return parsed.set(drivername=driver).render_as_string(hide_password=False)
+
+
 # 엔진 생성
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL,
@@ -13,9 +32,24 @@ engine = create_engine(
     pool_recycle=300,    # 5분마다 연결 재생성
 )
 
+# asyncio 엔진 생성 (조회 위주 API용, 이벤트 루프를 막지 않음)
+async_engine = create_async_engine(
+    to_async_database_url(SQLALCHEMY_DATABASE_URL),
+    pool_pre_ping=True,
+    pool_recycle=300,
+)
+
 # 세션 팩토리 생성
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# asyncio 세션 팩토리 (커밋 후에도 로드된 속성을 재조회 없이 사용)
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
 # 베이스 클래스
 Base = declarative_base()
 
@@ -27,4 +61,7 @@ def get_db():
     finally:
         db.close()
 
-
+# asyncio 데이터베이스 세션 의존성
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -4,11 +4,18 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from contextlib import asynccontextmanager
 import json
-from .database import engine, Base
+from .database import engine, async_engine, Base, SessionLocal
 from .config import settings
 from .api import lotto, recommendations, admin, sessions, auth, saved_recommendations, public_recommendations, winning_comparison, user_preferences
 from .api.v1.endpoints import unified_auth
 from .services.auto_updater import auto_updater
+from .services.combination_table import combination_scores
+from .services.number_stats import ensure_number_stats
+from .services.recommendation_stats import refresh_draw_rollups
+from .services.ml.model_registry import model_registry
+from .services.executors import shutdown_executors
+from .services.http_clients import http_clients
+from .services.public_recommendation_writer import public_recommendation_writer
 
 # 로깅 설정
 logging.basicConfig(
@@ -32,6 +39,59 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         print(f"❌ 데이터베이스 테이블 생성 실패: {e}")
     
+    # 번호별 누적 통계 테이블 초기화 (비어 있으면 전체 회차에서 재구축)
+    try:
+        db = SessionLocal()
+        try:
+            if ensure_number_stats(db):
+                print("✅ 번호별 통계(number_stats) 재구축 완료")
+        finally:
+            db.close()
+    except Exception as e:
+        print(f"❌ 번호별 통계 초기화 실패: {e}")
+    
+    # 마감 회차 추천 통계 롤업 백필 (조회 API는 롤업을 쓰지 않고 읽기만 함)
+    try:
+        db = SessionLocal()
+        try:
+            rolled = refresh_draw_rollups(db)
+            if rolled:
+                print(f"✅ 추천 통계 롤업 백필 완료: {rolled}개 회차")
+        finally:
+            db.close()
+    except Exception as e:
+        print(f"❌ 추천 통계 롤업 백필 실패: {e}")
+    
+    # 조합 점수 테이블 mmap 적재 (없으면 실시간 계산으로 동작)
+    try:
+        if combination_scores.load():
+            print(f"✅ 조합 점수 테이블 적재 완료: {combination_scores.path}")
+        else:
+            print("⚠️ 조합 점수 테이블 없음 - 실시간 점수 계산 사용 (build_combination_table_script.py로 생성)")
+    except Exception as e:
+        print(f"❌ 조합 점수 테이블 적재 실패: {e}")
+    
+    # ML 모델 적재 및 새 모델 파일 감시 시작
+    try:
+        if model_registry.load_latest():
+            print(f"✅ ML 모델 적재 완료: {model_registry.version}")
+        else:
+            print("⚠️ 학습된 ML 모델 없음 - ML 추천 요청은 통계 모드로 폴백")
+        model_registry.start_watching(settings.ml_model_watch_interval)
+    except Exception as e:
+        print(f"❌ ML 모델 적재 실패: {e}")
+    
+    # 외부 HTTP 공유 클라이언트 (OAuth, 당첨번호 스크래핑)
+    http_clients.start()
+    print(f"✅ HTTP 클라이언트 풀 생성 완료 (최대 연결 {http_clients.max_connections}, 호스트별 {http_clients.max_connections_per_host})")
+    
+    # 공공 추천 기록 write-behind 큐 시작
+    try:
+        public_recommendation_writer.start()
+        print(f"✅ 공공 추천 기록 큐 시작 완료 (내구성 모드: {public_recommendation_writer.durability})")
+    except Exception as e:
+        print(f"❌ 공공 추천 기록 큐 시작 실패: {e}")
+    
     # 자동 업데이트 스케줄러 시작
     try:
         auto_updater.start_scheduler()
@@ -43,6 +103,15 @@ async def lifespan(app: FastAPI):
     
     # 종료 시
     print("🛑 로또리아 AI 백엔드 서버 종료 중...")
+    model_registry.stop_watching()
+    try:
+        flushed = public_recommendation_writer.stop()
+        print(f"✅ 공공 추천 기록 큐 플러시 완료 ({flushed}건)")
+    except Exception as e:
+        print(f"❌ 공공 추천 기록 큐 플러시 실패: {e}")
+    shutdown_executors()
+    await http_clients.close()
+    await async_engine.dispose()
 
 # FastAPI 앱 생성
 app = FastAPI(
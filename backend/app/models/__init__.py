@@ -5,6 +5,9 @@ from .session import UserSession
 from .user import User, SocialProvider, SubscriptionPlan
 from .saved_recommendation import SavedRecommendation
 from .public_recommendation import PublicRecommendation
+from .number_stat import NumberStat
+from .recommendation_draw_stat import RecommendationDrawStat
+from .draw_checksum import DrawChecksum
 
 __all__ = [
     "LottoDraw", 
@@ -15,7 +18,10 @@ __all__ = [
     "SocialProvider",
     "SubscriptionPlan", 
     "SavedRecommendation",
-    "PublicRecommendation"
+    "PublicRecommendation",
+    "NumberStat",
+    "RecommendationDrawStat",
+    "DrawChecksum"
 ]
 
 
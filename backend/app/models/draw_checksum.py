@@ -0,0 +1,14 @@
+from sqlalchemy import Column, Integer, String, DateTime
+from sqlalchemy.sql import func
+from ..database import Base
+
+class DrawChecksum(Base):
+    """회차별 당첨번호 행 체크섬 매니페스트 (무결성 검사 기준값)"""
+    __tablename__ = "lotto_draw_checksums"
+    
+    draw_number = Column(Integer, primary_key=True)  # 회차
+    checksum = Column(String(64), nullable=False)  # 회차/추첨일/번호/보너스/1등 정보 SHA-256
+    recorded_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    
+    def __repr__(self):
+        return f"<DrawChecksum(draw_number={self.draw_number}, checksum={self.checksum[:12]})>"
@@ -0,0 +1,21 @@
+from sqlalchemy import Column, Integer, DateTime, CheckConstraint
+from sqlalchemy.sql import func
+from ..database import Base
+
+class NumberStat(Base):
+    """번호별 누적 통계 집계 테이블 (1~45, 회차 입력 시 함께 갱신)"""
+    __tablename__ = "number_stats"
+    
+    number = Column(Integer, primary_key=True)  # 번호 (1-45)
+    appearances = Column(Integer, nullable=False, default=0)  # 당첨번호 출현 횟수
+    bonus_appearances = Column(Integer, nullable=False, default=0)  # 보너스 번호 출현 횟수
+    last_appearance = Column(Integer, nullable=False, default=0)  # 마지막 출현 회차 (0 = 미출현)
+    gap_since_last = Column(Integer, nullable=False, default=0)  # 최신 회차 - 마지막 출현 회차
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    
+    __table_args__ = (
+        CheckConstraint('number BETWEEN 1 AND 45', name='check_number_stat_range'),
+    )
+    
+    def __repr__(self):
+        return f"<NumberStat(number={self.number}, appearances={self.appearances}, last={self.last_appearance})>"
@@ -0,0 +1,18 @@
+from sqlalchemy import Column, Integer, DateTime
+from sqlalchemy.sql import func
+from ..database import Base
+
+class RecommendationDrawStat(Base):
+    """마감된 회차별 공공 추천 데이터 집계 (관리자 대시보드 통계용 롤업)"""
+    __tablename__ = "recommendation_draw_stats"
+    
+    draw_number = Column(Integer, primary_key=True)  # 회차
+    total = Column(Integer, nullable=False, default=0)  # 전체 추천 수
+    ai = Column(Integer, nullable=False, default=0)  # AI 추천 수
+    manual = Column(Integer, nullable=False, default=0)  # 수동 추천 수
+    member = Column(Integer, nullable=False, default=0)  # 회원 추천 수
+    guest = Column(Integer, nullable=False, default=0)  # 비회원 추천 수
+    computed_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    
+    def __repr__(self):
+        return f"<RecommendationDrawStat(draw_number={self.draw_number}, total={self.total})>"
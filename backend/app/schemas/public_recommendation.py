@@ -30,6 +30,7 @@ class PublicRecommendationList(BaseModel):
     total: int
     draw_number: int
     message: str
+    next_cursor: Optional[str] = None
 
 class PublicRecommendationStats(BaseModel):
     """공공 추천 통계 스키마"""
@@ -128,4 +128,7 @@ class APIResponse(BaseModel):
     error: Optional[Dict[str, Any]] = Field(None, description="에러 정보")
     message: Optional[str] = Field(None, description="응답 메시지")
 
+class PagedAPIResponse(APIResponse):
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (마지막 페이지면 null)")
+
 
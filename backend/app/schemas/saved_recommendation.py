@@ -88,6 +88,7 @@ class SavedRecommendationList(BaseModel):
     per_page: int
     has_next: bool
     has_prev: bool
+    next_cursor: Optional[str] = None
 
 class RecommendationFilter(BaseModel):
     """추천 번호 필터"""
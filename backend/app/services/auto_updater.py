@@ -5,14 +5,21 @@ from typing import List, Optional
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from sqlalchemy.orm import Session
-import requests
-from bs4 import BeautifulSoup
-import re
 import pytz
 import random
+import asyncio
 
 from ..database import get_db
 from ..models.lotto import LottoDraw
+from ..models.public_recommendation import PublicRecommendation
+from .draw_scraper import draw_scraper
+from .draw_integrity import draw_integrity, record_checksum
+from .draw_snapshot import draw_history
+from .response_cache import lotto_response_cache
+from .dummy_recommendations import build_dummy_rows, bulk_insert_dummy_rows
+from .number_stats import apply_draw as apply_number_stats
+from .recommendation_stats import refresh_draw_rollup, refresh_draw_rollups
+from .ml.feature_cache import inference_features
 
 logger = logging.getLogger(__name__)
 
@@ -22,10 +29,6 @@ class AutoUpdater:
         self.timezone = pytz.timezone('Asia/Seoul')
         self.scheduler = AsyncIOScheduler(timezone=self.timezone)
         self.is_running = False
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        })
         # 기본 스케줄러 설정 (매주 토요일 오후 9시 20분, 한국시간)
         self.schedule_config = {
             'day_of_week': 'sat',  # 0=월요일, 6=일요일
@@ -39,6 +42,9 @@ class AutoUpdater:
             'last_generated_draw': 0,  # 마지막 생성 회차
             'last_generated_at': None  # 마지막 생성 시간
         }
+        # 누락 회차 복구 결과
+        self.last_repair: Optional[dict] = None
+        self._repair_task: Optional[asyncio.Task] = None
     
     def get_kst_now(self):
         """현재 한국시간 반환"""
@@ -184,6 +190,7 @@ class AutoUpdater:
                         if new_draws:
                             self._insert_new_draws(db, new_draws)
                             logger.info(f"자동 업데이트가 완료되었습니다. {len(new_draws)}개 회차가 추가되었습니다.")
+                            self._scan_and_schedule_repair(db, latest_site_draw)
                             
                             # 업데이트 성공 시 즉시 반환
                             return
@@ -195,6 +202,7 @@ class AutoUpdater:
                                 continue
                     else:
                         logger.info("새로운 데이터가 없습니다.")
+                        self._scan_and_schedule_repair(db, latest_site_draw)
                         return
                         
                 finally:
@@ -213,279 +221,128 @@ class AutoUpdater:
                 else:
                     logger.error("모든 재시도가 실패했습니다. 자동 업데이트를 중단합니다.")
             
+    # ========================================================================
+    # Integrity Repair
+    # ========================================================================
+
+    def _scan_and_schedule_repair(self, db: Session, latest_site_draw: int) -> Optional[dict]:
+        """무결성 검사 후 누락 회차가 있으면 그 회차들만 복구 예약 (실패해도 업데이트는 성공 처리)"""
+        try:
+            report = draw_integrity.scan(db, latest_draw=latest_site_draw)
+        except Exception as e:
+            db.rollback()
+            logger.warning(f"회차 무결성 검사 실패: {str(e)}")
+            return None
+        if report['missing_draws']:
+            self.schedule_gap_repair(report['missing_draws'])
+        return report
+
+    def schedule_gap_repair(self, draw_numbers: List[int]) -> bool:
+        """
+        누락 회차 복구 예약 (스케줄러가 실행 중이면 즉시 실행 작업으로 등록, 아니면 백그라운드 태스크).
+
+        Returns:
+            bool: 예약 여부 (회차가 없거나 이미 복구 중이면 False)
+        """
+        draw_numbers = sorted(set(draw_numbers))
+        if not draw_numbers:
+            return False
+        if self._repair_task is not None and not self._repair_task.done():
+            logger.info("누락 회차 복구가 이미 진행 중입니다.")
+            return False
+
+        if self.is_running:
+            self.scheduler.add_job(
+                self.repair_missing_draws,
+                trigger='date',
+                args=[draw_numbers],
+                id='draw_gap_repair',
+                name=f"누락 회차 복구 ({len(draw_numbers)}개)",
+                replace_existing=True,
+                misfire_grace_time=300
+            )
+        else:
+            self._repair_task = asyncio.get_running_loop().create_task(self.repair_missing_draws(draw_numbers))
+        logger.info(f"누락 회차 복구를 예약했습니다: {draw_numbers}")
+        return True
+
+    async def repair_missing_draws(self, draw_numbers: List[int]) -> dict:
+        """누락 회차만 수집해 입력하고 결과를 last_repair에 기록"""
+        started_at = self.get_kst_now().isoformat()
+        scraped, failed = await draw_scraper.scrape_draws(draw_numbers)
+
+        inserted = []
+        if scraped:
+            db = next(get_db())
+            try:
+                # 기존 최신 회차 이후(끝부분 누락)만 주간 업데이트처럼 더미 데이터 생성
+                inserted = self._insert_new_draws(
+                    db,
+                    scraped,
+                    dummy_min_draw=self._get_latest_draw_number(db) + 1
+                )
+            finally:
+                db.close()
+
+        self.last_repair = {
+            'started_at': started_at,
+            'finished_at': self.get_kst_now().isoformat(),
+            'requested': sorted(set(draw_numbers)),
+            'inserted': inserted,
+            'failed': failed,
+        }
+        logger.info(f"누락 회차 복구 완료: 입력 {len(inserted)}개, 실패 {failed}")
+        return self.last_repair
+            
     def _get_latest_draw_number(self, db: Session) -> int:
         """DB에서 최신 회차 조회"""
         latest_draw = db.query(LottoDraw).order_by(LottoDraw.draw_number.desc()).first()
         return latest_draw.draw_number if latest_draw else 0
         
     async def _get_latest_site_draw_number(self) -> int:
-        """로또 사이트에서 최신 회차 조회 (재시도 메커니즘 포함)"""
-        max_retries = 3
-        retry_delay = 2
-        
-        for attempt in range(max_retries):
-            try:
-                # 동행복권 당첨번호 페이지에서 최신 회차 확인
-                url = "https://www.dhlottery.co.kr/gameResult.do?method=byWin"
-                
-                # 요청 헤더 강화
-                headers = {
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36',
-                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                    'Accept-Language': 'ko-KR,ko;q=0.9,en;q=0.8',
-                    'Accept-Encoding': 'gzip, deflate, br',
-                    'Connection': 'keep-alive',
-                    'Upgrade-Insecure-Requests': '1',
-                }
-                
-                response = self.session.get(url, headers=headers, timeout=15)
-                response.raise_for_status()
-                
-                # EUC-KR 인코딩으로 디코딩
-                response.encoding = 'euc-kr'
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
-                # 최신 회차 정보 찾기 (win_result div 안의 h4 > strong)
-                win_result_div = soup.find('div', class_='win_result')
-                if win_result_div:
-                    h4_element = win_result_div.find('h4')
-                    if h4_element:
-                        latest_draw_element = h4_element.find('strong')
-                        if latest_draw_element:
-                            # "1186회" 같은 텍스트에서 숫자 추출
-                            draw_text = latest_draw_element.text.strip()
-                            match = re.search(r'(\d+)', draw_text)
-                            if match:
-                                latest_draw = int(match.group(1))
-                                logger.info(f"사이트에서 최신 회차 확인: {latest_draw}회차")
-                                return latest_draw
-                
-                # 백업 방법: select 옵션에서 최신 회차 확인
-                draw_select = soup.find('select', {'id': 'dwrNoList'})
-                if draw_select:
-                    first_option = draw_select.find('option')
-                    if first_option:
-                        draw_text = first_option.get('value', '').strip()
-                        if draw_text.isdigit():
-                            latest_draw = int(draw_text)
-                            logger.info(f"select에서 최신 회차 확인: {latest_draw}회차")
-                            return latest_draw
-                
-                logger.warning(f"시도 {attempt + 1}: HTML 구조에서 회차 정보를 찾을 수 없습니다.")
-                
-            except requests.exceptions.RequestException as e:
-                logger.warning(f"시도 {attempt + 1} 네트워크 오류: {str(e)}")
-                if attempt < max_retries - 1:
-                    import asyncio
-                    await asyncio.sleep(retry_delay * (attempt + 1))
-                    continue
-            except Exception as e:
-                logger.warning(f"시도 {attempt + 1} 파싱 오류: {str(e)}")
-                if attempt < max_retries - 1:
-                    import asyncio
-                    await asyncio.sleep(retry_delay * (attempt + 1))
-                    continue
+        """로또 사이트에서 최신 회차 조회 (실패 시 DB 최신 회차)"""
+        try:
+            latest_draw = await draw_scraper.fetch_latest_draw_number()
+            logger.info(f"사이트에서 최신 회차 확인: {latest_draw}회차")
+            return latest_draw
+        except Exception as e:
+            logger.warning(f"사이트 최신 회차 조회 실패: {str(e)}")
         
         # 모든 시도 실패 시 DB 기반으로 추정
         logger.warning("모든 시도가 실패했습니다. DB 기반으로 최신 회차를 추정합니다.")
         db = next(get_db())
-        latest_db = self._get_latest_draw_number(db)
-        return latest_db  # DB와 동일하게 설정하여 새 데이터 없음으로 처리
+        try:
+            return self._get_latest_draw_number(db)  # DB와 동일하게 설정하여 새 데이터 없음으로 처리
+        finally:
+            db.close()
         
     async def _scrape_new_draws(self, start_draw: int, end_draw: int) -> List[dict]:
-        """새로운 회차 데이터 스크래핑 - 개선된 버전"""
-        new_draws = []
-        failed_draws = []
-        
-        for draw_num in range(start_draw, end_draw + 1):
-            max_attempts = 3
-            success = False
-            
-            for attempt in range(max_attempts):
-                try:
-                    logger.info(f"{draw_num}회차 데이터 스크래핑 시작... (시도 {attempt + 1}/{max_attempts})")
-                    
-                    # 동행복권 당첨번호 페이지에서 데이터 스크래핑
-                    draw_data = await self._scrape_single_draw(draw_num)
-                    
-                    if draw_data:
-                        new_draws.append(draw_data)
-                        logger.info(f"{draw_num}회차 스크래핑 성공: {draw_data['numbers']} + {draw_data['bonus_number']}")
-                        success = True
-                        break
-                    else:
-                        logger.warning(f"{draw_num}회차 시도 {attempt + 1}: 데이터를 찾을 수 없습니다.")
-                        
-                except Exception as e:
-                    logger.error(f"{draw_num}회차 시도 {attempt + 1} 실패: {str(e)}")
-                    
-                # 재시도 전 대기
-                if attempt < max_attempts - 1:
-                    import asyncio
-                    await asyncio.sleep(2 * (attempt + 1))  # 점진적 대기 시간
-            
-            if not success:
-                failed_draws.append(draw_num)
-                logger.error(f"{draw_num}회차: 모든 시도가 실패했습니다.")
+        """
+        새로운 회차 데이터 동시 스크래핑.
         
-        # 결과 요약
+        중간 회차가 실패하면 그 앞까지만 반환해 DB에 회차 공백이 생기지 않도록 하고,
+        실패한 회차부터는 다음 업데이트에서 다시 수집한다.
+        """
+        scraped, failed_draws = await draw_scraper.scrape_range(start_draw, end_draw)
         if failed_draws:
             logger.warning(f"스크래핑 실패한 회차: {failed_draws}")
-        logger.info(f"스크래핑 완료: 성공 {len(new_draws)}개, 실패 {len(failed_draws)}개")
         
+        new_draws = []
+        for draw_data in scraped:
+            if draw_data['draw_number'] != start_draw + len(new_draws):
+                break
+            new_draws.append(draw_data)
+        if len(new_draws) < len(scraped):
+            logger.warning(f"{start_draw + len(new_draws)}회차 실패로 이후 {len(scraped) - len(new_draws)}개 회차 입력을 보류합니다.")
         return new_draws
         
     async def _scrape_single_draw(self, draw_number: int) -> Optional[dict]:
-        """단일 회차 데이터 스크래핑 (개선된 버전)"""
-        max_retries = 3
-        retry_delay = 1
-        
-        for attempt in range(max_retries):
-            try:
-                # 동행복권 당첨번호 조회 페이지 (POST 방식)
-                url = "https://www.dhlottery.co.kr/gameResult.do?method=byWin"
-                
-                # 강화된 헤더
-                headers = {
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36',
-                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                    'Accept-Language': 'ko-KR,ko;q=0.9,en;q=0.8',
-                    'Accept-Encoding': 'gzip, deflate, br',
-                    'Content-Type': 'application/x-www-form-urlencoded',
-                    'Referer': 'https://www.dhlottery.co.kr/gameResult.do?method=byWin',
-                }
-                
-                data = {'drwNo': str(draw_number)}
-                response = self.session.post(url, data=data, headers=headers, timeout=15)
-                response.raise_for_status()
-                
-                # EUC-KR 인코딩 처리
-                response.encoding = 'euc-kr'
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
-                logger.info(f"{draw_number}회차 스크래핑 시도 {attempt + 1} - 응답 상태: {response.status_code}")
-                
-                # 회차 확인 (올바른 회차인지 검증)
-                win_result_div = soup.find('div', class_='win_result')
-                if not win_result_div:
-                    logger.warning(f"{draw_number}회차: win_result div를 찾을 수 없습니다.")
-                    continue
-                    
-                h4_element = win_result_div.find('h4')
-                if h4_element:
-                    strong_element = h4_element.find('strong')
-                    if strong_element:
-                        draw_text = strong_element.text.strip()
-                        current_draw_match = re.search(r'(\d+)', draw_text)
-                        if current_draw_match:
-                            current_draw = int(current_draw_match.group(1))
-                            if current_draw != draw_number:
-                                logger.warning(f"요청한 {draw_number}회차와 응답 {current_draw}회차가 다릅니다.")
-                                continue
-                
-                # 당첨번호 추출
-                numbers = []
-                
-                # nums div 내의 win 클래스에서 당첨번호 6개 찾기
-                nums_div = win_result_div.find('div', class_='nums')
-                if nums_div:
-                    win_div = nums_div.find('div', class_='num win')
-                    if win_div:
-                        # p 태그 안에서 ball_645 클래스를 포함한 span 요소들 찾기
-                        p_element = win_div.find('p')
-                        ball_spans = []
-                        if p_element:
-                            ball_spans = p_element.select('span[class*="ball_645"]')
-                        
-                        if len(ball_spans) >= 6:
-                            for i in range(6):
-                                try:
-                                    number = int(ball_spans[i].text.strip())
-                                    numbers.append(number)
-                                except ValueError:
-                                    logger.error(f"번호 파싱 실패: {ball_spans[i].text}")
-                                    continue
-                            
-                            # 보너스번호 추출
-                            bonus_div = nums_div.find('div', class_='num bonus')
-                            if bonus_div:
-                                bonus_p = bonus_div.find('p')
-                                bonus_span = None
-                                if bonus_p:
-                                    bonus_spans = bonus_p.select('span[class*="ball_645"]')
-                                    bonus_span = bonus_spans[0] if bonus_spans else None
-                                if bonus_span:
-                                    try:
-                                        bonus_number = int(bonus_span.text.strip())
-                                        
-                                        # 추첨일 추출
-                                        date_element = win_result_div.find('p', class_='desc')
-                                        draw_date = self.get_kst_now().strftime('%Y-%m-%d')  # 기본값
-                                        
-                                        if date_element:
-                                            date_text = date_element.text.strip()
-                                            date_match = re.search(r'\((\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일', date_text)
-                                            if date_match:
-                                                year, month, day = date_match.groups()
-                                                draw_date = f"{year}-{month.zfill(2)}-{day.zfill(2)}"
-                                        
-                                        # 1등 당첨 정보 추출
-                                        first_winners = 0
-                                        first_amount = 0
-                                        
-                                        prize_table = soup.find('table', class_='tbl_data tbl_data_col')
-                                        if prize_table:
-                                            rows = prize_table.find_all('tr')
-                                            for row in rows[1:]:  # 헤더 제외
-                                                cells = row.find_all(['td', 'th'])
-                                                if cells and len(cells) >= 4:
-                                                    cell_texts = [cell.get_text().strip() for cell in cells]
-                                                    # 1등인지 확인
-                                                    if '1등' in cell_texts[0]:
-                                                        try:
-                                                            # 당첨게임 수 (당첨자 수)
-                                                            winners_match = re.search(r'(\d+)', cell_texts[2])
-                                                            if winners_match:
-                                                                first_winners = int(winners_match.group(1))
-                                                            
-                                                            # 1게임당 당첨금액
-                                                            amount_match = re.search(r'([\d,]+)', cell_texts[3])
-                                                            if amount_match:
-                                                                amount_str = amount_match.group(1).replace(',', '')
-                                                                first_amount = int(amount_str)
-                                                            
-                                                            logger.info(f"{draw_number}회차 1등 정보: {first_winners}명, {first_amount:,}원")
-                                                            break
-                                                        except (ValueError, IndexError) as e:
-                                                            logger.warning(f"{draw_number}회차 1등 정보 파싱 실패: {str(e)}")
-                                        
-                                        logger.info(f"{draw_number}회차 스크래핑 성공: {numbers} + {bonus_number}, 날짜: {draw_date}, 1등: {first_winners}명/{first_amount:,}원")
-                                        
-                                        return {
-                                            'draw_number': draw_number,
-                                            'draw_date': draw_date,
-                                            'numbers': numbers,
-                                            'bonus_number': bonus_number,
-                                            'first_winners': first_winners,
-                                            'first_amount': first_amount
-                                        }
-                                    except ValueError:
-                                        logger.error(f"보너스번호 파싱 실패: {bonus_span.text}")
-                
-                logger.warning(f"{draw_number}회차 시도 {attempt + 1}: 당첨번호를 완전히 추출하지 못했습니다.")
-                
-            except requests.exceptions.RequestException as e:
-                logger.warning(f"{draw_number}회차 시도 {attempt + 1} 네트워크 오류: {str(e)}")
-            except Exception as e:
-                logger.warning(f"{draw_number}회차 시도 {attempt + 1} 파싱 오류: {str(e)}")
-            
-            # 재시도 전 대기
-            if attempt < max_retries - 1:
-                import asyncio
-                await asyncio.sleep(retry_delay * (attempt + 1))
-        
-        logger.error(f"{draw_number}회차: 모든 시도가 실패했습니다.")
-        return None
+        """단일 회차 데이터 스크래핑 (실패 시 None)"""
+        try:
+            return await draw_scraper.scrape_draw(draw_number)
+        except Exception as e:
+            logger.error(f"{draw_number}회차: 모든 시도가 실패했습니다. ({e})")
+            return None
     
     def _calculate_purchase_dates(self, draw_date: date) -> tuple[date, date]:
         """
@@ -503,9 +360,23 @@ class AutoUpdater:
         
         return purchase_start, purchase_end
         
-    def _insert_new_draws(self, db: Session, new_draws: List[dict]):
-        """새로운 데이터를 DB에 입력 (구매기간 포함)"""
-        for draw_data in new_draws:
+    def _insert_new_draws(self, db: Session, new_draws: List[dict], dummy_min_draw: int = 0) -> List[int]:
+        """
+        새로운 데이터를 DB에 입력 (구매기간 포함).
+        
+        모든 회차를 한 트랜잭션에서 입력하고 한 번만 커밋한다.
+        회차별로 SAVEPOINT를 두어 한 회차 입력이 실패해도 나머지는 입력된다.
+        
+        Args:
+            db: 데이터베이스 세션
+            new_draws: 수집한 회차 데이터
+            dummy_min_draw: 이 회차 이상만 자동 더미 데이터 생성 (누락 회차 복구용)
+        
+        Returns:
+            List[int]: 입력된 회차 번호
+        """
+        inserted = []
+        for draw_data in sorted(new_draws, key=lambda d: d['draw_number']):
             try:
                 # 추첨일을 기준으로 구매기간 자동 계산
                 draw_date = draw_data['draw_date']
@@ -514,40 +385,79 @@ class AutoUpdater:
                     draw_date = datetime.strptime(draw_date, '%Y-%m-%d').date()
                 purchase_start, purchase_end = self._calculate_purchase_dates(draw_date)
                 
-                new_draw = LottoDraw(
-                    draw_number=draw_data['draw_number'],
-                    draw_date=draw_date,
-                    purchase_start_date=purchase_start,
-                    purchase_end_date=purchase_end,
-                    number_1=draw_data['numbers'][0],
-                    number_2=draw_data['numbers'][1],
-                    number_3=draw_data['numbers'][2],
-                    number_4=draw_data['numbers'][3],
-                    number_5=draw_data['numbers'][4],
-                    number_6=draw_data['numbers'][5],
-                    bonus_number=draw_data['bonus_number'],
-                    first_winners=draw_data.get('first_winners', 0),
-                    first_amount=draw_data.get('first_amount', 0)
-                )
-                db.add(new_draw)
-                db.commit()
-                logger.info(f"{draw_data['draw_number']}회차가 성공적으로 입력되었습니다. (구매기간: {purchase_start} ~ {purchase_end})")
-                
-                # ✅ 자동 더미 데이터 생성 (새 회차 저장 후, 설정이 활성화된 경우)
-                if self.auto_dummy_config.get('enabled', True):
-                    self._generate_auto_dummy_data(db, draw_data['draw_number'], draw_data)
-                    self.auto_dummy_config['last_generated_draw'] = draw_data['draw_number']
-                    self.auto_dummy_config['last_generated_at'] = self.get_kst_now().isoformat()
+                with db.begin_nested():
+                    new_draw = LottoDraw(
+                        draw_number=draw_data['draw_number'],
+                        draw_date=draw_date,
+                        purchase_start_date=purchase_start,
+                        purchase_end_date=purchase_end,
+                        number_1=draw_data['numbers'][0],
+                        number_2=draw_data['numbers'][1],
+                        number_3=draw_data['numbers'][2],
+                        number_4=draw_data['numbers'][3],
+                        number_5=draw_data['numbers'][4],
+                        number_6=draw_data['numbers'][5],
+                        bonus_number=draw_data['bonus_number'],
+                        first_winners=draw_data.get('first_winners', 0),
+                        first_amount=draw_data.get('first_amount', 0)
+                    )
+                    db.add(new_draw)
+                    db.flush()
+                    # 번호별 누적 통계를 같은 트랜잭션에서 갱신
+                    apply_number_stats(db, new_draw.draw_number, new_draw.numbers, new_draw.bonus_number)
+                    # 무결성 검사 기준 체크섬
+                    record_checksum(db, new_draw)
+                inserted.append(draw_data)
+                logger.info(f"{draw_data['draw_number']}회차 입력 준비 완료 (구매기간: {purchase_start} ~ {purchase_end})")
                 
             except Exception as e:
-                db.rollback()
                 logger.error(f"{draw_data['draw_number']}회차 입력 실패: {str(e)}")
+        
+        if not inserted:
+            return []
+        
+        # 새로 마감된 회차의 추천 통계 롤업을 같은 트랜잭션에서 기록
+        try:
+            with db.begin_nested():
+                refresh_draw_rollups(db, commit=False)
+        except Exception as e:
+            logger.error(f"추천 통계 롤업 갱신 실패: {str(e)}")
+        
+        try:
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.error(f"회차 일괄 입력 커밋 실패: {str(e)}")
+            return []
+        logger.info(f"{len(inserted)}개 회차가 성공적으로 입력되었습니다: {[d['draw_number'] for d in inserted]}")
+        
+        # 메모리 당첨번호 스냅샷/조회 응답 캐시 무효화 (다음 요청 시 재적재)
+        draw_history.invalidate()
+        lotto_response_cache.invalidate()
+        
+        # ✅ 자동 더미 데이터 생성 (새 회차 저장 후, 설정이 활성화된 경우)
+        if self.auto_dummy_config.get('enabled', True):
+            for draw_data in inserted:
+                if draw_data['draw_number'] < dummy_min_draw:
+                    continue
+                self._generate_auto_dummy_data(db, draw_data['draw_number'], draw_data)
+                # 이미 마감된 회차(여러 회차 일괄 입력)라면 롤업에 더미 데이터 반영
+                refresh_draw_rollup(db, draw_data['draw_number'])
+                self.auto_dummy_config['last_generated_draw'] = draw_data['draw_number']
+                self.auto_dummy_config['last_generated_at'] = self.get_kst_now().isoformat()
+        
+        # ML 추론 특성 캐시 즉시 갱신 (첫 ML 요청이 재계산 비용을 부담하지 않도록)
+        try:
+            inference_features.refresh(db)
+        except Exception as e:
+            logger.warning(f"추론 특성 캐시 갱신 실패 (요청 시 재계산됨): {str(e)}")
+        
+        return [draw_data['draw_number'] for draw_data in inserted]
     
     def _generate_auto_dummy_data(self, db: Session, draw_number: int, draw_data: dict):
         """자동 더미 데이터 생성 (데이터 업데이트 후 자동 실행)"""
         try:
             # 이미 이 회차의 더미 데이터가 있는지 확인 (중복 생성 방지)
-            from ..models.public_recommendation import PublicRecommendation
             existing_dummy = db.query(PublicRecommendation).filter(
                 PublicRecommendation.draw_number == draw_number,
                 PublicRecommendation.is_dummy == True
@@ -591,20 +501,10 @@ class AutoUpdater:
             ]
             bonus_number = draw_data['bonus_number']
             
-            # 3️⃣ 구매 기간 날짜 생성 (추첨일 기준 일주일)
+            # 3️⃣ 추첨일 (구매 날짜는 추첨일 기준 일주일 중 랜덤)
             draw_date = draw_data['draw_date']
-            if isinstance(draw_date, str):
-                draw_date = datetime.strptime(draw_date, '%Y-%m-%d').date()
-            
-            purchase_dates = []
-            for i in range(7):
-                date_obj = draw_date - timedelta(days=6 - i)
-                purchase_dates.append(date_obj)
-            
-            # 4️⃣ 더미 데이터 생성
-            created_count = 0
             
-            # 등수별 데이터 생성
+            # 4️⃣ 더미 데이터 생성 (튜플 행으로 만들어 COPY/다중 행 INSERT로 대량 입력)
             rank_data = {
                 1: rank_1_count,
                 2: rank_2_count,
@@ -612,69 +512,16 @@ class AutoUpdater:
                 4: rank_4_count,
                 5: rank_5_count
             }
-            
-            for rank, count in rank_data.items():
-                for i in range(count):
-                    # 등수별 번호 조합 생성
-                    numbers, matched_numbers, matched_count = self._generate_winning_combination(
-                        winning_numbers, bonus_number, rank
-                    )
-                    
-                    # 랜덤 구매 날짜 선택
-                    random_purchase_date = random.choice(purchase_dates)
-                    
-                    # 더미 데이터 생성
-                    dummy_data = PublicRecommendation(
-                        numbers=numbers,
-                        generation_method="ai",
-                        confidence_score=random.randint(70, 95),
-                        analysis_data={"is_dummy": True, "auto_generated": True, "rank": rank},
-                        draw_number=draw_number,
-                        user_type="member",
-                        is_dummy=True,
-                        winning_rank=rank,
-                        matched_count=matched_count,
-                        matched_numbers=matched_numbers,
-                        winning_amount=1000000 if rank == 1 else 0,
-                        created_at=random_purchase_date
-                    )
-                    
-                    db.add(dummy_data)
-                    created_count += 1
-            
-            # 미당첨 데이터 생성
-            for i in range(no_win_count):
-                # 미당첨: 0-2개 일치
-                match_count = random.randint(0, 2)
-                if match_count == 0:
-                    numbers = random.sample([n for n in range(1, 46) if n not in winning_numbers], 6)
-                    matched_numbers = []
-                else:
-                    base_numbers = random.sample(winning_numbers, match_count)
-                    other_numbers = random.sample([n for n in range(1, 46) if n not in winning_numbers], 6 - match_count)
-                    numbers = base_numbers + other_numbers
-                    matched_numbers = base_numbers
-                
-                # 랜덤 구매 날짜 선택
-                random_purchase_date = random.choice(purchase_dates)
-                
-                dummy_data = PublicRecommendation(
-                    numbers=numbers,
-                    generation_method="ai",
-                    confidence_score=random.randint(50, 85),
-                    analysis_data={"is_dummy": True, "auto_generated": True, "rank": 0},
-                    draw_number=draw_number,
-                    user_type="member",
-                    is_dummy=True,
-                    winning_rank=None,
-                    matched_count=match_count,
-                    matched_numbers=matched_numbers,
-                    winning_amount=0,
-                    created_at=random_purchase_date
-                )
-                
-                db.add(dummy_data)
-                created_count += 1
+            rows = build_dummy_rows(
+                draw_number,
+                winning_numbers,
+                bonus_number,
+                draw_date,
+                rank_data,
+                no_win_count,
+                auto_generated=True
+            )
+            created_count = bulk_insert_dummy_rows(db, rows)
             
             # DB 저장
             db.commit()
@@ -686,54 +533,6 @@ class AutoUpdater:
             logger.error(f"❌ {draw_number}회차 자동 더미 데이터 생성 실패: {str(e)}")
             import traceback
             logger.error(f"상세 오류: {traceback.format_exc()}")
-    
-    def _generate_winning_combination(self, winning_numbers: List[int], bonus_number: int, rank: int) -> tuple[List[int], List[int], int]:
-        """등수별 번호 조합 생성
-        
-        반환값: (번호들, 일치한 번호들, 일치 개수)
-        """
-        if rank == 1:
-            # 1등: 6개 모두 일치
-            return winning_numbers.copy(), winning_numbers.copy(), 6
-        
-        elif rank == 2:
-            # 2등: 5개 일치 + 보너스 번호
-            base_numbers = random.sample(winning_numbers, 5)
-            numbers = base_numbers + [bonus_number]
-            return numbers, base_numbers, 5
-        
-        elif rank == 3:
-            # 3등: 5개 일치 (보너스 번호 제외)
-            base_numbers = random.sample(winning_numbers, 5)
-            other_numbers = [n for n in range(1, 46) if n not in winning_numbers and n != bonus_number]
-            numbers = base_numbers + random.sample(other_numbers, 1)
-            return numbers, base_numbers, 5
-        
-        elif rank == 4:
-            # 4등: 4개 일치
-            base_numbers = random.sample(winning_numbers, 4)
-            other_numbers = [n for n in range(1, 46) if n not in winning_numbers]
-            numbers = base_numbers + random.sample(other_numbers, 2)
-            return numbers, base_numbers, 4
-        
-        elif rank == 5:
-            # 5등: 3개 일치
-            base_numbers = random.sample(winning_numbers, 3)
-            other_numbers = [n for n in range(1, 46) if n not in winning_numbers]
-            numbers = base_numbers + random.sample(other_numbers, 3)
-            return numbers, base_numbers, 3
-        
-        else:
-            # 미당첨: 0-2개 일치
-            match_count = random.randint(0, 2)
-            if match_count == 0:
-                numbers = random.sample([n for n in range(1, 46) if n not in winning_numbers], 6)
-                return numbers, [], 0
-            else:
-                base_numbers = random.sample(winning_numbers, match_count)
-                other_numbers = random.sample([n for n in range(1, 46) if n not in winning_numbers], 6 - match_count)
-                numbers = base_numbers + other_numbers
-                return numbers, base_numbers, match_count
 
 # 전역 인스턴스
 auto_updater = AutoUpdater()
@@ -0,0 +1,126 @@
+"""
+Weighted Combination Sampler
+
+번호별 가중치로 (N, 6) 조합 배치를 한 번에 비복원 추출하는 NumPy 샘플러.
+
+- Gumbel-top-k: log(가중치)에 Gumbel 잡음을 더해 행마다 상위 k개를 고르면
+  가중치 비례 순차 비복원 추출과 같은 분포가 된다
+- 포함 번호는 고정 열로, 제외 번호는 후보 풀에서 빼는 방식으로 구성 단계에서 반영
+- 조합은 NumberMask와 같은 비트 배치(번호 n → 비트 n)의 64비트 정수로 묶어 중복 제거
+"""
+
+from typing import Iterable, Optional
+
+import numpy as np
+
+
+# ============================================================================
+# Constants
+# ============================================================================
+
+TOTAL_NUMBERS = 45
+COMBINATION_SIZE = 6
+MIN_BATCH_SIZE = 64
+
+
+# ============================================================================
+# Bitmask Helpers
+# ============================================================================
+
+def combination_masks(candidates: np.ndarray) -> np.ndarray:
+    """
+    조합 배열을 64비트 번호 마스크로 변환 (번호 n → 비트 n, NumberMask.bits와 동일).
+
+    Args:
+        candidates: (N, k) 번호 배열 (1~45)
+
+    Returns:
+        np.ndarray: int64 마스크 (shape: (N,))
+    """
+    candidates = np.asarray(candidates, dtype=np.int64)
+    return np.bitwise_or.reduce(np.left_shift(np.int64(1), candidates), axis=1)
+
+
+def first_unique_rows(candidates: np.ndarray) -> np.ndarray:
+    """중복 조합을 제거하되 처음 나온 순서를 유지"""
+    _, first_index = np.unique(combination_masks(candidates), return_index=True)
+    return candidates[np.sort(first_index)]
+
+
+# ============================================================================
+# Gumbel-top-k Sampling
+# ============================================================================
+
+def gumbel_top_k(log_weights: np.ndarray, k: int, size: int, rng: np.random.Generator) -> np.ndarray:
+    """
+    가중치 비례 비복원 추출을 size번 동시에 수행.
+
+    Args:
+        log_weights: 후보별 log 가중치 (shape: (m,), -inf는 선택되지 않음)
+        k: 행마다 뽑을 개수 (k <= 유한 가중치 개수)
+        size: 추출 횟수
+        rng: 난수 생성기
+
+    Returns:
+        np.ndarray: 선택된 후보 인덱스 (shape: (size, k), 행 내 순서 무작위)
+    """
+    if k == 0:
+        return np.empty((size, 0), dtype=np.int64)
+
+    keys = log_weights + rng.gumbel(size=(size, log_weights.shape[0]))
+    return np.argpartition(-keys, k - 1, axis=1)[:, :k]
+
+
+def sample_combinations(
+    number_weights: np.ndarray,
+    count: int,
+    include_numbers: Optional[Iterable[int]] = None,
+    exclude_numbers: Optional[Iterable[int]] = None,
+    rng: Optional[np.random.Generator] = None,
+    max_draws: Optional[int] = None
+) -> np.ndarray:
+    """
+    번호별 가중치로 서로 다른 6개 번호 조합을 최대 count개 추출.
+
+    Args:
+        number_weights: 번호별 가중치 (shape: (46,), 인덱스 = 번호, 0번 무시)
+        count: 원하는 고유 조합 수
+        include_numbers: 모든 조합에 반드시 포함할 번호
+        exclude_numbers: 어떤 조합에도 포함하지 않을 번호
+        rng: 난수 생성기 (기본값: 새 default_rng)
+        max_draws: 총 추출 한도 (기본값: count * 10)
+
+    Returns:
+        np.ndarray: (<= count, 6) int64 배열, 각 행 오름차순, 처음 뽑힌 순서 유지
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+    if max_draws is None:
+        max_draws = count * 10
+
+    fixed = np.array(sorted(set(include_numbers or [])), dtype=np.int64)
+    blocked = set(fixed.tolist()) | set(exclude_numbers or [])
+    pool = np.array([n for n in range(1, TOTAL_NUMBERS + 1) if n not in blocked], dtype=np.int64)
+    free_count = COMBINATION_SIZE - fixed.shape[0]
+
+    if free_count < 0 or pool.shape[0] < free_count:
+        return np.empty((0, COMBINATION_SIZE), dtype=np.int64)
+
+    with np.errstate(divide='ignore'):
+        log_weights = np.log(np.asarray(number_weights, dtype=np.float64)[pool])
+
+    samples = np.empty((0, COMBINATION_SIZE), dtype=np.int64)
+    unique_rows = samples
+    drawn = 0
+
+    while unique_rows.shape[0] < count and drawn < max_draws:
+        batch_size = min(max(2 * (count - unique_rows.shape[0]), MIN_BATCH_SIZE), max_draws - drawn)
+
+        picked = pool[gumbel_top_k(log_weights, free_count, batch_size, rng)]
+        batch = np.concatenate([np.broadcast_to(fixed, (batch_size, fixed.shape[0])), picked], axis=1)
+        samples = np.concatenate([samples, np.sort(batch, axis=1)])
+        drawn += batch_size
+
+        unique_rows = first_unique_rows(samples)
+
+    return unique_rows[:count]
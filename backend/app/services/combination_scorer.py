@@ -0,0 +1,268 @@
+"""
+Batch Combination Scorer
+
+(N, 6) 후보 조합 배열을 NumPy 열 연산으로 한 번에 채점하는 통계 엔진용 스코어러.
+RecommendationEngine의 조합별 점수 함수(_calculate_pattern_score,
+_calculate_balance_score 등)와 동일한 연산 순서를 따르므로 랜덤 변동을 제외한
+점수가 기존 구현과 정확히 일치한다.
+"""
+
+from typing import Optional, Tuple
+
+import numpy as np
+
+
+# ============================================================================
+# Constants
+# ============================================================================
+
+COMBINATION_SIZE = 6
+THEORETICAL_MEAN = 23  # (1 + 45) / 2
+
+# 종합 점수 가중치 (개별 40% + 패턴 35% + 균형 25%)
+INDIVIDUAL_WEIGHT = 0.40
+PATTERN_WEIGHT = 0.35
+BALANCE_WEIGHT = 0.25
+
+# 과거 패턴 유사도 점수 (현재 고정값)
+HISTORICAL_SIMILARITY_SCORE = 0.8
+
+# 신뢰도 랜덤 변동 범위 (±10%)
+JITTER_LOW = 0.9
+JITTER_HIGH = 1.1
+
+CONFIDENCE_MIN = 0.15
+CONFIDENCE_MAX = 0.65
+
+
+# ============================================================================
+# Helper Functions
+# ============================================================================
+
+def _tiered(values: np.ndarray, thresholds, scores, default: float) -> np.ndarray:
+    """값이 임계값 이하인 첫 구간의 점수를 부여 (if/elif 체인의 벡터화)"""
+    conditions = [values <= threshold for threshold in thresholds]
+    return np.select(conditions, scores, default=default)
+
+
+def _sum_columns(values: np.ndarray) -> np.ndarray:
+    """열을 왼쪽부터 차례로 더함 (파이썬 sum()과 같은 부동소수점 합산 순서)"""
+    total = values[:, 0].astype(np.float64)
+    for column in range(1, values.shape[1]):
+        total = total + values[:, column]
+    return total
+
+
+def as_candidate_array(combinations) -> np.ndarray:
+    """
+    조합 목록을 행 단위로 정렬된 (N, 6) int64 배열로 변환.
+
+    Args:
+        combinations: 번호 리스트들의 시퀀스 또는 (N, 6) 배열
+
+    Returns:
+        np.ndarray: 각 행이 오름차순으로 정렬된 후보 배열
+    """
+    candidates = np.asarray(combinations, dtype=np.int64).reshape(-1, COMBINATION_SIZE)
+    return np.sort(candidates, axis=1)
+
+
+# ============================================================================
+# Pattern Scores
+# ============================================================================
+
+def calculate_pattern_scores(candidates: np.ndarray) -> np.ndarray:
+    """
+    조합 패턴 점수 일괄 계산 (홀짝, 구간분포, 연속번호, 간격균형, 끝자리분포).
+
+    Args:
+        candidates: 행 단위로 정렬된 (N, 6) 후보 배열
+
+    Returns:
+        np.ndarray: 패턴 점수 (shape: (N,))
+    """
+    # 1. 홀짝 균형 (3:3 → 1.0, 2:4/4:2 → 0.8, 그 외 0.5)
+    odd_count = (candidates % 2 == 1).sum(axis=1)
+    odd_even_score = np.select(
+        [odd_count == 3, (odd_count == 2) | (odd_count == 4)],
+        [1.0, 0.8],
+        default=0.5
+    )
+
+    # 2. 구간 분포 (1-15, 16-30, 31-45 각 2개 → 1.0, 차이 1 이하 → 0.8, 그 외 0.6)
+    range_1 = (candidates <= 15).sum(axis=1)
+    range_2 = ((candidates >= 16) & (candidates <= 30)).sum(axis=1)
+    range_3 = (candidates >= 31).sum(axis=1)
+    is_even_split = (range_1 == 2) & (range_2 == 2) & (range_3 == 2)
+    is_near_split = (
+        (np.abs(range_1 - range_2) <= 1) &
+        (np.abs(range_2 - range_3) <= 1) &
+        (np.abs(range_1 - range_3) <= 1)
+    )
+    range_score = np.select([is_even_split, is_near_split], [1.0, 0.8], default=0.6)
+
+    # 3. 연속 번호 (연속 쌍 0개 → 1.0, 1개 → 0.8, 2개 → 0.6, 3개 이상 → 0.3)
+    gaps = np.diff(candidates, axis=1)
+    consecutive_count = (gaps == 1).sum(axis=1)
+    consecutive_score = _tiered(consecutive_count, [0, 1, 2], [1.0, 0.8, 0.6], default=0.3)
+
+    # 4. 간격 균형 (간격 표준편차 ≤2 → 1.0, ≤4 → 0.8, ≤6 → 0.6, 그 외 0.4)
+    gap_count = gaps.shape[1]
+    mean_gap = gaps.sum(axis=1) / gap_count
+    gap_variance = _sum_columns((gaps - mean_gap[:, None]) ** 2) / gap_count
+    # std ≤ k ⇔ variance ≤ k² (제곱근 계산 없이 동일한 구간 판정)
+    gap_balance_score = _tiered(gap_variance, [4, 16, 36], [1.0, 0.8, 0.6], default=0.4)
+
+    # 5. 끝자리 분포 (고유 끝자리 6개 → 1.0, 5개 → 0.8, 4개 → 0.6, 그 외 0.4)
+    endings = np.sort(candidates % 10, axis=1)
+    unique_endings = 1 + (np.diff(endings, axis=1) != 0).sum(axis=1)
+    ending_score = np.select(
+        [unique_endings == 6, unique_endings == 5, unique_endings == 4],
+        [1.0, 0.8, 0.6],
+        default=0.4
+    )
+
+    return (
+        odd_even_score * 0.25 +
+        range_score * 0.25 +
+        consecutive_score * 0.20 +
+        gap_balance_score * 0.20 +
+        ending_score * 0.10
+    )
+
+
+# ============================================================================
+# Balance Scores
+# ============================================================================
+
+def calculate_balance_scores(candidates: np.ndarray) -> np.ndarray:
+    """
+    통계적 균형 점수 일괄 계산 (평균 편차, 분산, 극값 범위, 과거 유사도).
+
+    Args:
+        candidates: 행 단위로 정렬된 (N, 6) 후보 배열
+
+    Returns:
+        np.ndarray: 균형 점수 (shape: (N,))
+    """
+    size = candidates.shape[1]
+    mean = candidates.sum(axis=1) / size
+
+    # 1. 평균 편차 (|평균 - 23| ≤2 → 1.0, ≤4 → 0.8, ≤6 → 0.6, 그 외 0.4)
+    deviation = np.abs(mean - THEORETICAL_MEAN)
+    mean_score = _tiered(deviation, [2, 4, 6], [1.0, 0.8, 0.6], default=0.4)
+
+    # 2. 분산 (50~200 → 1.0, 30~250 → 0.8, 20~300 → 0.6, 그 외 0.4)
+    variance = _sum_columns((candidates - mean[:, None]) ** 2) / size
+    variance_score = np.select(
+        [
+            (variance >= 50) & (variance <= 200),
+            (variance >= 30) & (variance <= 250),
+            (variance >= 20) & (variance <= 300),
+        ],
+        [1.0, 0.8, 0.6],
+        default=0.4
+    )
+
+    # 3. 극값 범위 (20~35 → 1.0, 15~40 → 0.8, 10~44 → 0.6, 그 외 0.4)
+    range_size = candidates[:, -1] - candidates[:, 0]
+    extreme_score = np.select(
+        [
+            (range_size >= 20) & (range_size <= 35),
+            (range_size >= 15) & (range_size <= 40),
+            (range_size >= 10) & (range_size <= 44),
+        ],
+        [1.0, 0.8, 0.6],
+        default=0.4
+    )
+
+    return (
+        mean_score * 0.30 +
+        variance_score * 0.25 +
+        extreme_score * 0.25 +
+        HISTORICAL_SIMILARITY_SCORE * 0.20
+    )
+
+
+# ============================================================================
+# Confidence Normalization
+# ============================================================================
+
+def normalize_confidence(adjusted_scores: np.ndarray) -> np.ndarray:
+    """
+    종합 점수를 15~65% 범위의 현실적인 신뢰도 분포로 변환.
+
+    Args:
+        adjusted_scores: 랜덤 변동이 적용된 종합 점수
+
+    Returns:
+        np.ndarray: 신뢰도 점수 (0.15~0.65)
+    """
+    normalized = np.select(
+        [
+            adjusted_scores > 0.85,   # 매우 우수한 조합: 55-65%
+            adjusted_scores > 0.70,   # 우수한 조합: 45-55%
+            adjusted_scores > 0.50,   # 양호한 조합: 32-45%
+            adjusted_scores > 0.30,   # 보통 조합: 22-32%
+        ],
+        [
+            0.55 + (adjusted_scores - 0.85) * 0.67,
+            0.45 + (adjusted_scores - 0.70) * 0.67,
+            0.32 + (adjusted_scores - 0.50) * 0.65,
+            0.22 + (adjusted_scores - 0.30) * 0.50,
+        ],
+        default=0.15 + adjusted_scores * 0.23  # 낮은 조합: 15-22%
+    )
+    return np.minimum(CONFIDENCE_MAX, np.maximum(CONFIDENCE_MIN, normalized))
+
+
+# ============================================================================
+# Batch Scoring
+# ============================================================================
+
+def score_combinations_batch(
+    candidates: np.ndarray,
+    number_scores: np.ndarray,
+    rng: Optional[np.random.Generator] = None,
+    score_table=None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    후보 조합 배열의 종합 점수와 신뢰도를 한 번에 계산.
+
+    Args:
+        candidates: 행 단위로 정렬된 (N, 6) 후보 배열
+        number_scores: 번호별 기본 점수 (shape: (46,), 인덱스 = 번호)
+        rng: 랜덤 변동용 난수 생성기 (기본값: 새 default_rng)
+        score_table: 적재된 CombinationScoreTable (있으면 패턴/균형 점수를 계산 대신 조회)
+
+    Returns:
+        Tuple of (total_scores, confidence_scores), 각각 shape (N,)
+    """
+    if candidates.shape[0] == 0:
+        return np.empty(0), np.empty(0)
+
+    if rng is None:
+        rng = np.random.default_rng()
+
+    # 1단계: 번호별 개별 점수 평균
+    individual_scores = _sum_columns(number_scores[candidates]) / COMBINATION_SIZE
+
+    # 2~3단계: 패턴 점수, 균형 점수 (사전 계산 테이블이 있으면 O(1) 조회)
+    if score_table is not None and score_table.is_loaded:
+        pattern_scores, balance_scores = score_table.lookup(candidates)
+    else:
+        pattern_scores = calculate_pattern_scores(candidates)
+        balance_scores = calculate_balance_scores(candidates)
+
+    # 4단계: 가중 합산
+    total_scores = (
+        individual_scores * INDIVIDUAL_WEIGHT +
+        pattern_scores * PATTERN_WEIGHT +
+        balance_scores * BALANCE_WEIGHT
+    )
+
+    # 5단계: 랜덤 변동(±10%) 후 신뢰도 정규화
+    jitter = rng.uniform(JITTER_LOW, JITTER_HIGH, size=total_scores.shape[0])
+    confidence_scores = normalize_confidence(total_scores * jitter)
+
+    return total_scores, confidence_scores
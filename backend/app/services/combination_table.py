@@ -0,0 +1,257 @@
+"""
+Combination Score Table
+
+가능한 모든 로또 조합 C(45,6) = 8,145,060개의 정적 점수(패턴 점수, 균형 점수)를
+colex 순위(조합 번호 체계) 순서로 미리 계산해 둔 메모리 매핑 테이블.
+
+- 패턴 점수는 0.005 단위, 균형 점수는 0.01 단위 값만 가지므로
+  각각 ×200, ×100 한 uint8 코드로 손실 없이 저장한다 (행당 2바이트, 약 16MB)
+- 서버 시작 시 파일을 mmap으로 열어 재계산 없이 O(1) 조회한다
+- 테이블 생성은 build_combination_table_script.py로 수행한다
+"""
+
+import logging
+import os
+from math import comb
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from .combination_scorer import (
+    BALANCE_WEIGHT,
+    COMBINATION_SIZE,
+    PATTERN_WEIGHT,
+    calculate_balance_scores,
+    calculate_pattern_scores,
+)
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# Constants
+# ============================================================================
+
+TOTAL_NUMBERS = 45
+TOTAL_COMBINATIONS = comb(TOTAL_NUMBERS, COMBINATION_SIZE)  # 8,145,060
+
+TABLE_VERSION = 1
+PATTERN_SCALE = 200  # 패턴 점수 양자화 배율 (0.005 단위)
+BALANCE_SCALE = 100  # 균형 점수 양자화 배율 (0.01 단위)
+BUILD_CHUNK_SIZE = 500_000
+
+_APP_DIR = Path(__file__).resolve().parent.parent
+TABLE_DIR = _APP_DIR / "models" / "tables"
+DEFAULT_TABLE_PATH = TABLE_DIR / f"combination_scores_v{TABLE_VERSION}.npy"
+
+# _BINOMIAL[a, k] = C(a, k)  (a: 0-based 번호, k: 1~6)
+_BINOMIAL = np.array(
+    [[comb(a, k) for k in range(COMBINATION_SIZE + 1)] for a in range(TOTAL_NUMBERS)],
+    dtype=np.int64
+)
+
+
+# ============================================================================
+# Combinatorial Number System (colex rank)
+# ============================================================================
+
+def rank_combinations(candidates: np.ndarray) -> np.ndarray:
+    """
+    행 단위로 정렬된 조합을 colex 순위로 변환.
+
+    rank = Σ C(n_i - 1, i + 1)  (n_0 < n_1 < ... < n_5, 번호는 1~45)
+
+    Args:
+        candidates: 행 단위로 정렬된 (N, 6) 번호 배열
+
+    Returns:
+        np.ndarray: 0 ~ TOTAL_COMBINATIONS-1 범위의 순위 (shape: (N,))
+    """
+    candidates = np.asarray(candidates, dtype=np.int64).reshape(-1, COMBINATION_SIZE)
+    ranks = np.zeros(candidates.shape[0], dtype=np.int64)
+    for position in range(COMBINATION_SIZE):
+        ranks += _BINOMIAL[candidates[:, position] - 1, position + 1]
+    return ranks
+
+
+def unrank_combinations(ranks: np.ndarray) -> np.ndarray:
+    """
+    colex 순위를 행 단위로 정렬된 조합으로 변환 (rank_combinations의 역함수).
+
+    Args:
+        ranks: 0 ~ TOTAL_COMBINATIONS-1 범위의 순위 배열
+
+    Returns:
+        np.ndarray: (N, 6) 번호 배열 (각 행 오름차순)
+    """
+    remaining = np.asarray(ranks, dtype=np.int64).copy()
+    candidates = np.empty((remaining.shape[0], COMBINATION_SIZE), dtype=np.int64)
+
+    # 가장 큰 원소부터: C(a, k) <= rank 를 만족하는 최대 a 선택
+    for k in range(COMBINATION_SIZE, 0, -1):
+        column = _BINOMIAL[:, k]
+        element = np.searchsorted(column, remaining, side='right') - 1
+        candidates[:, k - 1] = element + 1
+        remaining -= column[element]
+
+    return candidates
+
+
+# ============================================================================
+# Table Builder
+# ============================================================================
+
+def build_score_table(path: Optional[str] = None, chunk_size: int = BUILD_CHUNK_SIZE) -> str:
+    """
+    전체 조합의 정적 점수 테이블 생성 (오프라인 작업).
+
+    Args:
+        path: 저장 경로 (기본값: models/tables/combination_scores_v1.npy)
+        chunk_size: 한 번에 채점할 조합 수
+
+    Returns:
+        str: 생성된 테이블 파일 경로
+    """
+    table_path = Path(path) if path else DEFAULT_TABLE_PATH
+    table_path.parent.mkdir(parents=True, exist_ok=True)
+
+    # 임시 파일에 작성 후 교체 (서비스 중인 mmap 파일을 덮어쓰지 않도록)
+    tmp_path = table_path.with_name(table_path.name + ".tmp")
+    table = np.lib.format.open_memmap(
+        tmp_path, mode='w+', dtype=np.uint8, shape=(TOTAL_COMBINATIONS, 2)
+    )
+
+    for start in range(0, TOTAL_COMBINATIONS, chunk_size):
+        stop = min(start + chunk_size, TOTAL_COMBINATIONS)
+        candidates = unrank_combinations(np.arange(start, stop, dtype=np.int64))
+        table[start:stop, 0] = np.rint(calculate_pattern_scores(candidates) * PATTERN_SCALE)
+        table[start:stop, 1] = np.rint(calculate_balance_scores(candidates) * BALANCE_SCALE)
+
+    table.flush()
+    del table
+    os.replace(tmp_path, table_path)
+
+    return str(table_path)
+
+
+# ============================================================================
+# CombinationScoreTable
+# ============================================================================
+
+class CombinationScoreTable:
+    """
+    메모리 매핑된 조합 정적 점수 테이블.
+
+    테이블 파일이 없으면 is_loaded가 False이며, 호출자는 배치 스코어러로
+    직접 계산하는 경로를 사용한다.
+    """
+
+    def __init__(self):
+        self._table: Optional[np.ndarray] = None
+        self._path: Optional[str] = None
+        self._top_ranks: Dict[float, np.ndarray] = {}
+
+    @property
+    def is_loaded(self) -> bool:
+        """테이블 적재 여부"""
+        return self._table is not None
+
+    @property
+    def path(self) -> Optional[str]:
+        """적재된 테이블 파일 경로"""
+        return self._path
+
+    def load(self, path: Optional[str] = None) -> bool:
+        """
+        테이블 파일을 mmap으로 연다.
+
+        Args:
+            path: 테이블 파일 경로 (기본값: DEFAULT_TABLE_PATH)
+
+        Returns:
+            bool: 적재 성공 여부 (파일이 없거나 형식이 다르면 False)
+        """
+        table_path = Path(path) if path else DEFAULT_TABLE_PATH
+        if not table_path.exists():
+            logger.info(f"조합 점수 테이블이 없습니다: {table_path}")
+            return False
+
+        table = np.load(table_path, mmap_mode='r')
+        if table.shape != (TOTAL_COMBINATIONS, 2) or table.dtype != np.uint8:
+            logger.warning(f"조합 점수 테이블 형식이 올바르지 않습니다: {table_path} {table.shape} {table.dtype}")
+            return False
+
+        self._table = table
+        self._path = str(table_path)
+        self._top_ranks = {}
+        logger.info(f"조합 점수 테이블 적재 완료: {table_path}")
+        return True
+
+    def unload(self) -> None:
+        """테이블 해제"""
+        self._table = None
+        self._path = None
+        self._top_ranks = {}
+
+    def lookup(self, candidates: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        조합별 패턴 점수와 균형 점수 조회.
+
+        Args:
+            candidates: 행 단위로 정렬된 (N, 6) 번호 배열
+
+        Returns:
+            Tuple of (pattern_scores, balance_scores), 각각 shape (N,)
+        """
+        if self._table is None:
+            raise RuntimeError("조합 점수 테이블이 적재되지 않았습니다")
+
+        codes = self._table[rank_combinations(candidates)]
+        return codes[:, 0] / PATTERN_SCALE, codes[:, 1] / BALANCE_SCALE
+
+    def static_scores(self, candidates: np.ndarray) -> np.ndarray:
+        """조합별 정적 점수 (패턴 35% + 균형 25%) 조회"""
+        pattern_scores, balance_scores = self.lookup(candidates)
+        return pattern_scores * PATTERN_WEIGHT + balance_scores * BALANCE_WEIGHT
+
+    def sample_top(
+        self,
+        count: int,
+        percentile: float = 1.0,
+        rng: Optional[np.random.Generator] = None
+    ) -> np.ndarray:
+        """
+        정적 점수 상위 percentile(%) 조합 중에서 균등 추출.
+
+        Args:
+            count: 추출할 조합 수 (상위 조합 수보다 크면 상위 조합 전체)
+            percentile: 상위 비율 (%, 기본값 1.0)
+            rng: 난수 생성기
+
+        Returns:
+            np.ndarray: (count, 6) 번호 배열 (중복 없음)
+        """
+        if self._table is None:
+            raise RuntimeError("조합 점수 테이블이 적재되지 않았습니다")
+        if rng is None:
+            rng = np.random.default_rng()
+
+        top_ranks = self._get_top_ranks(percentile)
+        size = min(count, top_ranks.shape[0])
+        picked = rng.choice(top_ranks, size=size, replace=False)
+        return unrank_combinations(picked)
+
+    def _get_top_ranks(self, percentile: float) -> np.ndarray:
+        """상위 percentile(%) 조합의 순위 목록 (percentile별 캐싱)"""
+        if percentile not in self._top_ranks:
+            # 정수 코드 합으로 비교 (패턴 35% : 균형 25% = 코드 기준 7 : 10)
+            codes = self._table.astype(np.int32)
+            static_codes = codes[:, 0] * 7 + codes[:, 1] * 10
+            threshold = np.percentile(static_codes, 100.0 - percentile)
+            self._top_ranks[percentile] = np.flatnonzero(static_codes >= threshold)
+        return self._top_ranks[percentile]
+
+
+# 전역 인스턴스
+combination_scores = CombinationScoreTable()
@@ -0,0 +1,179 @@
+"""
+Draw Integrity
+
+lotto_draws 테이블의 무결성 검사 모듈.
+
+- 누락 회차: 1..상한 회차 번호 시리즈와 lotto_draws의 안티 조인 쿼리 한 번으로 찾는다
+  (PostgreSQL은 generate_series, 그 외(SQLite 테스트)는 재귀 CTE)
+- 체크섬: 회차 행의 내용(추첨일, 번호, 보너스, 1등 정보)을 SHA-256으로 요약해
+  lotto_draw_checksums 매니페스트와 비교한다. 매니페스트가 없는 행은 첫 검사 때 기록한다
+- 누락 회차 재수집/입력은 AutoUpdater.repair_missing_draws가 담당한다
+"""
+
+import hashlib
+import logging
+from datetime import datetime
+from typing import Iterable, List, Optional
+
+import pytz
+from sqlalchemy import func, literal, select
+from sqlalchemy.orm import Session
+
+from ..models.draw_checksum import DrawChecksum
+from ..models.lotto import LottoDraw
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# Checksums
+# ============================================================================
+
+def draw_checksum(draw) -> str:
+    """
+    회차 행 체크섬.
+
+    Args:
+        draw: draw_number, draw_date, number_1~6, bonus_number, first_winners,
+            first_amount 속성을 가진 객체 (LottoDraw 또는 조회 행)
+    """
+    draw_date = draw.draw_date.isoformat() if draw.draw_date else ""
+    numbers = ",".join(str(getattr(draw, f"number_{i}")) for i in range(1, 7))
+    canonical = (
+        f"{draw.draw_number}|{draw_date}|{numbers}|{draw.bonus_number}"
+        f"|{draw.first_winners or 0}|{draw.first_amount or 0}"
+    )
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def record_checksum(db: Session, draw: LottoDraw) -> None:
+    """회차 체크섬을 매니페스트에 기록 (있으면 갱신, 커밋하지 않음)"""
+    db.merge(DrawChecksum(draw_number=draw.draw_number, checksum=draw_checksum(draw)))
+
+
+def delete_checksums(db: Session, draw_numbers: Iterable[int]) -> None:
+    """삭제된 회차의 매니페스트 제거 (커밋하지 않음)"""
+    db.query(DrawChecksum).filter(
+        DrawChecksum.draw_number.in_(list(draw_numbers))
+    ).delete(synchronize_session=False)
+
+
+# ============================================================================
+# Missing Draws
+# ============================================================================
+
+def _number_series(dialect_name: str, upper: int):
+    """1..upper 회차 번호 시리즈 (컬럼 n)"""
+    if dialect_name == "postgresql":
+        return func.generate_series(1, upper).table_valued("n").alias("series")
+
+    series = select(literal(1).label("n")).cte("series", recursive=True)
+    return series.union_all(select(series.c.n + 1).where(series.c.n < upper))
+
+
+def missing_draws_query(dialect_name: str, upper: int):
+    """1..upper 중 lotto_draws에 없는 회차 조회문"""
+    series = _number_series(dialect_name, upper)
+    return (
+        select(series.c.n)
+        .outerjoin(LottoDraw, LottoDraw.draw_number == series.c.n)
+        .where(LottoDraw.draw_number.is_(None))
+        .order_by(series.c.n)
+    )
+
+
+def find_missing_draws(db: Session, upper: Optional[int] = None) -> List[int]:
+    """
+    누락 회차 조회.
+
+    Args:
+        db: 데이터베이스 세션
+        upper: 검사 상한 회차 (기본값: DB 최신 회차, 사이트 최신 회차를 넘기면 끝부분 누락도 포함)
+    """
+    if upper is None:
+        upper = db.scalar(select(func.max(LottoDraw.draw_number))) or 0
+    if upper < 1:
+        return []
+    query = missing_draws_query(db.get_bind().dialect.name, upper)
+    return [row[0] for row in db.execute(query)]
+
+
+# ============================================================================
+# Scan
+# ============================================================================
+
+_CHECKSUM_COLUMNS = (
+    LottoDraw.draw_number,
+    LottoDraw.draw_date,
+    LottoDraw.number_1,
+    LottoDraw.number_2,
+    LottoDraw.number_3,
+    LottoDraw.number_4,
+    LottoDraw.number_5,
+    LottoDraw.number_6,
+    LottoDraw.bonus_number,
+    LottoDraw.first_winners,
+    LottoDraw.first_amount,
+)
+
+
+class DrawIntegrityScanner:
+    """누락 회차 + 체크섬 검사기 (마지막 보고서 보관)"""
+
+    def __init__(self):
+        self.last_report: Optional[dict] = None
+
+    def scan(self, db: Session, latest_draw: Optional[int] = None, record_new: bool = True) -> dict:
+        """
+        무결성 검사.
+
+        Args:
+            db: 데이터베이스 세션
+            latest_draw: 사이트 최신 회차 (알면 DB 최신 회차보다 큰 경우 상한으로 사용)
+            record_new: 매니페스트에 없는 행의 체크섬을 기록하고 커밋
+
+        Returns:
+            dict: 검사 보고서 (missing_draws, mismatched_draws, recorded_checksums 등)
+        """
+        db_latest = db.scalar(select(func.max(LottoDraw.draw_number))) or 0
+        upper = max(db_latest, latest_draw or 0)
+        missing = find_missing_draws(db, upper)
+
+        rows = db.execute(
+            select(*_CHECKSUM_COLUMNS, DrawChecksum.checksum)
+            .outerjoin(DrawChecksum, DrawChecksum.draw_number == LottoDraw.draw_number)
+            .order_by(LottoDraw.draw_number)
+        ).all()
+
+        mismatched = []
+        unrecorded = []
+        for row in rows:
+            checksum = draw_checksum(row)
+            if row.checksum is None:
+                unrecorded.append(DrawChecksum(draw_number=row.draw_number, checksum=checksum))
+            elif row.checksum != checksum:
+                mismatched.append(row.draw_number)
+
+        if record_new and unrecorded:
+            db.add_all(unrecorded)
+            db.commit()
+
+        if missing or mismatched:
+            logger.warning(f"회차 무결성 문제 발견 - 누락: {missing}, 체크섬 불일치: {mismatched}")
+
+        report = {
+            "scanned_at": datetime.now(pytz.timezone('Asia/Seoul')).isoformat(),
+            "db_latest_draw": db_latest,
+            "checked_upto": upper,
+            "total_draws": len(rows),
+            "missing_draws": missing,
+            "mismatched_draws": mismatched,
+            "recorded_checksums": len(unrecorded) if record_new else 0,
+            "is_healthy": not missing and not mismatched,
+        }
+        self.last_report = report
+        return report
+
+
+# 전역 인스턴스
+draw_integrity = DrawIntegrityScanner()
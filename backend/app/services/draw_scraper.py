@@ -0,0 +1,339 @@
+"""
+Draw Scraper
+
+동행복권 당첨결과 페이지에서 회차별 당첨번호를 수집하는 비동기 스크래퍼.
+
+- 공유 HTTP 클라이언트(http_clients)로 요청하며 이벤트 루프를 막지 않는다
+- 동시 요청 수(concurrency)와 호스트별 초당 요청 수(rate_per_second)를 제한해
+  장애 후 여러 회차를 따라잡을 때도 사이트에 부담을 주지 않는다
+- 네트워크 오류, 재시도 대상 응답, 불완전한 페이지를 하나의 재시도 정책(지수 백오프 + 지터)으로 처리
+- HTML 파싱(BeautifulSoup)은 scraper 작업 풀에서 실행한다
+"""
+
+import asyncio
+import logging
+import re
+import time
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import httpx
+import pytz
+from bs4 import BeautifulSoup
+
+from ..config import settings
+from .executors import scraper_executor
+from .http_clients import NO_RETRY, HTTPClientManager, RetryPolicy, http_clients
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# Constants
+# ============================================================================
+
+DRAW_RESULT_URL = "https://www.dhlottery.co.kr/gameResult.do?method=byWin"
+
+SCRAPER_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'ko-KR,ko;q=0.9,en;q=0.8',
+    # 봇 트래픽 필터링 대응: 당첨결과 페이지에서 조회한 것처럼 보냄
+    # (POST 폼의 Content-Type은 httpx가 data= 인자로 application/x-www-form-urlencoded를 설정)
+    'Referer': DRAW_RESULT_URL,
+}
+
+PAGE_ENCODING = 'euc-kr'
+
+
+class IncompletePageError(ValueError):
+    """페이지에서 요청한 회차의 당첨번호를 모두 찾지 못함 (재시도 대상)"""
+
+
+# ============================================================================
+# Parsing
+# ============================================================================
+
+def _draw_number_from(win_result_div) -> Optional[int]:
+    """win_result div의 h4 > strong ("1186회")에서 회차 추출"""
+    h4_element = win_result_div.find('h4')
+    strong_element = h4_element.find('strong') if h4_element else None
+    if strong_element:
+        match = re.search(r'(\d+)', strong_element.text.strip())
+        if match:
+            return int(match.group(1))
+    return None
+
+
+def _ball_numbers(num_div) -> List[int]:
+    p_element = num_div.find('p') if num_div else None
+    if not p_element:
+        return []
+    return [int(span.text.strip()) for span in p_element.select('span[class*="ball_645"]')]
+
+
+def _first_prize(soup: BeautifulSoup, draw_number: int) -> Tuple[int, int]:
+    """1등 (당첨자 수, 1게임당 당첨금액) 추출 (없으면 0, 0)"""
+    prize_table = soup.find('table', class_='tbl_data tbl_data_col')
+    if not prize_table:
+        return 0, 0
+
+    for row in prize_table.find_all('tr')[1:]:  # 헤더 제외
+        cell_texts = [cell.get_text().strip() for cell in row.find_all(['td', 'th'])]
+        if len(cell_texts) < 4 or '1등' not in cell_texts[0]:
+            continue
+        try:
+            winners_match = re.search(r'(\d+)', cell_texts[2])
+            amount_match = re.search(r'([\d,]+)', cell_texts[3])
+            first_winners = int(winners_match.group(1)) if winners_match else 0
+            first_amount = int(amount_match.group(1).replace(',', '')) if amount_match else 0
+            return first_winners, first_amount
+        except (ValueError, IndexError) as e:
+            logger.warning(f"{draw_number}회차 1등 정보 파싱 실패: {str(e)}")
+            break
+    return 0, 0
+
+
+def parse_latest_draw_number(content: bytes) -> int:
+    """
+    당첨결과 첫 페이지에서 최신 회차 추출.
+
+    Raises:
+        IncompletePageError: 회차 정보를 찾을 수 없는 경우
+    """
+    soup = BeautifulSoup(content.decode(PAGE_ENCODING, errors='replace'), 'html.parser')
+
+    win_result_div = soup.find('div', class_='win_result')
+    latest_draw = _draw_number_from(win_result_div) if win_result_div else None
+    if latest_draw is not None:
+        return latest_draw
+
+    # 백업 방법: select 옵션에서 최신 회차 확인
+    draw_select = soup.find('select', {'id': 'dwrNoList'})
+    first_option = draw_select.find('option') if draw_select else None
+    if first_option:
+        draw_text = first_option.get('value', '').strip()
+        if draw_text.isdigit():
+            return int(draw_text)
+
+    raise IncompletePageError("HTML 구조에서 회차 정보를 찾을 수 없습니다")
+
+
+def parse_draw_page(content: bytes, draw_number: int, default_date: Optional[str] = None) -> dict:
+    """
+    회차 당첨결과 페이지 파싱.
+
+    Args:
+        content: 응답 본문 (EUC-KR)
+        draw_number: 요청한 회차
+        default_date: 추첨일을 찾지 못했을 때 사용할 날짜 (YYYY-MM-DD)
+
+    Returns:
+        dict: draw_number, draw_date, numbers, bonus_number, first_winners, first_amount
+
+    Raises:
+        IncompletePageError: 다른 회차 페이지이거나 당첨번호를 모두 찾지 못한 경우
+    """
+    soup = BeautifulSoup(content.decode(PAGE_ENCODING, errors='replace'), 'html.parser')
+
+    win_result_div = soup.find('div', class_='win_result')
+    if not win_result_div:
+        raise IncompletePageError(f"{draw_number}회차: win_result div를 찾을 수 없습니다")
+
+    page_draw = _draw_number_from(win_result_div)
+    if page_draw is not None and page_draw != draw_number:
+        raise IncompletePageError(f"요청한 {draw_number}회차와 응답 {page_draw}회차가 다릅니다")
+
+    nums_div = win_result_div.find('div', class_='nums')
+    try:
+        numbers = _ball_numbers(nums_div.find('div', class_='num win') if nums_div else None)[:6]
+        bonus = _ball_numbers(nums_div.find('div', class_='num bonus') if nums_div else None)[:1]
+    except ValueError as e:
+        raise IncompletePageError(f"{draw_number}회차 번호 파싱 실패: {e}") from None
+    if len(numbers) < 6 or not bonus:
+        raise IncompletePageError(f"{draw_number}회차: 당첨번호를 완전히 추출하지 못했습니다")
+
+    draw_date = default_date
+    date_element = win_result_div.find('p', class_='desc')
+    if date_element:
+        date_match = re.search(r'\((\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일', date_element.text.strip())
+        if date_match:
+            year, month, day = date_match.groups()
+            draw_date = f"{year}-{month.zfill(2)}-{day.zfill(2)}"
+
+    first_winners, first_amount = _first_prize(soup, draw_number)
+
+    return {
+        'draw_number': draw_number,
+        'draw_date': draw_date,
+        'numbers': numbers,
+        'bonus_number': bonus[0],
+        'first_winners': first_winners,
+        'first_amount': first_amount
+    }
+
+
+# ============================================================================
+# Rate Limiting
+# ============================================================================
+
+class HostRateLimiter:
+    """
+    호스트별 요청 간격 제한 (rate_per_second가 0 이하면 제한 없음).
+
+    이벤트 루프 안에서만 호출되므로 다음 요청 시각 예약에 잠금이 필요 없다.
+    """
+
+    def __init__(self, rate_per_second: float, clock: Callable[[], float] = time.monotonic):
+        self.interval = 1.0 / rate_per_second if rate_per_second > 0 else 0.0
+        self._clock = clock
+        self._next_slot: Dict[str, float] = {}
+
+    async def acquire(self, host: str) -> None:
+        """다음 요청 시각까지 대기"""
+        if self.interval <= 0:
+            return
+        now = self._clock()
+        slot = max(now, self._next_slot.get(host, now))
+        self._next_slot[host] = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+# ============================================================================
+# DrawScraper Class
+# ============================================================================
+
+class DrawScraper:
+    """
+    회차 당첨번호 비동기 스크래퍼.
+
+    Attributes:
+        url: 당첨결과 페이지 URL
+        concurrency: 동시에 수집할 회차 수
+        retry: 회차/최신 회차 조회 재시도 정책
+    """
+
+    def __init__(
+        self,
+        url: str = DRAW_RESULT_URL,
+        concurrency: int = 4,
+        rate_per_second: float = 2.0,
+        retry: RetryPolicy = RetryPolicy(max_attempts=4, backoff=1.0, backoff_max=15.0),
+        client: Optional[HTTPClientManager] = None
+    ):
+        self.url = url
+        self.concurrency = concurrency
+        self.retry = retry
+        self.rate_limiter = HostRateLimiter(rate_per_second)
+        self._client = client
+
+    @property
+    def client(self) -> HTTPClientManager:
+        return self._client or http_clients
+
+    async def _fetch(self, method: str, **kwargs) -> bytes:
+        """요청 1회 (재시도는 호출자의 단일 정책에서 처리)"""
+        await self.rate_limiter.acquire(httpx.URL(self.url).host)
+        response = await self.client.request(
+            method,
+            self.url,
+            headers=SCRAPER_HEADERS,
+            retry=NO_RETRY,
+            idempotent=True,
+            **kwargs
+        )
+        response.raise_for_status()
+        return response.content
+
+    def _is_retryable(self, error: Exception) -> bool:
+        if isinstance(error, httpx.HTTPStatusError):
+            return error.response.status_code in self.retry.retry_statuses
+        return isinstance(error, (httpx.TransportError, IncompletePageError))
+
+    async def _with_retry(self, label: str, attempt_once):
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                return await attempt_once()
+            except Exception as e:
+                if not self._is_retryable(e) or attempt >= self.retry.max_attempts:
+                    raise
+                delay = self.retry.delay(attempt)
+                logger.warning(f"{label} 시도 {attempt}/{self.retry.max_attempts} 실패, {delay:.1f}초 후 재시도: {e}")
+                await asyncio.sleep(delay)
+
+    async def fetch_latest_draw_number(self) -> int:
+        """
+        사이트 최신 회차 조회.
+
+        Raises:
+            httpx.HTTPError, IncompletePageError: 모든 시도가 실패한 경우
+        """
+        async def attempt_once():
+            content = await self._fetch("GET")
+            return await scraper_executor.run(parse_latest_draw_number, content)
+
+        return await self._with_retry("최신 회차 조회", attempt_once)
+
+    async def scrape_draw(self, draw_number: int) -> dict:
+        """
+        단일 회차 수집.
+
+        Raises:
+            httpx.HTTPError, IncompletePageError: 모든 시도가 실패한 경우
+        """
+        default_date = datetime.now(pytz.timezone('Asia/Seoul')).strftime('%Y-%m-%d')
+
+        async def attempt_once():
+            content = await self._fetch("POST", data={'drwNo': str(draw_number)})
+            return await scraper_executor.run(parse_draw_page, content, draw_number, default_date)
+
+        return await self._with_retry(f"{draw_number}회차 수집", attempt_once)
+
+    async def scrape_range(self, start_draw: int, end_draw: int) -> Tuple[List[dict], List[int]]:
+        """
+        회차 범위 동시 수집.
+
+        Returns:
+            Tuple of (회차 순으로 정렬된 수집 결과, 실패한 회차 목록)
+        """
+        return await self.scrape_draws(range(start_draw, end_draw + 1))
+
+    async def scrape_draws(self, draw_numbers: Iterable[int]) -> Tuple[List[dict], List[int]]:
+        """
+        지정한 회차들 동시 수집 (무결성 검사에서 찾은 누락 회차 복구용).
+
+        Returns:
+            Tuple of (회차 순으로 정렬된 수집 결과, 실패한 회차 목록)
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def scrape(draw_number: int) -> Optional[dict]:
+            async with semaphore:
+                try:
+                    return await self.scrape_draw(draw_number)
+                except Exception as e:
+                    logger.error(f"{draw_number}회차: 모든 시도가 실패했습니다. ({e})")
+                    return None
+
+        draw_numbers = sorted(set(draw_numbers))
+        results = await asyncio.gather(*(scrape(n) for n in draw_numbers))
+
+        scraped = [draw for draw in results if draw is not None]
+        failed = [n for n, draw in zip(draw_numbers, results) if draw is None]
+        logger.info(f"스크래핑 완료: 성공 {len(scraped)}개, 실패 {len(failed)}개")
+        return scraped, failed
+
+
+# 전역 인스턴스
+draw_scraper = DrawScraper(
+    concurrency=settings.scraper_concurrency,
+    rate_per_second=settings.scraper_rate_per_second,
+    retry=RetryPolicy(
+        max_attempts=settings.scraper_max_attempts,
+        backoff=settings.scraper_backoff,
+        backoff_max=settings.scraper_backoff_max
+    )
+)
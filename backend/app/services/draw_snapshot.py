@@ -0,0 +1,174 @@
+"""
+Draw History Snapshot
+
+lotto_draws 테이블 전체를 (n_draws, 7) NumPy 배열로 메모리에 보관하는
+프로세스 전역 스냅샷. 읽기 전용 통계(빈도, 간격, 트렌드)는 모두 이 스냅샷에서
+계산되며, 새 회차가 커밋될 때만 무효화된다.
+"""
+
+import threading
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+
+import numpy as np
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+
+# ============================================================================
+# Constants
+# ============================================================================
+
+# number_1 ~ number_6 + bonus_number
+SNAPSHOT_COLUMNS = 7
+MAIN_NUMBER_COUNT = 6
+
+_LOAD_QUERY = text("""
+    SELECT draw_number, number_1, number_2, number_3, number_4, number_5, number_6, bonus_number
+    FROM lotto_draws
+    ORDER BY draw_number
+""")
+
+
+# ============================================================================
+# DrawSnapshot
+# ============================================================================
+
+class DrawSnapshot:
+    """
+    특정 시점의 당첨번호 이력 (불변).
+
+    Attributes:
+        version: 스냅샷 버전 (무효화될 때마다 증가)
+        draw_numbers: 회차 번호 배열 (shape: (n_draws,), 오름차순)
+        numbers: 당첨번호 + 보너스 배열 (shape: (n_draws, 7))
+        loaded_at: 스냅샷 생성 시각
+    """
+
+    __slots__ = ('version', 'draw_numbers', 'numbers', 'loaded_at', '_memo')
+
+    def __init__(self, version: int, draw_numbers: np.ndarray, numbers: np.ndarray):
+        self.version = version
+        self.draw_numbers = draw_numbers
+        self.numbers = numbers
+        self.loaded_at = datetime.now()
+        self._memo: Dict[Any, Any] = {}
+
+        # 스냅샷 공유 시 실수로 수정되지 않도록 읽기 전용으로 고정
+        self.draw_numbers.setflags(write=False)
+        self.numbers.setflags(write=False)
+
+    @property
+    def total_draws(self) -> int:
+        """총 추첨 회수"""
+        return int(self.draw_numbers.shape[0])
+
+    @property
+    def latest_draw_number(self) -> int:
+        """최신 회차 번호 (데이터가 없으면 0)"""
+        return int(self.draw_numbers[-1]) if self.total_draws else 0
+
+    @property
+    def main_numbers(self) -> np.ndarray:
+        """보너스를 제외한 당첨번호 6개 (shape: (n_draws, 6))"""
+        return self.numbers[:, :MAIN_NUMBER_COUNT]
+
+    @property
+    def bonus_numbers(self) -> np.ndarray:
+        """보너스 번호 (shape: (n_draws,))"""
+        return self.numbers[:, MAIN_NUMBER_COUNT]
+
+    def memoize(self, key: Any, compute: Callable[[], Any]) -> Any:
+        """
+        스냅샷에서 파생된 값을 캐싱한다.
+
+        스냅샷은 불변이므로 같은 키의 결과는 스냅샷 수명 동안 재사용할 수 있다.
+        반환값은 여러 요청이 공유하므로 호출자는 읽기 전용으로 다뤄야 한다.
+        """
+        try:
+            return self._memo[key]
+        except KeyError:
+            return self._memo.setdefault(key, compute())
+
+
+# ============================================================================
+# DrawHistoryStore
+# ============================================================================
+
+class DrawHistoryStore:
+    """
+    프로세스 전역 당첨번호 스냅샷 저장소.
+
+    - 최초 요청 시 lotto_draws를 한 번 조회하여 스냅샷을 만든다
+    - 이후 요청은 DB 없이 메모리 스냅샷을 사용한다
+    - AutoUpdater가 새 회차를 커밋하면 invalidate()로 다음 요청 때 다시 적재한다
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._snapshot: Optional[DrawSnapshot] = None
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        """현재 스냅샷 버전"""
+        return self._version
+
+    def get(self, db: Session) -> DrawSnapshot:
+        """
+        현재 스냅샷 반환 (없으면 DB에서 적재).
+
+        Args:
+            db: 스냅샷이 없을 때 사용할 데이터베이스 세션
+
+        Returns:
+            DrawSnapshot: 최신 당첨번호 스냅샷
+        """
+        snapshot = self._snapshot
+        if snapshot is not None:
+            return snapshot
+
+        with self._lock:
+            if self._snapshot is not None:
+                return self._snapshot
+            version = self._version
+
+        rows = db.execute(_LOAD_QUERY).fetchall()
+        loaded = self._build_snapshot(version, rows)
+
+        with self._lock:
+            # 적재 중에 무효화되었다면 오래된 데이터이므로 저장하지 않음
+            if self._version == version and self._snapshot is None:
+                self._snapshot = loaded
+        return loaded
+
+    def peek(self) -> Optional[DrawSnapshot]:
+        """DB 조회 없이 현재 적재된 스냅샷 반환 (없으면 None)"""
+        return self._snapshot
+
+    def invalidate(self) -> None:
+        """스냅샷 무효화 (새 회차 커밋 후 호출)"""
+        with self._lock:
+            self._snapshot = None
+            self._version += 1
+
+    @staticmethod
+    def _build_snapshot(version: int, rows) -> DrawSnapshot:
+        """조회 결과를 NumPy 배열 스냅샷으로 변환"""
+        if not rows:
+            return DrawSnapshot(
+                version,
+                np.empty(0, dtype=np.int32),
+                np.empty((0, SNAPSHOT_COLUMNS), dtype=np.int16)
+            )
+
+        raw = np.asarray(rows, dtype=np.int32)
+        return DrawSnapshot(
+            version,
+            np.ascontiguousarray(raw[:, 0]),
+            np.ascontiguousarray(raw[:, 1:], dtype=np.int16)
+        )
+
+
+# 전역 인스턴스
+draw_history = DrawHistoryStore()
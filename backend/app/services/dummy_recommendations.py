@@ -0,0 +1,282 @@
+"""
+Dummy Public Recommendations
+
+회차별 더미 공공 추천 데이터(당첨 통계 시연용 4,000~5,000건)를 ORM 객체 없이
+튜플 행으로 만들어 대량 입력하는 모듈.
+
+- 번호 조합은 등수별로 NumPy 일괄 추출 (당첨번호 k개 + 비당첨 번호 6-k개)
+- PostgreSQL: 세션 트랜잭션 안에서 COPY FROM STDIN으로 배치 스트리밍
+- 그 외(SQLite 테스트 등): insert().values() 다중 행 INSERT 배치
+"""
+
+import csv
+import io
+import json
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy import ARRAY, insert
+from sqlalchemy.orm import Session
+
+from ..models.public_recommendation import PublicRecommendation
+from .combination_sampler import gumbel_top_k
+
+
+# ============================================================================
+# Constants
+# ============================================================================
+
+# 입력 컬럼 순서 (행 튜플 순서와 동일)
+DUMMY_COLUMNS = (
+    'numbers',
+    'generation_method',
+    'confidence_score',
+    'analysis_data',
+    'draw_number',
+    'user_type',
+    'is_dummy',
+    'winning_rank',
+    'matched_count',
+    'matched_numbers',
+    'winning_amount',
+    'created_at',
+)
+
+# 등수별 당첨번호 일치 개수 (2등은 5개 + 보너스 번호)
+RANK_MATCH_COUNTS = {1: 6, 2: 5, 3: 5, 4: 4, 5: 3}
+
+# 미당첨 조합의 당첨번호 일치 개수 범위 (0~2개)
+NO_WIN_MAX_MATCHES = 2
+
+# 신뢰도 범위 (당첨 조합 70~95, 미당첨 조합 50~85)
+WINNER_CONFIDENCE_RANGE = (70, 95)
+NO_WIN_CONFIDENCE_RANGE = (50, 85)
+
+FIRST_PRIZE_DUMMY_AMOUNT = 1000000
+
+# 구매 기간 (추첨일 포함 7일)
+PURCHASE_PERIOD_DAYS = 7
+
+COPY_BATCH_SIZE = 5000
+INSERT_BATCH_SIZE = 500
+
+DummyRow = Tuple
+
+
+# ============================================================================
+# Row Generation
+# ============================================================================
+
+def _random_subsets(pool: np.ndarray, k: int, size: int, rng: np.random.Generator) -> np.ndarray:
+    """pool에서 비복원 k개 추출을 size번 수행 (shape: (size, k))"""
+    return pool[gumbel_top_k(np.zeros(pool.shape[0]), k, size, rng)]
+
+
+def _rank_combinations(
+    rank: int,
+    count: int,
+    winning: np.ndarray,
+    bonus_number: int,
+    rng: np.random.Generator
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    등수별 (번호 조합, 당첨번호 일치 개수) 일괄 생성.
+
+    번호는 기존 생성 방식과 같이 [일치한 당첨번호..., 나머지 번호...] 순서이며
+    일치한 당첨번호는 각 행의 앞 matched_count개이다.
+    rank가 1~5가 아니면 미당첨 패턴(0~2개 일치)으로 생성한다.
+    """
+    numbers = np.empty((count, 6), dtype=np.int64)
+    all_numbers = np.arange(1, 46)
+    others = np.setdiff1d(all_numbers, winning)
+
+    if rank in RANK_MATCH_COUNTS:
+        matches = np.full(count, RANK_MATCH_COUNTS[rank], dtype=np.int64)
+        match_count = RANK_MATCH_COUNTS[rank]
+        numbers[:, :match_count] = _random_subsets(winning, match_count, count, rng)
+        if rank == 2:
+            numbers[:, 5] = bonus_number
+        elif match_count < 6:
+            # 3등은 보너스 번호를 제외해야 2등과 구분됨
+            pool = others[others != bonus_number] if rank == 3 else others
+            numbers[:, match_count:] = _random_subsets(pool, 6 - match_count, count, rng)
+        return numbers, matches
+
+    matches = rng.integers(0, NO_WIN_MAX_MATCHES + 1, size=count)
+    for match_count in range(NO_WIN_MAX_MATCHES + 1):
+        rows = np.flatnonzero(matches == match_count)
+        if rows.size == 0:
+            continue
+        numbers[rows, :match_count] = _random_subsets(winning, match_count, rows.size, rng)
+        numbers[rows, match_count:] = _random_subsets(others, 6 - match_count, rows.size, rng)
+    return numbers, matches
+
+
+def purchase_dates_for(draw_date) -> List[date]:
+    """추첨일 기준 구매 기간 날짜 목록 (추첨일 6일 전 ~ 추첨일)"""
+    if isinstance(draw_date, str):
+        draw_date = datetime.strptime(draw_date, '%Y-%m-%d').date()
+    return [draw_date - timedelta(days=PURCHASE_PERIOD_DAYS - 1 - i) for i in range(PURCHASE_PERIOD_DAYS)]
+
+
+def build_dummy_rows(
+    draw_number: int,
+    winning_numbers: Sequence[int],
+    bonus_number: int,
+    draw_date,
+    rank_counts: Dict[int, int],
+    no_win_count: int,
+    auto_generated: bool = False,
+    rng: Optional[np.random.Generator] = None
+) -> Iterator[DummyRow]:
+    """
+    더미 공공 추천 행 튜플 생성 (DUMMY_COLUMNS 순서).
+
+    Args:
+        draw_number: 회차
+        winning_numbers: 당첨번호 6개
+        bonus_number: 보너스 번호
+        draw_date: 추첨일 (구매일은 추첨일 기준 일주일 중 랜덤)
+        rank_counts: 등수별 생성 개수
+        no_win_count: 미당첨 생성 개수
+        auto_generated: 자동 생성 여부 (analysis_data에 기록)
+        rng: 난수 생성기 (기본값: 새 default_rng)
+
+    Yields:
+        DummyRow: 행 튜플
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+
+    winning = np.asarray(winning_numbers, dtype=np.int64)
+    purchase_dates = purchase_dates_for(draw_date)
+
+    groups = [(rank, count, rank) for rank, count in rank_counts.items() if count > 0]
+    if no_win_count > 0:
+        groups.append((0, no_win_count, None))
+
+    for rank, count, winning_rank in groups:
+        numbers, matches = _rank_combinations(rank, count, winning, bonus_number, rng)
+        low, high = WINNER_CONFIDENCE_RANGE if winning_rank is not None else NO_WIN_CONFIDENCE_RANGE
+        confidences = rng.integers(low, high + 1, size=count).tolist()
+        date_indexes = rng.integers(0, len(purchase_dates), size=count).tolist()
+
+        analysis_data = {"is_dummy": True, "rank": rank}
+        if auto_generated:
+            analysis_data = {"is_dummy": True, "auto_generated": True, "rank": rank}
+        winning_amount = FIRST_PRIZE_DUMMY_AMOUNT if rank == 1 else 0
+
+        for row_numbers, match_count, confidence, date_index in zip(
+            numbers.tolist(), matches.tolist(), confidences, date_indexes
+        ):
+            yield (
+                row_numbers,
+                "ai",
+                confidence,
+                analysis_data,
+                draw_number,
+                "member",
+                True,
+                winning_rank,
+                match_count,
+                row_numbers[:match_count],
+                winning_amount,
+                purchase_dates[date_index],
+            )
+
+
+# ============================================================================
+# Bulk Insert
+# ============================================================================
+
+def _batches(rows: Iterable[DummyRow], size: int) -> Iterator[List[DummyRow]]:
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _copy_value(value, is_array: bool):
+    """COPY CSV 필드 값 변환 (None은 빈 필드 = NULL)"""
+    if is_array:
+        # PostgreSQL 배열 리터럴 {1,2,3}
+        return '{' + ','.join(map(str, value)) + '}'
+    if isinstance(value, (dict, list)):
+        return json.dumps(value)
+    if isinstance(value, bool):
+        return 't' if value else 'f'
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+
+def _copy_rows(db: Session, rows: Iterable[DummyRow], batch_size: int) -> int:
+    """PostgreSQL COPY FROM STDIN 배치 스트리밍 (세션 트랜잭션 공유)"""
+    table = PublicRecommendation.__table__
+    array_columns = {
+        index for index, name in enumerate(DUMMY_COLUMNS)
+        if isinstance(table.c[name].type, ARRAY)
+    }
+    statement = (
+        f"COPY {table.name} ({', '.join(DUMMY_COLUMNS)}) "
+        f"FROM STDIN WITH (FORMAT csv)"
+    )
+
+    cursor = db.connection().connection.cursor()
+    inserted = 0
+    try:
+        for batch in _batches(rows, batch_size):
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            for row in batch:
+                writer.writerow([
+                    _copy_value(value, index in array_columns)
+                    for index, value in enumerate(row)
+                ])
+            buffer.seek(0)
+            cursor.copy_expert(statement, buffer)
+            inserted += len(batch)
+    finally:
+        cursor.close()
+    return inserted
+
+
+def _insert_rows(db: Session, rows: Iterable[DummyRow], batch_size: int) -> int:
+    """다중 행 insert().values() 배치 (COPY 미지원 DB용)"""
+    table = PublicRecommendation.__table__
+    # 배열 타입이 없는 DB(SQLite)에서는 ARRAY 컬럼을 비워 둠
+    skip_arrays = db.get_bind().dialect.name != "postgresql"
+    columns = [
+        (index, name) for index, name in enumerate(DUMMY_COLUMNS)
+        if not (skip_arrays and isinstance(table.c[name].type, ARRAY))
+    ]
+
+    inserted = 0
+    for batch in _batches(rows, batch_size):
+        db.execute(insert(table).values([
+            {name: row[index] for index, name in columns}
+            for row in batch
+        ]))
+        inserted += len(batch)
+    return inserted
+
+
+def bulk_insert_dummy_rows(db: Session, rows: Iterable[DummyRow]) -> int:
+    """
+    더미 추천 행 대량 입력 (커밋하지 않음).
+
+    Args:
+        db: 데이터베이스 세션 (호출자가 커밋/롤백)
+        rows: build_dummy_rows가 만든 행 튜플
+
+    Returns:
+        int: 입력한 행 수
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        return _copy_rows(db, rows, COPY_BATCH_SIZE)
+    return _insert_rows(db, rows, INSERT_BATCH_SIZE)
@@ -0,0 +1,264 @@
+"""
+Bounded Executors
+
+async 라우트에서 호출되는 CPU 작업(bcrypt 해싱, 번호 조합 생성, 랜덤 포레스트 추론,
+당첨결과 HTML 파싱)을 이벤트 루프 밖에서 실행하는 용도별 스레드 풀.
+
+각 풀은 동시 실행 수(max_workers)와 대기열 길이(max_queue)가 제한되어 있어
+요청이 몰리면 무한정 쌓이지 않고 ExecutorSaturatedError로 즉시 거절되며,
+풀별 기본 타임아웃을 넘기면 ExecutorTimeoutError가 발생한다.
+대상 작업은 GIL을 해제하는 네이티브 코드(bcrypt, NumPy, scikit-learn)이거나
+프로세스 내 캐시(당첨번호 스냅샷, 모델)를 공유해야 하므로 프로세스 풀이 아닌 스레드 풀을 사용한다.
+타임아웃이 나도 실행 중인 작업은 멈추지 않으므로, DB가 필요한 작업은 요청 세션 대신
+작업 안에서 자체 세션을 열어야 한다.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Dict, Optional
+
+from ..config import settings
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# Exceptions
+# ============================================================================
+
+class ExecutorSaturatedError(RuntimeError):
+    """실행 중 + 대기 작업 수가 풀 용량을 초과해 작업이 거절됨"""
+
+
+class ExecutorTimeoutError(TimeoutError):
+    """작업이 풀의 타임아웃 안에 완료되지 않음"""
+
+
+# 호출 시 timeout을 지정하지 않으면 풀 기본값 사용
+_DEFAULT_TIMEOUT = object()
+
+
+# ============================================================================
+# BoundedExecutor Class
+# ============================================================================
+
+class BoundedExecutor:
+    """
+    크기와 대기열이 제한된 이름 있는 스레드 풀.
+
+    Attributes:
+        name: 풀 이름 (스레드 이름 접두사, 메트릭 키)
+        max_workers: 동시 실행 스레드 수
+        max_queue: 실행을 기다릴 수 있는 최대 작업 수
+        timeout: 기본 작업 타임아웃 (초, None이면 무제한)
+    """
+
+    def __init__(self, name: str, max_workers: int, max_queue: int, timeout: Optional[float] = None):
+        self.name = name
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.timeout = timeout
+
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+        # 메트릭
+        self._pending = 0      # 실행 중 + 대기 중
+        self._running = 0
+        self._peak_queue_depth = 0
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._rejected = 0
+        self._timed_out = 0
+        self._total_wait = 0.0
+        self._total_run = 0.0
+        self._started = 0
+
+    @property
+    def capacity(self) -> int:
+        """동시에 받아들일 수 있는 최대 작업 수 (실행 + 대기)"""
+        return self.max_workers + self.max_queue
+
+    @property
+    def queue_depth(self) -> int:
+        """실행을 기다리는 작업 수"""
+        with self._lock:
+            return self._pending - self._running
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """스레드 풀 지연 생성 (종료 후 재사용 시 새로 생성)"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix=f"{self.name}-pool"
+            )
+        return self._executor
+
+    def submit(self, fn: Callable, *args, **kwargs) -> Future:
+        """
+        작업 제출.
+
+        Returns:
+            Future: concurrent.futures.Future
+
+        Raises:
+            ExecutorSaturatedError: 실행 + 대기 작업 수가 용량에 도달한 경우
+        """
+        enqueued_at = time.perf_counter()
+
+        def task():
+            started_at = time.perf_counter()
+            with self._lock:
+                self._running += 1
+                self._started += 1
+                self._total_wait += started_at - enqueued_at
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                with self._lock:
+                    self._running -= 1
+                    self._total_run += time.perf_counter() - started_at
+
+        with self._lock:
+            if self._pending >= self.capacity:
+                self._rejected += 1
+                raise ExecutorSaturatedError(
+                    f"{self.name} 작업 풀이 가득 찼습니다 (실행 {self._running}, 대기 {self._pending - self._running})"
+                )
+            self._pending += 1
+            self._submitted += 1
+            self._peak_queue_depth = max(self._peak_queue_depth, self._pending - self._running)
+            future = self._get_executor().submit(task)
+
+        future.add_done_callback(self._on_done)
+        return future
+
+    def _on_done(self, future: Future) -> None:
+        """완료/실패/취소 집계 (대기 중 취소된 작업도 용량에서 제외)"""
+        with self._lock:
+            self._pending -= 1
+            if future.cancelled():
+                return
+            if future.exception() is not None:
+                self._failed += 1
+            else:
+                self._completed += 1
+
+    def _resolve_timeout(self, timeout) -> Optional[float]:
+        return self.timeout if timeout is _DEFAULT_TIMEOUT else timeout
+
+    def _record_timeout(self, timeout: Optional[float]) -> ExecutorTimeoutError:
+        with self._lock:
+            self._timed_out += 1
+        logger.warning(f"{self.name} 작업 타임아웃 ({timeout}초)")
+        return ExecutorTimeoutError(f"{self.name} 작업이 {timeout}초 안에 완료되지 않았습니다")
+
+    def call(self, fn: Callable, *args, timeout=_DEFAULT_TIMEOUT, **kwargs) -> Any:
+        """
+        동기 코드에서 작업을 풀에 제출하고 결과를 기다림.
+
+        Raises:
+            ExecutorSaturatedError: 풀이 가득 찬 경우
+            ExecutorTimeoutError: 타임아웃 초과 (대기 중이면 취소)
+        """
+        timeout = self._resolve_timeout(timeout)
+        future = self.submit(fn, *args, **kwargs)
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            raise self._record_timeout(timeout) from None
+
+    async def run(self, fn: Callable, *args, timeout=_DEFAULT_TIMEOUT, **kwargs) -> Any:
+        """
+        async 라우트에서 작업을 풀에 제출하고 이벤트 루프를 막지 않고 결과를 기다림.
+
+        Raises:
+            ExecutorSaturatedError: 풀이 가득 찬 경우
+            ExecutorTimeoutError: 타임아웃 초과 (대기 중이면 취소)
+        """
+        timeout = self._resolve_timeout(timeout)
+        future = self.submit(fn, *args, **kwargs)
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+        except asyncio.TimeoutError:
+            raise self._record_timeout(timeout) from None
+
+    def status(self) -> Dict[str, Any]:
+        """풀 설정과 대기열/처리 메트릭"""
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "timeout": self.timeout,
+                "running": self._running,
+                "queue_depth": self._pending - self._running,
+                "peak_queue_depth": self._peak_queue_depth,
+                "submitted": self._submitted,
+                "completed": self._completed,
+                "failed": self._failed,
+                "rejected": self._rejected,
+                "timed_out": self._timed_out,
+                "avg_wait_ms": round(self._total_wait * 1000 / self._started, 2) if self._started else 0.0,
+                "avg_run_ms": round(self._total_run * 1000 / self._started, 2) if self._started else 0.0,
+            }
+
+    def shutdown(self, wait: bool = False) -> None:
+        """스레드 풀 종료 (대기 중인 작업은 취소)"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+
+# ============================================================================
+# Pools
+# ============================================================================
+
+# 전역 인스턴스
+auth_executor = BoundedExecutor(
+    "auth",
+    max_workers=settings.auth_executor_workers,
+    max_queue=settings.auth_executor_queue,
+    timeout=settings.auth_executor_timeout
+)
+recommendation_executor = BoundedExecutor(
+    "recommendation",
+    max_workers=settings.recommendation_executor_workers,
+    max_queue=settings.recommendation_executor_queue,
+    timeout=settings.recommendation_executor_timeout
+)
+ml_executor = BoundedExecutor(
+    "ml",
+    max_workers=settings.ml_executor_workers,
+    max_queue=settings.ml_executor_queue,
+    timeout=settings.ml_executor_timeout
+)
+
+scraper_executor = BoundedExecutor(
+    "scraper",
+    max_workers=settings.scraper_executor_workers,
+    max_queue=settings.scraper_executor_queue,
+    timeout=settings.scraper_executor_timeout
+)
+
+EXECUTORS = {
+    executor.name: executor
+    for executor in (auth_executor, recommendation_executor, ml_executor, scraper_executor)
+}
+
+
+def executor_status() -> Dict[str, Dict[str, Any]]:
+    """전체 풀 메트릭 (헬스체크용)"""
+    return {name: executor.status() for name, executor in EXECUTORS.items()}
+
+
+def shutdown_executors(wait: bool = False) -> None:
+    """전체 풀 종료 (애플리케이션 종료 시)"""
+    for executor in EXECUTORS.values():
+        executor.shutdown(wait=wait)
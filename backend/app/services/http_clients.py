@@ -0,0 +1,246 @@
+"""
+HTTP Client Manager
+
+외부 HTTP 호출(카카오/네이버 OAuth, 동행복권 당첨번호 스크래핑)이 공유하는
+애플리케이션 범위 httpx.AsyncClient 관리 모듈.
+
+- FastAPI lifespan에서 start()로 만들고 종료 시 close()로 닫는다
+  (lifespan 밖의 스크립트에서는 첫 요청 때 자동 생성)
+- HTTP/1.1 keep-alive 연결 풀을 재사용해 요청마다 TCP/TLS 연결을 새로 맺지 않는다
+- 호스트별 동시 요청 수 제한, 연결/읽기 타임아웃
+- 재시도: 연결 실패, 타임아웃, 재시도 대상 상태 코드(429, 5xx)에 지수 백오프 + 지터
+  (멱등이 아닌 요청은 요청이 전송되지 않은 연결 실패에만 재시도)
+- 테스트에서는 start(transport=httpx.MockTransport(...))로 네트워크 없이 검증
+"""
+
+import asyncio
+import logging
+import random
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+import httpx
+
+from ..config import settings
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# Retry Policy
+# ============================================================================
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# 요청이 서버에 전송되기 전에 실패한 오류 (어떤 메서드든 재시도 가능)
+_NOT_SENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    재시도 정책.
+
+    Attributes:
+        max_attempts: 최초 요청 포함 최대 시도 횟수
+        backoff: 첫 재시도 대기 시간 기준 (초, 시도마다 2배)
+        backoff_max: 재시도 대기 시간 상한 (초)
+        retry_statuses: 재시도할 응답 상태 코드
+    """
+    max_attempts: int = 3
+    backoff: float = 0.5
+    backoff_max: float = 8.0
+    retry_statuses: Tuple[int, ...] = (429, 500, 502, 503, 504)
+
+    def delay(self, attempt: int) -> float:
+        """attempt번째(1부터) 실패 후 대기 시간 (full jitter)"""
+        return random.uniform(0, min(self.backoff_max, self.backoff * (2 ** (attempt - 1))))
+
+
+NO_RETRY = RetryPolicy(max_attempts=1)
+
+
+# ============================================================================
+# HTTPClientManager Class
+# ============================================================================
+
+class HTTPClientManager:
+    """
+    공유 httpx.AsyncClient와 호스트별 동시 요청 제한, 재시도 정책.
+
+    Attributes:
+        max_connections: 전체 연결 풀 크기
+        max_connections_per_host: 호스트별 동시 요청 수
+        keepalive_expiry: 유휴 keep-alive 연결 유지 시간 (초)
+        timeout: 연결/읽기 타임아웃
+        retry: 기본 재시도 정책
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 20,
+        max_connections_per_host: int = 6,
+        keepalive_expiry: float = 30.0,
+        connect_timeout: float = 5.0,
+        read_timeout: float = 15.0,
+        retry: RetryPolicy = RetryPolicy()
+    ):
+        self.max_connections = max_connections
+        self.max_connections_per_host = max_connections_per_host
+        self.keepalive_expiry = keepalive_expiry
+        self.timeout = httpx.Timeout(read_timeout, connect=connect_timeout)
+        self.retry = retry
+
+        self._client: Optional[httpx.AsyncClient] = None
+        self._host_limits: Dict[str, asyncio.Semaphore] = {}
+
+        # 메트릭
+        self._requests: Dict[str, int] = defaultdict(int)
+        self._retries: Dict[str, int] = defaultdict(int)
+        self._failures: Dict[str, int] = defaultdict(int)
+
+    # ------------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------------
+
+    def start(self, transport: Optional[httpx.AsyncBaseTransport] = None) -> httpx.AsyncClient:
+        """
+        공유 클라이언트 생성 (이미 있으면 그대로 반환).
+
+        Args:
+            transport: 테스트용 전송 계층 (예: httpx.MockTransport)
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                http1=True,
+                http2=False,
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                    keepalive_expiry=self.keepalive_expiry
+                ),
+                transport=transport,
+                follow_redirects=True
+            )
+            self._host_limits.clear()
+        return self._client
+
+    async def close(self) -> None:
+        """공유 클라이언트 종료 (연결 풀 정리)"""
+        client, self._client = self._client, None
+        self._host_limits.clear()
+        if client is not None:
+            await client.aclose()
+
+    @property
+    def is_started(self) -> bool:
+        return self._client is not None
+
+    def _host_limit(self, host: str) -> asyncio.Semaphore:
+        semaphore = self._host_limits.get(host)
+        if semaphore is None:
+            semaphore = self._host_limits[host] = asyncio.Semaphore(self.max_connections_per_host)
+        return semaphore
+
+    # ------------------------------------------------------------------------
+    # Requests
+    # ------------------------------------------------------------------------
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        retry: Optional[RetryPolicy] = None,
+        idempotent: Optional[bool] = None,
+        **kwargs
+    ) -> httpx.Response:
+        """
+        공유 클라이언트로 요청 (호스트별 동시 요청 제한 + 재시도).
+
+        Args:
+            method: HTTP 메서드
+            url: 요청 URL
+            retry: 재시도 정책 (기본값: 관리자 기본 정책)
+            idempotent: 멱등 요청 여부 (기본값: 메서드로 판단).
+                조회용 POST처럼 다시 보내도 안전한 요청은 True로 지정
+            **kwargs: httpx.AsyncClient.request 인자 (params, data, json, headers, timeout 등)
+
+        Returns:
+            httpx.Response: 마지막 응답 (재시도 대상 상태 코드여도 시도를 다 쓰면 그대로 반환)
+
+        Raises:
+            httpx.HTTPError: 모든 시도가 전송/타임아웃 오류로 실패한 경우
+        """
+        policy = retry or self.retry
+        method = method.upper()
+        if idempotent is None:
+            idempotent = method in IDEMPOTENT_METHODS
+
+        client = self.start()
+        host = httpx.URL(url).host
+
+        attempt = 0
+        while True:
+            attempt += 1
+            self._requests[host] += 1
+            try:
+                async with self._host_limit(host):
+                    response = await client.request(method, url, **kwargs)
+            except httpx.TransportError as e:
+                retryable = idempotent or isinstance(e, _NOT_SENT_ERRORS)
+                if not retryable or attempt >= policy.max_attempts:
+                    self._failures[host] += 1
+                    raise
+                logger.warning(f"{method} {host} 요청 실패 (시도 {attempt}/{policy.max_attempts}): {e!r}")
+            else:
+                if (
+                    response.status_code not in policy.retry_statuses
+                    or not idempotent
+                    or attempt >= policy.max_attempts
+                ):
+                    return response
+                logger.warning(f"{method} {host} 응답 {response.status_code} (시도 {attempt}/{policy.max_attempts})")
+                await response.aclose()
+
+            self._retries[host] += 1
+            await asyncio.sleep(policy.delay(attempt))
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("POST", url, **kwargs)
+
+    def status(self) -> dict:
+        """풀 설정과 호스트별 요청/재시도/실패 수"""
+        return {
+            "started": self.is_started,
+            "max_connections": self.max_connections,
+            "max_connections_per_host": self.max_connections_per_host,
+            "hosts": {
+                host: {
+                    "requests": self._requests[host],
+                    "retries": self._retries[host],
+                    "failures": self._failures[host],
+                }
+                for host in self._requests
+            },
+        }
+
+
+# 전역 인스턴스
+http_clients = HTTPClientManager(
+    max_connections=settings.http_max_connections,
+    max_connections_per_host=settings.http_max_connections_per_host,
+    keepalive_expiry=settings.http_keepalive_expiry,
+    connect_timeout=settings.http_connect_timeout,
+    read_timeout=settings.http_read_timeout,
+    retry=RetryPolicy(
+        max_attempts=settings.http_retry_attempts,
+        backoff=settings.http_retry_backoff,
+        backoff_max=settings.http_retry_backoff_max
+    )
+)
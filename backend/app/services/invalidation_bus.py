@@ -0,0 +1,67 @@
+"""
+Invalidation Bus
+
+프로세스 내 캐시 무효화 메시지를 채널별 구독자에게 전달하는 pub/sub 모듈.
+
+여러 워커가 각자 메모리 캐시를 가질 때 한 워커의 변경을 다른 워커에 알리는 통로로,
+현재는 같은 프로세스 안의 구독자에게 동기적으로 전달하는 로컬 구현만 있다.
+워커 간 전달이 필요하면 같은 publish/subscribe 인터페이스로 Redis pub/sub이나
+PostgreSQL LISTEN/NOTIFY 구현을 만들어 전역 인스턴스를 교체한다.
+"""
+
+import logging
+import threading
+from collections import defaultdict
+from typing import Any, Callable, Dict, List
+
+logger = logging.getLogger(__name__)
+
+Subscriber = Callable[[Any], None]
+
+
+class LocalInvalidationBus:
+    """프로세스 내 무효화 pub/sub (구독자 호출은 publish 스레드에서 동기 실행)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers: Dict[str, List[Subscriber]] = defaultdict(list)
+        self._published = 0
+
+    def subscribe(self, channel: str, callback: Subscriber) -> Callable[[], None]:
+        """
+        채널 구독.
+
+        Returns:
+            Callable: 구독 해제 함수
+        """
+        with self._lock:
+            self._subscribers[channel].append(callback)
+
+        def unsubscribe() -> None:
+            with self._lock:
+                if callback in self._subscribers[channel]:
+                    self._subscribers[channel].remove(callback)
+
+        return unsubscribe
+
+    def publish(self, channel: str, message: Any) -> int:
+        """
+        채널에 메시지 발행.
+
+        Returns:
+            int: 메시지를 받은 구독자 수 (구독자 오류는 로그만 남기고 계속 전달)
+        """
+        with self._lock:
+            subscribers = list(self._subscribers.get(channel, ()))
+            self._published += 1
+
+        for callback in subscribers:
+            try:
+                callback(message)
+            except Exception as e:
+                logger.error(f"무효화 메시지 처리 실패 (채널: {channel}): {e}")
+        return len(subscribers)
+
+
+# 전역 인스턴스
+invalidation_bus = LocalInvalidationBus()
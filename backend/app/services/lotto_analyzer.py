@@ -1,84 +1,82 @@
 from typing import Dict, List, Tuple
+import numpy as np
 from sqlalchemy.orm import Session
-from sqlalchemy import text
-from ..models.lotto import LottoDraw
+from .draw_snapshot import DrawSnapshot, draw_history
+from .number_stats import load_frequency_statistics
 
 class LottoAnalyzer:
     def __init__(self, db_session: Session):
         self.db = db_session
     
+    def _snapshot(self) -> DrawSnapshot:
+        """프로세스 전역 당첨번호 스냅샷 반환"""
+        return draw_history.get(self.db)
+    
     def get_total_draws(self) -> int:
         """총 추첨 회수 반환"""
-        return self.db.query(LottoDraw).count()
+        return self._snapshot().total_draws
     
     def get_latest_draw_number(self) -> int:
         """최신 회차 번호 반환"""
-        latest = self.db.query(LottoDraw).order_by(LottoDraw.draw_number.desc()).first()
-        return latest.draw_number if latest else 0
+        return self._snapshot().latest_draw_number
     
     def calculate_frequency_statistics(self) -> Dict[int, dict]:
-        """번호별 출현 빈도 통계"""
-        query = text("""
-        WITH number_frequency AS (
-            SELECT 
-                number,
-                COUNT(*) as total_appearances,
-                MAX(draw_number) as last_appearance
-            FROM (
-                SELECT draw_number, number_1 as number FROM lotto_draws UNION ALL
-                SELECT draw_number, number_2 as number FROM lotto_draws UNION ALL
-                SELECT draw_number, number_3 as number FROM lotto_draws UNION ALL
-                SELECT draw_number, number_4 as number FROM lotto_draws UNION ALL
-                SELECT draw_number, number_5 as number FROM lotto_draws UNION ALL
-                SELECT draw_number, number_6 as number FROM lotto_draws
-            ) all_numbers
-            GROUP BY number
-        )
-        SELECT 
-            number,
-            total_appearances,
-            ROUND(total_appearances * 100.0 / (SELECT COUNT(*) FROM lotto_draws), 2) as frequency_percent,
-            last_appearance,
-            (SELECT MAX(draw_number) FROM lotto_draws) - last_appearance as gap
-        FROM number_frequency
-        ORDER BY number
-        """)
-        
-        result = self.db.execute(query).fetchall()
+        """번호별 출현 빈도 통계 (number_stats 45행 조회, 스냅샷 버전별 캐싱)"""
+        snapshot = self._snapshot()
+        return snapshot.memoize('frequency', lambda: self._load_frequency_statistics(snapshot))
+    
+    def _load_frequency_statistics(self, snapshot: DrawSnapshot) -> Dict[int, dict]:
+        """number_stats 집계 테이블에서 조회 (동기화되지 않았으면 스냅샷에서 계산)"""
+        stats = load_frequency_statistics(self.db, snapshot.total_draws, snapshot.latest_draw_number)
+        if stats is None:
+            stats = self._compute_frequency_statistics(snapshot)
+        return stats
+    
+    @staticmethod
+    def _compute_frequency_statistics(snapshot: DrawSnapshot) -> Dict[int, dict]:
+        """스냅샷에서 번호별 출현 횟수, 마지막 출현 회차, 미출현 간격 계산"""
+        total_draws = snapshot.total_draws
+        if total_draws == 0:
+            return {}
+        
+        flat_numbers = snapshot.main_numbers.ravel()
+        appearances = np.bincount(flat_numbers, minlength=46)
+        
+        # 번호별 마지막 출현 회차 (draw_numbers는 오름차순이므로 최대값이 마지막 출현)
+        last_appearance = np.zeros(46, dtype=np.int64)
+        np.maximum.at(last_appearance, flat_numbers, np.repeat(snapshot.draw_numbers, 6))
+        latest_draw = snapshot.latest_draw_number
         
         stats = {}
-        for row in result:
-            stats[row.number] = {
-                'total_appearances': row.total_appearances,
-                'frequency_percent': row.frequency_percent,
-                'last_appearance': row.last_appearance,
-                'gap_since_last': row.gap
+        for number in np.flatnonzero(appearances):
+            count = int(appearances[number])
+            stats[int(number)] = {
+                'total_appearances': count,
+                'frequency_percent': round(count * 100.0 / total_draws, 2),
+                'last_appearance': int(last_appearance[number]),
+                'gap_since_last': latest_draw - int(last_appearance[number])
             }
         
         return stats
     
     def calculate_recent_trends(self, recent_draws: int = 20) -> Dict[int, dict]:
-        """최근 트렌드 분석"""
-        # 최근 회차 데이터 조회
-        recent_query = text(f"""
-            SELECT number_1, number_2, number_3, number_4, number_5, number_6
-            FROM lotto_draws 
-            ORDER BY draw_number DESC 
-            LIMIT {recent_draws}
-        """)
-        
-        recent_result = self.db.execute(recent_query).fetchall()
+        """최근 트렌드 분석 (메모리 스냅샷 기반)"""
+        snapshot = self._snapshot()
+        return snapshot.memoize(('trends', recent_draws), lambda: self._compute_recent_trends(snapshot, recent_draws))
+    
+    @staticmethod
+    def _compute_recent_trends(snapshot: DrawSnapshot, recent_draws: int) -> Dict[int, dict]:
+        """스냅샷의 최근 N회차에서 번호별 출현 횟수와 핫/콜드 상태 계산"""
+        # 최근 회차 데이터 (스냅샷은 회차 오름차순)
+        recent_numbers = snapshot.main_numbers[-recent_draws:] if recent_draws > 0 else snapshot.main_numbers[:0]
         
         # 번호별 출현 횟수 계산
-        number_counts = {}
-        for row in recent_result:
-            for number in [row.number_1, row.number_2, row.number_3, row.number_4, row.number_5, row.number_6]:
-                number_counts[number] = number_counts.get(number, 0) + 1
+        number_counts = np.bincount(recent_numbers.ravel(), minlength=46)
         
         # 1-45 모든 번호에 대해 트렌드 계산
         trends = {}
         for number in range(1, 46):
-            count = number_counts.get(number, 0)
+            count = int(number_counts[number])
             percent = round(count * 100.0 / recent_draws, 2)
             
             # 핫/콜드 상태 결정
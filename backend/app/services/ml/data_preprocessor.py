@@ -8,9 +8,8 @@ Provides functions for loading, validating, and preparing lottery data for ML tr
 
 import pandas as pd
 import numpy as np
-from typing import Tuple, Dict, Any
+from typing import Tuple, Dict, Any, Optional
 from sqlalchemy.orm import Session
-from ...models.lotto import LottoDraw
 from sklearn.model_selection import train_test_split
 
 
@@ -22,38 +21,183 @@ NUMBER_COLS = ['number_1', 'number_2', 'number_3', 'number_4', 'number_5', 'numb
 TOTAL_NUMBERS = 45
 NUMBERS_PER_DRAW = 6
 RECENT_WINDOW_SIZE = 20
+INFERENCE_WINDOW_SIZE = 100  # Latest draws used to build the inference feature vector
 
 
 # ============================================================================
 # Helper Functions
 # ============================================================================
 
-def _count_number_appearances(data: pd.DataFrame, number: int) -> int:
-    """Count how many times a number appears in the data."""
-    appearances = 0
-    for col in NUMBER_COLS:
-        appearances += (data[col] == number).sum()
-    return appearances
+def _number_occurrence_matrix(numbers: np.ndarray) -> np.ndarray:
+    """
+    Build per-draw occurrence counts of each number.
+
+    Args:
+        numbers: Drawn numbers (shape: (n_draws, 6))
 
+    Returns:
+        np.ndarray: Counts (shape: (n_draws, TOTAL_NUMBERS + 1)), column = number.
+                    Values outside 1-45 are ignored.
+    """
+    n_draws = numbers.shape[0]
+    occurrences = np.zeros((n_draws, TOTAL_NUMBERS + 1), dtype=np.int64)
+    valid = (numbers >= 1) & (numbers <= TOTAL_NUMBERS)
+    rows = np.broadcast_to(np.arange(n_draws)[:, None], numbers.shape)
+    np.add.at(occurrences, (rows[valid], numbers[valid]), 1)
+    return occurrences
 
-def _extract_all_numbers(data: pd.DataFrame) -> list:
-    """Extract all numbers from the data as a flat list."""
-    all_numbers = []
-    for col in NUMBER_COLS:
-        all_numbers.extend(data[col].tolist())
-    return all_numbers
+
+def _prefix_totals(values: np.ndarray) -> np.ndarray:
+    """
+    Exclusive cumulative sums along axis 0.
+
+    Row i holds the total of rows [0, i), so row 0 is all zeros.
+    """
+    totals = np.zeros((values.shape[0] + 1,) + values.shape[1:], dtype=np.int64)
+    np.cumsum(values, axis=0, out=totals[1:])
+    return totals[:-1]
 
 
 # ============================================================================
 # Data Loading
 # ============================================================================
 
-def load_draw_data(db_session: Session) -> pd.DataFrame:
+DRAW_COLUMNS = [
+    'draw_number', 'draw_date', *NUMBER_COLS, 'bonus_number',
+    'first_winners', 'first_amount'
+]
+
+# Rows pulled from the DBAPI cursor per fetchmany() call
+DRAW_FETCH_BATCH_SIZE = 1024
+
+_COLUMNAR_SELECT = (
+    "SELECT draw_number, draw_date, number_1, number_2, number_3, number_4, number_5, number_6, "
+    "bonus_number, COALESCE(first_winners, 0), COALESCE(first_amount, 0) "
+    "FROM lotto_draws"
+)
+
+
+class DrawColumns:
+    """
+    Columnar draw history backed by typed NumPy arrays.
+
+    Attributes:
+        draw_numbers: Draw numbers (shape: (n_draws,), int32, ascending)
+        draw_dates: Draw dates (shape: (n_draws,), datetime64[D])
+        numbers: Main numbers (shape: (n_draws, 6), int16)
+        bonus_numbers: Bonus numbers (shape: (n_draws,), int16)
+        first_winners: First prize winner counts (shape: (n_draws,), int32)
+        first_amounts: First prize amounts (shape: (n_draws,), int64)
+    """
+
+    __slots__ = ('draw_numbers', 'draw_dates', 'numbers', 'bonus_numbers', 'first_winners', 'first_amounts')
+
+    def __init__(self, capacity: int = 0):
+        self.draw_numbers = np.empty(capacity, dtype=np.int32)
+        self.draw_dates = np.empty(capacity, dtype='datetime64[D]')
+        self.numbers = np.empty((capacity, NUMBERS_PER_DRAW), dtype=np.int16)
+        self.bonus_numbers = np.empty(capacity, dtype=np.int16)
+        self.first_winners = np.empty(capacity, dtype=np.int32)
+        self.first_amounts = np.empty(capacity, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return self.draw_numbers.shape[0]
+
+    def _resize(self, capacity: int) -> None:
+        """Grow (copy) or shrink (view) every column to `capacity` rows."""
+        for name in self.__slots__:
+            column = getattr(self, name)
+            if capacity <= column.shape[0]:
+                setattr(self, name, column[:capacity])
+            else:
+                grown = np.empty((capacity,) + column.shape[1:], dtype=column.dtype)
+                grown[:column.shape[0]] = column
+                setattr(self, name, grown)
+
+    def _fill(self, start: int, rows) -> None:
+        """Copy one fetchmany() batch into rows [start, start + len(rows))."""
+        block = np.array(rows, dtype=object)
+        end = start + block.shape[0]
+        self.draw_numbers[start:end] = block[:, 0]
+        # psycopg2 returns datetime.date, sqlite3 returns ISO strings; both convert
+        self.draw_dates[start:end] = block[:, 1].astype('datetime64[D]')
+        self.numbers[start:end] = block[:, 2:8]
+        self.bonus_numbers[start:end] = block[:, 8]
+        self.first_winners[start:end] = block[:, 9]
+        self.first_amounts[start:end] = block[:, 10]
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        DataFrame view in the load_draw_data column layout.
+
+        Number and amount columns share memory with the arrays where pandas allows;
+        draw_date is exposed as datetime.date objects like the ORM rows were.
+        """
+        data = {
+            'draw_number': self.draw_numbers,
+            'draw_date': self.draw_dates.astype(object),
+            **{col: self.numbers[:, idx] for idx, col in enumerate(NUMBER_COLS)},
+            'bonus_number': self.bonus_numbers,
+            'first_winners': self.first_winners,
+            'first_amount': self.first_amounts,
+        }
+        return pd.DataFrame(data, columns=DRAW_COLUMNS, copy=False)
+
+
+def load_draw_columns(
+    db_session: Session,
+    since_draw: Optional[int] = None,
+    batch_size: int = DRAW_FETCH_BATCH_SIZE
+) -> DrawColumns:
+    """
+    Load draw history straight from the DBAPI cursor into typed arrays.
+
+    Skips ORM object construction: only the needed columns are selected and
+    each fetchmany() batch is copied into preallocated arrays (sized from the
+    cursor rowcount when the driver reports it, grown by doubling otherwise).
+
+    Args:
+        db_session: SQLAlchemy database session (its transaction is reused)
+        since_draw: Only load draws with draw_number > since_draw (incremental loads)
+        batch_size: Rows per fetchmany() call
+
+    Returns:
+        DrawColumns: Draws ordered by draw_number
+    """
+    sql = _COLUMNAR_SELECT
+    if since_draw is not None:
+        sql += f" WHERE draw_number > {int(since_draw)}"
+    sql += " ORDER BY draw_number"
+
+    cursor = db_session.connection().connection.cursor()
+    try:
+        cursor.execute(sql)
+        capacity = cursor.rowcount if cursor.rowcount and cursor.rowcount > 0 else batch_size
+        columns = DrawColumns(capacity)
+        size = 0
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            if size + len(rows) > capacity:
+                capacity = max(size + len(rows), capacity * 2)
+                columns._resize(capacity)
+            columns._fill(size, rows)
+            size += len(rows)
+    finally:
+        cursor.close()
+
+    columns._resize(size)
+    return columns
+
+
+def load_draw_data(db_session: Session, since_draw: Optional[int] = None) -> pd.DataFrame:
     """
     Load lottery draw data from PostgreSQL database.
 
     Args:
         db_session: SQLAlchemy database session
+        since_draw: Only load draws with draw_number > since_draw (incremental loads)
 
     Returns:
         pd.DataFrame: DataFrame containing lottery draw data with columns:
@@ -64,40 +208,165 @@ def load_draw_data(db_session: Session) -> pd.DataFrame:
             - first_winners
             - first_amount
     """
-    # Query all draws ordered by draw number
-    draws = db_session.query(LottoDraw).order_by(LottoDraw.draw_number).all()
-
-    # Convert to list of dictionaries
-    data = []
-    for draw in draws:
-        data.append({
-            'draw_number': draw.draw_number,
-            'draw_date': draw.draw_date,
-            'number_1': draw.number_1,
-            'number_2': draw.number_2,
-            'number_3': draw.number_3,
-            'number_4': draw.number_4,
-            'number_5': draw.number_5,
-            'number_6': draw.number_6,
-            'bonus_number': draw.bonus_number,
-            'first_winners': draw.first_winners,
-            'first_amount': draw.first_amount
-        })
-
-    # Create DataFrame with explicit columns to ensure consistency even when empty
-    df = pd.DataFrame(data, columns=[
-        'draw_number', 'draw_date', 'number_1', 'number_2', 'number_3',
-        'number_4', 'number_5', 'number_6', 'bonus_number',
-        'first_winners', 'first_amount'
-    ])
-
-    return df
+    return load_draw_columns(db_session, since_draw=since_draw).to_frame()
 
 
 # ============================================================================
 # Feature Extraction
 # ============================================================================
 
+# Bump whenever FEATURE_COLUMNS or their computation changes
+FEATURE_SCHEMA_VERSION = 1
+
+FEATURE_COLUMNS = (
+    [f'freq_{num}' for num in range(1, TOTAL_NUMBERS + 1)] +
+    [f'trend_{num}' for num in range(1, TOTAL_NUMBERS + 1)] +
+    [f'co_occur_{num}' for num in range(1, TOTAL_NUMBERS + 1)] +
+    [
+        'stat_mean', 'stat_std', 'stat_min', 'stat_max', 'stat_range',
+        'stat_low_count', 'stat_mid_count', 'stat_high_count',
+        'stat_odd_ratio', 'stat_even_ratio'
+    ]
+)
+
+# Statistical features stored as integers in the feature DataFrame
+_INTEGER_STAT_COLUMNS = ['stat_min', 'stat_max', 'stat_range']
+
+# Default statistical features for the first draw (no history)
+_FIRST_DRAW_STATS = {
+    'stat_mean': 23,
+    'stat_std': 0,
+    'stat_min': 1,
+    'stat_max': 45,
+    'stat_range': 44,
+    'stat_low_count': 0.33,
+    'stat_mid_count': 0.33,
+    'stat_high_count': 0.34,
+    'stat_odd_ratio': 0.5,
+    'stat_even_ratio': 0.5
+}
+
+
+def extract_feature_matrix(numbers: np.ndarray) -> np.ndarray:
+    """
+    Extract the ML feature matrix in a single incremental pass.
+
+    Each row only uses draws strictly before it. Running per-number counts,
+    sliding-window trend counts and running min/max/sum moments replace the
+    per-row rescans of the full history.
+
+    Args:
+        numbers: Drawn numbers in draw order (shape: (n_draws, 6))
+
+    Returns:
+        np.ndarray: Feature matrix (shape: (n_draws, 145)), columns in FEATURE_COLUMNS order
+    """
+    numbers = np.asarray(numbers, dtype=np.int64)
+    n_draws = numbers.shape[0]
+    features = np.empty((n_draws, len(FEATURE_COLUMNS)), dtype=np.float64)
+    if n_draws == 0:
+        return features
+
+    occurrences = _number_occurrence_matrix(numbers)
+    draws_before = np.arange(n_draws)
+
+    # Running counts over draws [0, idx) and the trailing window [idx - 20, idx)
+    counts_before = _prefix_totals(occurrences)[:, 1:]
+    presence_before = _prefix_totals((occurrences > 0).astype(np.int64))[:, 1:]
+    window_start = np.maximum(0, draws_before - RECENT_WINDOW_SIZE)
+    window_counts = counts_before - counts_before[window_start]
+    window_size = np.minimum(RECENT_WINDOW_SIZE, draws_before - window_start)
+
+    history = draws_before > 0
+    freq = features[:, 0:TOTAL_NUMBERS]
+    trend = features[:, TOTAL_NUMBERS:2 * TOTAL_NUMBERS]
+    co_occur = features[:, 2 * TOTAL_NUMBERS:3 * TOTAL_NUMBERS]
+    stats = features[:, 3 * TOTAL_NUMBERS:]
+
+    # 1. FREQUENCY / 2. TREND / 3. CORRELATION FEATURES (45 each)
+    expected = draws_before[history] * NUMBERS_PER_DRAW / TOTAL_NUMBERS
+    freq[~history] = 0
+    freq[history] = counts_before[history] / expected[:, None]
+    trend[~history] = 0
+    trend[history] = window_counts[history] / window_size[history, None]
+    co_occur[~history] = 0
+    co_occur[history] = presence_before[history] / draws_before[history, None]
+
+    # 4. STATISTICAL FEATURES (10)
+    number_count = draws_before[history] * NUMBERS_PER_DRAW
+    row_sums = _prefix_totals(numbers.sum(axis=1))[history]
+    running_min = np.minimum.accumulate(numbers.min(axis=1))[:-1]
+    running_max = np.maximum.accumulate(numbers.max(axis=1))[:-1]
+    low_count = _prefix_totals((numbers <= 15).sum(axis=1))[history]
+    mid_count = _prefix_totals(((numbers >= 16) & (numbers <= 30)).sum(axis=1))[history]
+    high_count = _prefix_totals((numbers >= 31).sum(axis=1))[history]
+    odd_count = _prefix_totals((numbers % 2 == 1).sum(axis=1))[history]
+
+    stats[~history] = [_FIRST_DRAW_STATS[column] for column in FEATURE_COLUMNS[3 * TOTAL_NUMBERS:]]
+    stats[history, 0] = row_sums / number_count
+    # np.std uses pairwise summation over the column-major history, so it is
+    # evaluated on that exact layout to keep the values bit-identical
+    column_major = numbers.T
+    stats[history, 1] = [np.std(column_major[:, :idx].ravel()) for idx in draws_before[history]]
+    stats[history, 2] = running_min
+    stats[history, 3] = running_max
+    stats[history, 4] = running_max - running_min
+    stats[history, 5] = low_count / number_count
+    stats[history, 6] = mid_count / number_count
+    stats[history, 7] = high_count / number_count
+    stats[history, 8] = odd_count / number_count
+    stats[history, 9] = 1 - stats[history, 8]
+
+    return features
+
+
+def extract_next_feature_row(numbers: np.ndarray) -> np.ndarray:
+    """
+    Extract the feature row of the draw that follows `numbers`.
+
+    Produces the same values as the matching extract_feature_matrix row
+    (row len(numbers) of the history plus the new draw) without computing
+    the rows before it, so a feature store can append one draw at a time.
+
+    Args:
+        numbers: Drawn numbers of the full history in draw order (shape: (n_draws, 6))
+
+    Returns:
+        np.ndarray: Feature row (shape: (145,)), columns in FEATURE_COLUMNS order
+    """
+    numbers = np.asarray(numbers, dtype=np.int64)
+    n_draws = numbers.shape[0]
+    row = np.empty(len(FEATURE_COLUMNS), dtype=np.float64)
+    if n_draws == 0:
+        row[:3 * TOTAL_NUMBERS] = 0
+        row[3 * TOTAL_NUMBERS:] = [_FIRST_DRAW_STATS[column] for column in FEATURE_COLUMNS[3 * TOTAL_NUMBERS:]]
+        return row
+
+    occurrences = _number_occurrence_matrix(numbers)
+    counts = occurrences.sum(axis=0)[1:]
+    presence = (occurrences > 0).sum(axis=0)[1:]
+    window_size = min(RECENT_WINDOW_SIZE, n_draws)
+    window_counts = occurrences[n_draws - window_size:].sum(axis=0)[1:]
+
+    row[0:TOTAL_NUMBERS] = counts / (np.int64(n_draws) * NUMBERS_PER_DRAW / TOTAL_NUMBERS)
+    row[TOTAL_NUMBERS:2 * TOTAL_NUMBERS] = window_counts / np.int64(window_size)
+    row[2 * TOTAL_NUMBERS:3 * TOTAL_NUMBERS] = presence / np.int64(n_draws)
+
+    number_count = np.int64(n_draws * NUMBERS_PER_DRAW)
+    stats = row[3 * TOTAL_NUMBERS:]
+    stats[0] = numbers.sum() / number_count
+    stats[1] = np.std(numbers.T.ravel())
+    stats[2] = numbers.min()
+    stats[3] = numbers.max()
+    stats[4] = stats[3] - stats[2]
+    stats[5] = (numbers <= 15).sum() / number_count
+    stats[6] = ((numbers >= 16) & (numbers <= 30)).sum() / number_count
+    stats[7] = (numbers >= 31).sum() / number_count
+    stats[8] = (numbers % 2 == 1).sum() / number_count
+    stats[9] = 1 - stats[8]
+    return row
+
+
 def extract_features(draw_data: pd.DataFrame) -> pd.DataFrame:
     """
     Extract ML features from lottery draw data.
@@ -118,103 +387,48 @@ def extract_features(draw_data: pd.DataFrame) -> pd.DataFrame:
         # Return empty DataFrame with expected columns
         return pd.DataFrame()
 
-    features = []
+    matrix = extract_feature_matrix(draw_data[NUMBER_COLS].to_numpy(dtype=np.int64))
+    feature_df = pd.DataFrame(matrix, columns=FEATURE_COLUMNS)
 
-    # Process each draw to create feature vector
-    for idx in range(len(draw_data)):
-        feature_dict = {}
+    # Keep the column dtypes of the original per-row dict construction
+    integer_columns = list(_INTEGER_STAT_COLUMNS)
+    if len(draw_data) == 1:
+        # A single draw only has integer defaults except the float stat ratios
+        integer_columns += [
+            column for column in FEATURE_COLUMNS
+            if column not in integer_columns and not isinstance(_FIRST_DRAW_STATS.get(column, 0), float)
+        ]
+    feature_df[integer_columns] = feature_df[integer_columns].astype(np.int64)
 
-        # Get historical data up to current draw (excluding current)
-        historical_data = draw_data.iloc[:idx] if idx > 0 else pd.DataFrame()
+    return feature_df
 
-        # 1. FREQUENCY FEATURES (45 features)
-        # Calculate appearance frequency for each number 1-45
-        for num in range(1, TOTAL_NUMBERS + 1):
-            if len(historical_data) > 0:
-                appearances = _count_number_appearances(historical_data, num)
-                total_draws = len(historical_data)
-                expected = total_draws * NUMBERS_PER_DRAW / TOTAL_NUMBERS
-                freq_ratio = appearances / expected if expected > 0 else 0
-            else:
-                freq_ratio = 0
 
-            feature_dict[f'freq_{num}'] = freq_ratio
+# ============================================================================
+# Target Label Creation
+# ============================================================================
 
-        # 2. TREND FEATURES (45 features)
-        # Calculate recent trend (last N draws) for each number
-        recent_data = draw_data.iloc[max(0, idx-RECENT_WINDOW_SIZE):idx] if idx > 0 else pd.DataFrame()
+TARGET_COLUMNS = [f'target_{num}' for num in range(1, TOTAL_NUMBERS + 1)]
 
-        for num in range(1, TOTAL_NUMBERS + 1):
-            if len(recent_data) > 0:
-                recent_appearances = _count_number_appearances(recent_data, num)
-                trend_score = recent_appearances / min(RECENT_WINDOW_SIZE, len(recent_data))
-            else:
-                trend_score = 0
 
-            feature_dict[f'trend_{num}'] = trend_score
+def create_target_matrix(numbers: np.ndarray) -> np.ndarray:
+    """
+    Build next-draw target labels as a uint8 matrix.
 
-        # 3. CORRELATION FEATURES (45 features)
-        # Calculate co-occurrence patterns for each number
-        for num in range(1, TOTAL_NUMBERS + 1):
-            if len(historical_data) > 0:
-                # Find draws where this number appeared
-                draw_mask = False
-                for col in NUMBER_COLS:
-                    draw_mask = draw_mask | (historical_data[col] == num)
-
-                co_occur_count = draw_mask.sum()
-                co_occur_ratio = co_occur_count / len(historical_data)
-            else:
-                co_occur_ratio = 0
-
-            feature_dict[f'co_occur_{num}'] = co_occur_ratio
-
-        # 4. STATISTICAL FEATURES (10 features)
-        if len(historical_data) > 0:
-            all_numbers = _extract_all_numbers(historical_data)
-
-            # Calculate statistics
-            feature_dict['stat_mean'] = np.mean(all_numbers) if all_numbers else 23
-            feature_dict['stat_std'] = np.std(all_numbers) if all_numbers else 0
-            feature_dict['stat_min'] = np.min(all_numbers) if all_numbers else 1
-            feature_dict['stat_max'] = np.max(all_numbers) if all_numbers else 45
-            feature_dict['stat_range'] = feature_dict['stat_max'] - feature_dict['stat_min']
-
-            # Distribution features
-            num_count = len(all_numbers)
-            feature_dict['stat_low_count'] = sum(1 for n in all_numbers if n <= 15) / num_count
-            feature_dict['stat_mid_count'] = sum(1 for n in all_numbers if 16 <= n <= 30) / num_count
-            feature_dict['stat_high_count'] = sum(1 for n in all_numbers if n >= 31) / num_count
-
-            # Odd/even ratio
-            feature_dict['stat_odd_ratio'] = sum(1 for n in all_numbers if n % 2 == 1) / num_count
-            feature_dict['stat_even_ratio'] = 1 - feature_dict['stat_odd_ratio']
-        else:
-            # Default values for first draw
-            feature_dict.update({
-                'stat_mean': 23,
-                'stat_std': 0,
-                'stat_min': 1,
-                'stat_max': 45,
-                'stat_range': 44,
-                'stat_low_count': 0.33,
-                'stat_mid_count': 0.33,
-                'stat_high_count': 0.34,
-                'stat_odd_ratio': 0.5,
-                'stat_even_ratio': 0.5
-            })
-
-        features.append(feature_dict)
-
-    # Create feature DataFrame
-    feature_df = pd.DataFrame(features)
+    Row i marks the numbers drawn in draw i + 1 (same values as create_target_labels).
 
-    return feature_df
+    Args:
+        numbers: Drawn numbers in draw order (shape: (n_draws, 6))
 
+    Returns:
+        np.ndarray: Binary labels (shape: (max(n_draws - 1, 0), 45)), columns in TARGET_COLUMNS order
+    """
+    numbers = np.asarray(numbers, dtype=np.int64)
+    n_targets = max(numbers.shape[0] - 1, 0)
+    labels = np.zeros((n_targets, TOTAL_NUMBERS), dtype=np.uint8)
+    if n_targets:
+        labels[np.arange(n_targets)[:, None], numbers[1:] - 1] = 1
+    return labels
 
-# ============================================================================
-# Target Label Creation
-# ============================================================================
 
 def create_target_labels(draw_data: pd.DataFrame) -> pd.DataFrame:
     """
@@ -313,6 +527,39 @@ def prepare_train_test_split(
     return X_train, X_test, y_train, y_test
 
 
+def split_training_arrays(
+    features: np.ndarray,
+    labels: np.ndarray,
+    test_size: float = 0.2,
+    random_state: int = 42
+) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """
+    Train/test split over feature store arrays.
+
+    Wraps the (read-only, memory-mapped) arrays in DataFrames without copying and
+    splits them exactly like prepare_train_test_split does for the same draws.
+
+    Args:
+        features: Feature rows of the draws that have a next draw (shape: (n, 145))
+        labels: Next-draw targets (shape: (n, 45))
+        test_size: Proportion of data for test set
+        random_state: Random seed for reproducibility
+
+    Returns:
+        Tuple of (X_train, X_test, y_train, y_test)
+    """
+    if len(features) == 0:
+        return pd.DataFrame(), pd.DataFrame(), pd.DataFrame(), pd.DataFrame()
+
+    return train_test_split(
+        pd.DataFrame(features, columns=FEATURE_COLUMNS, copy=False),
+        pd.DataFrame(labels, columns=TARGET_COLUMNS, copy=False),
+        test_size=test_size,
+        random_state=random_state,
+        shuffle=True
+    )
+
+
 # ============================================================================
 # Data Quality Validation
 # ============================================================================
@@ -402,28 +649,14 @@ def prepare_features_for_inference(db_session) -> np.ndarray:
     @CODE:LOTTO-ML-INTEGRATE-001
     """
     # Fetch latest draws for feature extraction
-    all_data = load_draw_data(db_session)
+    numbers = load_draw_columns(db_session).numbers
     # Use latest 100 draws for inference
-    data = all_data.tail(100) if len(all_data) >= 100 else all_data
+    window = numbers[-INFERENCE_WINDOW_SIZE:]
 
-    if len(data) == 0:
+    if window.shape[0] == 0:
         # Return default features if no data available
         return np.ones((1, TOTAL_NUMBERS)) / TOTAL_NUMBERS
 
-    # Extract features (returns DataFrame)
-    features_df = extract_features(data)
-
-    if len(features_df) == 0:
-        # Return default features if extraction failed
-        return np.ones((1, TOTAL_NUMBERS)) / TOTAL_NUMBERS
-
-    # Get the latest feature row (most recent draw)
-    latest_features = features_df.iloc[-1]
-
-    # Use ALL features (145 features) as used during training
-    feature_vector = latest_features.values
-
-    # Reshape to (1, 145) for model input
-    feature_vector = feature_vector.reshape(1, -1)
-
-    return feature_vector
+    # Latest feature row (most recent draw), ALL features (145) as used during training,
+    # shaped (1, 145) for model input
+    return extract_feature_matrix(window)[-1:]
@@ -0,0 +1,116 @@
+"""
+ML Inference Feature Cache
+
+Caches the inference feature vector keyed by (latest draw number, feature schema version).
+The vector only changes when a new draw is committed, so ML recommendation requests
+reuse it without touching the database or pandas.
+@CODE:LOTTO-ML-INTEGRATE-001
+"""
+
+import logging
+import threading
+from typing import Optional, Tuple
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from ..draw_snapshot import draw_history
+from .data_preprocessor import (
+    FEATURE_SCHEMA_VERSION,
+    INFERENCE_WINDOW_SIZE,
+    TOTAL_NUMBERS,
+    extract_feature_matrix,
+)
+
+
+# ============================================================================
+# Module Logger
+# ============================================================================
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# InferenceFeatureCache Class
+# ============================================================================
+
+class InferenceFeatureCache:
+    """
+    Process-wide cache of the ML inference feature vector.
+
+    - Built from the in-memory draw snapshot (no ORM, no DataFrame)
+    - Keyed by (latest draw_number, FEATURE_SCHEMA_VERSION)
+    - Refreshed eagerly by AutoUpdater after new draws are inserted
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._key: Optional[Tuple[int, int]] = None
+        self._features: Optional[np.ndarray] = None
+
+    @property
+    def key(self) -> Optional[Tuple[int, int]]:
+        """Cache key of the stored vector: (latest draw_number, schema version)"""
+        return self._key
+
+    def get(self, db_session: Session) -> np.ndarray:
+        """
+        Get the inference feature vector for the latest draw.
+
+        Args:
+            db_session: Session used only when the draw snapshot must be (re)loaded
+
+        Returns:
+            np.ndarray: Read-only feature vector (shape: (1, 145)),
+                        or uniform defaults (shape: (1, 45)) when no draws exist
+        """
+        return self.get_entry(db_session)[1]
+
+    def get_entry(self, db_session: Session) -> Tuple[Tuple[int, int], np.ndarray]:
+        """
+        Get the inference feature vector together with its cache key.
+
+        Returns:
+            Tuple of (key, features) where key is (latest draw_number, schema version)
+        """
+        snapshot = draw_history.get(db_session)
+        key = (snapshot.latest_draw_number, FEATURE_SCHEMA_VERSION)
+
+        with self._lock:
+            if self._features is not None and self._key == key:
+                return key, self._features
+
+            features = self._build(snapshot.main_numbers)
+            self._key = key
+            self._features = features
+            logger.info(f"Inference features cached for draw {key[0]} (schema v{key[1]})")
+            return key, features
+
+    def refresh(self, db_session: Session) -> np.ndarray:
+        """Drop the cached vector and rebuild it from the latest draws."""
+        self.invalidate()
+        return self.get(db_session)
+
+    def invalidate(self) -> None:
+        """Drop the cached vector."""
+        with self._lock:
+            self._key = None
+            self._features = None
+
+    @staticmethod
+    def _build(numbers: np.ndarray) -> np.ndarray:
+        """Extract the latest feature row from the trailing inference window."""
+        window = numbers[-INFERENCE_WINDOW_SIZE:]
+
+        if window.shape[0] == 0:
+            # Default features if no data available
+            features = np.ones((1, TOTAL_NUMBERS)) / TOTAL_NUMBERS
+        else:
+            features = extract_feature_matrix(window)[-1:].copy()
+
+        features.setflags(write=False)
+        return features
+
+
+# Global instance
+inference_features = InferenceFeatureCache()
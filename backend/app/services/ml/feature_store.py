@@ -0,0 +1,287 @@
+"""
+ML Feature Store
+
+Persisted, memory-mapped training feature matrix and next-draw target labels.
+
+Layout (models/ml/features/):
+    - features.npy      float64 (capacity, 145)  feature row per draw
+    - labels.npy        uint8   (capacity, 45)   next-draw targets (row i = draw i + 1)
+    - numbers.npy       int16   (capacity, 6)    drawn numbers (history for appends)
+    - draw_numbers.npy  int32   (capacity,)      draw number per row
+    - manifest.json     schema version, feature columns, draw range, row count
+
+Files are preallocated with spare rows so a weekly draw is appended in place
+(one feature row + one label row); the manifest is rewritten last, so rows past
+its count are ignored after an interrupted append. Training reads slices of
+the read-only memory maps (no copy). The store is rebuilt only when
+FEATURE_SCHEMA_VERSION / FEATURE_COLUMNS change or the stored draw numbers no
+longer match the database row for row (e.g. a missing draw was repaired or a
+draw's numbers were corrected).
+@CODE:LOTTO-ML-PREPROCESS-001
+"""
+
+import json
+import logging
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+import pytz
+from sqlalchemy.orm import Session
+
+from . import data_preprocessor
+from .data_preprocessor import DrawColumns, FEATURE_COLUMNS, FEATURE_SCHEMA_VERSION, NUMBERS_PER_DRAW, TOTAL_NUMBERS
+from .model_utils import MODEL_BASE_DIR
+
+
+# ============================================================================
+# Module Logger
+# ============================================================================
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# Constants
+# ============================================================================
+
+FEATURE_STORE_DIR = MODEL_BASE_DIR / "features"
+MANIFEST_FILE = "manifest.json"
+
+# Spare rows preallocated on (re)allocation (~5 years of weekly draws)
+GROWTH_ROWS = 256
+
+# name -> (dtype, trailing shape)
+_ARRAYS = {
+    'features': (np.float64, (len(FEATURE_COLUMNS),)),
+    'labels': (np.uint8, (TOTAL_NUMBERS,)),
+    'numbers': (np.int16, (NUMBERS_PER_DRAW,)),
+    'draw_numbers': (np.int32, ()),
+}
+
+
+# ============================================================================
+# FeatureStore Class
+# ============================================================================
+
+class FeatureStore:
+    """
+    Append-only on-disk feature store for model training.
+
+    Usage:
+        features, labels = feature_store.sync(db_session)
+        X_train, X_test, y_train, y_test = data_preprocessor.split_training_arrays(features, labels)
+    """
+
+    def __init__(self, directory: Optional[str] = None):
+        """
+        Args:
+            directory: Store directory (default: models/ml/features)
+        """
+        self.directory = Path(directory) if directory else FEATURE_STORE_DIR
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------------
+    # Manifest
+    # ------------------------------------------------------------------------
+
+    def _path(self, name: str) -> Path:
+        return self.directory / f"{name}.npy"
+
+    def load_manifest(self) -> Optional[Dict[str, Any]]:
+        """Read the manifest (None if missing or unreadable)."""
+        path = self.directory / MANIFEST_FILE
+        if not path.exists():
+            return None
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (json.JSONDecodeError, IOError) as e:
+            logger.warning(f"Failed to load feature store manifest {path}: {e}")
+            return None
+
+    def _write_manifest(self, rows: int, capacity: int, first_draw: Optional[int], last_draw: Optional[int]) -> Dict[str, Any]:
+        manifest = {
+            'schema_version': FEATURE_SCHEMA_VERSION,
+            'feature_columns': list(FEATURE_COLUMNS),
+            'rows': rows,
+            'label_rows': max(rows - 1, 0),
+            'capacity': capacity,
+            'first_draw': first_draw,
+            'last_draw': last_draw,
+            'updated_at': datetime.now(pytz.timezone('Asia/Seoul')).isoformat(),
+        }
+        tmp_path = self.directory / (MANIFEST_FILE + ".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, self.directory / MANIFEST_FILE)
+        return manifest
+
+    def _is_current(self, manifest: Optional[Dict[str, Any]]) -> bool:
+        """Manifest matches the current feature schema and the array files exist."""
+        return (
+            manifest is not None
+            and manifest.get('schema_version') == FEATURE_SCHEMA_VERSION
+            and manifest.get('feature_columns') == list(FEATURE_COLUMNS)
+            and all(self._path(name).exists() for name in _ARRAYS)
+        )
+
+    # ------------------------------------------------------------------------
+    # Arrays
+    # ------------------------------------------------------------------------
+
+    def _allocate(self, capacity: int, rows: int, source: Dict[str, np.ndarray]) -> None:
+        """Write fresh array files with `capacity` rows, copying the first `rows` from `source`."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        for name, (dtype, shape) in _ARRAYS.items():
+            tmp_path = self.directory / f"{name}.npy.tmp"
+            array = np.lib.format.open_memmap(tmp_path, mode='w+', dtype=dtype, shape=(capacity,) + shape)
+            array[:rows] = source[name][:rows]
+            array.flush()
+            del array
+            os.replace(tmp_path, self._path(name))
+
+    def _open(self, mode: str = 'r') -> Dict[str, np.ndarray]:
+        return {name: np.load(self._path(name), mmap_mode=mode) for name in _ARRAYS}
+
+    def read(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Zero-copy training arrays from the current store.
+
+        Returns:
+            Tuple of (features, labels), read-only memory-mapped views of the
+            draws that have a next draw (shape: (n, 145), (n, 45))
+
+        Raises:
+            FileNotFoundError: If the store is missing or built for another schema
+        """
+        manifest = self.load_manifest()
+        if not self._is_current(manifest):
+            raise FileNotFoundError(f"Feature store is missing or outdated: {self.directory}")
+        arrays = self._open('r')
+        label_rows = manifest['label_rows']
+        return arrays['features'][:label_rows], arrays['labels'][:label_rows]
+
+    # ------------------------------------------------------------------------
+    # Build / Append
+    # ------------------------------------------------------------------------
+
+    def rebuild(self, db_session: Session) -> Dict[str, Any]:
+        """Recompute every feature and label row from the database."""
+        with self._lock:
+            return self._rebuild(db_session)
+
+    def _rebuild(self, db_session: Session, columns: Optional[DrawColumns] = None) -> Dict[str, Any]:
+        if columns is None:
+            columns = data_preprocessor.load_draw_columns(db_session)
+        rows = len(columns)
+        labels = np.zeros((rows, TOTAL_NUMBERS), dtype=np.uint8)
+        labels[:max(rows - 1, 0)] = data_preprocessor.create_target_matrix(columns.numbers)
+
+        self._allocate(rows + GROWTH_ROWS, rows, {
+            'features': data_preprocessor.extract_feature_matrix(columns.numbers),
+            'labels': labels,
+            'numbers': columns.numbers,
+            'draw_numbers': columns.draw_numbers,
+        })
+        manifest = self._write_manifest(
+            rows,
+            rows + GROWTH_ROWS,
+            int(columns.draw_numbers[0]) if rows else None,
+            int(columns.draw_numbers[-1]) if rows else None
+        )
+        logger.info(f"Feature store rebuilt: {rows} draws (schema v{FEATURE_SCHEMA_VERSION})")
+        return manifest
+
+    def _history_matches(self, manifest: Dict[str, Any], columns: DrawColumns) -> bool:
+        """
+        Stored draws are still exactly the database draws up to last_draw.
+
+        Compares the stored draw_numbers/numbers arrays row by row, so a
+        deleted, re-inserted or corrected draw forces a rebuild.
+        """
+        rows = manifest['rows']
+        if len(columns) < rows:
+            return False
+        arrays = self._open('r')
+        return (
+            np.array_equal(arrays['draw_numbers'][:rows], columns.draw_numbers[:rows])
+            and np.array_equal(arrays['numbers'][:rows], columns.numbers[:rows])
+        )
+
+    def sync(self, db_session: Session) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Bring the store up to date and return the training arrays.
+
+        - Missing store or schema change: full rebuild
+        - Stored draw numbers differ from the database (deleted, repaired or
+          corrected draws): full rebuild
+        - Otherwise: append one feature row (and one label row for the previous draw)
+          per new draw
+
+        Returns:
+            Tuple of (features, labels) as returned by read()
+        """
+        with self._lock:
+            manifest = self.load_manifest()
+            if not self._is_current(manifest):
+                logger.info("Feature store missing or schema changed, rebuilding")
+                self._rebuild(db_session)
+            else:
+                columns = data_preprocessor.load_draw_columns(db_session)
+                if not self._history_matches(manifest, columns):
+                    logger.info("Feature store history differs from database, rebuilding")
+                    self._rebuild(db_session, columns)
+                else:
+                    self._append(manifest, columns)
+        return self.read()
+
+    def _append(self, manifest: Dict[str, Any], columns: DrawColumns) -> None:
+        """Append the draws of `columns` past the stored rows (history already verified)."""
+        rows = manifest['rows']
+        new_numbers = columns.numbers[rows:]
+        new_draw_numbers = columns.draw_numbers[rows:]
+        if len(new_draw_numbers) == 0:
+            return
+
+        capacity = manifest['capacity']
+        if rows + len(new_draw_numbers) > capacity:
+            capacity = rows + len(new_draw_numbers) + GROWTH_ROWS
+            self._allocate(capacity, rows, self._open('r'))
+
+        arrays = self._open('r+')
+        numbers = arrays['numbers']
+        for idx in range(len(new_draw_numbers)):
+            draw_numbers = new_numbers[idx]
+            arrays['features'][rows] = data_preprocessor.extract_next_feature_row(numbers[:rows])
+            if rows > 0:
+                arrays['labels'][rows - 1] = 0
+                arrays['labels'][rows - 1, draw_numbers.astype(np.int64) - 1] = 1
+            numbers[rows] = draw_numbers
+            arrays['draw_numbers'][rows] = new_draw_numbers[idx]
+            rows += 1
+        for array in arrays.values():
+            array.flush()
+        del arrays, numbers
+
+        first_draw = manifest.get('first_draw')
+        if first_draw is None:
+            first_draw = int(new_draw_numbers[0])
+        self._write_manifest(rows, capacity, first_draw, int(new_draw_numbers[-1]))
+        logger.info(f"Feature store appended {len(new_draw_numbers)} draw(s), now {rows} rows")
+
+    def status(self) -> Dict[str, Any]:
+        """Manifest plus whether it matches the current feature schema."""
+        manifest = self.load_manifest()
+        return {
+            'directory': str(self.directory),
+            'is_current': self._is_current(manifest),
+            'manifest': manifest,
+        }
+
+
+# Global instance
+feature_store = FeatureStore()
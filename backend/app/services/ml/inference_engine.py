@@ -9,6 +9,9 @@ Prediction engine for lottery number recommendations using trained ML models
 import numpy as np
 from typing import List, Dict, Tuple, Optional, Any
 
+from ..combination_sampler import first_unique_rows, gumbel_top_k
+from ..number_mask import NumberMask
+
 # Constants
 LOTTO_NUMBER_COUNT = 45  # Total lottery numbers (1-45)
 COMBINATION_SIZE = 6  # Numbers per combination
@@ -16,6 +19,19 @@ CONFIDENCE_MIN = 0.20  # Minimum confidence score (AC-004)
 CONFIDENCE_MAX = 0.75  # Maximum confidence score (AC-004)
 
 
+def _positive_class_probability(output: np.ndarray, classes: Optional[np.ndarray]) -> float:
+    """
+    Probability of class 1 (number appearing) from one output's (1, n_classes) array
+
+    A number that never (or always) appeared in training leaves a single class,
+    so the class-1 column is located through the fitted classes when available.
+    """
+    if classes is None:
+        return output[0, 1]
+    positive = np.flatnonzero(np.asarray(classes) == 1)
+    return output[0, positive[0]] if positive.size else 0.0
+
+
 def predict_probabilities(model: Any, features: np.ndarray) -> np.ndarray:
     """
     Predict probabilities for each lottery number (1-45)
@@ -40,15 +56,22 @@ def predict_probabilities(model: Any, features: np.ndarray) -> np.ndarray:
         raise ValueError("Features must be a 2D array with shape (1, n_features)")
 
     # Get predictions from model
-    # MultiOutputClassifier returns list of arrays (one per output)
+    # Both training modes (MultiOutputClassifier and a native multi-output forest)
+    # return a list of arrays, one per number, each shaped (1, n_classes)
     raw_probabilities = model.predict_proba(features)
 
-    # Extract probability of class 1 (number appearing) for each of 45 outputs
-    # Each output is shape (1, 2) with [prob_class_0, prob_class_1]
-    probabilities = np.array([
-        output[0, 1]  # Get class 1 probability for each number
-        for output in raw_probabilities
-    ])
+    if isinstance(raw_probabilities, np.ndarray) and raw_probabilities.ndim == 2:
+        # Multi-label estimators returning a (1, 45) positive-class matrix directly
+        probabilities = np.asarray(raw_probabilities[0], dtype=np.float64)
+    else:
+        output_classes = getattr(model, 'classes_', None)
+        probabilities = np.array([
+            _positive_class_probability(
+                output,
+                output_classes[idx] if isinstance(output_classes, list) else None
+            )
+            for idx, output in enumerate(raw_probabilities)
+        ])
 
     # Normalize to ensure sum = 1.0 (for weighted sampling)
     probabilities = probabilities / probabilities.sum()
@@ -56,9 +79,89 @@ def predict_probabilities(model: Any, features: np.ndarray) -> np.ndarray:
     return probabilities
 
 
+class CombinationSampler:
+    """
+    Vectorized weighted sampler for distinct 6-number combinations
+
+    Precomputes log-weights once per probability vector and draws whole batches
+    with the Gumbel-top-k trick: adding independent Gumbel noise to log(p) and
+    taking the top COMBINATION_SIZE indices per row is equivalent to sequential
+    weighted sampling without replacement (np.random.choice(replace=False, p=p)).
+
+    @CODE:LOTTO-ML-PREDICT-001
+    """
+
+    __slots__ = ('probabilities', 'log_weights')
+
+    def __init__(self, probabilities: np.ndarray):
+        probabilities = np.asarray(probabilities, dtype=np.float64)
+
+        if probabilities.shape != (LOTTO_NUMBER_COUNT,):
+            raise ValueError(f"Probabilities must have shape ({LOTTO_NUMBER_COUNT},)")
+        if np.count_nonzero(probabilities) < COMBINATION_SIZE:
+            raise ValueError("Fewer non-zero probabilities than combination size")
+
+        with np.errstate(divide='ignore'):
+            log_weights = np.log(probabilities)
+
+        self.probabilities = probabilities
+        self.log_weights = log_weights
+
+    def sample(self, size: int, rng: Optional[np.random.Generator] = None) -> np.ndarray:
+        """
+        Draw `size` combinations (duplicates across rows possible)
+
+        Returns:
+            np.ndarray: (size, 6) array of numbers 1-45, each row sorted ascending
+        """
+        if rng is None:
+            rng = np.random.default_rng()
+
+        top_indices = gumbel_top_k(self.log_weights, COMBINATION_SIZE, size, rng)
+        return np.sort(top_indices, axis=1) + 1
+
+    def sample_unique(
+        self,
+        count: int,
+        rng: Optional[np.random.Generator] = None,
+        max_draws: Optional[int] = None
+    ) -> np.ndarray:
+        """
+        Draw up to `count` distinct combinations in first-seen order
+
+        Args:
+            count: Number of distinct combinations wanted
+            rng: Random generator
+            max_draws: Total sample budget (default: count * 100)
+
+        Returns:
+            np.ndarray: (<= count, 6) array of distinct sorted combinations
+        """
+        if rng is None:
+            rng = np.random.default_rng()
+        if max_draws is None:
+            max_draws = count * 100
+
+        samples = np.empty((0, COMBINATION_SIZE), dtype=np.int64)
+        unique_rows = samples
+        drawn = 0
+
+        while unique_rows.shape[0] < count and drawn < max_draws:
+            batch_size = min(max(2 * (count - unique_rows.shape[0]), 64), max_draws - drawn)
+            samples = np.concatenate([samples, self.sample(batch_size, rng)])
+            drawn += batch_size
+
+            # Number bitmask per row as a dedup key, keeping first occurrences in draw order
+            unique_rows = first_unique_rows(samples)
+
+        return unique_rows[:count]
+
+
 def generate_combinations(
     probabilities: np.ndarray,
-    count: int = 5
+    count: int = 5,
+    sampler: Optional[CombinationSampler] = None,
+    rng: Optional[np.random.Generator] = None
 ) -> List[List[int]]:
     """
     Generate lottery number combinations using weighted sampling
@@ -69,43 +172,18 @@ def generate_combinations(
     Args:
         probabilities: Probability distribution for 45 numbers (sum to 1.0)
         count: Number of combinations to generate (default: 5)
+        sampler: Precomputed sampler for `probabilities` (built on demand if omitted)
+        rng: Random generator
 
     Returns:
         List[List[int]]: List of combinations, each with 6 unique numbers (1-45)
 
     @CODE:LOTTO-ML-PREDICT-001
     """
-    combinations = []
-    seen_combinations = set()
-
-    # Numbers 1 to LOTTO_NUMBER_COUNT
-    numbers = np.arange(1, LOTTO_NUMBER_COUNT + 1)
-
-    # Generate combinations with weighted sampling
-    max_attempts = count * 100  # Prevent infinite loop
-    attempts = 0
-
-    while len(combinations) < count and attempts < max_attempts:
-        attempts += 1
-
-        # Sample COMBINATION_SIZE numbers without replacement using probabilities as weights
-        selected_indices = np.random.choice(
-            LOTTO_NUMBER_COUNT,
-            size=COMBINATION_SIZE,
-            replace=False,
-            p=probabilities
-        )
-
-        # Convert indices to numbers (1-45)
-        combination = sorted(numbers[selected_indices].tolist())
-
-        # Check for duplicate combinations
-        combo_tuple = tuple(combination)
-        if combo_tuple not in seen_combinations:
-            combinations.append(combination)
-            seen_combinations.add(combo_tuple)
+    if sampler is None:
+        sampler = CombinationSampler(probabilities)
 
-    return combinations
+    return sampler.sample_unique(count, rng=rng).tolist()
 
 
 def calculate_confidence_scores(probabilities: np.ndarray) -> Dict[str, float]:
@@ -188,20 +266,20 @@ def apply_user_preferences(
 
     @CODE:LOTTO-ML-PREDICT-001
     """
-    include_numbers = set(preferences.get('include_numbers', []))
-    exclude_numbers = set(preferences.get('exclude_numbers', []))
+    include_mask = NumberMask.from_numbers(preferences.get('include_numbers', []))
+    exclude_mask = NumberMask.from_numbers(preferences.get('exclude_numbers', []))
 
     filtered_combinations = []
 
     for combo in combinations:
-        combo_set = set(combo)
+        combo_mask = NumberMask.from_numbers(combo)
 
         # Check exclude condition (must not contain any excluded numbers)
-        if exclude_numbers and combo_set & exclude_numbers:
+        if combo_mask.intersects(exclude_mask):
             continue
 
         # Check include condition (must contain at least one included number)
-        if include_numbers and not (combo_set & include_numbers):
+        if include_mask and not combo_mask.intersects(include_mask):
             continue
 
         filtered_combinations.append(combo)
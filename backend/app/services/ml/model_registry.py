@@ -0,0 +1,211 @@
+"""
+ML Model Registry
+
+Process-wide holder of the active ML model. The model is loaded once at startup
+and shared by every RecommendationEngine instance. A background watcher polls
+the trained model directory and hot-swaps newer artifacts written by
+model_trainer.save_trained_model without blocking in-flight requests.
+@CODE:LOTTO-ML-INTEGRATE-001
+"""
+
+import logging
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from . import model_utils
+
+
+# ============================================================================
+# Constants
+# ============================================================================
+
+DEFAULT_WATCH_INTERVAL_SECONDS = 60
+
+
+# ============================================================================
+# Module Logger
+# ============================================================================
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# LoadedModel Class
+# ============================================================================
+
+class LoadedModel:
+    """
+    Immutable record of a loaded model artifact.
+
+    Attributes:
+        model: Deserialized model object
+        path: Artifact path
+        version: Artifact name (e.g. lotto_model_20250101)
+        modified_at: Artifact mtime (ns) used to detect overwrites
+        loaded_at: When the artifact was loaded into this process
+    """
+
+    __slots__ = ('model', 'path', 'version', 'modified_at', 'loaded_at')
+
+    def __init__(self, model: Any, path: str, modified_at: int):
+        self.model = model
+        self.path = path
+        self.version = Path(path).stem
+        self.modified_at = modified_at
+        self.loaded_at = datetime.now()
+
+    @property
+    def key(self) -> Tuple[str, int]:
+        """Artifact identity: (path, mtime)"""
+        return (self.path, self.modified_at)
+
+
+# ============================================================================
+# ModelRegistry Class
+# ============================================================================
+
+class ModelRegistry:
+    """
+    Singleton-style registry serving the active ML model.
+
+    - load_latest(): load the newest artifact if it differs from the active one
+    - get_model(): return the active model (loads on first use if startup load failed)
+    - start_watching()/stop_watching(): background polling for new artifacts
+
+    Readers grab a single reference to the active LoadedModel, so a swap never
+    affects a request that is already running inference.
+    """
+
+    def __init__(self):
+        self._active: Optional[LoadedModel] = None
+        self._load_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._watcher: Optional[threading.Thread] = None
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether a model is currently active"""
+        return self._active is not None
+
+    @property
+    def version(self) -> Optional[str]:
+        """Version (artifact name) of the active model"""
+        active = self._active
+        return active.version if active else None
+
+    @property
+    def loaded_at(self) -> Optional[datetime]:
+        """Load time of the active model"""
+        active = self._active
+        return active.loaded_at if active else None
+
+    def get_model(self) -> Any:
+        """
+        Get the active model.
+
+        Returns:
+            Any: Loaded ML model
+
+        Raises:
+            FileNotFoundError: If no trained model artifact exists
+        """
+        return self.get_active().model
+
+    def get_active(self) -> LoadedModel:
+        """
+        Get the active model record (model plus version/identity).
+
+        Raises:
+            FileNotFoundError: If no trained model artifact exists
+        """
+        active = self._active
+        if active is None:
+            self.load_latest()
+            active = self._active
+            if active is None:
+                raise FileNotFoundError("ML model not found. Falling back to statistical mode.")
+        return active
+
+    def load_latest(self) -> bool:
+        """
+        Load the newest model artifact if it differs from the active one.
+
+        Returns:
+            bool: True if a new model was swapped in
+        """
+        model_path = model_utils.get_latest_model_path()
+        if model_path is None:
+            return False
+
+        with self._load_lock:
+            try:
+                modified_at = os.stat(model_path).st_mtime_ns
+            except FileNotFoundError:
+                return False
+
+            active = self._active
+            if active is not None and active.key == (model_path, modified_at):
+                return False
+
+            # Deserialize before swapping; requests keep using the previous model meanwhile
+            loaded = LoadedModel(model_utils.load_model(model_path), model_path, modified_at)
+            self._active = loaded
+
+        logger.info(f"ML model loaded: {loaded.version} ({loaded.path})")
+        return True
+
+    def unload(self) -> None:
+        """Drop the active model"""
+        with self._load_lock:
+            self._active = None
+
+    def status(self) -> Dict[str, Any]:
+        """Registry status for health/admin endpoints"""
+        active = self._active
+        return {
+            'loaded': active is not None,
+            'version': active.version if active else None,
+            'path': active.path if active else None,
+            'loaded_at': active.loaded_at.isoformat() if active else None,
+            'watching': self._watcher is not None and self._watcher.is_alive()
+        }
+
+    # ------------------------------------------------------------------------
+    # Artifact Watcher
+    # ------------------------------------------------------------------------
+
+    def start_watching(self, interval_seconds: int = DEFAULT_WATCH_INTERVAL_SECONDS) -> None:
+        """Start polling the trained model directory for new artifacts."""
+        if self._watcher is not None and self._watcher.is_alive():
+            return
+
+        self._stop_event.clear()
+        self._watcher = threading.Thread(
+            target=self._watch_loop,
+            args=(interval_seconds,),
+            name="ml-model-watcher",
+            daemon=True
+        )
+        self._watcher.start()
+
+    def stop_watching(self) -> None:
+        """Stop the artifact watcher."""
+        self._stop_event.set()
+        if self._watcher is not None:
+            self._watcher.join(timeout=5)
+            self._watcher = None
+
+    def _watch_loop(self, interval_seconds: int) -> None:
+        while not self._stop_event.wait(interval_seconds):
+            try:
+                self.load_latest()
+            except Exception as e:
+                # Keep serving the current model if the new artifact is unreadable
+                logger.warning(f"ML model hot reload failed: {e}")
+
+
+# Global instance
+model_registry = ModelRegistry()
@@ -6,9 +6,14 @@ Provides functions for training, evaluating, and saving lottery prediction model
 @DOC:LOTTO-ML-MODEL-001 → .moai/specs/SPEC-LOTTO-ML-MODEL-001/spec.md
 """
 
+import logging
+import os
+import tempfile
+import time
+import joblib
 import pandas as pd
 import numpy as np
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Sequence, Union
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.multioutput import MultiOutputClassifier
 from sklearn.metrics import (
@@ -22,6 +27,21 @@ from sklearn.metrics import (
 from datetime import datetime
 from . import model_utils
 
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# Constants
+# ============================================================================
+
+# MultiOutputClassifier: 45 independent forests (one binary forest per number)
+TRAINING_MODE_MULTIOUTPUT = 'multioutput'
+# One RandomForestClassifier fitted on the 45-column target (shared trees)
+TRAINING_MODE_NATIVE = 'native_multioutput'
+TRAINING_MODES = (TRAINING_MODE_MULTIOUTPUT, TRAINING_MODE_NATIVE)
+
+TrainedModel = Union[MultiOutputClassifier, RandomForestClassifier]
+
 
 # ============================================================================
 # Global State (for get_model_metrics)
@@ -39,13 +59,20 @@ def train_model(
     y_train: pd.DataFrame,
     n_estimators: int = 100,
     max_depth: Optional[int] = None,
-    random_state: int = 42
-) -> MultiOutputClassifier:
+    random_state: int = 42,
+    mode: str = TRAINING_MODE_MULTIOUTPUT
+) -> TrainedModel:
     """
     Train Random Forest model for multi-label lottery prediction.
 
-    Uses MultiOutputClassifier to train 45 independent binary classifiers
-    (one for each lottery number 1-45).
+    Modes:
+        - 'multioutput': MultiOutputClassifier with 45 independent binary forests
+          (45 x n_estimators trees)
+        - 'native_multioutput': a single forest fitted on the 45-column target
+          (n_estimators trees, each leaf stores all 45 label distributions)
+
+    Both artifacts expose predict() -> (n, 45) and predict_proba() -> list of 45
+    (n, n_classes) arrays, so evaluation and inference handle either shape.
 
     Args:
         X_train: Training features (DataFrame with 145 features)
@@ -53,9 +80,13 @@ def train_model(
         n_estimators: Number of trees in the forest (default 100)
         max_depth: Maximum depth of trees (default None = unlimited)
         random_state: Random seed for reproducibility
+        mode: Training mode, one of TRAINING_MODES
 
     Returns:
-        MultiOutputClassifier: Trained multi-output model
+        MultiOutputClassifier or RandomForestClassifier: Trained multi-output model
+
+    Raises:
+        ValueError: If mode is not one of TRAINING_MODES
 
     Performance:
         - Should complete within 5 minutes for 1000 samples (AC-003)
@@ -63,6 +94,9 @@ def train_model(
 
     @CODE:LOTTO-ML-MODEL-001
     """
+    if mode not in TRAINING_MODES:
+        raise ValueError(f"Unknown training mode: {mode} (expected one of {TRAINING_MODES})")
+
     # Initialize base Random Forest model
     base_estimator = RandomForestClassifier(
         n_estimators=n_estimators,
@@ -72,8 +106,12 @@ def train_model(
         verbose=0
     )
 
-    # Wrap with MultiOutputClassifier for 45 binary classifiers
-    model = MultiOutputClassifier(base_estimator, n_jobs=-1)
+    if mode == TRAINING_MODE_NATIVE:
+        # Single forest over the 45-column target
+        model = base_estimator
+    else:
+        # Wrap with MultiOutputClassifier for 45 binary classifiers
+        model = MultiOutputClassifier(base_estimator, n_jobs=-1)
 
     # Train the model
     model.fit(X_train, y_train)
@@ -83,17 +121,42 @@ def train_model(
     _last_training_metrics['training_samples'] = len(X_train)
     _last_training_metrics['features_count'] = X_train.shape[1]
     _last_training_metrics['n_targets'] = y_train.shape[1]
+    _last_training_metrics['training_mode'] = mode
     _last_training_metrics['trained_at'] = datetime.now().isoformat()
 
     return model
 
 
+def get_training_mode(model: TrainedModel) -> str:
+    """Training mode of a trained artifact."""
+    return TRAINING_MODE_MULTIOUTPUT if isinstance(model, MultiOutputClassifier) else TRAINING_MODE_NATIVE
+
+
+def get_forest_params(model: TrainedModel) -> Dict[str, Any]:
+    """
+    Forest size of a trained artifact.
+
+    Returns:
+        Dict with n_estimators and max_depth (per forest), n_forests and total_trees
+    """
+    if isinstance(model, MultiOutputClassifier):
+        forests = model.estimators_
+    else:
+        forests = [model]
+    return {
+        'n_estimators': forests[0].n_estimators if forests else None,
+        'max_depth': forests[0].max_depth if forests else None,
+        'n_forests': len(forests),
+        'total_trees': sum(len(forest.estimators_) for forest in forests),
+    }
+
+
 # ============================================================================
 # Model Evaluation
 # ============================================================================
 
 def evaluate_model(
-    model: MultiOutputClassifier,
+    model: TrainedModel,
     X_test: pd.DataFrame,
     y_test: pd.DataFrame
 ) -> Dict[str, Any]:
@@ -103,7 +166,7 @@ def evaluate_model(
     Calculates macro-averaged metrics across all 45 lottery number classifiers.
 
     Args:
-        model: Trained MultiOutputClassifier model
+        model: Trained multi-output model (either training mode)
         X_test: Test features
         y_test: Multi-label test targets (DataFrame with 45 columns)
 
@@ -160,7 +223,7 @@ def evaluate_model(
 # ============================================================================
 
 def save_trained_model(
-    model: MultiOutputClassifier,
+    model: TrainedModel,
     metadata: Dict[str, Any],
     model_name: Optional[str] = None
 ) -> str:
@@ -168,7 +231,7 @@ def save_trained_model(
     Save trained multi-output model to disk with metadata.
 
     Args:
-        model: Trained MultiOutputClassifier model
+        model: Trained multi-output model (either training mode)
         metadata: Dictionary with model metadata (accuracy, training info, etc.)
         model_name: Optional custom model name (default: lotto_model_YYYYMMDD)
 
@@ -186,10 +249,10 @@ def save_trained_model(
         metadata['saved_at'] = datetime.now().isoformat()
 
     # Add model type info
-    metadata['model_type'] = 'MultiOutputClassifier'
+    metadata['model_type'] = type(model).__name__
     metadata['base_estimator'] = 'RandomForestClassifier'
-    metadata['n_estimators'] = model.estimators_[0].n_estimators if model.estimators_ else 100
-    metadata['max_depth'] = model.estimators_[0].max_depth if model.estimators_ else None
+    metadata['training_mode'] = get_training_mode(model)
+    metadata.update(get_forest_params(model))
 
     # Save model using model_utils
     save_path = model_utils.save_model(
@@ -198,9 +261,99 @@ def save_trained_model(
         metadata=metadata
     )
 
+    # Serving processes pick the new artifact up through the registry's directory watcher
     return save_path
 
 
+# ============================================================================
+# Training Mode Benchmark
+# ============================================================================
+
+def benchmark_training_modes(
+    X_train: pd.DataFrame,
+    y_train: pd.DataFrame,
+    X_test: pd.DataFrame,
+    y_test: pd.DataFrame,
+    n_estimators: int = 100,
+    max_depth: Optional[int] = None,
+    random_state: int = 42,
+    modes: Sequence[str] = TRAINING_MODES,
+    predict_repeats: int = 20
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Compare training modes on the same split.
+
+    For each mode: training time, pickled artifact size, artifact load time,
+    single-row predict_probabilities latency (the inference path) and the
+    evaluation metrics.
+
+    Args:
+        X_train, y_train: Training split
+        X_test, y_test: Test split (first row is used for predict latency)
+        n_estimators: Trees per forest
+        max_depth: Maximum tree depth
+        random_state: Random seed
+        modes: Training modes to compare
+        predict_repeats: Timed predict_probabilities calls (median reported)
+
+    Returns:
+        Dict keyed by mode with train_seconds, artifact_bytes, load_seconds,
+        predict_ms, total_trees, accuracy, hamming_loss, f1_score
+
+    @CODE:LOTTO-ML-MODEL-001
+    """
+    # Imported here: inference_engine is the serving path, not a training dependency
+    from .inference_engine import predict_probabilities
+
+    results = {}
+    single_row = np.asarray(X_test)[:1]
+
+    for mode in modes:
+        started = time.perf_counter()
+        model = train_model(
+            X_train,
+            y_train,
+            n_estimators=n_estimators,
+            max_depth=max_depth,
+            random_state=random_state,
+            mode=mode
+        )
+        train_seconds = time.perf_counter() - started
+
+        fd, artifact_path = tempfile.mkstemp(suffix='.pkl')
+        os.close(fd)
+        try:
+            joblib.dump(model, artifact_path)
+            artifact_bytes = os.path.getsize(artifact_path)
+
+            started = time.perf_counter()
+            loaded = joblib.load(artifact_path)
+            load_seconds = time.perf_counter() - started
+        finally:
+            os.remove(artifact_path)
+
+        predict_times = []
+        for _ in range(predict_repeats):
+            started = time.perf_counter()
+            predict_probabilities(loaded, single_row)
+            predict_times.append(time.perf_counter() - started)
+
+        metrics = evaluate_model(loaded, X_test, y_test)
+        results[mode] = {
+            'train_seconds': train_seconds,
+            'artifact_bytes': artifact_bytes,
+            'load_seconds': load_seconds,
+            'predict_ms': float(np.median(predict_times) * 1000),
+            'total_trees': get_forest_params(loaded)['total_trees'],
+            'accuracy': float(metrics['accuracy']),
+            'hamming_loss': float(metrics['hamming_loss']),
+            'f1_score': float(metrics['f1_score']),
+        }
+        logger.info(f"Training mode {mode}: {results[mode]}")
+
+    return results
+
+
 # ============================================================================
 # Model Metrics Retrieval
 # ============================================================================
@@ -54,10 +54,15 @@ def save_model(model: Any, model_name: str = None, metadata: Dict = None) -> str
 
     model_path = TRAINED_DIR / f"{model_name}.pkl"
 
-    # Save model using joblib
+    # Save model using joblib (write to a temp file and rename so that
+    # ModelRegistry never picks up a partially written artifact)
+    tmp_path = model_path.with_name(model_path.name + ".tmp")
     try:
-        joblib.dump(model, model_path)
+        joblib.dump(model, tmp_path)
+        os.replace(tmp_path, model_path)
     except Exception as e:
+        if tmp_path.exists():
+            tmp_path.unlink()
         raise IOError(f"Failed to save model: {e}")
 
     # Save metadata if provided (JSON format for easy inspection)
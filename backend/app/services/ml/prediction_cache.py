@@ -0,0 +1,115 @@
+"""
+ML Prediction Cache
+
+For a given model artifact and latest draw, predict_probabilities always returns
+the same 45-element vector. This cache computes it once per (model, draw) together
+with its weighted sampler and confidence scores, so ML requests skip
+the forest predict_proba entirely.
+@CODE:LOTTO-ML-PREDICT-001
+"""
+
+import logging
+import threading
+from typing import Any, Dict, Hashable, Optional
+
+import numpy as np
+
+from ..executors import ml_executor
+from .inference_engine import CombinationSampler, calculate_confidence_scores, predict_probabilities
+
+
+# ============================================================================
+# Module Logger
+# ============================================================================
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# PredictionEntry Class
+# ============================================================================
+
+class PredictionEntry:
+    """
+    Cached prediction for one (model, draw) pair.
+
+    Attributes:
+        key: (model key, feature key)
+        probabilities: Normalized probability vector (read-only, shape: (45,))
+        sampler: Precomputed CombinationSampler for the vector
+        confidence: calculate_confidence_scores result for the vector
+    """
+
+    __slots__ = ('key', 'probabilities', 'sampler', 'confidence')
+
+    def __init__(self, key: Hashable, probabilities: np.ndarray):
+        probabilities = np.asarray(probabilities, dtype=np.float64)
+        probabilities.setflags(write=False)
+
+        self.key = key
+        self.probabilities = probabilities
+        self.sampler = CombinationSampler(probabilities)
+        self.confidence: Dict[str, float] = calculate_confidence_scores(probabilities)
+
+
+# ============================================================================
+# PredictionCache Class
+# ============================================================================
+
+class PredictionCache:
+    """
+    Holds the prediction for the current (model, draw) pair.
+
+    Only the latest pair is kept: a new draw or a hot-swapped model changes
+    the key and the previous entry is simply replaced.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entry: Optional[PredictionEntry] = None
+
+    def get(
+        self,
+        model: Any,
+        model_key: Hashable,
+        features: np.ndarray,
+        features_key: Hashable
+    ) -> PredictionEntry:
+        """
+        Get the cached prediction, computing it on first use.
+
+        Args:
+            model: Trained model with predict_proba
+            model_key: Identity of the model artifact (e.g. LoadedModel.key)
+            features: Inference feature vector (shape: (1, n_features))
+            features_key: Identity of the features (e.g. (draw_number, schema version))
+
+        Returns:
+            PredictionEntry: Probabilities, sampler and confidence for the pair
+        """
+        key = (model_key, features_key)
+
+        entry = self._entry
+        if entry is not None and entry.key == key:
+            return entry
+
+        with self._lock:
+            entry = self._entry
+            if entry is not None and entry.key == key:
+                return entry
+
+            # Forest inference runs on the size-capped ML pool
+            entry = PredictionEntry(key, ml_executor.call(predict_probabilities, model, features))
+            self._entry = entry
+
+        logger.info(f"ML prediction cached for model {model_key} / features {features_key}")
+        return entry
+
+    def invalidate(self) -> None:
+        """Drop the cached prediction"""
+        with self._lock:
+            self._entry = None
+
+
+# Global instance
+prediction_cache = PredictionCache()
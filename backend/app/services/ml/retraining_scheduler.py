@@ -14,9 +14,11 @@ from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
 from sqlalchemy.orm import Session
 
+from ...config import settings
 from .retrain_metadata import RetrainMetadata
 from . import data_preprocessor
 from . import model_trainer
+from .feature_store import feature_store
 
 # ============================================================================
 # Logging
@@ -137,9 +139,9 @@ class RetrainingScheduler:
 
         Cycle steps:
         1. Check if training already in progress (prevent concurrent runs)
-        2. Load lottery draw data from database
+        2. Sync the on-disk feature store (appends new draws, rebuilds on schema change)
         3. Validate data quantity (min 500 draws required)
-        4. Extract ML features
+        4. Read features/labels from the store (memory-mapped, no recomputation)
         5. Train new model
         6. Evaluate model performance
         7. Save model to disk
@@ -163,25 +165,22 @@ class RetrainingScheduler:
             self.metadata.mark_training_start()
             logger.info("Starting model retraining cycle")
 
-            # Step 1: Load data
-            logger.info("Loading draw data from database")
-            draw_data = data_preprocessor.load_draw_data(self.db_session)
+            # Step 1: Sync feature store with the database
+            logger.info("Syncing feature store with draw data")
+            features, labels = feature_store.sync(self.db_session)
 
             # Step 2: Validate data quantity
-            data_count = len(draw_data)
-            logger.info(f"Loaded {data_count} draws")
+            data_count = feature_store.load_manifest()['rows']
+            logger.info(f"Feature store holds {data_count} draws")
 
             if data_count < MIN_TRAINING_SAMPLES:
                 error_msg = f"Insufficient training data: {data_count} draws (minimum {MIN_TRAINING_SAMPLES} required)"
                 raise ValueError(error_msg)
 
-            # Step 3: Extract features
-            logger.info("Extracting ML features")
-            features = data_preprocessor.extract_features(draw_data)
-
-            # Step 4: Prepare train/test split
-            X_train, X_test, y_train, y_test = data_preprocessor.prepare_train_test_split(
+            # Step 3-4: Prepare train/test split from the stored features and labels
+            X_train, X_test, y_train, y_test = data_preprocessor.split_training_arrays(
                 features,
+                labels,
                 test_size=TEST_SIZE_RATIO,
                 random_state=RANDOM_SEED
             )
@@ -192,7 +191,8 @@ class RetrainingScheduler:
                 X_train=X_train,
                 y_train=y_train,
                 n_estimators=N_ESTIMATORS,
-                random_state=RANDOM_SEED
+                random_state=RANDOM_SEED,
+                mode=settings.ml_training_mode
             )
 
             # Step 6: Evaluate model
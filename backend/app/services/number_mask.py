@@ -0,0 +1,138 @@
+"""
+Number Mask
+
+로또 번호 집합을 64비트 정수 비트마스크(번호 n → 비트 n)로 표현하는 경량 타입.
+조합 비교(일치 개수), 포함/제외 필터링, 중복 제거를 리스트나 set 생성 없이
+정수 비트 연산과 popcount로 처리한다.
+"""
+
+from typing import Iterable, Iterator, List, Tuple, Union
+
+
+# ============================================================================
+# Constants
+# ============================================================================
+
+MIN_NUMBER = 1
+MAX_NUMBER = 45
+
+
+# ============================================================================
+# NumberMask
+# ============================================================================
+
+class NumberMask:
+    """
+    비트마스크 기반 번호 집합 (불변).
+
+    Attributes:
+        bits: 번호 n이 포함되면 비트 n이 1인 정수 (0번 비트는 사용하지 않음)
+    """
+
+    __slots__ = ('bits',)
+
+    def __init__(self, bits: int = 0):
+        self.bits = bits
+
+    @classmethod
+    def from_numbers(cls, numbers: Iterable[int]) -> 'NumberMask':
+        """번호 목록으로 생성"""
+        bits = 0
+        for number in numbers:
+            bits |= 1 << number
+        return cls(bits)
+
+    @classmethod
+    def of(cls, value: Union['NumberMask', Iterable[int]]) -> 'NumberMask':
+        """이미 NumberMask이면 그대로, 번호 목록이면 변환"""
+        return value if isinstance(value, NumberMask) else cls.from_numbers(value)
+
+    # ------------------------------------------------------------------------
+    # 집합 연산
+    # ------------------------------------------------------------------------
+
+    def __and__(self, other: 'NumberMask') -> 'NumberMask':
+        return NumberMask(self.bits & other.bits)
+
+    def __or__(self, other: 'NumberMask') -> 'NumberMask':
+        return NumberMask(self.bits | other.bits)
+
+    def __sub__(self, other: 'NumberMask') -> 'NumberMask':
+        return NumberMask(self.bits & ~other.bits)
+
+    def __bool__(self) -> bool:
+        return self.bits != 0
+
+    def __len__(self) -> int:
+        return self.bits.bit_count()
+
+    def __contains__(self, number: int) -> bool:
+        return (self.bits >> number) & 1 == 1
+
+    def __iter__(self) -> Iterator[int]:
+        """포함된 번호를 오름차순으로 순회"""
+        bits = self.bits
+        while bits:
+            lowest = bits & -bits
+            yield lowest.bit_length() - 1
+            bits ^= lowest
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, NumberMask) and self.bits == other.bits
+
+    def __hash__(self) -> int:
+        return hash(self.bits)
+
+    def __repr__(self) -> str:
+        return f"NumberMask({self.to_list()})"
+
+    def match_count(self, other: 'NumberMask') -> int:
+        """두 집합에 공통으로 포함된 번호 개수 (popcount)"""
+        return (self.bits & other.bits).bit_count()
+
+    def intersects(self, other: 'NumberMask') -> bool:
+        """공통 번호가 하나라도 있는지 여부"""
+        return self.bits & other.bits != 0
+
+    def issuperset(self, other: 'NumberMask') -> bool:
+        """other의 모든 번호를 포함하는지 여부"""
+        return other.bits & ~self.bits == 0
+
+    def to_list(self) -> List[int]:
+        """오름차순 번호 리스트"""
+        return list(self)
+
+
+# ============================================================================
+# Winning Grade
+# ============================================================================
+
+def winning_grade(ticket: NumberMask, winning: NumberMask, bonus_number: int) -> Tuple[int, bool, int]:
+    """
+    로또 규칙에 따른 당첨 등수 판정.
+
+    Args:
+        ticket: 추천/구매 번호
+        winning: 당첨번호 6개
+        bonus_number: 보너스 번호
+
+    Returns:
+        Tuple of (일치 개수, 보너스 일치 여부, 등수 1~5, 낙첨 0)
+    """
+    matches = ticket.match_count(winning)
+    bonus_match = bonus_number in ticket
+
+    if matches == 6:
+        grade = 1
+    elif matches == 5 and bonus_match:
+        grade = 2
+    elif matches == 5:
+        grade = 3
+    elif matches == 4:
+        grade = 4
+    elif matches == 3:
+        grade = 5
+    else:
+        grade = 0
+
+    return matches, bonus_match, grade
@@ -0,0 +1,181 @@
+"""
+Number Stats Service
+
+번호별 누적 통계(number_stats, 45행)를 관리한다.
+
+- 새 회차 입력 시 같은 트랜잭션 안에서 증분 갱신 (apply_draw)
+- 백필/데이터 정리 후에는 전체 재구축 (rebuild_number_stats)
+- 통계 조회는 lotto_draws 전체 대신 45행만 읽는다 (load_frequency_statistics)
+"""
+
+import logging
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from ..models.lotto import LottoDraw
+from ..models.number_stat import NumberStat
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# Constants
+# ============================================================================
+
+TOTAL_NUMBERS = 45
+MAIN_NUMBER_COUNT = 6
+
+
+# ============================================================================
+# Incremental Update
+# ============================================================================
+
+def is_initialized(db: Session) -> bool:
+    """number_stats가 45개 번호로 채워져 있는지 여부"""
+    return db.query(func.count(NumberStat.number)).scalar() == TOTAL_NUMBERS
+
+
+def apply_draw(db: Session, draw_number: int, numbers: Iterable[int], bonus_number: int) -> None:
+    """
+    새 회차를 number_stats에 반영 (커밋하지 않음 - 회차 입력과 같은 트랜잭션).
+
+    테이블이 비어 있으면 이번 회차를 포함해 전체를 재구축한다.
+
+    Args:
+        db: 회차 INSERT가 flush된 세션
+        draw_number: 회차 번호
+        numbers: 당첨번호 6개
+        bonus_number: 보너스 번호
+    """
+    if not is_initialized(db):
+        rebuild_number_stats(db, commit=False)
+        return
+
+    # 동시 갱신 방지를 위해 45행 잠금 후 갱신
+    stats = {
+        stat.number: stat
+        for stat in db.query(NumberStat).with_for_update().all()
+    }
+
+    for number in numbers:
+        stat = stats[number]
+        stat.appearances += 1
+        stat.last_appearance = max(stat.last_appearance, draw_number)
+    stats[bonus_number].bonus_appearances += 1
+
+    latest_draw = max(stat.last_appearance for stat in stats.values())
+    for stat in stats.values():
+        stat.gap_since_last = latest_draw - stat.last_appearance if stat.last_appearance else 0
+
+
+# ============================================================================
+# Rebuild
+# ============================================================================
+
+def rebuild_number_stats(db: Session, commit: bool = True) -> int:
+    """
+    lotto_draws 전체에서 number_stats를 다시 계산.
+
+    Args:
+        db: 데이터베이스 세션
+        commit: True면 재구축 후 커밋
+
+    Returns:
+        int: 집계에 사용한 회차 수
+    """
+    rows = db.query(
+        LottoDraw.draw_number,
+        LottoDraw.number_1, LottoDraw.number_2, LottoDraw.number_3,
+        LottoDraw.number_4, LottoDraw.number_5, LottoDraw.number_6,
+        LottoDraw.bonus_number
+    ).order_by(LottoDraw.draw_number).all()
+
+    appearances = np.zeros(TOTAL_NUMBERS + 1, dtype=np.int64)
+    bonus_appearances = np.zeros(TOTAL_NUMBERS + 1, dtype=np.int64)
+    last_appearance = np.zeros(TOTAL_NUMBERS + 1, dtype=np.int64)
+    latest_draw = 0
+
+    if rows:
+        raw = np.asarray(rows, dtype=np.int64)
+        draw_numbers = raw[:, 0]
+        main_numbers = raw[:, 1:1 + MAIN_NUMBER_COUNT].ravel()
+
+        appearances = np.bincount(main_numbers, minlength=TOTAL_NUMBERS + 1)
+        bonus_appearances = np.bincount(raw[:, -1], minlength=TOTAL_NUMBERS + 1)
+        np.maximum.at(last_appearance, main_numbers, np.repeat(draw_numbers, MAIN_NUMBER_COUNT))
+        latest_draw = int(draw_numbers[-1])
+
+    db.query(NumberStat).delete(synchronize_session=False)
+    db.add_all([
+        NumberStat(
+            number=number,
+            appearances=int(appearances[number]),
+            bonus_appearances=int(bonus_appearances[number]),
+            last_appearance=int(last_appearance[number]),
+            gap_since_last=latest_draw - int(last_appearance[number]) if last_appearance[number] else 0
+        )
+        for number in range(1, TOTAL_NUMBERS + 1)
+    ])
+
+    if commit:
+        db.commit()
+
+    logger.info(f"number_stats 재구축 완료: {len(rows)}개 회차")
+    return len(rows)
+
+
+def ensure_number_stats(db: Session) -> bool:
+    """
+    number_stats가 비어 있으면 재구축 (서버 시작 시 호출).
+
+    Returns:
+        bool: 재구축 수행 여부
+    """
+    if is_initialized(db):
+        return False
+    rebuild_number_stats(db)
+    return True
+
+
+# ============================================================================
+# Read
+# ============================================================================
+
+def load_frequency_statistics(db: Session, total_draws: int, latest_draw: int) -> Optional[Dict[int, dict]]:
+    """
+    number_stats 45행으로 번호별 빈도 통계 구성 (LottoAnalyzer 형식).
+
+    Args:
+        db: 데이터베이스 세션
+        total_draws: 기준 총 회차 수
+        latest_draw: 기준 최신 회차 번호
+
+    Returns:
+        Optional[Dict[int, dict]]: 통계, 테이블이 기준 회차와 동기화되지 않았으면 None
+    """
+    stats = db.query(NumberStat).order_by(NumberStat.number).all()
+    if len(stats) != TOTAL_NUMBERS:
+        return None
+
+    # 회차마다 당첨번호 6개가 집계되므로 합계와 최신 회차로 동기화 여부 확인
+    appearance_sum = sum(stat.appearances for stat in stats)
+    stats_latest = max(stat.last_appearance for stat in stats)
+    if appearance_sum != total_draws * MAIN_NUMBER_COUNT or stats_latest != latest_draw:
+        return None
+
+    if total_draws == 0:
+        return {}
+
+    return {
+        stat.number: {
+            'total_appearances': stat.appearances,
+            'frequency_percent': round(stat.appearances * 100.0 / total_draws, 2),
+            'last_appearance': stat.last_appearance,
+            'gap_since_last': stat.gap_since_last
+        }
+        for stat in stats
+        if stat.appearances > 0
+    }
@@ -0,0 +1,210 @@
+"""
+Principal Cache
+
+인증된 요청마다 JWT subject로 users 테이블을 조회하지 않도록
+사용자 행(컬럼 값)을 짧은 TTL로 보관하는 크기 제한 캐시.
+
+- 키: 토큰 subject (숫자 id 문자열 또는 user_id)
+- 적중 시 캐시한 컬럼 값으로 분리(detached) User를 만들어 요청 세션에
+  merge(load=False)로 붙이므로 SQL 없이 일반 영속 객체처럼 사용/수정할 수 있다
+- 무효화: User 행을 변경한 세션이 커밋되면(역할 변경, 비밀번호 변경, 비활성화 등)
+  해당 사용자 항목을 invalidation_bus로 발행해 모든 구독 캐시에서 제거한다
+"""
+
+import copy
+import logging
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from typing import Any, Callable, Dict, Optional, Set
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
+
+from ..config import settings
+from ..models.user import User
+from .invalidation_bus import invalidation_bus
+
+logger = logging.getLogger(__name__)
+
+PRINCIPAL_CHANNEL = "principal"
+
+# 커밋 후 무효화할 사용자 id (Session.info 키)
+_PENDING_INVALIDATIONS = "principal_cache_invalidations"
+
+
+class _CachedPrincipal:
+    __slots__ = ("user_id", "columns", "expires_at")
+
+    def __init__(self, user_id: int, columns: Dict[str, Any], expires_at: float):
+        self.user_id = user_id
+        self.columns = columns
+        self.expires_at = expires_at
+
+
+# ============================================================================
+# PrincipalCache Class
+# ============================================================================
+
+class PrincipalCache:
+    """
+    토큰 subject → 사용자 컬럼 값 TTL/LRU 캐시.
+
+    Attributes:
+        ttl_seconds: 항목 유효 시간 (초)
+        max_entries: 최대 항목 수 (초과 시 가장 오래 쓰지 않은 항목부터 제거)
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 30.0,
+        max_entries: int = 10000,
+        bus=invalidation_bus,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._bus = bus
+        self._clock = clock
+
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, _CachedPrincipal]" = OrderedDict()
+        self._subjects_by_user: Dict[int, Set[str]] = defaultdict(set)
+
+        # 메트릭
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+        self._unsubscribe = bus.subscribe(PRINCIPAL_CHANNEL, self._on_invalidation)
+
+    # ------------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------------
+
+    def get(self, db: Session, subject: str) -> Optional[User]:
+        """
+        캐시된 사용자를 요청 세션에 연결해 반환 (없거나 만료되면 None).
+
+        Args:
+            db: 요청 데이터베이스 세션
+            subject: 토큰 subject
+        """
+        with self._lock:
+            entry = self._entries.get(subject)
+            if entry is not None and entry.expires_at <= self._clock():
+                self._remove(subject)
+                entry = None
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(subject)
+            self._hits += 1
+            columns = entry.columns
+
+        user = User.__mapper__.class_manager.new_instance()
+        for key, value in columns.items():
+            # 요청 중 JSON 컬럼을 제자리 수정해도 캐시 값이 바뀌지 않도록 복사
+            set_committed_value(user, key, copy.deepcopy(value))
+        make_transient_to_detached(user)
+        return db.merge(user, load=False)
+
+    def put(self, subject: str, user: User) -> None:
+        """커밋된 사용자 행을 subject로 저장"""
+        columns = {
+            attr.key: copy.deepcopy(getattr(user, attr.key))
+            for attr in inspect(User).column_attrs
+        }
+        with self._lock:
+            self._remove(subject)
+            self._entries[subject] = _CachedPrincipal(user.id, columns, self._clock() + self.ttl_seconds)
+            self._subjects_by_user[user.id].add(subject)
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+
+    def _remove(self, subject: str) -> None:
+        """항목 제거 (lock 보유 상태에서 호출)"""
+        entry = self._entries.pop(subject, None)
+        if entry is None:
+            return
+        subjects = self._subjects_by_user.get(entry.user_id)
+        if subjects is not None:
+            subjects.discard(subject)
+            if not subjects:
+                del self._subjects_by_user[entry.user_id]
+
+    # ------------------------------------------------------------------------
+    # Invalidation
+    # ------------------------------------------------------------------------
+
+    def invalidate_user(self, user_id: int) -> None:
+        """사용자 항목 무효화 (구독 중인 모든 캐시에 발행)"""
+        self._bus.publish(PRINCIPAL_CHANNEL, {"user_id": user_id})
+
+    def clear(self) -> None:
+        """전체 항목 제거 (이 캐시만)"""
+        with self._lock:
+            self._entries.clear()
+            self._subjects_by_user.clear()
+
+    def _on_invalidation(self, message: Dict[str, Any]) -> None:
+        with self._lock:
+            for subject in list(self._subjects_by_user.get(message["user_id"], ())):
+                self._remove(subject)
+            self._invalidations += 1
+
+    def close(self) -> None:
+        """무효화 채널 구독 해제"""
+        self._unsubscribe()
+
+    def status(self) -> dict:
+        """항목 수와 적중 메트릭"""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "ttl_seconds": self.ttl_seconds,
+                "max_entries": self.max_entries,
+                "hits": self._hits,
+                "misses": self._misses,
+                "invalidations": self._invalidations,
+            }
+
+
+# 전역 인스턴스
+principal_cache = PrincipalCache(
+    ttl_seconds=settings.principal_cache_ttl_seconds,
+    max_entries=settings.principal_cache_max_entries
+)
+
+
+# ============================================================================
+# Session Hooks
+# ============================================================================
+
+@event.listens_for(Session, "before_flush")
+def _collect_user_changes(session: Session, flush_context, instances) -> None:
+    """플러시되는 User 변경(수정/삭제) 수집"""
+    for obj in list(session.dirty) + list(session.deleted):
+        if isinstance(obj, User) and obj.id is not None and (
+            obj in session.deleted or session.is_modified(obj)
+        ):
+            session.info.setdefault(_PENDING_INVALIDATIONS, set()).add(obj.id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_users(session: Session) -> None:
+    """커밋된 User 변경 무효화 발행 (커밋 전에 다른 요청이 옛 값을 다시 채워도 제거됨)"""
+    if session.in_nested_transaction():
+        # SAVEPOINT 해제는 아직 커밋이 아니므로 바깥 트랜잭션 커밋 때 발행
+        return
+    for user_id in session.info.pop(_PENDING_INVALIDATIONS, ()):
+        principal_cache.invalidate_user(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back_users(session: Session) -> None:
+    if session.in_nested_transaction():
+        # SAVEPOINT 롤백은 바깥 트랜잭션의 변경까지 되돌리지 않으므로 유지 (중복 무효화는 무해)
+        return
+    session.info.pop(_PENDING_INVALIDATIONS, None)
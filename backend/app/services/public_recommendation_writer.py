@@ -0,0 +1,281 @@
+"""
+Public Recommendation Writer
+
+추천 생성 시 남기는 공공 추천 기록(public_recommendations)을 요청 트랜잭션에서 분리해
+프로세스 내 write-behind 큐로 모아 기록하는 모듈.
+
+- 요청은 행을 큐에 넣기만 하고 즉시 반환 (생성 지연이 total_count에 비례하지 않음)
+- 백그라운드 스레드가 batch_size 행이 모이거나 flush_interval_ms가 지나면
+  현재 회차를 배치당 한 번만 조회해 다중 행 INSERT 한 번으로 기록
+- 애플리케이션 종료 시 남은 행을 모두 기록
+
+내구성 모드 (settings.public_recommendation_durability):
+- "async": write-behind (기본값, 플러시 전 프로세스가 죽으면 큐의 행은 유실)
+- "sync": 요청 세션에 같은 다중 행 INSERT를 추가해 요청 트랜잭션과 함께 커밋
+"""
+
+import logging
+import threading
+from collections import deque
+from datetime import datetime
+from typing import Callable, Deque, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import func, insert, select
+from sqlalchemy.orm import Session
+
+from ..config import settings
+from ..database import SessionLocal
+from ..models.lotto import LottoDraw
+from ..models.public_recommendation import PublicRecommendation
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# Constants
+# ============================================================================
+
+DURABILITY_ASYNC = "async"
+DURABILITY_SYNC = "sync"
+DURABILITY_MODES = (DURABILITY_ASYNC, DURABILITY_SYNC)
+
+# 기록 실패가 계속될 때 큐에 보관할 최대 행 수 (초과분은 오래된 것부터 버림)
+MAX_PENDING_ROWS = 50000
+
+# (numbers, generation_method, confidence_score, user_type)
+PublicEntry = Tuple[List[int], str, Optional[int], str]
+
+
+def make_entry(
+    numbers: Sequence[int],
+    generation_method: str,
+    confidence_score: Optional[float] = None,
+    user_type: str = "guest"
+) -> PublicEntry:
+    """공공 추천 기록 행 생성 (번호 정렬, 신뢰도 정수화)"""
+    return (
+        sorted(int(n) for n in numbers),
+        generation_method,
+        int(confidence_score) if confidence_score else None,
+        user_type
+    )
+
+
+def current_draw_number(db: Session) -> Optional[int]:
+    """현재(다음 추첨) 회차 = 최신 회차 + 1 (데이터가 없으면 None)"""
+    latest = db.scalar(select(func.max(LottoDraw.draw_number)))
+    return latest + 1 if latest is not None else None
+
+
+def insert_entries(db: Session, entries: Sequence[PublicEntry], draw_number: int) -> None:
+    """공공 추천 기록을 다중 행 INSERT 한 번으로 추가 (커밋하지 않음)"""
+    db.execute(insert(PublicRecommendation.__table__).values([
+        {
+            "numbers": numbers,
+            "generation_method": generation_method,
+            "confidence_score": confidence_score,
+            "analysis_data": None,
+            "draw_number": draw_number,
+            "user_type": user_type,
+            "is_dummy": False,
+        }
+        for numbers, generation_method, confidence_score, user_type in entries
+    ]))
+
+
+# ============================================================================
+# PublicRecommendationWriter Class
+# ============================================================================
+
+class PublicRecommendationWriter:
+    """
+    공공 추천 기록 write-behind 큐.
+
+    Attributes:
+        batch_size: 이 행 수가 모이면 즉시 플러시
+        flush_interval_ms: 마지막 플러시 후 이 시간이 지나면 플러시
+        durability: "async" (write-behind) 또는 "sync" (요청 트랜잭션에서 기록)
+    """
+
+    def __init__(
+        self,
+        batch_size: int = 200,
+        flush_interval_ms: int = 500,
+        durability: str = DURABILITY_ASYNC,
+        session_factory: Callable[[], Session] = SessionLocal
+    ):
+        if durability not in DURABILITY_MODES:
+            raise ValueError(f"지원하지 않는 내구성 모드: {durability} (가능: {', '.join(DURABILITY_MODES)})")
+
+        self.batch_size = batch_size
+        self.flush_interval_ms = flush_interval_ms
+        self.durability = durability
+        self._session_factory = session_factory
+
+        self._pending: Deque[PublicEntry] = deque()
+        self._condition = threading.Condition()
+        self._flush_lock = threading.Lock()
+        self._stopping = False
+        self._worker: Optional[threading.Thread] = None
+
+        # 메트릭
+        self._written = 0
+        self._failed_flushes = 0
+        self._dropped = 0
+        self._last_flush_at: Optional[datetime] = None
+
+    # ------------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------------
+
+    def record(self, db: Session, entries: Iterable[PublicEntry]) -> int:
+        """
+        공공 추천 기록 요청.
+
+        async 모드에서는 큐에 넣고 반환하며, sync 모드(또는 플러시 스레드가 없을 때)에는
+        요청 세션에 다중 행 INSERT를 추가한다 (커밋은 호출자가 수행).
+
+        Args:
+            db: 요청 데이터베이스 세션 (sync 모드에서 사용)
+            entries: make_entry로 만든 행
+
+        Returns:
+            int: 기록 요청한 행 수
+        """
+        entries = list(entries)
+        if not entries:
+            return 0
+
+        if self.durability == DURABILITY_SYNC or not self.is_running:
+            draw_number = current_draw_number(db)
+            if draw_number is None:
+                logger.warning("로또 데이터가 없어 공공 추천 기록을 건너뜁니다")
+                return 0
+            insert_entries(db, entries, draw_number)
+            return len(entries)
+
+        with self._condition:
+            self._pending.extend(entries)
+            self._drop_overflow()
+            if len(self._pending) >= self.batch_size:
+                self._condition.notify()
+        return len(entries)
+
+    def _drop_overflow(self) -> None:
+        """큐 상한 초과분 폐기 (condition 보유 상태에서 호출)"""
+        overflow = len(self._pending) - MAX_PENDING_ROWS
+        if overflow > 0:
+            for _ in range(overflow):
+                self._pending.popleft()
+            self._dropped += overflow
+            logger.error(f"공공 추천 기록 큐 초과로 {overflow}건 폐기")
+
+    # ------------------------------------------------------------------------
+    # Flushing
+    # ------------------------------------------------------------------------
+
+    def flush(self) -> int:
+        """
+        큐에 쌓인 행을 모두 기록.
+
+        Returns:
+            int: 기록한 행 수 (실패 시 행은 큐 앞쪽으로 되돌림)
+        """
+        with self._flush_lock:
+            with self._condition:
+                batch = list(self._pending)
+                self._pending.clear()
+            if not batch:
+                return 0
+
+            db = self._session_factory()
+            try:
+                draw_number = current_draw_number(db)
+                if draw_number is None:
+                    raise RuntimeError("로또 데이터가 없어 현재 회차를 알 수 없습니다")
+                insert_entries(db, batch, draw_number)
+                db.commit()
+            except Exception as e:
+                db.rollback()
+                with self._condition:
+                    self._pending.extendleft(reversed(batch))
+                    self._drop_overflow()
+                    self._failed_flushes += 1
+                logger.error(f"공공 추천 기록 플러시 실패 ({len(batch)}건, 다음 주기에 재시도): {e}")
+                return 0
+            finally:
+                db.close()
+
+            with self._condition:
+                self._written += len(batch)
+                self._last_flush_at = datetime.now()
+            logger.debug(f"공공 추천 기록 {len(batch)}건 저장 (회차: {draw_number})")
+            return len(batch)
+
+    def _flush_loop(self) -> None:
+        interval = self.flush_interval_ms / 1000
+        while True:
+            with self._condition:
+                if not self._stopping and len(self._pending) < self.batch_size:
+                    self._condition.wait(interval)
+                if self._stopping:
+                    break
+            self.flush()
+
+    # ------------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------------
+
+    @property
+    def is_running(self) -> bool:
+        return self._worker is not None and self._worker.is_alive()
+
+    def start(self) -> None:
+        """플러시 스레드 시작 (sync 모드에서는 시작하지 않음)"""
+        if self.durability == DURABILITY_SYNC or self.is_running:
+            return
+
+        with self._condition:
+            self._stopping = False
+        self._worker = threading.Thread(
+            target=self._flush_loop,
+            name="public-recommendation-writer",
+            daemon=True
+        )
+        self._worker.start()
+
+    def stop(self) -> int:
+        """
+        플러시 스레드 종료 후 남은 행 기록 (애플리케이션 종료 시).
+
+        Returns:
+            int: 마지막으로 기록한 행 수
+        """
+        with self._condition:
+            self._stopping = True
+            self._condition.notify()
+        if self._worker is not None:
+            self._worker.join(timeout=5)
+            self._worker = None
+        return self.flush()
+
+    def status(self) -> dict:
+        """큐 상태와 기록 메트릭"""
+        with self._condition:
+            return {
+                "durability": self.durability,
+                "running": self.is_running,
+                "pending": len(self._pending),
+                "written": self._written,
+                "failed_flushes": self._failed_flushes,
+                "dropped": self._dropped,
+                "last_flush_at": self._last_flush_at.isoformat() if self._last_flush_at else None,
+            }
+
+
+# 전역 인스턴스
+public_recommendation_writer = PublicRecommendationWriter(
+    batch_size=settings.public_recommendation_batch_size,
+    flush_interval_ms=settings.public_recommendation_flush_interval_ms,
+    durability=settings.public_recommendation_durability
+)
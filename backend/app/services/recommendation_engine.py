@@ -1,23 +1,27 @@
-import random
-import os
 import numpy as np
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, Iterable, List, Tuple, Optional
 from sqlalchemy.orm import Session
 from .lotto_analyzer import LottoAnalyzer
+from .combination_scorer import as_candidate_array, score_combinations_batch
+from .combination_table import combination_scores
+from .combination_sampler import combination_masks, sample_combinations
+from .number_mask import NumberMask, winning_grade
 from ..schemas.recommendation import PreferenceSettings
-from .ml.model_utils import load_model, get_latest_model_path
-from .ml.data_preprocessor import prepare_features_for_inference
+from .ml.model_registry import model_registry
+from .ml.feature_cache import inference_features
+from .ml.prediction_cache import prediction_cache
 from .ml.inference_engine import (
-    predict_probabilities,
     generate_combinations as ml_generate_combinations,
-    calculate_confidence_scores,
     apply_user_preferences
 )
 
 class Combination:
     """로또 번호 조합 클래스"""
-    def __init__(self, numbers: List[int], confidence_score: float = 0.0):
-        self.numbers = sorted(numbers)  # 번호를 오름차순으로 정렬
+    __slots__ = ('mask', 'numbers', 'confidence_score', 'total_score', 'analysis')
+    
+    def __init__(self, numbers: Iterable[int], confidence_score: float = 0.0, mask: Optional[NumberMask] = None):
+        self.mask = mask if mask is not None else NumberMask.from_numbers(numbers)  # 비트마스크 (중복 제거/비교용)
+        self.numbers = self.mask.to_list()  # 번호를 오름차순으로 정렬
         self.confidence_score = confidence_score  # AI 신뢰도 점수 (0.0~1.0)
         self.total_score = 0.0  # 종합 점수
         self.analysis = None  # 번호 조합 분석 데이터
@@ -28,13 +32,16 @@ class RecommendationEngine:
     @CODE:LOTTO-ML-INTEGRATE-001: ML integration added
     @DOC:LOTTO-ML-INTEGRATE-001 → .moai/specs/SPEC-LOTTO-ML-INTEGRATE-001/spec.md
     """
+    # 등수별 당첨 금액 (예시: 1등 20억, 2등 5천만, 3등 150만, 4등 5만, 5등 5천원)
+    PRIZE_AMOUNTS = {1: 2000000000, 2: 50000000, 3: 1500000, 4: 50000, 5: 5000}
+    
     def __init__(self, db_session: Session, use_ml_model: bool = False):
         self.db = db_session
         self.analyzer = LottoAnalyzer(db_session)  # 로또 데이터 분석기
 
         # @CODE:LOTTO-ML-INTEGRATE-001: ML mode configuration
         self.use_ml_model = use_ml_model
-        self.ml_engine = None  # Lazy loading (load model on first use)
+        self.ml_engine = None  # Resolved from model_registry on first use
 
         # 기본 점수 계산 가중치 설정
         self.weights = {
@@ -168,126 +175,49 @@ class RecommendationEngine:
         
         return adjusted_scores
     
-    def _generate_candidate_combinations(self, scores: Dict[int, float], count: int, preferences: PreferenceSettings = None) -> List[List[int]]:
-        """후보 조합 생성 - 몬테카를로 샘플링 방식"""
-        combinations = []
-        
+    def _generate_candidate_combinations(self, scores: Dict[int, float], count: int, preferences: PreferenceSettings = None) -> np.ndarray:
+        """후보 조합 생성 - 가중치 비례 비복원 배치 샘플링 (Gumbel-top-k)"""
         # 사용자 선호도에서 포함/제외 번호 추출
         include_numbers = preferences.include_numbers if preferences else []
         exclude_numbers = preferences.exclude_numbers if preferences else []
         
-        # 사용 가능한 번호 목록 생성 (제외할 번호 제거)
-        available_numbers = [num for num in range(1, 46) if num not in exclude_numbers]
-        available_weights = [scores[num] for num in available_numbers]  # 각 번호의 가중치
-        
-        attempts = 0
-        max_attempts = count * 10  # 포함할 번호가 있을 때 더 많은 시도 필요
+        # 번호별 가중치 배열 (인덱스 = 번호)
+        number_weights = np.ones(46)
+        for number, score in scores.items():
+            number_weights[number] = score
+        
+        # 포함 번호는 고정, 제외 번호는 후보 풀에서 제거한 뒤 고유 조합만 추출 ((N, 6) 배열)
+        return sample_combinations(
+            number_weights,
+            count,
+            include_numbers=include_numbers,
+            exclude_numbers=exclude_numbers
+        )
+    
+    def _score_combinations(self, combinations) -> List[Combination]:
+        """AI 종합 분석을 통한 조합별 신뢰도 점수 계산 (배치 벡터 연산)"""
+        if len(combinations) == 0:
+            return []
+        
+        # 번호별 기본 점수는 조합과 무관하므로 한 번만 계산 (인덱스 = 번호)
+        base_scores = self._calculate_base_scores()
+        number_scores = np.ones(46)
+        for number, score in base_scores.items():
+            number_scores[number] = score
+        
+        # 개별점수(40%) + 패턴점수(35%) + 균형점수(25%) 및 신뢰도 정규화(15-65%)
+        candidates = as_candidate_array(combinations)
+        total_scores, confidence_scores = score_combinations_batch(
+            candidates, number_scores, score_table=combination_scores
+        )
         
-        # 요청된 개수만큼 조합 생성
-        while len(combinations) < count and attempts < max_attempts:
-            attempts += 1
-            
-            if include_numbers:
-                # 포함할 번호가 있는 경우: 포함할 번호를 먼저 선택하고 나머지 채우기
-                combination = include_numbers.copy()
-                
-                # 나머지 번호를 가중 확률로 선택
-                remaining_count = 6 - len(combination)
-                if remaining_count > 0:
-                    # 사용 가능한 번호에서 포함할 번호 제외
-                    remaining_available = [num for num in available_numbers if num not in combination]
-                    remaining_weights = [scores[num] for num in remaining_available]
-                    
-                    if remaining_weights:
-                        # 가중 확률로 나머지 번호 선택
-                        selected = random.choices(remaining_available, weights=remaining_weights, k=remaining_count)
-                        
-                        # 중복 제거 및 추가
-                        for num in selected:
-                            if num not in combination and len(combination) < 6:
-                                combination.append(num)
-                        
-                        # 정확히 6개가 될 때까지 재시도
-                        while len(combination) < 6:
-                            additional = random.choices(remaining_available, weights=remaining_weights, k=1)[0]
-                            if additional not in combination:
-                                combination.append(additional)
-                else:
-                    # 포함할 번호가 이미 6개인 경우
-                    pass
-            else:
-                # 포함할 번호가 없는 경우: 가중 확률로 6개 번호 선택
-                selected = random.choices(available_numbers, weights=available_weights, k=6)
-                
-                # 중복 제거 및 정렬
-                unique_selected = list(set(selected))
-                
-                # 정확히 6개가 될 때까지 재시도
-                while len(unique_selected) < 6:
-                    additional = random.choices(available_numbers, weights=available_weights, k=1)[0]
-                    if additional not in unique_selected:
-                        unique_selected.append(additional)
-                
-                combination = unique_selected[:6]
-            
-            # 정렬 및 중복 조합 방지
-            combination = sorted(combination)
-            if combination not in combinations:
-                combinations.append(combination)
+        masks = combination_masks(candidates)
         
-        return combinations
-    
-    def _score_combinations(self, combinations: List[List[int]]) -> List[Combination]:
-        """AI 종합 분석을 통한 조합별 신뢰도 점수 계산"""
         scored_combinations = []
-        
-        for combo in combinations:
-            combination = Combination(combo)
-            
-            # 1단계: 번호별 개별 점수 계산 (출현빈도 + 최근트렌드 기반)
-            number_scores = self._calculate_base_scores()
-            individual_score = sum(number_scores[num] for num in combo) / 6  # 6개 번호의 평균 점수
-            
-            # 2단계: 조합 패턴 점수 계산 (홀짝, 구간분포, 연속번호 등)
-            pattern_score = self._calculate_pattern_score(combo)
-            
-            # 3단계: 통계적 균형 점수 계산 (평균, 분산, 극값분포 등)
-            balance_score = self._calculate_balance_score(combo)
-            
-            # 4단계: AI 가중치를 적용한 종합 점수 계산
-            total_score = (
-                individual_score * 0.40 +      # 개별 번호 점수 (40%)
-                pattern_score * 0.35 +         # 조합 패턴 점수 (35%)
-                balance_score * 0.25           # 통계적 균형 점수 (25%)
-            )
-            
-            # 5단계: 신뢰도 점수 정규화 (15-65% 범위로 현실적 분포)
+        for bits, total_score, confidence_score in zip(masks.tolist(), total_scores.tolist(), confidence_scores.tolist()):
+            combination = Combination((), mask=NumberMask(bits))
             combination.total_score = total_score
-            
-            # 랜덤 요소 추가로 더 다양한 점수 분포 생성 (±10% 변동)
-            import random
-            random_factor = random.uniform(0.9, 1.1)
-            adjusted_score = total_score * random_factor
-            
-            # 점수 구간별 차등 적용으로 현실적인 분포 생성
-            if adjusted_score > 0.85:
-                # 매우 우수한 조합 (5%): 55-65%
-                normalized_score = 0.55 + (adjusted_score - 0.85) * 0.67
-            elif adjusted_score > 0.70:
-                # 우수한 조합 (15%): 45-55%
-                normalized_score = 0.45 + (adjusted_score - 0.70) * 0.67
-            elif adjusted_score > 0.50:
-                # 양호한 조합 (30%): 32-45%
-                normalized_score = 0.32 + (adjusted_score - 0.50) * 0.65
-            elif adjusted_score > 0.30:
-                # 보통 조합 (30%): 22-32%
-                normalized_score = 0.22 + (adjusted_score - 0.30) * 0.50
-            else:
-                # 낮은 조합 (20%): 15-22%
-                normalized_score = 0.15 + adjusted_score * 0.23
-            
-            # 최종 신뢰도 점수 (15-65% 범위로 제한)
-            combination.confidence_score = min(0.65, max(0.15, normalized_score))
+            combination.confidence_score = confidence_score
             scored_combinations.append(combination)
         
         return scored_combinations
@@ -511,17 +441,16 @@ class RecommendationEngine:
         sorted_combinations = sorted(combinations, key=lambda x: x.total_score, reverse=True)
         
         selected = []
-        exclude_set = {tuple(sorted(combo)) for combo in exclude_combinations}  # 제외할 조합들
+        exclude_set = {NumberMask.from_numbers(combo) for combo in exclude_combinations}  # 제외할 조합들
         
         # 요청된 개수만큼 상위 조합 선택
         for combo in sorted_combinations:
             if len(selected) >= count:
                 break  # 요청된 개수만큼 선택 완료
             
-            combo_tuple = tuple(combo.numbers)
-            if combo_tuple not in exclude_set:  # 제외 목록에 없으면 선택
+            if combo.mask not in exclude_set:  # 제외 목록에 없으면 선택
                 selected.append(combo)
-                exclude_set.add(combo_tuple)  # 중복 방지를 위해 추가
+                exclude_set.add(combo.mask)  # 중복 방지를 위해 추가
         
         return selected
     
@@ -530,28 +459,14 @@ class RecommendationEngine:
         if len(combination) != 6 or len(winning_numbers) != 6:
             return {'rank': None, 'amount': 0, 'matched': 0}  # 잘못된 입력
         
-        # 일치하는 번호 개수 계산
-        matched = len(set(combination) & set(winning_numbers))
-        
-        # 당첨 등수 결정 (로또 규칙에 따라)
-        if matched == 6:
-            rank = 1
-            amount = 2000000000  # 1등: 20억원 (예시)
-        elif matched == 5 and bonus_number in combination:
-            rank = 2
-            amount = 50000000    # 2등: 5천만원 (예시)
-        elif matched == 5:
-            rank = 3
-            amount = 1500000     # 3등: 150만원 (예시)
-        elif matched == 4:
-            rank = 4
-            amount = 50000       # 4등: 5만원 (예시)
-        elif matched == 3:
-            rank = 5
-            amount = 5000        # 5등: 5천원 (예시)
-        else:
-            rank = None
-            amount = 0           # 미당첨
+        # 일치 개수(popcount) 및 당첨 등수 결정 (로또 규칙에 따라)
+        matched, _, grade = winning_grade(
+            NumberMask.from_numbers(combination),
+            NumberMask.from_numbers(winning_numbers),
+            bonus_number
+        )
+        rank = grade if grade > 0 else None
+        amount = self.PRIZE_AMOUNTS.get(grade, 0)
         
         return {
             'rank': rank,        # 당첨 등수
@@ -570,23 +485,19 @@ class RecommendationEngine:
 
         @CODE:LOTTO-ML-INTEGRATE-001
         """
-        # Lazy load ML model on first use
-        if self.ml_engine is None:
-            model_path = get_latest_model_path()
-
-            if model_path is None or not os.path.exists(model_path):
-                raise FileNotFoundError("ML model not found. Falling back to statistical mode.")
-
-            self.ml_engine = load_model(model_path)
+        # Shared process-wide model (loaded at startup, hot-reloaded on new artifacts)
+        active_model = model_registry.get_active()
+        self.ml_engine = active_model.model
 
-        # Prepare features for inference
-        features = prepare_features_for_inference(self.db)
+        # Cached inference features (rebuilt only when a new draw arrives)
+        features_key, features = inference_features.get_entry(self.db)
 
-        # Get probability predictions from ML model
-        probabilities = predict_probabilities(self.ml_engine, features)
+        # Probabilities, sampler and confidence computed once per (model, draw)
+        prediction = prediction_cache.get(active_model.model, active_model.key, features, features_key)
+        probabilities = prediction.probabilities
 
         # Generate combinations using weighted sampling
-        raw_combinations = ml_generate_combinations(probabilities, count=count * 2)
+        raw_combinations = ml_generate_combinations(probabilities, count=count * 2, sampler=prediction.sampler)
 
         # Apply user preferences (filter combinations)
         if preferences:
@@ -598,13 +509,13 @@ class RecommendationEngine:
 
             # If too few combinations after filtering, regenerate more
             if len(filtered_combinations) < count:
-                raw_combinations = ml_generate_combinations(probabilities, count=count * 5)
+                raw_combinations = ml_generate_combinations(probabilities, count=count * 5, sampler=prediction.sampler)
                 filtered_combinations = apply_user_preferences(raw_combinations, pref_dict)
 
             raw_combinations = filtered_combinations[:count * 2]
 
-        # Calculate confidence scores
-        confidence_scores = calculate_confidence_scores(probabilities)
+        # Confidence scores (cached with the prediction)
+        confidence_scores = prediction.confidence
 
         # Convert to Combination objects with confidence scores
         combinations = []
@@ -0,0 +1,248 @@
+"""
+Recommendation Stats Service
+
+공공/개인 추천 데이터 통계를 조건부 집계(SUM(CASE ...)) 한 번의 스캔으로 계산한다.
+
+- 회차 지정 통계: 해당 회차 행만 한 번 스캔해 모든 분류(생성 방법, 사용자 타입, 최근 7일)를 계산
+- 전체 통계: 마감된 회차는 recommendation_draw_stats 롤업 합계로, 진행 중인 회차만 실시간 집계
+  (테이블 크기와 무관하게 인덱스 조회 몇 번으로 끝남)
+- 마감 회차 = 최신 추첨 회차보다 이전 회차 (최신 추첨 회차는 자동 더미 데이터가 추가되므로 실시간 집계)
+- 롤업은 새 회차 입력 트랜잭션(AutoUpdater)과 서버 시작 시 백필에서만 기록한다.
+  조회 경로는 읽기 전용이며, 아직 롤업되지 않은 회차는 실시간 집계에 포함된다
+"""
+
+import logging
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from sqlalchemy import case, func
+from sqlalchemy.orm import Session
+
+from ..models.lotto import LottoDraw
+from ..models.public_recommendation import PublicRecommendation
+from ..models.recommendation_draw_stat import RecommendationDrawStat
+from ..models.saved_recommendation import SavedRecommendation
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# Constants
+# ============================================================================
+
+BREAKDOWN_KEYS = ('total', 'ai', 'manual', 'member', 'guest')
+
+
+# ============================================================================
+# Helper Functions
+# ============================================================================
+
+def _count_if(condition):
+    """조건을 만족하는 행 수 (조건부 집계)"""
+    return func.coalesce(func.sum(case((condition, 1), else_=0)), 0)
+
+
+def _public_breakdown_columns():
+    """공공 추천 분류별 집계 컬럼 (BREAKDOWN_KEYS 순서)"""
+    return (
+        func.count(PublicRecommendation.id),
+        _count_if(PublicRecommendation.generation_method == "ai"),
+        _count_if(PublicRecommendation.generation_method == "manual"),
+        _count_if(PublicRecommendation.user_type == "member"),
+        _count_if(PublicRecommendation.user_type == "guest"),
+    )
+
+
+def latest_closed_draw(db: Session) -> int:
+    """롤업 대상 마지막 회차 (최신 추첨 회차 - 1, 데이터가 없으면 0)"""
+    latest_draw = db.query(func.max(LottoDraw.draw_number)).scalar() or 0
+    return max(latest_draw - 1, 0)
+
+
+# ============================================================================
+# Single-pass Aggregation
+# ============================================================================
+
+def aggregate_public(
+    db: Session,
+    draw_number: Optional[int] = None,
+    min_draw_number: Optional[int] = None,
+    since: Optional[datetime] = None
+) -> Dict[str, int]:
+    """
+    공공 추천 데이터 분류별 개수를 한 번의 스캔으로 집계.
+
+    Args:
+        db: 데이터베이스 세션
+        draw_number: 특정 회차만 집계
+        min_draw_number: 이 회차 이상만 집계 (진행 중인 회차)
+        since: 지정 시 이후 생성된 행 수(recent)도 함께 집계
+
+    Returns:
+        Dict[str, int]: total, ai, manual, member, guest (+ recent)
+    """
+    columns = _public_breakdown_columns()
+    if since is not None:
+        columns += (_count_if(PublicRecommendation.created_at >= since),)
+
+    query = db.query(*columns)
+    if draw_number is not None:
+        query = query.filter(PublicRecommendation.draw_number == draw_number)
+    if min_draw_number is not None:
+        query = query.filter(PublicRecommendation.draw_number >= min_draw_number)
+
+    row = query.one()
+    result = {key: int(value) for key, value in zip(BREAKDOWN_KEYS, row)}
+    if since is not None:
+        result['recent'] = int(row[-1])
+    return result
+
+
+def aggregate_personal(
+    db: Session,
+    draw_number: Optional[int] = None,
+    since: Optional[datetime] = None
+) -> Dict[str, int]:
+    """
+    개인 저장 데이터 전체 수와 최근 생성 수를 한 번의 스캔으로 집계.
+
+    Returns:
+        Dict[str, int]: total (+ recent)
+    """
+    columns = (func.count(SavedRecommendation.id),)
+    if since is not None:
+        columns += (_count_if(SavedRecommendation.created_at >= since),)
+
+    query = db.query(*columns)
+    if draw_number is not None:
+        query = query.filter(SavedRecommendation.target_draw_number == draw_number)
+
+    row = query.one()
+    result = {'total': int(row[0])}
+    if since is not None:
+        result['recent'] = int(row[1])
+    return result
+
+
+# ============================================================================
+# Closed-draw Rollups
+# ============================================================================
+
+def rolled_through_draw(db: Session) -> int:
+    """마지막 롤업 회차 (롤업이 없으면 0)"""
+    return db.query(func.max(RecommendationDrawStat.draw_number)).scalar() or 0
+
+
+def refresh_draw_rollups(db: Session, through_draw: Optional[int] = None, commit: bool = True) -> int:
+    """
+    아직 롤업되지 않은 마감 회차를 한 번의 GROUP BY로 집계해 저장.
+
+    롤업은 1회차부터 연속으로 유지되므로 (마지막 롤업 회차, through_draw] 구간만 계산한다.
+    추천 데이터가 없는 회차도 0으로 저장해 구간이 끊기지 않게 한다.
+    새 회차 입력 트랜잭션과 서버 시작 시 백필에서 호출한다 (조회 경로에서는 호출하지 않음).
+
+    Args:
+        db: 데이터베이스 세션
+        through_draw: 롤업할 마지막 회차 (기본값: 최신 마감 회차)
+        commit: 커밋 여부 (호출자 트랜잭션에 포함하려면 False)
+
+    Returns:
+        int: 새로 롤업한 회차 수
+    """
+    if through_draw is None:
+        through_draw = latest_closed_draw(db)
+    rolled_through = rolled_through_draw(db)
+    if through_draw <= rolled_through:
+        return 0
+
+    rows = db.query(PublicRecommendation.draw_number, *_public_breakdown_columns()).filter(
+        PublicRecommendation.draw_number > rolled_through,
+        PublicRecommendation.draw_number <= through_draw
+    ).group_by(PublicRecommendation.draw_number).all()
+    counts = {row[0]: row[1:] for row in rows}
+
+    empty = (0,) * len(BREAKDOWN_KEYS)
+    db.add_all([
+        RecommendationDrawStat(
+            draw_number=draw_number,
+            **{key: int(value) for key, value in zip(BREAKDOWN_KEYS, counts.get(draw_number, empty))}
+        )
+        for draw_number in range(rolled_through + 1, through_draw + 1)
+    ])
+    if commit:
+        db.commit()
+
+    logger.info(f"추천 통계 롤업 갱신: {rolled_through + 1}~{through_draw}회차")
+    return through_draw - rolled_through
+
+
+def refresh_draw_rollup(db: Session, draw_number: int) -> None:
+    """
+    이미 롤업된 회차에 데이터가 추가/삭제되었을 때 해당 회차만 다시 집계.
+
+    롤업 전 회차라면 아무것도 하지 않는다 (나중에 refresh_draw_rollups에서 집계됨).
+    """
+    rollup = db.query(RecommendationDrawStat).filter(
+        RecommendationDrawStat.draw_number == draw_number
+    ).first()
+    if rollup is None:
+        return
+
+    counts = aggregate_public(db, draw_number=draw_number)
+    for key in BREAKDOWN_KEYS:
+        setattr(rollup, key, counts[key])
+    db.commit()
+
+
+def _sum_rollups(db: Session, through_draw: int) -> Dict[str, int]:
+    """마감 회차 롤업 합계"""
+    row = db.query(
+        *(func.coalesce(func.sum(getattr(RecommendationDrawStat, key)), 0) for key in BREAKDOWN_KEYS)
+    ).filter(RecommendationDrawStat.draw_number <= through_draw).one()
+    return {key: int(value) for key, value in zip(BREAKDOWN_KEYS, row)}
+
+
+# ============================================================================
+# Statistics
+# ============================================================================
+
+def get_public_statistics(
+    db: Session,
+    draw_number: Optional[int] = None,
+    since: Optional[datetime] = None
+) -> Dict[str, int]:
+    """
+    공공 추천 데이터 분류별 통계.
+
+    Args:
+        db: 데이터베이스 세션
+        draw_number: 특정 회차 (없으면 전체)
+        since: 지정 시 이후 생성된 행 수(recent) 포함
+
+    Returns:
+        Dict[str, int]: total, ai, manual, member, guest (+ recent)
+    """
+    if draw_number:
+        return aggregate_public(db, draw_number=draw_number, since=since)
+
+    # 전체: 롤업된 마감 회차 합계 + 그 이후 회차 실시간 집계 (읽기 전용)
+    rolled_through = min(rolled_through_draw(db), latest_closed_draw(db))
+
+    totals = _sum_rollups(db, rolled_through)
+    live = aggregate_public(db, min_draw_number=rolled_through + 1)
+    result = {key: totals[key] + live[key] for key in BREAKDOWN_KEYS}
+
+    # 최근 생성 수는 created_at 인덱스 범위 조회
+    if since is not None:
+        result['recent'] = db.query(func.count(PublicRecommendation.id)).filter(
+            PublicRecommendation.created_at >= since
+        ).scalar()
+    return result
+
+
+def get_latest_public_markers(db: Session) -> Dict[str, Any]:
+    """공공 추천 데이터의 최신 회차와 최신 생성 시각 (인덱스 MAX 조회)"""
+    return {
+        'draw_number': db.query(func.max(PublicRecommendation.draw_number)).scalar() or 0,
+        'created_at': db.query(func.max(PublicRecommendation.created_at)).scalar()
+    }
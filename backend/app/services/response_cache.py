@@ -0,0 +1,167 @@
+"""
+Draw Response Cache
+
+로또 조회 API(/api/v1/lotto/...) 응답 본문을 최신 회차 기준으로 메모리에 보관하는 모듈.
+
+당첨번호 데이터는 새 회차가 입력될 때만 바뀌므로 응답은 최신 회차 번호가 같은 동안 동일하다.
+캐시는 "세대(generation)" 단위로 관리된다.
+
+- 세대는 최신 회차 번호와 그 회차 기준으로 직렬화한 응답 본문(+ 강한 ETag)을 가진다
+- 새 회차 커밋 후 invalidate()가 빈 세대로 한 번에 교체하므로
+  이전 회차 응답과 새 회차 응답이 섞여 제공되지 않는다
+- 교체 전에 시작된 요청이 채운 응답은 이전 세대에만 기록되어 버려진다
+"""
+
+import hashlib
+import threading
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional, Tuple
+
+# 세대당 최대 응답 수 (limit/offset 조합이 무한히 쌓이지 않도록 제한)
+MAX_ENTRIES_PER_GENERATION = 2048
+
+# 지난 회차 응답 (내용이 바뀌지 않음)
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """직렬화된 응답 본문과 강한 ETag"""
+    body: bytes
+    etag: str
+
+
+class CacheGeneration:
+    """최신 회차 하나에 대한 응답 묶음"""
+
+    def __init__(self, version: int, latest_draw: Optional[int], max_entries: int):
+        self.version = version
+        self.latest_draw = latest_draw
+        self.max_entries = max_entries
+        self._entries: Dict[str, CachedResponse] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def is_resolved(self) -> bool:
+        """최신 회차 번호가 확인된 세대인지 여부"""
+        return self.latest_draw is not None
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        return self._entries.get(key)
+
+    def put(self, key: str, body: bytes) -> CachedResponse:
+        """응답 본문 저장 (세대 상한을 넘으면 저장하지 않고 ETag만 계산)"""
+        entry = CachedResponse(body=body, etag=make_etag(self.latest_draw, body))
+        with self._lock:
+            existing = self._entries.get(key)
+            if existing is not None:
+                return existing
+            if len(self._entries) < self.max_entries:
+                self._entries[key] = entry
+        return entry
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def make_etag(latest_draw: Optional[int], body: bytes) -> str:
+    """본문 해시 기반 강한 ETag (최신 회차 번호를 접두사로 포함)"""
+    digest = hashlib.sha256(body).hexdigest()[:32]
+    return f'"{latest_draw}-{digest}"'
+
+
+def cache_key(path: str, query_params: Iterable[Tuple[str, str]]) -> str:
+    """경로 + 정렬된 쿼리 파라미터 캐시 키"""
+    query = "&".join(f"{name}={value}" for name, value in sorted(query_params))
+    return f"{path}?{query}" if query else path
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더가 ETag와 일치하는지 (약한 비교, '*' 허용)"""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+# ============================================================================
+# DrawResponseCache Class
+# ============================================================================
+
+class DrawResponseCache:
+    """
+    최신 회차 기준 응답 캐시.
+
+    - current(): 현재 세대 (최신 회차 미확인이면 is_resolved == False)
+    - resolve(): 요청이 조회한 최신 회차로 미확인 세대를 확정
+    - invalidate(): 새 회차 커밋 후 빈 세대로 교체
+    """
+
+    def __init__(self, max_entries: int = MAX_ENTRIES_PER_GENERATION):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._generation = CacheGeneration(0, None, max_entries)
+
+        # 메트릭
+        self._hits = 0
+        self._misses = 0
+        self._not_modified = 0
+
+    def current(self) -> CacheGeneration:
+        """현재 세대"""
+        return self._generation
+
+    def resolve(self, generation: CacheGeneration, latest_draw: int) -> CacheGeneration:
+        """
+        미확인 세대를 latest_draw 기준 세대로 확정.
+
+        그 사이에 다른 요청이 먼저 확정했거나 invalidate()로 교체되었다면
+        현재 세대를 그대로 반환한다 (교체된 경우 다음 요청에서 다시 확정).
+        """
+        with self._lock:
+            if self._generation is generation and not generation.is_resolved:
+                self._generation = CacheGeneration(generation.version, latest_draw, self.max_entries)
+                return self._generation
+            if self._generation.is_resolved:
+                return self._generation
+        # 확정 도중 무효화됨: 이번 요청은 조회한 회차로만 응답하고 저장은 버려지는 세대에
+        return CacheGeneration(generation.version, latest_draw, self.max_entries)
+
+    def invalidate(self) -> None:
+        """전체 응답 무효화 (새 회차 커밋/회차 삭제 후 호출)"""
+        with self._lock:
+            self._generation = CacheGeneration(self._generation.version + 1, None, self.max_entries)
+
+    def record(self, hit: bool, not_modified: bool = False) -> None:
+        """요청 결과 집계"""
+        with self._lock:
+            if hit:
+                self._hits += 1
+            else:
+                self._misses += 1
+            if not_modified:
+                self._not_modified += 1
+
+    def status(self) -> dict:
+        """세대 정보와 적중 메트릭"""
+        generation = self._generation
+        with self._lock:
+            return {
+                "version": generation.version,
+                "latest_draw": generation.latest_draw,
+                "entries": len(generation),
+                "hits": self._hits,
+                "misses": self._misses,
+                "not_modified": self._not_modified,
+            }
+
+
+# 전역 인스턴스
+lotto_response_cache = DrawResponseCache()
@@ -6,6 +6,7 @@ from sqlalchemy.orm import Session
 from sqlalchemy import and_, or_, func
 from ..models.user import User, SocialProvider, LoginMethod, UserRole
 from ..utils.auth import SocialAuthService
+from .executors import ExecutorSaturatedError, ExecutorTimeoutError, auth_executor
 from passlib.context import CryptContext
 from typing import Optional, Dict, Any
 import logging
@@ -28,6 +29,16 @@ class UnifiedAuthService:
         """비밀번호 해싱"""
         return pwd_context.hash(password)
     
+    @staticmethod
+    async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+        """비밀번호 검증 (auth 작업 풀에서 실행)"""
+        return await auth_executor.run(pwd_context.verify, plain_password, hashed_password)
+    
+    @staticmethod
+    async def get_password_hash_async(password: str) -> str:
+        """비밀번호 해싱 (auth 작업 풀에서 실행)"""
+        return await auth_executor.run(pwd_context.hash, password)
+    
     @staticmethod
     async def authenticate_social_user(
         db: Session,
@@ -160,7 +171,7 @@ class UnifiedAuthService:
                 return None
             
             # 비밀번호 검증
-            if not UnifiedAuthService.verify_password(password, user.password_hash):
+            if not await UnifiedAuthService.verify_password_async(password, user.password_hash):
                 return None
             
             # 로그인 시간 업데이트
@@ -179,6 +190,8 @@ class UnifiedAuthService:
                 }
             }
             
+        except (ExecutorSaturatedError, ExecutorTimeoutError):
+            raise
         except Exception as e:
             logger.error(f"이메일 로그인 인증 오류: {e}")
             return None
@@ -208,9 +221,10 @@ class UnifiedAuthService:
                 }
             
             # 새 사용자 생성
+            password_hash = await UnifiedAuthService.get_password_hash_async(password)
             user = User(
                 email=email,
-                password_hash=UnifiedAuthService.get_password_hash(password),
+                password_hash=password_hash,
                 nickname=nickname,
                 login_method=LoginMethod.EMAIL,
                 role=UserRole.ADMIN if role == "admin" else UserRole.USER,
@@ -234,6 +248,8 @@ class UnifiedAuthService:
                 }
             }
             
+        except (ExecutorSaturatedError, ExecutorTimeoutError):
+            raise
         except Exception as e:
             logger.error(f"이메일 회원가입 오류: {e}")
             db.rollback()
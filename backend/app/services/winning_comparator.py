@@ -0,0 +1,149 @@
+"""
+Batch Winning Comparator
+
+회차별 추천 번호 전체를 (N, 6) 배열로 받아 일치 개수, 보너스 일치, 당첨 등수를
+벡터 연산으로 한 번에 계산하고 등수별 집계를 한 번의 bincount로 만든다.
+ORM 객체 대신 (id, numbers) 컬럼만 조회한 결과를 입력으로 사용한다.
+"""
+
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+
+# ============================================================================
+# Constants
+# ============================================================================
+
+COMBINATION_SIZE = 6
+MAX_GRADE = 5
+
+# _GRADE_TABLE[일치 개수, 보너스 일치] = 등수 (0 = 낙첨)
+_GRADE_TABLE = np.zeros((COMBINATION_SIZE + 1, 2), dtype=np.int8)
+_GRADE_TABLE[6, :] = 1
+_GRADE_TABLE[5, 1] = 2
+_GRADE_TABLE[5, 0] = 3
+_GRADE_TABLE[4, :] = 4
+_GRADE_TABLE[3, :] = 5
+
+
+# ============================================================================
+# Helper Functions
+# ============================================================================
+
+def numbers_to_array(numbers_list: Iterable[Sequence[int]]) -> np.ndarray:
+    """
+    추천 번호 목록을 (N, 6) 배열로 변환.
+
+    번호가 6개가 아닌 잘못된 행은 0으로 채워 어떤 당첨번호와도 일치하지 않게 한다.
+    """
+    rows = list(numbers_list)
+    array = np.zeros((len(rows), COMBINATION_SIZE), dtype=np.int16)
+    for index, numbers in enumerate(rows):
+        if numbers is not None and len(numbers) == COMBINATION_SIZE:
+            array[index] = numbers
+    return array
+
+
+# ============================================================================
+# BatchComparison
+# ============================================================================
+
+class BatchComparison:
+    """
+    회차 단위 일괄 당첨 비교 결과.
+
+    Attributes:
+        ids: 추천 ID 배열 (shape: (N,))
+        matches: 일치 개수 (shape: (N,))
+        bonus_matches: 보너스 번호 일치 여부 (shape: (N,))
+        grades: 당첨 등수 1~5, 낙첨 0 (shape: (N,))
+    """
+
+    def __init__(self, ids: np.ndarray, matches: np.ndarray, bonus_matches: np.ndarray, grades: np.ndarray):
+        self.ids = ids
+        self.matches = matches
+        self.bonus_matches = bonus_matches
+        self.grades = grades
+
+    @property
+    def total(self) -> int:
+        """비교한 추천 수"""
+        return int(self.ids.shape[0])
+
+    def grade_histogram(self) -> np.ndarray:
+        """등수별 개수 (인덱스 0 = 낙첨, 1~5 = 등수)"""
+        return np.bincount(self.grades, minlength=MAX_GRADE + 1)
+
+    def summary(self) -> Dict[str, object]:
+        """기존 응답 형식의 집계 (total_recommendations, total_winners, win_rate, grade_stats)"""
+        histogram = self.grade_histogram()
+        total = self.total
+        winners = int(histogram[1:].sum())
+        return {
+            "total_recommendations": total,
+            "total_winners": winners,
+            "win_rate": winners / total if total > 0 else 0,
+            "grade_stats": {f"grade_{grade}": int(histogram[grade]) for grade in range(1, MAX_GRADE + 1)}
+        }
+
+    def result_for(self, index: int) -> Dict[str, object]:
+        """행 하나의 비교 결과 (compare_numbers와 같은 형식)"""
+        grade = int(self.grades[index])
+        return {
+            "matches": int(self.matches[index]),
+            "bonus_match": bool(self.bonus_matches[index]),
+            "grade": grade,
+            "is_winner": grade > 0
+        }
+
+    def page(self, offset: int = 0, limit: Optional[int] = None) -> List[int]:
+        """상세 행 페이지에 해당하는 인덱스 목록"""
+        stop = self.total if limit is None else min(offset + limit, self.total)
+        return list(range(min(offset, self.total), stop))
+
+
+# ============================================================================
+# Batch Comparison
+# ============================================================================
+
+def compare_batch(
+    ids: Sequence[int],
+    numbers: np.ndarray,
+    winning_numbers: Sequence[int],
+    bonus_number: int,
+    stored_matches: Optional[np.ndarray] = None,
+    stored_grades: Optional[np.ndarray] = None
+) -> BatchComparison:
+    """
+    추천 번호 배열 전체를 당첨번호와 한 번에 비교.
+
+    Args:
+        ids: 추천 ID 목록
+        numbers: (N, 6) 추천 번호 배열
+        winning_numbers: 당첨번호 6개
+        bonus_number: 보너스 번호
+        stored_matches: 저장된 일치 개수 (더미 데이터용, 음수면 계산값 사용)
+        stored_grades: 저장된 당첨 등수 (더미 데이터용, 음수면 계산값 사용)
+
+    Returns:
+        BatchComparison: 행별 비교 결과와 집계
+    """
+    numbers = np.asarray(numbers, dtype=np.int64).reshape(-1, COMBINATION_SIZE)
+
+    # 번호 → 당첨 여부 조회표 (0번은 잘못된 행 채움값으로 항상 False)
+    is_winning = np.zeros(46, dtype=bool)
+    is_winning[list(winning_numbers)] = True
+
+    matches = is_winning[numbers].sum(axis=1)
+    bonus_matches = (numbers == bonus_number).any(axis=1)
+    grades = _GRADE_TABLE[matches, bonus_matches.astype(np.int64)].astype(np.int64)
+
+    # 더미 데이터는 저장된 당첨 정보를 그대로 사용 (보너스 매칭 정보 없음)
+    if stored_grades is not None:
+        override = stored_grades >= 0
+        grades = np.where(override, stored_grades, grades)
+        matches = np.where(override, stored_matches, matches)
+        bonus_matches = bonus_matches & ~override
+
+    return BatchComparison(np.asarray(ids, dtype=np.int64), matches, bonus_matches, grades)
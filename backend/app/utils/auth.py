@@ -3,13 +3,16 @@ from typing import Optional, Dict, Any
 import pytz
 from jose import JWTError, jwt
 from passlib.context import CryptContext
+from sqlalchemy import update
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from ..models.user import User, SocialProvider
 from ..config import settings
 from ..database import get_db
-import httpx
+from ..services.http_clients import http_clients
+from ..services.principal_cache import principal_cache
 import logging
 
 logger = logging.getLogger(__name__)
@@ -57,6 +60,11 @@ def get_user_from_token(db: Session, token: str) -> Optional[User]:
     if not user_id:
         return None
     
+    # 캐시 적중 시 users 조회 없이 요청 세션에 연결된 사용자 반환
+    user = principal_cache.get(db, str(user_id))
+    if user:
+        return user
+    
     # user_id가 숫자 문자열이면 id로 조회, 그렇지 않으면 user_id로 조회
     try:
         user_db_id = int(user_id)
@@ -65,7 +73,12 @@ def get_user_from_token(db: Session, token: str) -> Optional[User]:
         user = db.query(User).filter(User.user_id == user_id).first()
     
     if user:
-        user.update_last_login()
+        # 마지막 로그인 시간은 캐시 미스(TTL당 한 번)에만 갱신하며,
+        # 객체 변경이 아닌 UPDATE 문으로 기록해 캐시 무효화를 일으키지 않음
+        now = get_utc_now()
+        db.execute(update(User).where(User.id == user.id).values(last_login_at=now))
+        set_committed_value(user, "last_login_at", now)
+        principal_cache.put(str(user_id), user)
         db.commit()
     
     return user
@@ -77,27 +90,26 @@ class SocialAuthService:
     async def get_kakao_access_token(authorization_code: str) -> Optional[str]:
         """카카오 인증 코드를 액세스 토큰으로 교환"""
         try:
-            async with httpx.AsyncClient() as client:
-                data = {
-                    "grant_type": "authorization_code",
-                    "client_id": settings.kakao_rest_api_key,
-                    "redirect_uri": "http://localhost:5173",  # 개발환경
-                    "code": authorization_code
-                }
-                
-                response = await client.post(
-                    "https://kauth.kakao.com/oauth/token",
-                    data=data,
-                    headers={"Content-Type": "application/x-www-form-urlencoded"}
-                )
+            data = {
+                "grant_type": "authorization_code",
+                "client_id": settings.kakao_rest_api_key,
+                "redirect_uri": "http://localhost:5173",  # 개발환경
+                "code": authorization_code
+            }
+            
+            response = await http_clients.post(
+                "https://kauth.kakao.com/oauth/token",
+                data=data,
+                headers={"Content-Type": "application/x-www-form-urlencoded"}
+            )
+            
+            if response.status_code == 200:
+                token_data = response.json()
+                return token_data.get("access_token")
+            else:
+                logger.error(f"Kakao token exchange error: {response.status_code} - {response.text}")
+                return None
                 
-                if response.status_code == 200:
-                    token_data = response.json()
-                    return token_data.get("access_token")
-                else:
-                    logger.error(f"Kakao token exchange error: {response.status_code} - {response.text}")
-                    return None
-                    
         except Exception as e:
             logger.error(f"Kakao token exchange error: {e}")
             return None
@@ -106,28 +118,27 @@ class SocialAuthService:
     async def get_naver_access_token(authorization_code: str) -> Optional[str]:
         """네이버 인증 코드를 액세스 토큰으로 교환"""
         try:
-            async with httpx.AsyncClient() as client:
-                data = {
-                    "grant_type": "authorization_code",
-                    "client_id": settings.naver_client_id,
-                    "client_secret": settings.naver_client_secret,
-                    "code": authorization_code,
-                    "state": "naver_login_state"  # 네이버는 state 파라미터도 필요
-                }
-                
-                response = await client.post(
-                    "https://nid.naver.com/oauth2.0/token",
-                    data=data,
-                    headers={"Content-Type": "application/x-www-form-urlencoded"}
-                )
+            data = {
+                "grant_type": "authorization_code",
+                "client_id": settings.naver_client_id,
+                "client_secret": settings.naver_client_secret,
+                "code": authorization_code,
+                "state": "naver_login_state"  # 네이버는 state 파라미터도 필요
+            }
+            
+            response = await http_clients.post(
+                "https://nid.naver.com/oauth2.0/token",
+                data=data,
+                headers={"Content-Type": "application/x-www-form-urlencoded"}
+            )
+            
+            if response.status_code == 200:
+                token_data = response.json()
+                return token_data.get("access_token")
+            else:
+                logger.error(f"Naver token exchange error: {response.status_code} - {response.text}")
+                return None
                 
-                if response.status_code == 200:
-                    token_data = response.json()
-                    return token_data.get("access_token")
-                else:
-                    logger.error(f"Naver token exchange error: {response.status_code} - {response.text}")
-                    return None
-                    
         except Exception as e:
             logger.error(f"Naver token exchange error: {e}")
             return None
@@ -136,29 +147,28 @@ class SocialAuthService:
     async def get_kakao_user_info(access_token: str) -> Optional[Dict[str, Any]]:
         """카카오 사용자 정보 가져오기"""
         try:
-            async with httpx.AsyncClient() as client:
-                headers = {
-                    "Authorization": f"Bearer {access_token}",
-                    "Content-Type": "application/x-www-form-urlencoded"
+            headers = {
+                "Authorization": f"Bearer {access_token}",
+                "Content-Type": "application/x-www-form-urlencoded"
+            }
+            
+            response = await http_clients.get(
+                "https://kapi.kakao.com/v2/user/me",
+                headers=headers
+            )
+            
+            if response.status_code == 200:
+                user_data = response.json()
+                return {
+                    "social_id": str(user_data["id"]),
+                    "email": user_data.get("kakao_account", {}).get("email"),
+                    "nickname": user_data.get("kakao_account", {}).get("profile", {}).get("nickname"),
+                    "profile_image_url": user_data.get("kakao_account", {}).get("profile", {}).get("profile_image_url")
                 }
+            else:
+                logger.error(f"Kakao API error: {response.status_code} - {response.text}")
+                return None
                 
-                response = await client.get(
-                    "https://kapi.kakao.com/v2/user/me",
-                    headers=headers
-                )
-                
-                if response.status_code == 200:
-                    user_data = response.json()
-                    return {
-                        "social_id": str(user_data["id"]),
-                        "email": user_data.get("kakao_account", {}).get("email"),
-                        "nickname": user_data.get("kakao_account", {}).get("profile", {}).get("nickname"),
-                        "profile_image_url": user_data.get("kakao_account", {}).get("profile", {}).get("profile_image_url")
-                    }
-                else:
-                    logger.error(f"Kakao API error: {response.status_code} - {response.text}")
-                    return None
-                    
         except Exception as e:
             logger.error(f"Kakao user info fetch error: {e}")
             return None
@@ -167,33 +177,32 @@ class SocialAuthService:
     async def get_naver_user_info(access_token: str) -> Optional[Dict[str, Any]]:
         """네이버 사용자 정보 가져오기"""
         try:
-            async with httpx.AsyncClient() as client:
-                headers = {
-                    "Authorization": f"Bearer {access_token}",
-                }
-                
-                response = await client.get(
-                    "https://openapi.naver.com/v1/nid/me",
-                    headers=headers
-                )
-                
-                if response.status_code == 200:
-                    user_data = response.json()
-                    if user_data["resultcode"] == "00":
-                        response_data = user_data["response"]
-                        return {
-                            "social_id": response_data["id"],
-                            "email": response_data.get("email"),
-                            "nickname": response_data.get("nickname"),
-                            "profile_image_url": response_data.get("profile_image")
-                        }
-                    else:
-                        logger.error(f"Naver API error: {user_data}")
-                        return None
+            headers = {
+                "Authorization": f"Bearer {access_token}",
+            }
+            
+            response = await http_clients.get(
+                "https://openapi.naver.com/v1/nid/me",
+                headers=headers
+            )
+            
+            if response.status_code == 200:
+                user_data = response.json()
+                if user_data["resultcode"] == "00":
+                    response_data = user_data["response"]
+                    return {
+                        "social_id": response_data["id"],
+                        "email": response_data.get("email"),
+                        "nickname": response_data.get("nickname"),
+                        "profile_image_url": response_data.get("profile_image")
+                    }
                 else:
-                    logger.error(f"Naver API error: {response.status_code} - {response.text}")
+                    logger.error(f"Naver API error: {user_data}")
                     return None
-                    
+            else:
+                logger.error(f"Naver API error: {response.status_code} - {response.text}")
+                return None
+                
         except Exception as e:
             logger.error(f"Naver user info fetch error: {e}")
             return None
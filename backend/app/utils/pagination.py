@@ -0,0 +1,85 @@
+"""
+키셋(커서) 페이지네이션 유틸리티
+
+목록 API를 OFFSET 대신 (created_at, id) 기준 키셋으로 페이지 처리한다.
+커서는 마지막 행의 (created_at, id)를 담은 불투명 문자열(base64url JSON)이며,
+다음 페이지는 인덱스 범위 조건 (created_at, id) < 커서 로 바로 시작하므로
+페이지가 깊어져도 조회 비용이 일정하다.
+"""
+
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, List, Optional, Sequence, Tuple
+
+from sqlalchemy import tuple_
+
+CURSOR_VERSION = 1
+
+
+class InvalidCursorError(ValueError):
+    """해석할 수 없는 페이지 커서"""
+
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    """(created_at, id)를 불투명 커서 문자열로 인코딩"""
+    payload = json.dumps([CURSOR_VERSION, created_at.isoformat(), row_id], separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    커서 문자열을 (created_at, id)로 디코딩.
+
+    Raises:
+        InvalidCursorError: 형식이 잘못되었거나 다른 버전의 커서인 경우
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        version, created_at, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if version != CURSOR_VERSION or not isinstance(row_id, int):
+            raise InvalidCursorError("지원하지 않는 커서입니다")
+        return datetime.fromisoformat(created_at), row_id
+    except InvalidCursorError:
+        raise
+    except (binascii.Error, ValueError, TypeError) as e:
+        raise InvalidCursorError(f"잘못된 커서입니다: {e}") from None
+
+
+def keyset_order(created_at_column, id_column, descending: bool = True) -> list:
+    """키셋 정렬 순서 (created_at, id)"""
+    if descending:
+        return [created_at_column.desc(), id_column.desc()]
+    return [created_at_column.asc(), id_column.asc()]
+
+
+def keyset_condition(created_at_column, id_column, cursor: str, descending: bool = True):
+    """
+    커서 이후 행 조건.
+
+    Raises:
+        InvalidCursorError: 커서를 해석할 수 없는 경우
+    """
+    created_at, row_id = decode_cursor(cursor)
+    position = tuple_(created_at_column, id_column)
+    bound = tuple_(created_at, row_id)
+    return position < bound if descending else position > bound
+
+
+def keyset_page(rows: Sequence[Any], limit: int) -> Tuple[List[Any], Optional[str]]:
+    """
+    limit + 1개로 조회한 행에서 페이지와 다음 커서 분리.
+
+    Args:
+        rows: created_at, id 속성을 가진 행 (limit + 1개까지)
+        limit: 페이지 크기
+
+    Returns:
+        Tuple of (page rows, next_cursor 또는 None)
+    """
+    page = list(rows[:limit])
+    if len(rows) <= limit or not page:
+        return page, None
+    last = page[-1]
+    return page, encode_cursor(last.created_at, last.id)
@@ -0,0 +1,53 @@
+"""
+Combination Score Table Build Script
+Precomputes pattern/balance scores for all C(45,6) combinations
+"""
+import sys
+import time
+import argparse
+from pathlib import Path
+
+# Add app directory to path
+sys.path.append(str(Path(__file__).parent))
+
+from app.services import combination_table
+
+
+def main():
+    """Build the memory-mapped combination score table"""
+    parser = argparse.ArgumentParser(description="Build combination score table")
+    parser.add_argument("--output", default=None, help="Output path (default: app/models/tables/)")
+    args = parser.parse_args()
+
+    start_time = time.time()
+
+    print("="*60)
+    print("Combination Score Table Builder")
+    print("="*60)
+
+    # Step 1: Build table
+    print(f"\n[1/2] Scoring {combination_table.TOTAL_COMBINATIONS:,} combinations...")
+    table_path = combination_table.build_score_table(args.output)
+    print(f"✓ Table written to: {table_path}")
+
+    # Step 2: Verify table
+    print("\n[2/2] Verifying table...")
+    table = combination_table.CombinationScoreTable()
+    if not table.load(table_path):
+        print("✗ Table verification failed")
+        sys.exit(1)
+    sample = table.sample_top(5, percentile=1.0)
+    print(f"✓ Top 1% sample: {sample.tolist()}")
+
+    # Summary
+    elapsed_time = time.time() - start_time
+    print("\n" + "="*60)
+    print("Build Complete!")
+    print("="*60)
+    print(f"Total time: {elapsed_time:.2f} seconds")
+    print(f"Table location: {table_path}")
+    print("="*60)
+
+
+if __name__ == "__main__":
+    main()
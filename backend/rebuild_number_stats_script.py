@@ -0,0 +1,53 @@
+"""
+Number Stats Rebuild Script
+Recomputes the number_stats aggregate table from all lotto_draws (backfills, data fixes)
+"""
+import sys
+import time
+from pathlib import Path
+
+# Add app directory to path
+sys.path.append(str(Path(__file__).parent))
+
+from app.database import SessionLocal, engine
+from app.models.number_stat import NumberStat
+from app.services.number_stats import rebuild_number_stats
+
+
+def main():
+    """Rebuild number_stats from lotto_draws"""
+    start_time = time.time()
+
+    print("="*60)
+    print("Number Stats Rebuild")
+    print("="*60)
+
+    # Step 1: Ensure table exists
+    print("\n[1/2] Ensuring number_stats table...")
+    NumberStat.__table__.create(bind=engine, checkfirst=True)
+    print("✓ Table ready")
+
+    # Step 2: Rebuild
+    print("\n[2/2] Aggregating lotto_draws...")
+    db = SessionLocal()
+    try:
+        draw_count = rebuild_number_stats(db)
+    except Exception as e:
+        db.rollback()
+        print(f"✗ Rebuild failed: {e}")
+        sys.exit(1)
+    finally:
+        db.close()
+    print(f"✓ Aggregated {draw_count} draws into 45 rows")
+
+    # Summary
+    elapsed_time = time.time() - start_time
+    print("\n" + "="*60)
+    print("Rebuild Complete!")
+    print("="*60)
+    print(f"Total time: {elapsed_time:.2f} seconds")
+    print("="*60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+"""
+Async Lotto API Test Module
+
+Exercises the lotto router through the AsyncSession dependency backed by
+aiosqlite.
+"""
+
+from datetime import date
+
+import httpx
+import pytest
+import pytest_asyncio
+from fastapi import FastAPI
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.api import lotto
+from app.database import Base, get_async_db, to_async_database_url
+from app.models.lotto import LottoDraw
+from app.models.number_stat import NumberStat
+from app.services.draw_snapshot import draw_history
+from app.services.response_cache import (
+    IMMUTABLE_CACHE_CONTROL, DrawResponseCache, etag_matches, lotto_response_cache
+)
+from tests.conftest import SAMPLE_DRAW_COUNT, make_sample_draws
+
+
+@pytest.fixture(autouse=True)
+def reset_snapshot():
+    draw_history.invalidate()
+    lotto_response_cache.invalidate()
+    yield
+    draw_history.invalidate()
+    lotto_response_cache.invalidate()
+
+
+@pytest_asyncio.fixture
+async def session_factory():
+    """샘플 당첨번호가 들어 있는 aiosqlite 세션 팩토리"""
+    engine = create_async_engine(
+        "sqlite+aiosqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all, tables=[
+            LottoDraw.__table__,
+            NumberStat.__table__
+        ])
+
+    session_factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+    async with session_factory() as session:
+        session.add_all(make_sample_draws())
+        await session.commit()
+
+    yield session_factory
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def client(session_factory):
+    """aiosqlite 세션을 주입한 lotto 라우터 클라이언트"""
+    async def override_get_async_db():
+        async with session_factory() as session:
+            yield session
+
+    app = FastAPI()
+    app.include_router(lotto.router)
+    app.dependency_overrides[get_async_db] = override_get_async_db
+
+    async with httpx.AsyncClient(app=app, base_url="http://test") as http_client:
+        yield http_client
+
+
+def test_async_database_url_conversion():
+    assert to_async_database_url("postgresql://u:p@db:5432/lotto") == "postgresql+asyncpg://u:p@db:5432/lotto"
+    assert to_async_database_url("sqlite:///./lotto.db") == "sqlite+aiosqlite:///./lotto.db"
+    assert to_async_database_url("postgresql+asyncpg://u:p@db/lotto") == "postgresql+asyncpg://u:p@db/lotto"
+
+
+@pytest.mark.asyncio
+async def test_latest_and_current_draw(client):
+    latest = (await client.get("/api/v1/lotto/latest")).json()
+    assert latest["success"] is True
+    assert latest["data"]["draw_number"] == SAMPLE_DRAW_COUNT
+    assert len(latest["data"]["numbers"]) == 6
+
+    current = (await client.get("/api/v1/lotto/current-draw")).json()
+    assert current["data"]["draw_number"] == SAMPLE_DRAW_COUNT + 1
+
+
+@pytest.mark.asyncio
+async def test_draw_listing_and_lookup(client):
+    draws = (await client.get("/api/v1/lotto/draws", params={"limit": 5, "offset": 2})).json()["data"]
+    assert [draw["draw_number"] for draw in draws] == list(range(SAMPLE_DRAW_COUNT - 2, SAMPLE_DRAW_COUNT - 7, -1))
+
+    draw = (await client.get("/api/v1/lotto/draw/10")).json()["data"]
+    assert draw["draw_number"] == 10
+
+    missing = await client.get(f"/api/v1/lotto/draw/{SAMPLE_DRAW_COUNT + 50}")
+    assert missing.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_statistics_runs_sync_analyzer(client):
+    stats = (await client.get("/api/v1/lotto/statistics")).json()["data"]
+    assert stats["total_draws"] == SAMPLE_DRAW_COUNT
+    assert stats["latest_draw"] == SAMPLE_DRAW_COUNT
+    frequency = stats["number_frequency"].values()
+    assert sum(entry["total_appearances"] for entry in frequency) == SAMPLE_DRAW_COUNT * 6
+
+
+@pytest.mark.asyncio
+async def test_cached_responses_revalidate_with_etag(client):
+    before = lotto_response_cache.status()
+    first = await client.get("/api/v1/lotto/latest")
+    etag = first.headers["etag"]
+    assert etag.startswith(f'"{SAMPLE_DRAW_COUNT}-')
+    assert "must-revalidate" in first.headers["cache-control"]
+
+    second = await client.get("/api/v1/lotto/latest")
+    assert second.headers["etag"] == etag
+    assert second.content == first.content
+
+    not_modified = await client.get("/api/v1/lotto/latest", headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    assert not_modified.headers["etag"] == etag
+
+    status = lotto_response_cache.status()
+    assert status["hits"] - before["hits"] == 2
+    assert status["misses"] - before["misses"] == 1
+    assert status["not_modified"] - before["not_modified"] == 1
+
+
+@pytest.mark.asyncio
+async def test_past_draws_are_immutable(client):
+    past = await client.get("/api/v1/lotto/draw/10")
+    assert past.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
+
+    latest = await client.get(f"/api/v1/lotto/draw/{SAMPLE_DRAW_COUNT}")
+    assert latest.headers["cache-control"] != IMMUTABLE_CACHE_CONTROL
+
+
+@pytest.mark.asyncio
+async def test_new_draw_invalidates_cached_responses(client, session_factory):
+    before = await client.get("/api/v1/lotto/recent-draws")
+    etag = before.headers["etag"]
+
+    async with session_factory() as session:
+        session.add(LottoDraw(
+            draw_number=SAMPLE_DRAW_COUNT + 1,
+            draw_date=date(2024, 12, 28),
+            number_1=1, number_2=2, number_3=3, number_4=4, number_5=5, number_6=6,
+            bonus_number=7
+        ))
+        await session.commit()
+
+    # 무효화 전에는 이전 회차 응답 유지
+    stale = await client.get("/api/v1/lotto/recent-draws", headers={"If-None-Match": etag})
+    assert stale.status_code == 304
+
+    lotto_response_cache.invalidate()
+    fresh = await client.get("/api/v1/lotto/recent-draws", headers={"If-None-Match": etag})
+    assert fresh.status_code == 200
+    assert fresh.headers["etag"] != etag
+    assert fresh.json()["data"]["recent_draws"][0]["draw_number"] == SAMPLE_DRAW_COUNT + 1
+
+
+def test_etag_matching_and_stale_resolution():
+    assert etag_matches('"1-abc"', '"1-abc"')
+    assert etag_matches('W/"1-abc", "2-def"', '"1-abc"')
+    assert etag_matches("*", '"1-abc"')
+    assert not etag_matches('"1-abd"', '"1-abc"')
+    assert not etag_matches(None, '"1-abc"')
+
+    cache = DrawResponseCache()
+    unresolved = cache.current()
+    cache.invalidate()
+    # 확정 도중 무효화된 세대는 전역 캐시에 올라가지 않음
+    detached = cache.resolve(unresolved, 120)
+    assert detached.latest_draw == 120
+    assert cache.current() is not detached
+    assert not cache.current().is_resolved
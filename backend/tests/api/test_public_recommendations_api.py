@@ -0,0 +1,93 @@
+"""
+Public Recommendations API Test Module
+
+Walks the public recommendation listing with keyset cursors.
+"""
+
+from datetime import datetime, timedelta
+
+import httpx
+import pytest
+import pytest_asyncio
+from fastapi import FastAPI
+from sqlalchemy import event
+
+from app.api import public_recommendations
+from app.database import get_db
+from app.models.public_recommendation import PublicRecommendation
+from app.utils.pagination import InvalidCursorError, decode_cursor, encode_cursor
+
+
+ROW_COUNT = 23
+
+
+@pytest_asyncio.fixture
+async def client(db_session):
+    """같은 created_at이 섞인 공공 추천 데이터와 테스트 클라이언트"""
+    base = datetime(2024, 6, 1, 12, 0, 0)
+    db_session.add_all([
+        PublicRecommendation(
+            numbers=[1, 2, 3, 4, 5, 6],
+            generation_method="ai",
+            user_type="member",
+            draw_number=121,
+            # 3개씩 같은 시각 (키셋 동률은 id로 구분)
+            created_at=base + timedelta(minutes=index // 3)
+        )
+        for index in range(ROW_COUNT)
+    ])
+    db_session.commit()
+
+    app = FastAPI()
+    app.include_router(public_recommendations.router)
+    app.dependency_overrides[get_db] = lambda: db_session
+    async with httpx.AsyncClient(app=app, base_url="http://test") as http_client:
+        yield http_client
+
+
+def test_cursor_round_trip():
+    created_at = datetime(2024, 6, 1, 12, 30, 15, 120000)
+    assert decode_cursor(encode_cursor(created_at, 42)) == (created_at, 42)
+
+    with pytest.raises(InvalidCursorError):
+        decode_cursor("not-a-cursor")
+
+
+@pytest.mark.asyncio
+async def test_keyset_pages_cover_every_row_once(client, db_session):
+    statements = []
+    event.listen(db_session.get_bind(), "before_cursor_execute",
+                 lambda conn, cursor, statement, *args: statements.append(statement))
+
+    seen = []
+    cursor = None
+    pages = 0
+    while True:
+        params = {"limit": 5}
+        if cursor:
+            params["cursor"] = cursor
+        body = (await client.get("/api/v1/public-recommendations/", params=params)).json()
+        assert body["total"] == ROW_COUNT
+        seen.extend(item["id"] for item in body["data"])
+        pages += 1
+        cursor = body["next_cursor"]
+        if cursor is None:
+            break
+
+    assert pages == 5
+    assert len(seen) == len(set(seen)) == ROW_COUNT
+    # 페이지마다 개수 조회 + 페이지 조회 2회
+    assert len(statements) == pages * 2
+
+    expected = [
+        rec.id for rec in db_session.query(PublicRecommendation).order_by(
+            PublicRecommendation.created_at.desc(), PublicRecommendation.id.desc()
+        )
+    ]
+    assert seen == expected
+
+
+@pytest.mark.asyncio
+async def test_invalid_cursor_is_rejected(client):
+    response = await client.get("/api/v1/public-recommendations/", params={"cursor": "garbage"})
+    assert response.status_code == 400
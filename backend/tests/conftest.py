@@ -0,0 +1,79 @@
+"""
+Shared test fixtures
+
+Provides an in-memory SQLite session with the lotto_draws table populated
+with deterministic sample draws. number_stats, public_recommendations,
+recommendation_draw_stats and lotto_draw_checksums are created empty.
+"""
+
+import random
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import ARRAY, create_engine
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base
+from app.models.draw_checksum import DrawChecksum
+from app.models.lotto import LottoDraw
+from app.models.number_stat import NumberStat
+from app.models.public_recommendation import PublicRecommendation
+from app.models.recommendation_draw_stat import RecommendationDrawStat
+
+
+SAMPLE_DRAW_COUNT = 120
+
+
+@compiles(ARRAY, "sqlite")
+def _compile_array_for_sqlite(type_, compiler, **kw):
+    """PostgreSQL ARRAY columns are created as JSON so their tables exist on SQLite
+    (rows in tests leave ARRAY columns NULL)."""
+    return "JSON"
+
+
+def make_sample_draws(count: int = SAMPLE_DRAW_COUNT, seed: int = 7):
+    """Generate deterministic LottoDraw rows (sorted numbers + bonus)."""
+    rng = random.Random(seed)
+    first_date = date(2023, 1, 7)
+    draws = []
+    for draw_number in range(1, count + 1):
+        picked = rng.sample(range(1, 46), 7)
+        numbers = sorted(picked[:6])
+        draw_date = first_date + timedelta(weeks=draw_number - 1)
+        draws.append(LottoDraw(
+            draw_number=draw_number,
+            draw_date=draw_date,
+            number_1=numbers[0],
+            number_2=numbers[1],
+            number_3=numbers[2],
+            number_4=numbers[3],
+            number_5=numbers[4],
+            number_6=numbers[5],
+            bonus_number=picked[6],
+            first_winners=rng.randint(0, 20),
+            first_amount=rng.randint(1_000_000_000, 3_000_000_000)
+        ))
+    return draws
+
+
+@pytest.fixture
+def db_session():
+    """In-memory SQLite session with sample lotto draws."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine, tables=[
+        LottoDraw.__table__,
+        NumberStat.__table__,
+        PublicRecommendation.__table__,
+        RecommendationDrawStat.__table__,
+        DrawChecksum.__table__
+    ])
+    Session = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+    session = Session()
+    session.add_all(make_sample_draws())
+    session.commit()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
@@ -0,0 +1,67 @@
+"""
+Combination Sampler Test Module
+
+Tests the vectorized weighted sampler used for statistical candidate generation.
+"""
+
+import numpy as np
+
+from app.services.combination_sampler import combination_masks, sample_combinations
+
+
+def _weights():
+    """번호별 가중치 (인덱스 = 번호)"""
+    weights = np.ones(46)
+    weights[1:] = np.linspace(0.5, 1.5, 45)
+    return weights
+
+
+class TestSampleCombinations:
+    """Test weighted without-replacement batch sampling"""
+
+    def test_unique_sorted_combinations(self):
+        """정렬된 고유 조합을 요청 개수만큼 생성하는지 확인"""
+        candidates = sample_combinations(_weights(), 1000, rng=np.random.default_rng(0))
+
+        assert candidates.shape == (1000, 6)
+        assert np.all(np.diff(candidates, axis=1) > 0)
+        assert np.unique(combination_masks(candidates)).shape[0] == 1000
+
+    def test_include_exclude_by_construction(self):
+        """포함 번호는 항상 포함되고 제외 번호는 절대 나오지 않는지 확인"""
+        include = [3, 17, 40]
+        exclude = [1, 2, 4, 5, 44, 45]
+
+        candidates = sample_combinations(
+            _weights(), 500, include_numbers=include, exclude_numbers=exclude,
+            rng=np.random.default_rng(1)
+        )
+
+        assert candidates.shape[0] == 500
+        for number in include:
+            assert np.all((candidates == number).any(axis=1))
+        assert not np.isin(candidates, exclude).any()
+
+    def test_weighted_marginals(self):
+        """번호별 포함 빈도가 순차 비복원 추출과 통계적으로 일치하는지 확인"""
+        rng = np.random.default_rng(2)
+        weights = _weights()
+        probabilities = weights[1:] / weights[1:].sum()
+        draws = 20000
+
+        sampled = sample_combinations(weights, draws, rng=rng, max_draws=draws)
+        # max_draws 한도 안에서 중복이 제거되므로 빈도는 고유 조합 기준
+        sampled_freq = np.bincount(sampled.ravel(), minlength=46)[1:] / sampled.shape[0]
+
+        sequential = np.array([
+            rng.choice(45, size=6, replace=False, p=probabilities) for _ in range(draws)
+        ]) + 1
+        sequential_freq = np.bincount(sequential.ravel(), minlength=46)[1:] / draws
+
+        np.testing.assert_allclose(sampled_freq, sequential_freq, atol=0.02)
+
+    def test_insufficient_pool(self):
+        """제외 후 남은 번호가 부족하면 빈 배열 반환"""
+        candidates = sample_combinations(_weights(), 10, exclude_numbers=list(range(1, 42)))
+
+        assert candidates.shape == (0, 6)
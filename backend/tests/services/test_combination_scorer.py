@@ -0,0 +1,88 @@
+"""
+Batch Combination Scorer Test Module
+
+Tests that the vectorized scorer reproduces RecommendationEngine's per-combination scores.
+"""
+
+import random
+
+import numpy as np
+import pytest
+
+from app.services.combination_scorer import (
+    as_candidate_array,
+    calculate_balance_scores,
+    calculate_pattern_scores,
+    normalize_confidence,
+    score_combinations_batch,
+)
+from app.services.recommendation_engine import RecommendationEngine
+
+
+@pytest.fixture
+def engine():
+    """DB 없이 점수 함수만 사용하는 엔진"""
+    return RecommendationEngine(db_session=None)
+
+
+@pytest.fixture
+def combinations():
+    """무작위 조합 + 경계 사례 조합"""
+    rng = random.Random(2024)
+    combos = [sorted(rng.sample(range(1, 46), 6)) for _ in range(5000)]
+    combos += [
+        [1, 2, 3, 4, 5, 6],
+        [40, 41, 42, 43, 44, 45],
+        [1, 9, 17, 25, 33, 41],
+        [3, 10, 17, 24, 31, 38],
+        [1, 2, 3, 43, 44, 45],
+    ]
+    return combos
+
+
+class TestBatchScorer:
+    """Test vectorized scores against scalar implementations"""
+
+    def test_pattern_scores_match(self, engine, combinations):
+        """패턴 점수가 조합별 계산과 정확히 일치하는지 확인"""
+        batch = calculate_pattern_scores(as_candidate_array(combinations))
+        expected = [engine._calculate_pattern_score(combo) for combo in combinations]
+
+        assert batch.tolist() == expected
+
+    def test_balance_scores_match(self, engine, combinations):
+        """균형 점수가 조합별 계산과 정확히 일치하는지 확인"""
+        batch = calculate_balance_scores(as_candidate_array(combinations))
+        expected = [engine._calculate_balance_score(combo) for combo in combinations]
+
+        assert batch.tolist() == expected
+
+    def test_total_scores_match(self, engine, combinations):
+        """종합 점수(개별 40% + 패턴 35% + 균형 25%)가 일치하는지 확인"""
+        rng = np.random.default_rng(0)
+        number_scores = np.ones(46)
+        number_scores[1:] = rng.uniform(0.5, 1.5, size=45)
+
+        total, confidence = score_combinations_batch(as_candidate_array(combinations), number_scores)
+
+        for index, combo in enumerate(combinations):
+            individual = sum(number_scores[num] for num in combo) / 6
+            expected = (
+                individual * 0.40 +
+                engine._calculate_pattern_score(combo) * 0.35 +
+                engine._calculate_balance_score(combo) * 0.25
+            )
+            assert total[index] == expected
+        assert ((confidence >= 0.15) & (confidence <= 0.65)).all()
+
+    def test_normalize_confidence_tiers(self):
+        """구간별 신뢰도 정규화 확인"""
+        scores = np.array([0.1, 0.4, 0.6, 0.8, 0.9, 2.0])
+        normalized = normalize_confidence(scores)
+
+        assert normalized[0] == pytest.approx(0.15 + 0.1 * 0.23)
+        assert normalized[1] == pytest.approx(0.22 + 0.1 * 0.50)
+        assert normalized[2] == pytest.approx(0.32 + 0.1 * 0.65)
+        assert normalized[3] == pytest.approx(0.45 + 0.1 * 0.67)
+        assert normalized[4] == pytest.approx(0.55 + 0.05 * 0.67)
+        assert normalized[5] == 0.65
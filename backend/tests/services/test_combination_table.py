@@ -0,0 +1,50 @@
+"""
+Combination Score Table Test Module
+
+Tests for colex ranking and lossless score quantization.
+"""
+
+import numpy as np
+
+from app.services.combination_scorer import calculate_balance_scores, calculate_pattern_scores
+from app.services.combination_table import (
+    BALANCE_SCALE,
+    PATTERN_SCALE,
+    TOTAL_COMBINATIONS,
+    rank_combinations,
+    unrank_combinations,
+)
+
+
+class TestColexRank:
+    """Test combinatorial number system ranking"""
+
+    def test_rank_bounds(self):
+        """첫 조합과 마지막 조합의 순위 확인"""
+        ranks = rank_combinations(np.array([[1, 2, 3, 4, 5, 6], [40, 41, 42, 43, 44, 45]]))
+
+        assert ranks.tolist() == [0, TOTAL_COMBINATIONS - 1]
+
+    def test_unrank_roundtrip(self):
+        """unrank → rank 왕복 변환이 일치하는지 확인"""
+        ranks = np.random.default_rng(3).integers(0, TOTAL_COMBINATIONS, size=20000)
+        candidates = unrank_combinations(ranks)
+
+        assert (np.diff(candidates, axis=1) > 0).all()
+        assert candidates.min() >= 1 and candidates.max() <= 45
+        assert (rank_combinations(candidates) == ranks).all()
+
+
+class TestScoreQuantization:
+    """Test that uint8 score codes are lossless"""
+
+    def test_scores_are_exact_multiples(self):
+        """패턴/균형 점수가 양자화 단위의 정수배인지 확인"""
+        candidates = unrank_combinations(np.arange(0, TOTAL_COMBINATIONS, 97))
+
+        pattern_codes = calculate_pattern_scores(candidates) * PATTERN_SCALE
+        balance_codes = calculate_balance_scores(candidates) * BALANCE_SCALE
+
+        assert np.allclose(pattern_codes, np.rint(pattern_codes), atol=1e-9)
+        assert np.allclose(balance_codes, np.rint(balance_codes), atol=1e-9)
+        assert pattern_codes.max() <= 255 and balance_codes.max() <= 255
@@ -0,0 +1,60 @@
+"""
+Columnar Draw Loader Test Module
+
+Checks that load_draw_columns streams the DBAPI cursor into typed arrays and
+that its DataFrame view matches the previous ORM-based load_draw_data output.
+@TEST:LOTTO-ML-PREPROCESS-001
+"""
+
+import numpy as np
+import pandas as pd
+
+from app.models.lotto import LottoDraw
+from app.services.ml.data_preprocessor import DRAW_COLUMNS, load_draw_columns, load_draw_data
+from tests.conftest import SAMPLE_DRAW_COUNT
+
+
+def _orm_frame(db_session, since_draw=0) -> pd.DataFrame:
+    """Previous implementation: ORM rows -> dicts -> DataFrame."""
+    draws = (
+        db_session.query(LottoDraw)
+        .filter(LottoDraw.draw_number > since_draw)
+        .order_by(LottoDraw.draw_number)
+        .all()
+    )
+    return pd.DataFrame(
+        [{col: getattr(draw, col) for col in DRAW_COLUMNS} for draw in draws],
+        columns=DRAW_COLUMNS
+    )
+
+
+def test_typed_columns(db_session):
+    columns = load_draw_columns(db_session, batch_size=16)
+
+    assert len(columns) == SAMPLE_DRAW_COUNT
+    assert columns.numbers.dtype == np.int16
+    assert columns.numbers.shape == (SAMPLE_DRAW_COUNT, 6)
+    assert columns.bonus_numbers.dtype == np.int16
+    assert columns.first_amounts.dtype == np.int64
+    assert columns.draw_dates.dtype == np.dtype('datetime64[D]')
+    np.testing.assert_array_equal(columns.draw_numbers, np.arange(1, SAMPLE_DRAW_COUNT + 1))
+
+
+def test_frame_matches_orm_loader(db_session):
+    pd.testing.assert_frame_equal(
+        load_draw_data(db_session),
+        _orm_frame(db_session),
+        check_dtype=False
+    )
+
+
+def test_since_draw_loads_tail_only(db_session):
+    tail = load_draw_data(db_session, since_draw=SAMPLE_DRAW_COUNT - 5)
+
+    assert tail['draw_number'].tolist() == list(range(SAMPLE_DRAW_COUNT - 4, SAMPLE_DRAW_COUNT + 1))
+    pd.testing.assert_frame_equal(
+        tail,
+        _orm_frame(db_session, SAMPLE_DRAW_COUNT - 5),
+        check_dtype=False
+    )
+    assert len(load_draw_columns(db_session, since_draw=SAMPLE_DRAW_COUNT)) == 0
@@ -0,0 +1,95 @@
+"""
+Draw Integrity Test Module
+
+Checks the missing-draw anti-join (recursive CTE on SQLite, generate_series
+on PostgreSQL), checksum manifest verification, and that a repair only
+fetches the missing draws.
+"""
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.models.draw_checksum import DrawChecksum
+from app.models.lotto import LottoDraw
+from app.services import auto_updater as auto_updater_module
+from app.services.auto_updater import AutoUpdater
+from app.services.draw_integrity import DrawIntegrityScanner, find_missing_draws, missing_draws_query
+from tests.conftest import SAMPLE_DRAW_COUNT
+
+
+def delete_draws(db_session, draw_numbers):
+    db_session.query(LottoDraw).filter(LottoDraw.draw_number.in_(draw_numbers)).delete(synchronize_session=False)
+    db_session.commit()
+
+
+def test_find_missing_draws_includes_tail(db_session):
+    delete_draws(db_session, [3, 57, 58])
+
+    assert find_missing_draws(db_session) == [3, 57, 58]
+    assert find_missing_draws(db_session, SAMPLE_DRAW_COUNT + 2) == [
+        3, 57, 58, SAMPLE_DRAW_COUNT + 1, SAMPLE_DRAW_COUNT + 2
+    ]
+
+
+def test_postgresql_query_uses_generate_series():
+    sql = str(missing_draws_query("postgresql", 1200).compile(dialect=postgresql.dialect()))
+    assert "generate_series" in sql
+    assert "LEFT OUTER JOIN lotto_draws" in sql
+    assert "lotto_draws.draw_number IS NULL" in sql
+
+
+def test_scan_records_manifest_then_detects_mismatch(db_session):
+    scanner = DrawIntegrityScanner()
+
+    first = scanner.scan(db_session)
+    assert first["recorded_checksums"] == SAMPLE_DRAW_COUNT
+    assert first["is_healthy"]
+    assert db_session.query(DrawChecksum).count() == SAMPLE_DRAW_COUNT
+
+    draw = db_session.query(LottoDraw).filter(LottoDraw.draw_number == 42).one()
+    draw.bonus_number = 45 if draw.bonus_number != 45 else 44
+    db_session.commit()
+
+    second = scanner.scan(db_session)
+    assert second["recorded_checksums"] == 0
+    assert second["mismatched_draws"] == [42]
+    assert not second["is_healthy"]
+    assert scanner.last_report is second
+
+
+@pytest.mark.asyncio
+async def test_repair_fetches_only_missing_draws(db_session, monkeypatch):
+    delete_draws(db_session, [10, 11, 80])
+    report = DrawIntegrityScanner().scan(db_session, latest_draw=SAMPLE_DRAW_COUNT + 1)
+    assert report["missing_draws"] == [10, 11, 80, SAMPLE_DRAW_COUNT + 1]
+
+    requested = []
+
+    class FakeScraper:
+        async def scrape_draws(self, draw_numbers):
+            requested.extend(draw_numbers)
+            scraped = [
+                {
+                    "draw_number": n,
+                    "draw_date": "2024-06-01",
+                    "numbers": [1, 2, 3, 4, 5, 6],
+                    "bonus_number": 7,
+                }
+                for n in draw_numbers if n != 80
+            ]
+            return scraped, [80]
+
+    monkeypatch.setattr(auto_updater_module, "draw_scraper", FakeScraper())
+    monkeypatch.setattr(auto_updater_module, "get_db", lambda: iter([db_session]))
+    updater = AutoUpdater()
+    updater.auto_dummy_config["enabled"] = False
+
+    assert updater.schedule_gap_repair(report["missing_draws"])
+    await updater._repair_task
+
+    assert requested == [10, 11, 80, SAMPLE_DRAW_COUNT + 1]
+    assert updater.last_repair["inserted"] == [10, 11, SAMPLE_DRAW_COUNT + 1]
+    assert updater.last_repair["failed"] == [80]
+    assert find_missing_draws(db_session) == [80]
+    # 복구로 입력한 회차는 체크섬도 함께 기록됨
+    assert db_session.get(DrawChecksum, SAMPLE_DRAW_COUNT + 1) is not None
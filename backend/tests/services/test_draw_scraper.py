@@ -0,0 +1,205 @@
+"""
+Draw Scraper Test Module
+
+Runs the async scraper against a local HTML fixture server that mimics the
+dhlottery draw result page (EUC-KR, POST drwNo), and checks the batched
+insert in AutoUpdater.
+"""
+
+import random
+import threading
+import time
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event
+
+from app.models.lotto import LottoDraw
+from app.models.recommendation_draw_stat import RecommendationDrawStat
+from app.services import auto_updater as auto_updater_module
+from app.services.auto_updater import AutoUpdater
+from app.services.draw_scraper import DRAW_RESULT_URL, DrawScraper, HostRateLimiter, parse_draw_page
+from app.services.http_clients import HTTPClientManager, RetryPolicy
+from tests.conftest import SAMPLE_DRAW_COUNT
+
+PAGE_TEMPLATE = (Path(__file__).parent.parent / "fixtures" / "draw_result_page.html").read_text(encoding="utf-8")
+
+LATEST_DRAW = 130
+FIRST_DATE = date(2023, 1, 7)
+
+
+def draw_numbers(draw_number: int):
+    picked = random.Random(draw_number).sample(range(1, 46), 7)
+    return sorted(picked[:6]), picked[6]
+
+
+def render_page(draw_number: int) -> bytes:
+    numbers, bonus = draw_numbers(draw_number)
+    draw_date = FIRST_DATE + timedelta(weeks=draw_number - 1)
+    balls = "".join(f'<span class="ball_645 lrg ball{i}">{n}</span>' for i, n in enumerate(numbers, 1))
+    return PAGE_TEMPLATE.format(
+        latest_draw=LATEST_DRAW,
+        draw_number=draw_number,
+        year=draw_date.year,
+        month=f"{draw_date.month:02d}",
+        day=f"{draw_date.day:02d}",
+        balls=balls,
+        bonus_number=bonus,
+        first_total=f"{draw_number * 3_000_000_000:,}",
+        first_winners=draw_number % 7 + 1,
+        first_amount=f"{draw_number * 1_000_000:,}",
+    ).encode("euc-kr")
+
+
+class FixtureSite:
+    """당첨결과 페이지 픽스처 서버 상태 (장애 주입, 동시 요청 수 기록)"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.fail_once = set()
+        self.missing = set()
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.requests = []
+        self.post_headers = None
+
+
+@pytest.fixture
+def site():
+    state = FixtureSite()
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def _send(self, status: int, body: bytes = b""):
+            self.send_response(status)
+            self.send_header("Content-Type", "text/html; charset=euc-kr")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            self._send(200, render_page(LATEST_DRAW))
+
+        def do_POST(self):
+            length = int(self.headers.get("Content-Length", 0))
+            draw_number = int(parse_qs(self.rfile.read(length).decode())["drwNo"][0])
+            with state.lock:
+                state.requests.append(draw_number)
+                state.post_headers = dict(self.headers)
+                state.in_flight += 1
+                state.peak_in_flight = max(state.peak_in_flight, state.in_flight)
+                fail = draw_number in state.fail_once
+                state.fail_once.discard(draw_number)
+            try:
+                time.sleep(0.02)
+                if fail:
+                    self._send(503)
+                elif draw_number in state.missing or draw_number > LATEST_DRAW:
+                    # 발표 전 회차는 최신 회차 페이지가 내려옴
+                    self._send(200, render_page(LATEST_DRAW))
+                else:
+                    self._send(200, render_page(draw_number))
+            finally:
+                with state.lock:
+                    state.in_flight -= 1
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    state.url = f"http://127.0.0.1:{server.server_address[1]}/gameResult.do?method=byWin"
+    yield state
+    server.shutdown()
+    server.server_close()
+
+
+@pytest_asyncio.fixture
+async def scraper(site):
+    client = HTTPClientManager(retry=RetryPolicy(max_attempts=1))
+    client.start()
+    yield DrawScraper(
+        url=site.url,
+        concurrency=3,
+        rate_per_second=0,
+        retry=RetryPolicy(max_attempts=3, backoff=0.01),
+        client=client
+    )
+    await client.close()
+
+
+def test_parse_draw_page_fixture():
+    parsed = parse_draw_page(render_page(101), 101)
+    numbers, bonus = draw_numbers(101)
+    assert parsed == {
+        "draw_number": 101,
+        "draw_date": (FIRST_DATE + timedelta(weeks=100)).isoformat(),
+        "numbers": numbers,
+        "bonus_number": bonus,
+        "first_winners": 101 % 7 + 1,
+        "first_amount": 101_000_000,
+    }
+
+
+@pytest.mark.asyncio
+async def test_scrape_range_bounded_and_retried(site, scraper):
+    site.fail_once = {123, 127}
+    scraped, failed = await scraper.scrape_range(121, LATEST_DRAW)
+
+    assert failed == []
+    assert [draw["draw_number"] for draw in scraped] == list(range(121, LATEST_DRAW + 1))
+    assert site.peak_in_flight <= 3
+    assert site.requests.count(123) == 2
+    assert await scraper.fetch_latest_draw_number() == LATEST_DRAW
+
+    # 원래 스크래퍼의 강화된 헤더 유지 (Referer + 폼 Content-Type)
+    assert site.post_headers["Referer"] == DRAW_RESULT_URL
+    assert site.post_headers["Content-Type"] == "application/x-www-form-urlencoded"
+
+
+@pytest.mark.asyncio
+async def test_new_draws_stop_at_first_gap(site, scraper, monkeypatch):
+    site.missing = {124}
+    monkeypatch.setattr(auto_updater_module, "draw_scraper", scraper)
+
+    new_draws = await AutoUpdater()._scrape_new_draws(121, 126)
+    assert [draw["draw_number"] for draw in new_draws] == [121, 122, 123]
+    assert site.requests.count(124) == 3
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_spaces_requests_per_host():
+    now = [0.0]
+    limiter = HostRateLimiter(rate_per_second=10, clock=lambda: now[0])
+    await limiter.acquire("a")
+    await limiter.acquire("b")
+    assert limiter._next_slot == {"a": pytest.approx(0.1), "b": pytest.approx(0.1)}
+
+
+def test_insert_new_draws_single_commit(db_session):
+    updater = AutoUpdater()
+    updater.auto_dummy_config["enabled"] = False
+    commits = []
+    event.listen(db_session.get_bind(), "commit", lambda conn: commits.append(conn))
+
+    new_draws = []
+    for draw_number in (SAMPLE_DRAW_COUNT + 2, SAMPLE_DRAW_COUNT + 1, SAMPLE_DRAW_COUNT):
+        numbers, bonus = draw_numbers(draw_number)
+        new_draws.append({
+            "draw_number": draw_number,
+            "draw_date": (FIRST_DATE + timedelta(weeks=draw_number - 1)).isoformat(),
+            "numbers": numbers,
+            "bonus_number": bonus,
+        })
+    # SAMPLE_DRAW_COUNT 회차는 이미 있으므로 그 회차만 건너뛰고 나머지는 입력
+    updater._insert_new_draws(db_session, new_draws)
+
+    assert len(commits) == 1
+    latest = db_session.query(LottoDraw).order_by(LottoDraw.draw_number.desc()).limit(2).all()
+    assert [draw.draw_number for draw in latest] == [SAMPLE_DRAW_COUNT + 2, SAMPLE_DRAW_COUNT + 1]
+    # 새로 마감된 회차까지 추천 통계 롤업이 같은 커밋에 기록됨
+    assert db_session.query(RecommendationDrawStat).count() == SAMPLE_DRAW_COUNT + 1
@@ -0,0 +1,112 @@
+"""
+Draw History Snapshot Test Module
+
+Tests for the in-memory draw snapshot and snapshot-based LottoAnalyzer statistics.
+"""
+
+import pytest
+from sqlalchemy import text
+
+from app.services.draw_snapshot import DrawHistoryStore, draw_history
+from app.services.lotto_analyzer import LottoAnalyzer
+from tests.conftest import SAMPLE_DRAW_COUNT
+
+
+@pytest.fixture(autouse=True)
+def reset_snapshot():
+    """각 테스트마다 전역 스냅샷 초기화"""
+    draw_history.invalidate()
+    yield
+    draw_history.invalidate()
+
+
+class TestDrawHistoryStore:
+    """Test snapshot loading and invalidation"""
+
+    def test_snapshot_shape(self, db_session):
+        """스냅샷이 (n_draws, 7) 배열로 적재되는지 확인"""
+        snapshot = DrawHistoryStore().get(db_session)
+
+        assert snapshot.numbers.shape == (SAMPLE_DRAW_COUNT, 7)
+        assert snapshot.total_draws == SAMPLE_DRAW_COUNT
+        assert snapshot.latest_draw_number == SAMPLE_DRAW_COUNT
+
+    def test_snapshot_reused_until_invalidated(self, db_session):
+        """무효화 전까지 같은 스냅샷을 재사용하는지 확인"""
+        store = DrawHistoryStore()
+        first = store.get(db_session)
+
+        assert store.get(db_session) is first
+
+        store.invalidate()
+        second = store.get(db_session)
+        assert second is not first
+        assert second.version == first.version + 1
+
+
+class TestSnapshotAnalyzer:
+    """Test that snapshot statistics match the original SQL implementation"""
+
+    def test_frequency_statistics_match_sql(self, db_session):
+        """빈도 통계가 기존 UNION ALL 쿼리 결과와 동일한지 확인"""
+        query = text("""
+        WITH number_frequency AS (
+            SELECT number, COUNT(*) as total_appearances, MAX(draw_number) as last_appearance
+            FROM (
+                SELECT draw_number, number_1 as number FROM lotto_draws UNION ALL
+                SELECT draw_number, number_2 as number FROM lotto_draws UNION ALL
+                SELECT draw_number, number_3 as number FROM lotto_draws UNION ALL
+                SELECT draw_number, number_4 as number FROM lotto_draws UNION ALL
+                SELECT draw_number, number_5 as number FROM lotto_draws UNION ALL
+                SELECT draw_number, number_6 as number FROM lotto_draws
+            ) all_numbers
+            GROUP BY number
+        )
+        SELECT number, total_appearances,
+            ROUND(total_appearances * 100.0 / (SELECT COUNT(*) FROM lotto_draws), 2) as frequency_percent,
+            last_appearance,
+            (SELECT MAX(draw_number) FROM lotto_draws) - last_appearance as gap
+        FROM number_frequency ORDER BY number
+        """)
+        expected = {
+            row.number: {
+                'total_appearances': row.total_appearances,
+                'frequency_percent': float(row.frequency_percent),
+                'last_appearance': row.last_appearance,
+                'gap_since_last': row.gap
+            }
+            for row in db_session.execute(query).fetchall()
+        }
+
+        assert LottoAnalyzer(db_session).calculate_frequency_statistics() == expected
+
+    def test_recent_trends_match_latest_draws(self, db_session):
+        """최근 트렌드가 최신 20회차 기준으로 계산되는지 확인"""
+        rows = db_session.execute(text(
+            "SELECT number_1, number_2, number_3, number_4, number_5, number_6 "
+            "FROM lotto_draws ORDER BY draw_number DESC LIMIT 20"
+        )).fetchall()
+        counts = {}
+        for row in rows:
+            for number in row:
+                counts[number] = counts.get(number, 0) + 1
+
+        trends = LottoAnalyzer(db_session).calculate_recent_trends(20)
+
+        assert len(trends) == 45
+        for number in range(1, 46):
+            assert trends[number]['recent_appearances'] == counts.get(number, 0)
+
+    def test_statistics_served_without_database(self, db_session):
+        """스냅샷 적재 후에는 DB 없이 통계를 계산하는지 확인"""
+        analyzer = LottoAnalyzer(db_session)
+        analyzer.get_total_draws()
+        db_session.close()
+
+        class NoDatabase:
+            def execute(self, *args, **kwargs):
+                raise AssertionError("database should not be queried")
+
+        offline = LottoAnalyzer(NoDatabase())
+        assert offline.get_latest_draw_number() == SAMPLE_DRAW_COUNT
+        assert len(offline.calculate_recent_trends(20)) == 45
@@ -0,0 +1,89 @@
+"""
+Dummy Recommendations Test Module
+
+Tests vectorized dummy row generation and the bulk insert path.
+"""
+
+import time
+from datetime import date
+
+import numpy as np
+from sqlalchemy import func
+
+from app.models.public_recommendation import PublicRecommendation
+from app.services.dummy_recommendations import (
+    DUMMY_COLUMNS,
+    _copy_value,
+    build_dummy_rows,
+    bulk_insert_dummy_rows,
+)
+from app.services.number_mask import NumberMask, winning_grade
+
+
+WINNING = [3, 11, 19, 27, 35, 43]
+BONUS = 7
+DRAW_DATE = date(2024, 6, 1)
+RANK_COUNTS = {1: 2, 2: 15, 3: 60, 4: 150, 5: 250}
+
+
+def _rows(no_win_count=4000, seed=5, **kwargs):
+    return list(build_dummy_rows(
+        1120, WINNING, BONUS, DRAW_DATE, RANK_COUNTS, no_win_count,
+        rng=np.random.default_rng(seed), **kwargs
+    ))
+
+
+def test_rows_match_their_recorded_rank():
+    rows = _rows()
+    column = {name: index for index, name in enumerate(DUMMY_COLUMNS)}
+    assert len(rows) == sum(RANK_COUNTS.values()) + 4000
+
+    winning = NumberMask.from_numbers(WINNING)
+    for row in rows:
+        numbers = row[column['numbers']]
+        assert len(set(numbers)) == 6
+        assert all(1 <= n <= 45 for n in numbers)
+
+        matches, _, grade = winning_grade(NumberMask.from_numbers(numbers), winning, BONUS)
+        assert matches == row[column['matched_count']]
+        assert sorted(row[column['matched_numbers']]) == sorted(set(numbers) & set(WINNING))
+
+        rank = row[column['winning_rank']]
+        if rank is None:
+            assert matches <= 2
+            assert 50 <= row[column['confidence_score']] <= 85
+        else:
+            assert grade == rank
+            assert 70 <= row[column['confidence_score']] <= 95
+        assert (DRAW_DATE - row[column['created_at']]).days in range(7)
+
+
+def test_auto_generated_flag_in_analysis_data():
+    row = _rows(no_win_count=1, auto_generated=True)[0]
+    assert row[DUMMY_COLUMNS.index('analysis_data')] == {"is_dummy": True, "auto_generated": True, "rank": 1}
+
+
+def test_bulk_insert_fallback(db_session):
+    started = time.perf_counter()
+    inserted = bulk_insert_dummy_rows(db_session, build_dummy_rows(
+        1120, WINNING, BONUS, DRAW_DATE, RANK_COUNTS, 4500
+    ))
+    db_session.commit()
+    elapsed = time.perf_counter() - started
+
+    total = sum(RANK_COUNTS.values()) + 4500
+    assert inserted == total
+    assert db_session.query(func.count(PublicRecommendation.id)).scalar() == total
+    assert db_session.query(func.count(PublicRecommendation.id)).filter(
+        PublicRecommendation.winning_rank == 2
+    ).scalar() == RANK_COUNTS[2]
+    assert elapsed < 5.0
+
+
+def test_copy_value_formatting():
+    assert _copy_value([1, 2, 3], is_array=True) == "{1,2,3}"
+    assert _copy_value([1, 2, 3], is_array=False) == "[1, 2, 3]"
+    assert _copy_value({"rank": 0}, is_array=False) == '{"rank": 0}'
+    assert _copy_value(True, is_array=False) == "t"
+    assert _copy_value(DRAW_DATE, is_array=False) == "2024-06-01"
+    assert _copy_value(None, is_array=False) is None
@@ -0,0 +1,116 @@
+"""
+Bounded Executors Test Module
+
+Tests capacity limits, timeouts and queue metrics of the named CPU pools.
+"""
+
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from app.services.executors import (
+    BoundedExecutor,
+    ExecutorSaturatedError,
+    ExecutorTimeoutError,
+    executor_status,
+)
+
+
+@pytest.fixture
+def pool():
+    executor = BoundedExecutor("test", max_workers=1, max_queue=1, timeout=2.0)
+    yield executor
+    executor.shutdown(wait=True)
+
+
+def test_call_returns_result_and_records_metrics(pool):
+    assert pool.call(sum, [1, 2, 3]) == 6
+
+    status = pool.status()
+    assert status["submitted"] == 1
+    assert status["completed"] == 1
+    assert status["running"] == 0
+    assert status["queue_depth"] == 0
+
+
+def test_rejects_when_running_and_queue_are_full(pool):
+    release = threading.Event()
+    running = pool.submit(release.wait)
+    queued = pool.submit(release.wait)
+
+    with pytest.raises(ExecutorSaturatedError):
+        pool.submit(release.wait)
+
+    status = pool.status()
+    assert status["rejected"] == 1
+    assert status["peak_queue_depth"] >= 1
+
+    release.set()
+    assert running.result(timeout=2) and queued.result(timeout=2)
+    assert pool.call(len, "ok") == 2
+
+
+def test_timeout_cancels_queued_task_and_frees_capacity(pool):
+    release = threading.Event()
+    blocker = pool.submit(release.wait)
+
+    with pytest.raises(ExecutorTimeoutError):
+        pool.call(release.wait, timeout=0.05)
+
+    # 대기 중 취소된 작업은 용량에서 빠지므로 다시 제출 가능
+    assert pool.status()["timed_out"] == 1
+    queued = pool.submit(lambda: "after")
+    release.set()
+    assert blocker.result(timeout=2)
+    assert queued.result(timeout=2) == "after"
+
+
+def test_failures_are_counted(pool):
+    with pytest.raises(ZeroDivisionError):
+        pool.call(lambda: 1 / 0)
+    assert pool.status()["failed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_run_awaits_without_blocking_loop(pool):
+    assert await pool.run(pow, 2, 10) == 1024
+
+    release = threading.Event()
+    pool.submit(release.wait)
+    with pytest.raises(ExecutorTimeoutError):
+        await pool.run(release.wait, timeout=0.05)
+    release.set()
+
+
+def test_named_pools_are_registered():
+    assert set(executor_status()) == {"auth", "recommendation", "ml", "scraper"}
+
+
+@pytest.mark.asyncio
+async def test_recommendation_worker_uses_its_own_session(pool, monkeypatch):
+    """타임아웃 후에도 계속 도는 작업이 요청 세션 대신 전용 세션을 쓰는지 확인"""
+    from app.api import recommendations
+
+    release = threading.Event()
+    worker_session = Mock()
+    used_sessions = []
+
+    class SlowEngine:
+        def __init__(self, db, use_ml_model=False):
+            used_sessions.append(db)
+
+        def generate_combinations(self, **kwargs):
+            release.wait()
+            return []
+
+    monkeypatch.setattr(recommendations, "SessionLocal", Mock(return_value=worker_session))
+    monkeypatch.setattr(recommendations, "RecommendationEngine", SlowEngine)
+
+    with pytest.raises(ExecutorTimeoutError):
+        await pool.run(recommendations._generate_combinations_in_worker, count=1, timeout=0.05)
+    release.set()
+    pool.shutdown(wait=True)
+
+    assert used_sessions == [worker_session]
+    worker_session.close.assert_called_once()
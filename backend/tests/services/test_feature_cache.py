@@ -0,0 +1,69 @@
+"""
+Inference Feature Cache Test Module
+
+Tests that the cached inference vector matches the database/pandas path and
+is rebuilt only when the latest draw changes.
+"""
+
+import numpy as np
+import pytest
+
+from app.models.lotto import LottoDraw
+from app.services.draw_snapshot import draw_history
+from app.services.ml.data_preprocessor import FEATURE_SCHEMA_VERSION, prepare_features_for_inference
+from app.services.ml.feature_cache import InferenceFeatureCache
+from tests.conftest import SAMPLE_DRAW_COUNT, make_sample_draws
+
+
+@pytest.fixture(autouse=True)
+def reset_snapshot():
+    """각 테스트마다 전역 스냅샷 초기화"""
+    draw_history.invalidate()
+    yield
+    draw_history.invalidate()
+
+
+class TestInferenceFeatureCache:
+    """Test cached inference features"""
+
+    def test_matches_dataframe_path(self, db_session):
+        """캐시된 특성이 DB + pandas 경로와 정확히 일치하는지 확인"""
+        cached = InferenceFeatureCache().get(db_session)
+        expected = prepare_features_for_inference(db_session)
+
+        assert cached.shape == expected.shape
+        np.testing.assert_array_equal(cached, expected)
+
+    def test_reused_for_same_draw(self, db_session):
+        """최신 회차가 같으면 같은 배열을 재사용하는지 확인"""
+        cache = InferenceFeatureCache()
+        first = cache.get(db_session)
+
+        assert cache.get(db_session) is first
+        assert cache.key == (SAMPLE_DRAW_COUNT, FEATURE_SCHEMA_VERSION)
+        assert not first.flags.writeable
+
+    def test_refresh_after_new_draw(self, db_session):
+        """새 회차 커밋 후 refresh하면 새 회차 기준으로 다시 계산되는지 확인"""
+        cache = InferenceFeatureCache()
+        first = cache.get(db_session)
+
+        new_draw = make_sample_draws(SAMPLE_DRAW_COUNT + 1, seed=7)[-1]
+        db_session.add(new_draw)
+        db_session.commit()
+        draw_history.invalidate()
+
+        refreshed = cache.refresh(db_session)
+
+        assert refreshed is not first
+        assert cache.key == (SAMPLE_DRAW_COUNT + 1, FEATURE_SCHEMA_VERSION)
+        np.testing.assert_array_equal(refreshed, prepare_features_for_inference(db_session))
+
+    def test_empty_history_defaults(self, db_session):
+        """데이터가 없으면 균등 기본 특성을 반환하는지 확인"""
+        db_session.query(LottoDraw).delete()
+        db_session.commit()
+
+        features = InferenceFeatureCache().get(db_session)
+
+        np.testing.assert_array_equal(features, np.ones((1, 45)) / 45)
@@ -0,0 +1,115 @@
+"""
+Feature Store Test Module
+
+Tests the append-only on-disk feature store: appended rows match a full
+recomputation, training reads are memory-mapped, and rebuilds only happen on
+schema or history changes.
+@TEST:LOTTO-ML-PREPROCESS-001
+"""
+
+import numpy as np
+import pytest
+
+from app.models.lotto import LottoDraw
+from app.services.ml import data_preprocessor, feature_store as feature_store_module
+from app.services.ml.data_preprocessor import NUMBER_COLS
+from app.services.ml.feature_store import FeatureStore
+from tests.conftest import SAMPLE_DRAW_COUNT, make_sample_draws
+
+
+@pytest.fixture
+def store(tmp_path):
+    return FeatureStore(directory=str(tmp_path / "features"))
+
+
+def _expected(db_session):
+    numbers = data_preprocessor.load_draw_columns(db_session).numbers
+    return (
+        data_preprocessor.extract_feature_matrix(numbers)[:-1],
+        data_preprocessor.create_target_matrix(numbers)
+    )
+
+
+def _add_draws(db_session, first, last):
+    """Insert draws first..last (numbers from another seed)."""
+    db_session.add_all(make_sample_draws(last, seed=11)[first - 1:])
+    db_session.commit()
+
+
+def test_next_feature_row_matches_matrix():
+    numbers = np.array([[getattr(d, col) for col in NUMBER_COLS] for d in make_sample_draws(60)])
+    matrix = data_preprocessor.extract_feature_matrix(numbers)
+
+    for idx in (0, 1, 20, 59):
+        np.testing.assert_array_equal(data_preprocessor.extract_next_feature_row(numbers[:idx]), matrix[idx])
+
+
+def test_sync_builds_memory_mapped_store(db_session, store):
+    features, labels = store.sync(db_session)
+    expected_features, expected_labels = _expected(db_session)
+
+    assert isinstance(features.base, np.memmap) or isinstance(features, np.memmap)
+    assert not features.flags.writeable
+    np.testing.assert_array_equal(features, expected_features)
+    np.testing.assert_array_equal(labels, expected_labels)
+    assert store.load_manifest()["last_draw"] == SAMPLE_DRAW_COUNT
+
+
+def test_append_matches_rebuild_and_grows(db_session, store, monkeypatch):
+    monkeypatch.setattr(feature_store_module, "GROWTH_ROWS", 2)
+    store.sync(db_session)
+
+    def no_rebuild(*_args):
+        raise AssertionError("append must not rebuild")
+
+    monkeypatch.setattr(store, "_rebuild", no_rebuild)
+    _add_draws(db_session, SAMPLE_DRAW_COUNT + 1, SAMPLE_DRAW_COUNT + 1)
+    store.sync(db_session)
+    # 3 draws at once with 2 spare rows left: the arrays are reallocated
+    _add_draws(db_session, SAMPLE_DRAW_COUNT + 2, SAMPLE_DRAW_COUNT + 4)
+    features, labels = store.sync(db_session)
+
+    expected_features, expected_labels = _expected(db_session)
+    np.testing.assert_array_equal(features, expected_features)
+    np.testing.assert_array_equal(labels, expected_labels)
+    manifest = store.load_manifest()
+    assert manifest["rows"] == SAMPLE_DRAW_COUNT + 4
+    assert manifest["capacity"] >= manifest["rows"]
+
+
+def test_rebuild_on_schema_or_history_change(db_session, store, monkeypatch):
+    store.sync(db_session)
+    rebuilds = []
+    original = store._rebuild
+    monkeypatch.setattr(store, "_rebuild", lambda *args: rebuilds.append(1) or original(*args))
+
+    store.sync(db_session)
+    assert rebuilds == []
+
+    monkeypatch.setattr(feature_store_module, "FEATURE_SCHEMA_VERSION", 999)
+    store.sync(db_session)
+    assert rebuilds == [1]
+    assert store.load_manifest()["schema_version"] == 999
+
+    db_session.query(LottoDraw).filter(LottoDraw.draw_number == 50).delete()
+    db_session.commit()
+    features, _ = store.sync(db_session)
+    assert rebuilds == [1, 1]
+    assert len(features) == SAMPLE_DRAW_COUNT - 2
+
+
+def test_rebuild_on_corrected_draw(db_session, store):
+    store.sync(db_session)
+
+    # Same draw count and range, different numbers
+    draw = db_session.query(LottoDraw).filter(LottoDraw.draw_number == 30).one()
+    corrected = [n for n in range(1, 46) if n not in (draw.number_1, draw.number_2)][:6]
+    for idx, number in enumerate(corrected, start=1):
+        setattr(draw, f"number_{idx}", number)
+    db_session.commit()
+
+    features, labels = store.sync(db_session)
+
+    expected_features, expected_labels = _expected(db_session)
+    np.testing.assert_array_equal(features, expected_features)
+    np.testing.assert_array_equal(labels, expected_labels)
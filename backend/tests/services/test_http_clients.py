@@ -0,0 +1,136 @@
+"""
+HTTP Client Manager Test Module
+
+Runs the shared client against httpx.MockTransport: retry rules, per-host
+limits, and the OAuth / draw scraper call sites.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+import pytest_asyncio
+
+from app.services.auto_updater import AutoUpdater
+from app.services.http_clients import HTTPClientManager, RetryPolicy
+from app.utils.auth import SocialAuthService
+
+FAST_RETRY = RetryPolicy(max_attempts=3, backoff=0)
+
+
+def make_manager(handler, **kwargs) -> HTTPClientManager:
+    manager = HTTPClientManager(retry=FAST_RETRY, **kwargs)
+    manager.start(transport=httpx.MockTransport(handler))
+    return manager
+
+
+@pytest.mark.asyncio
+async def test_get_retries_retryable_status():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(503 if len(calls) < 3 else 200, text="ok")
+
+    manager = make_manager(handler)
+    response = await manager.get("https://example.test/draws")
+    await manager.close()
+
+    assert response.status_code == 200
+    assert len(calls) == 3
+    assert manager.status()["hosts"]["example.test"]["retries"] == 2
+
+
+@pytest.mark.asyncio
+async def test_post_retries_only_unsent_requests():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        if len(calls) == 1:
+            raise httpx.ConnectError("refused", request=request)
+        if len(calls) == 2:
+            raise httpx.ReadTimeout("slow", request=request)
+        return httpx.Response(200)
+
+    manager = make_manager(handler)
+    with pytest.raises(httpx.ReadTimeout):
+        await manager.post("https://example.test/token", data={"code": "x"})
+    assert len(calls) == 2
+
+    # 멱등으로 지정한 POST는 읽기 타임아웃도 재시도
+    response = await manager.post("https://example.test/token", data={"code": "x"}, idempotent=True)
+    await manager.close()
+    assert response.status_code == 200
+
+    status_calls = []
+
+    def unavailable(request):
+        status_calls.append(request)
+        return httpx.Response(503)
+
+    manager = make_manager(unavailable)
+    response = await manager.post("https://example.test/token")
+    await manager.close()
+    assert response.status_code == 503
+    assert len(status_calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_per_host_concurrency_limit():
+    active = {"now": 0, "peak": 0}
+
+    async def handler(request):
+        active["now"] += 1
+        active["peak"] = max(active["peak"], active["now"])
+        await asyncio.sleep(0.01)
+        active["now"] -= 1
+        return httpx.Response(200)
+
+    manager = make_manager(handler, max_connections_per_host=2)
+    await asyncio.gather(*(manager.get("https://example.test/") for _ in range(8)))
+    await manager.close()
+    assert active["peak"] == 2
+
+
+@pytest_asyncio.fixture
+async def shared_client(monkeypatch):
+    """전역 http_clients를 목 전송 계층 관리자로 교체"""
+    routes = {}
+
+    def handler(request):
+        return routes[(request.method, request.url.host, request.url.path)](request)
+
+    manager = make_manager(handler)
+    for module in ("app.utils.auth", "app.services.draw_scraper"):
+        monkeypatch.setattr(f"{module}.http_clients", manager)
+    yield routes
+    await manager.close()
+
+
+@pytest.mark.asyncio
+async def test_social_login_uses_shared_client(shared_client):
+    shared_client[("POST", "kauth.kakao.com", "/oauth/token")] = (
+        lambda request: httpx.Response(200, json={"access_token": "kakao-token"})
+    )
+    shared_client[("GET", "kapi.kakao.com", "/v2/user/me")] = lambda request: httpx.Response(200, json={
+        "id": 42,
+        "kakao_account": {"email": "a@b.kr", "profile": {"nickname": "lotto"}},
+        "echo": request.headers["Authorization"],
+    })
+
+    token = await SocialAuthService.get_kakao_access_token("code")
+    info = await SocialAuthService.get_kakao_user_info(token)
+    assert token == "kakao-token"
+    assert info["social_id"] == "42"
+    assert info["nickname"] == "lotto"
+
+
+@pytest.mark.asyncio
+async def test_scraper_reads_latest_draw_through_shared_client(shared_client):
+    page = '<div class="win_result"><h4><strong>1190회</strong> 당첨결과</h4></div>'
+    shared_client[("GET", "www.dhlottery.co.kr", "/gameResult.do")] = (
+        lambda request: httpx.Response(200, content=page.encode("euc-kr"))
+    )
+
+    assert await AutoUpdater()._get_latest_site_draw_number() == 1190
@@ -0,0 +1,93 @@
+"""
+ML Sampling Test Module
+
+Tests the vectorized Gumbel-top-k combination sampler and the per-(model, draw)
+prediction cache.
+"""
+
+import numpy as np
+import pytest
+
+from app.services.ml.inference_engine import CombinationSampler, generate_combinations
+from app.services.ml.prediction_cache import PredictionCache
+
+
+@pytest.fixture
+def probabilities():
+    """Skewed probability vector over 45 numbers"""
+    weights = np.linspace(1.0, 4.0, 45)
+    return weights / weights.sum()
+
+
+class FakeModel:
+    """predict_proba stub returning fixed per-number probabilities"""
+
+    def __init__(self, probabilities):
+        self.probabilities = probabilities
+        self.calls = 0
+
+    def predict_proba(self, features):
+        self.calls += 1
+        return [np.array([[1 - p, p]]) for p in self.probabilities]
+
+
+class TestCombinationSampler:
+    """Test vectorized weighted sampling"""
+
+    def test_rows_are_valid_combinations(self, probabilities):
+        """각 행이 1~45 범위의 정렬된 서로 다른 번호 6개인지 확인"""
+        samples = CombinationSampler(probabilities).sample(2000, np.random.default_rng(0))
+
+        assert samples.shape == (2000, 6)
+        assert samples.min() >= 1 and samples.max() <= 45
+        assert np.all(np.diff(samples, axis=1) > 0)
+
+    def test_matches_sequential_sampling(self, probabilities):
+        """번호별 포함 빈도가 np.random.choice(replace=False)와 통계적으로 일치하는지 확인"""
+        rng = np.random.default_rng(1)
+        draws = 20000
+
+        gumbel = CombinationSampler(probabilities).sample(draws, rng)
+        gumbel_freq = np.bincount(gumbel.ravel(), minlength=46)[1:] / draws
+
+        sequential = np.array([
+            rng.choice(45, size=6, replace=False, p=probabilities) for _ in range(draws)
+        ]) + 1
+        sequential_freq = np.bincount(sequential.ravel(), minlength=46)[1:] / draws
+
+        np.testing.assert_allclose(gumbel_freq, sequential_freq, atol=0.02)
+
+    def test_unique_combinations(self, probabilities):
+        """중복 없는 조합을 요청한 개수만큼 생성하는지 확인"""
+        combinations = generate_combinations(probabilities, count=500, rng=np.random.default_rng(2))
+
+        assert len(combinations) == 500
+        assert len({tuple(combo) for combo in combinations}) == 500
+
+    def test_rejects_degenerate_distribution(self):
+        """0이 아닌 확률이 6개 미만이면 ValueError"""
+        probabilities = np.zeros(45)
+        probabilities[:5] = 0.2
+
+        with pytest.raises(ValueError):
+            CombinationSampler(probabilities)
+
+
+class TestPredictionCache:
+    """Test per-(model, draw) prediction caching"""
+
+    def test_predict_once_per_key(self, probabilities):
+        """같은 (모델, 회차)에서는 predict_proba를 한 번만 호출하는지 확인"""
+        model = FakeModel(probabilities)
+        cache = PredictionCache()
+        features = np.zeros((1, 145))
+
+        first = cache.get(model, ('model_a', 1), features, (100, 1))
+        second = cache.get(model, ('model_a', 1), features, (100, 1))
+
+        assert first is second
+        assert model.calls == 1
+        np.testing.assert_allclose(first.probabilities, probabilities)
+
+        cache.get(model, ('model_a', 1), features, (101, 1))
+        assert model.calls == 2
@@ -0,0 +1,60 @@
+"""
+ML Model Registry Test Module
+
+Tests loading, version tracking and hot-swapping of model artifacts.
+"""
+
+import os
+
+import pytest
+
+from app.services.ml import model_utils
+from app.services.ml.model_registry import ModelRegistry
+
+
+@pytest.fixture
+def trained_dir(tmp_path, monkeypatch):
+    """Redirect model storage to a temporary directory"""
+    monkeypatch.setattr(model_utils, 'TRAINED_DIR', tmp_path / "trained")
+    monkeypatch.setattr(model_utils, 'METADATA_DIR', tmp_path / "metadata")
+    return tmp_path / "trained"
+
+
+class TestModelRegistry:
+    """Test process-wide model registry"""
+
+    def test_no_model(self, trained_dir):
+        """모델 파일이 없으면 FileNotFoundError (통계 모드 폴백 트리거)"""
+        registry = ModelRegistry()
+
+        assert registry.load_latest() is False
+        with pytest.raises(FileNotFoundError):
+            registry.get_model()
+
+    def test_load_once(self, trained_dir):
+        """같은 파일은 다시 적재하지 않는지 확인"""
+        model_utils.save_model({'weights': 1}, model_name="lotto_model_20250101")
+        registry = ModelRegistry()
+
+        assert registry.load_latest() is True
+        assert registry.load_latest() is False
+        assert registry.get_model() == {'weights': 1}
+        assert registry.version == "lotto_model_20250101"
+        assert registry.loaded_at is not None
+
+    def test_hot_swap_newer_artifact(self, trained_dir):
+        """새 모델 파일이 저장되면 교체되고 기존 참조는 유지되는지 확인"""
+        model_utils.save_model({'weights': 1}, model_name="lotto_model_20250101")
+        registry = ModelRegistry()
+        registry.load_latest()
+        in_flight = registry.get_model()
+
+        new_path = model_utils.save_model({'weights': 2}, model_name="lotto_model_20250108")
+        stat = os.stat(new_path)
+        os.utime(new_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        assert registry.load_latest() is True
+        assert registry.get_model() == {'weights': 2}
+        assert registry.version == "lotto_model_20250108"
+        assert in_flight == {'weights': 1}
+        assert not list(trained_dir.glob("*.tmp"))
@@ -0,0 +1,63 @@
+"""
+Model Trainer Test Module
+
+Tests both training modes (MultiOutputClassifier vs. a native multi-output
+forest) and that inference handles either artifact shape.
+@TEST:LOTTO-ML-MODEL-001
+"""
+
+import numpy as np
+import pytest
+
+from app.services.ml import data_preprocessor, model_trainer
+from app.services.ml.inference_engine import predict_probabilities
+from tests.conftest import make_sample_draws
+
+
+@pytest.fixture(scope="module")
+def split():
+    numbers = np.array([[getattr(d, col) for col in data_preprocessor.NUMBER_COLS] for d in make_sample_draws(80)])
+    features = data_preprocessor.extract_feature_matrix(numbers)[:-1]
+    labels = data_preprocessor.create_target_matrix(numbers)
+    # A number that never appears leaves a single class for that output
+    labels[:, 44] = 0
+    return data_preprocessor.split_training_arrays(features, labels)
+
+
+@pytest.mark.parametrize("mode", model_trainer.TRAINING_MODES)
+def test_modes_share_prediction_interface(split, mode):
+    X_train, X_test, y_train, y_test = split
+    model = model_trainer.train_model(X_train, y_train, n_estimators=5, mode=mode)
+
+    assert model_trainer.get_training_mode(model) == mode
+    assert model.predict(X_test).shape == y_test.shape
+
+    probabilities = predict_probabilities(model, X_test.to_numpy()[:1])
+    assert probabilities.shape == (45,)
+    assert probabilities.sum() == pytest.approx(1.0)
+    assert probabilities[44] == 0.0
+
+
+def test_native_mode_trains_single_forest(split):
+    X_train, _, y_train, _ = split
+    native = model_trainer.train_model(X_train, y_train, n_estimators=5, mode=model_trainer.TRAINING_MODE_NATIVE)
+    wrapped = model_trainer.train_model(X_train, y_train, n_estimators=5)
+
+    assert model_trainer.get_forest_params(native)["total_trees"] == 5
+    assert model_trainer.get_forest_params(wrapped)["total_trees"] == 5 * 45
+
+    with pytest.raises(ValueError):
+        model_trainer.train_model(X_train, y_train, mode="gradient_boosting")
+
+
+def test_benchmark_reports_each_mode(split):
+    X_train, X_test, y_train, y_test = split
+    results = model_trainer.benchmark_training_modes(
+        X_train, y_train, X_test, y_test, n_estimators=3, predict_repeats=2
+    )
+
+    assert set(results) == set(model_trainer.TRAINING_MODES)
+    for result in results.values():
+        assert result["artifact_bytes"] > 0
+        assert result["predict_ms"] >= 0
+        assert {"train_seconds", "load_seconds", "hamming_loss"} <= set(result)
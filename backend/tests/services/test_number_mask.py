@@ -0,0 +1,69 @@
+"""
+Number Mask Test Module
+
+Tests the bitmask number-set type and mask-based winning grade calculation.
+"""
+
+import random
+
+import numpy as np
+
+from app.services.combination_sampler import combination_masks
+from app.services.number_mask import NumberMask, winning_grade
+
+
+def _reference_grade(numbers, winning, bonus):
+    """기존 set 기반 등수 판정"""
+    matches = len(set(numbers) & set(winning))
+    bonus_match = bonus in numbers
+    if matches == 6:
+        return matches, bonus_match, 1
+    if matches == 5 and bonus_match:
+        return matches, bonus_match, 2
+    if matches == 5:
+        return matches, bonus_match, 3
+    if matches == 4:
+        return matches, bonus_match, 4
+    if matches == 3:
+        return matches, bonus_match, 5
+    return matches, bonus_match, 0
+
+
+class TestNumberMask:
+    """Test bitmask set semantics"""
+
+    def test_roundtrip_and_set_ops(self):
+        """번호 목록 변환, 집합 연산, 해시가 set과 동일하게 동작하는지 확인"""
+        a = NumberMask.from_numbers([45, 1, 7, 20, 33, 12])
+        b = NumberMask.from_numbers([7, 8, 9, 12, 40, 45])
+
+        assert a.to_list() == [1, 7, 12, 20, 33, 45]
+        assert len(a) == 6
+        assert 45 in a and 2 not in a
+        assert (a & b).to_list() == [7, 12, 45]
+        assert (a - b).to_list() == [1, 20, 33]
+        assert a.match_count(b) == 3
+        assert a.issuperset(NumberMask.from_numbers([1, 45]))
+        assert not a.intersects(NumberMask.from_numbers([2, 3]))
+        assert len({a, NumberMask.from_numbers([1, 7, 12, 20, 33, 45])}) == 1
+
+    def test_matches_vectorized_masks(self):
+        """배치 마스크(combination_masks)와 같은 비트 배치인지 확인"""
+        candidates = np.array([[1, 2, 3, 4, 5, 6], [10, 20, 30, 40, 44, 45]])
+
+        for row, bits in zip(candidates.tolist(), combination_masks(candidates).tolist()):
+            assert NumberMask(bits) == NumberMask.from_numbers(row)
+
+    def test_winning_grade_matches_reference(self):
+        """popcount 등수 판정이 set 기반 판정과 일치하는지 확인"""
+        rng = random.Random(3)
+        for _ in range(5000):
+            drawn = rng.sample(range(1, 46), 7)
+            winning, bonus = drawn[:6], drawn[6]
+            # 당첨번호와 많이 겹치도록 섞어서 상위 등수도 검증
+            pool = winning + [bonus] + rng.sample(range(1, 46), 6)
+            ticket = rng.sample(sorted(set(pool)), 6)
+
+            assert winning_grade(
+                NumberMask.from_numbers(ticket), NumberMask.from_numbers(winning), bonus
+            ) == _reference_grade(ticket, winning, bonus)
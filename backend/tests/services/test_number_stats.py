@@ -0,0 +1,74 @@
+"""
+Number Stats Test Module
+
+Tests the incrementally maintained number_stats aggregate table.
+"""
+
+import pytest
+
+from app.models.lotto import LottoDraw
+from app.models.number_stat import NumberStat
+from app.services.draw_snapshot import draw_history
+from app.services.lotto_analyzer import LottoAnalyzer
+from app.services.number_stats import apply_draw, load_frequency_statistics, rebuild_number_stats
+from tests.conftest import SAMPLE_DRAW_COUNT, make_sample_draws
+
+
+@pytest.fixture(autouse=True)
+def reset_snapshot():
+    """각 테스트마다 전역 스냅샷 초기화"""
+    draw_history.invalidate()
+    yield
+    draw_history.invalidate()
+
+
+def _stat_rows(db_session):
+    return [
+        (s.number, s.appearances, s.bonus_appearances, s.last_appearance, s.gap_since_last)
+        for s in db_session.query(NumberStat).order_by(NumberStat.number).all()
+    ]
+
+
+class TestNumberStats:
+    """Test number_stats maintenance"""
+
+    def test_rebuild_matches_snapshot_statistics(self, db_session):
+        """재구축한 통계가 스냅샷 계산 결과와 동일한지 확인"""
+        expected = LottoAnalyzer(db_session).calculate_frequency_statistics()
+
+        rebuild_number_stats(db_session)
+
+        assert load_frequency_statistics(db_session, SAMPLE_DRAW_COUNT, SAMPLE_DRAW_COUNT) == expected
+
+    def test_incremental_update_matches_rebuild(self, db_session):
+        """증분 갱신 결과가 전체 재구축 결과와 동일한지 확인"""
+        rebuild_number_stats(db_session)
+
+        new_draw = make_sample_draws(SAMPLE_DRAW_COUNT + 1)[-1]
+        db_session.add(new_draw)
+        db_session.flush()
+        apply_draw(db_session, new_draw.draw_number, new_draw.numbers, new_draw.bonus_number)
+        db_session.commit()
+        incremental = _stat_rows(db_session)
+
+        rebuild_number_stats(db_session)
+
+        assert incremental == _stat_rows(db_session)
+
+    def test_analyzer_reads_aggregate_table(self, db_session):
+        """동기화된 테이블이 있으면 분석기가 45행 집계를 사용하는지 확인"""
+        rebuild_number_stats(db_session)
+        db_session.query(NumberStat).filter(NumberStat.number == 1).update({'gap_since_last': 999})
+        db_session.commit()
+
+        stats = LottoAnalyzer(db_session).calculate_frequency_statistics()
+
+        assert stats[1]['gap_since_last'] == 999
+
+    def test_stale_table_falls_back(self, db_session):
+        """회차 삭제 등으로 동기화가 깨지면 None 반환 (스냅샷 계산으로 폴백)"""
+        rebuild_number_stats(db_session)
+        db_session.query(LottoDraw).filter(LottoDraw.draw_number == SAMPLE_DRAW_COUNT).delete()
+        db_session.commit()
+
+        assert load_frequency_statistics(db_session, SAMPLE_DRAW_COUNT - 1, SAMPLE_DRAW_COUNT - 1) is None
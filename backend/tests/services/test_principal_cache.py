@@ -0,0 +1,104 @@
+"""
+Principal Cache Test Module
+
+Covers TTL/LRU behaviour, merge into the request session, and invalidation
+on committed User changes (including delivery to other subscribed caches).
+"""
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base
+from app.models.user import LoginMethod, User, UserRole
+from app.services.invalidation_bus import LocalInvalidationBus
+from app.services.principal_cache import PrincipalCache, principal_cache
+from app.utils.auth import create_access_token, get_user_from_token
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine, tables=[User.__table__])
+    factory = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+    with factory() as session:
+        session.add(User(user_id="user_cache_test", email="cache@test.kr", login_method=LoginMethod.EMAIL))
+        session.commit()
+    principal_cache.clear()
+    yield factory
+    principal_cache.clear()
+    engine.dispose()
+
+
+def count_user_selects(engine):
+    statements = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT") and "FROM users" in statement:
+            statements.append(statement)
+
+    return statements
+
+
+def test_repeat_requests_skip_users_query(session_factory):
+    token = create_access_token({"sub": "user_cache_test"})
+    with session_factory() as db:
+        first = get_user_from_token(db, token)
+        assert first.last_login_at is not None
+
+    with session_factory() as db:
+        selects = count_user_selects(db.get_bind())
+        user = get_user_from_token(db, token)
+        assert user.email == "cache@test.kr"
+        assert user in db
+        assert selects == []
+
+
+def test_committed_role_change_invalidates(session_factory):
+    token = create_access_token({"sub": "user_cache_test"})
+    other_worker = PrincipalCache(ttl_seconds=60)
+    try:
+        with session_factory() as db:
+            user = get_user_from_token(db, token)
+            other_worker.put("user_cache_test", user)
+
+        with session_factory() as db:
+            user = get_user_from_token(db, token)
+            user.role = UserRole.ADMIN
+            db.commit()
+
+        assert principal_cache.status()["entries"] == 0
+        assert other_worker.status()["entries"] == 0
+
+        with session_factory() as db:
+            assert get_user_from_token(db, token).role == UserRole.ADMIN
+    finally:
+        other_worker.close()
+
+
+def test_rolled_back_change_keeps_entry(session_factory):
+    token = create_access_token({"sub": "user_cache_test"})
+    with session_factory() as db:
+        user = get_user_from_token(db, token)
+        user.is_active = False
+        db.flush()
+        db.rollback()
+
+    assert principal_cache.status()["entries"] == 1
+
+
+def test_ttl_and_size_bound(session_factory):
+    now = [0.0]
+    cache = PrincipalCache(ttl_seconds=10, max_entries=1, bus=LocalInvalidationBus(), clock=lambda: now[0])
+    with session_factory() as db:
+        user = db.query(User).first()
+        cache.put("a", user)
+        assert cache.get(db, "a") is user
+
+        cache.put("b", user)
+        assert cache.get(db, "a") is None
+
+        now[0] = 11.0
+        assert cache.get(db, "b") is None
+        assert cache.status()["entries"] == 0
@@ -0,0 +1,114 @@
+"""
+Public Recommendation Writer Test Module
+
+Tests write-behind batching, draw resolution per batch and durability modes.
+"""
+
+import time
+
+import pytest
+from sqlalchemy import create_engine, func
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.database import Base
+from app.models.lotto import LottoDraw
+from app.models.public_recommendation import PublicRecommendation
+from app.services.public_recommendation_writer import PublicRecommendationWriter, make_entry
+from tests.conftest import SAMPLE_DRAW_COUNT, make_sample_draws
+
+
+@pytest.fixture
+def session_factory():
+    """플러시 스레드와 공유하는 in-memory SQLite 세션 팩토리"""
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    Base.metadata.create_all(bind=engine, tables=[LottoDraw.__table__, PublicRecommendation.__table__])
+    factory = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+    with factory() as session:
+        session.add_all(make_sample_draws())
+        session.commit()
+    yield factory
+    engine.dispose()
+
+
+def _count(factory):
+    with factory() as session:
+        return session.query(func.count(PublicRecommendation.id)).scalar()
+
+
+def _entries(count):
+    return [make_entry([6, 5, 4, 3, 2, 1], "ai", 42.7, "member") for _ in range(count)]
+
+
+def test_make_entry_normalizes_values():
+    assert make_entry([9, 3, 1, 40, 22, 15], "manual") == ([1, 3, 9, 15, 22, 40], "manual", None, "guest")
+    assert make_entry([1, 2, 3, 4, 5, 6], "ai", 61.9, "member")[2] == 61
+
+
+def test_async_mode_queues_until_flush(session_factory):
+    writer = PublicRecommendationWriter(batch_size=1000, flush_interval_ms=60000, session_factory=session_factory)
+    writer.start()
+    try:
+        with session_factory() as db:
+            assert writer.record(db, _entries(30)) == 30
+        assert _count(session_factory) == 0
+        assert writer.status()["pending"] == 30
+    finally:
+        assert writer.stop() == 30
+
+    assert _count(session_factory) == 30
+    with session_factory() as db:
+        draws = {row[0] for row in db.query(PublicRecommendation.draw_number).all()}
+    assert draws == {SAMPLE_DRAW_COUNT + 1}
+    assert writer.status()["written"] == 30
+
+
+def test_batch_size_triggers_background_flush(session_factory):
+    writer = PublicRecommendationWriter(batch_size=10, flush_interval_ms=60000, session_factory=session_factory)
+    writer.start()
+    try:
+        with session_factory() as db:
+            writer.record(db, _entries(12))
+        deadline = time.monotonic() + 5
+        while _count(session_factory) < 12 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert _count(session_factory) == 12
+    finally:
+        writer.stop()
+
+
+def test_sync_mode_writes_in_request_transaction(session_factory):
+    writer = PublicRecommendationWriter(durability="sync", session_factory=session_factory)
+    writer.start()
+    assert not writer.is_running
+
+    with session_factory() as db:
+        writer.record(db, _entries(5))
+        db.rollback()
+    assert _count(session_factory) == 0
+
+    with session_factory() as db:
+        writer.record(db, _entries(5))
+        db.commit()
+    assert _count(session_factory) == 5
+
+
+def test_failed_flush_keeps_rows_queued(session_factory):
+    writer = PublicRecommendationWriter(session_factory=session_factory)
+    writer._pending.extend(_entries(3))
+    with session_factory() as db:
+        db.query(LottoDraw).delete()
+        db.commit()
+
+    assert writer.flush() == 0
+    assert writer.status()["pending"] == 3
+    assert writer.status()["failed_flushes"] == 1
+
+
+def test_rejects_unknown_durability_mode():
+    with pytest.raises(ValueError):
+        PublicRecommendationWriter(durability="eventually")
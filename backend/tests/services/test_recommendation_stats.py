@@ -0,0 +1,114 @@
+"""
+Recommendation Stats Test Module
+
+Tests single-pass conditional aggregation and closed-draw rollups.
+"""
+
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.api.admin import clear_test_data
+from app.models.public_recommendation import PublicRecommendation
+from app.models.recommendation_draw_stat import RecommendationDrawStat
+from app.services.recommendation_stats import (
+    aggregate_public,
+    get_public_statistics,
+    refresh_draw_rollup,
+    refresh_draw_rollups,
+)
+from tests.conftest import SAMPLE_DRAW_COUNT
+
+
+def _add_public(db_session, count, seed=11):
+    """회차/생성 방법/사용자 타입이 섞인 공공 추천 데이터 추가"""
+    rng = random.Random(seed)
+    now = datetime.now()
+    rows = []
+    for _ in range(count):
+        rows.append(PublicRecommendation(
+            numbers=sorted(rng.sample(range(1, 46), 6)),
+            generation_method=rng.choice(["ai", "manual"]),
+            user_type=rng.choice(["member", "guest"]),
+            draw_number=rng.randint(SAMPLE_DRAW_COUNT - 5, SAMPLE_DRAW_COUNT + 1),
+            created_at=now - timedelta(days=rng.randint(0, 20))
+        ))
+    db_session.add_all(rows)
+    db_session.commit()
+    return rows
+
+
+def _expected(rows, since=None):
+    return {
+        'total': len(rows),
+        'ai': sum(1 for r in rows if r.generation_method == "ai"),
+        'manual': sum(1 for r in rows if r.generation_method == "manual"),
+        'member': sum(1 for r in rows if r.user_type == "member"),
+        'guest': sum(1 for r in rows if r.user_type == "guest"),
+        **({'recent': sum(1 for r in rows if r.created_at >= since)} if since else {})
+    }
+
+
+class TestRecommendationStats:
+    """Test statistics service"""
+
+    def test_draw_statistics_single_pass(self, db_session):
+        """회차 지정 통계가 행별 집계와 일치하는지 확인"""
+        rows = _add_public(db_session, 300)
+        since = datetime.now() - timedelta(days=7)
+        draw_rows = [r for r in rows if r.draw_number == SAMPLE_DRAW_COUNT - 2]
+
+        assert get_public_statistics(db_session, SAMPLE_DRAW_COUNT - 2, since) == _expected(draw_rows, since)
+
+    def test_total_statistics_use_rollups(self, db_session):
+        """전체 통계가 마감 회차 롤업 + 진행 회차 집계로 정확히 계산되는지 확인"""
+        rows = _add_public(db_session, 300)
+        since = datetime.now() - timedelta(days=7)
+
+        # 최신 추첨 회차 이전까지 연속으로 롤업됨
+        assert refresh_draw_rollups(db_session) == SAMPLE_DRAW_COUNT - 1
+        assert db_session.query(RecommendationDrawStat).count() == SAMPLE_DRAW_COUNT - 1
+
+        assert get_public_statistics(db_session, since=since) == _expected(rows, since)
+
+    def test_total_statistics_are_read_only(self, db_session):
+        """롤업이 없거나 일부만 있어도 조회는 쓰기 없이 정확한 합계를 반환하는지 확인"""
+        rows = _add_public(db_session, 300)
+
+        assert get_public_statistics(db_session) == _expected(rows)
+        assert db_session.query(RecommendationDrawStat).count() == 0
+
+        refresh_draw_rollups(db_session, SAMPLE_DRAW_COUNT - 4)
+        assert get_public_statistics(db_session) == _expected(rows)
+        assert db_session.query(RecommendationDrawStat).count() == SAMPLE_DRAW_COUNT - 4
+        assert not db_session.new and not db_session.dirty
+
+    def test_rollup_refresh_after_late_write(self, db_session):
+        """롤업된 회차에 데이터가 추가되면 재집계되는지 확인"""
+        rows = _add_public(db_session, 200)
+        refresh_draw_rollups(db_session)
+
+        late = PublicRecommendation(
+            numbers=[1, 2, 3, 4, 5, 6], generation_method="ai", user_type="guest",
+            draw_number=SAMPLE_DRAW_COUNT - 3
+        )
+        db_session.add(late)
+        db_session.commit()
+        refresh_draw_rollup(db_session, SAMPLE_DRAW_COUNT - 3)
+
+        assert get_public_statistics(db_session) == _expected(rows + [late])
+        assert aggregate_public(db_session, draw_number=SAMPLE_DRAW_COUNT - 3)['total'] == \
+            sum(1 for r in rows + [late] if r.draw_number == SAMPLE_DRAW_COUNT - 3)
+
+    @pytest.mark.asyncio
+    async def test_clear_test_data_drops_rollups_of_deleted_draws(self, db_session):
+        """테스트 데이터 정리 시 삭제된 회차 이후의 롤업도 함께 제거되는지 확인"""
+        _add_public(db_session, 200)
+        refresh_draw_rollups(db_session)
+
+        await clear_test_data(db=db_session)
+
+        remaining = [row.draw_number for row in db_session.query(RecommendationDrawStat)]
+        assert remaining
+        assert max(remaining) < SAMPLE_DRAW_COUNT - 9
@@ -0,0 +1,71 @@
+"""
+Batch Winning Comparator Test Module
+
+Tests vectorized grade calculation against the per-row compare_numbers.
+"""
+
+import random
+
+import numpy as np
+
+from app.api.winning_comparison import compare_numbers
+from app.services.winning_comparator import compare_batch, numbers_to_array
+
+
+WINNING_NUMBERS = [3, 11, 19, 27, 35, 43]
+BONUS_NUMBER = 8
+
+
+def _tickets(count, seed=5):
+    """당첨번호와 자주 겹치는 추천 번호 목록"""
+    rng = random.Random(seed)
+    pool = WINNING_NUMBERS + [BONUS_NUMBER]
+    tickets = []
+    for _ in range(count):
+        hits = rng.sample(pool, rng.randint(0, 6))
+        rest = rng.sample([n for n in range(1, 46) if n not in hits], 6 - len(hits))
+        tickets.append(sorted(hits + rest))
+    return tickets
+
+
+class TestCompareBatch:
+    """Test vectorized winning comparison"""
+
+    def test_matches_per_row_comparison(self):
+        """행별 결과가 compare_numbers와 일치하는지 확인"""
+        tickets = _tickets(3000)
+        comparison = compare_batch(range(len(tickets)), numbers_to_array(tickets), WINNING_NUMBERS, BONUS_NUMBER)
+
+        for index, ticket in enumerate(tickets):
+            assert comparison.result_for(index) == compare_numbers(ticket, WINNING_NUMBERS, BONUS_NUMBER)
+
+    def test_summary_histogram(self):
+        """등수 집계가 행별 결과 집계와 일치하는지 확인"""
+        tickets = _tickets(2000, seed=6)
+        comparison = compare_batch(range(len(tickets)), numbers_to_array(tickets), WINNING_NUMBERS, BONUS_NUMBER)
+        expected = [compare_numbers(ticket, WINNING_NUMBERS, BONUS_NUMBER)["grade"] for ticket in tickets]
+
+        summary = comparison.summary()
+
+        assert summary["total_recommendations"] == 2000
+        assert summary["total_winners"] == sum(1 for grade in expected if grade > 0)
+        for grade in range(1, 6):
+            assert summary["grade_stats"][f"grade_{grade}"] == expected.count(grade)
+
+    def test_stored_results_override(self):
+        """저장된 당첨 정보(더미 데이터)가 계산값보다 우선하는지 확인"""
+        tickets = [[1, 2, 4, 5, 6, 7], WINNING_NUMBERS]
+        comparison = compare_batch(
+            [10, 11], numbers_to_array(tickets), WINNING_NUMBERS, BONUS_NUMBER,
+            stored_matches=np.array([4, 0]), stored_grades=np.array([4, -1])
+        )
+
+        assert comparison.result_for(0) == {"matches": 4, "bonus_match": False, "grade": 4, "is_winner": True}
+        assert comparison.result_for(1)["grade"] == 1
+
+    def test_invalid_rows_never_match(self):
+        """번호가 6개가 아닌 행은 낙첨 처리"""
+        comparison = compare_batch([1], numbers_to_array([[3, 11, 19]]), WINNING_NUMBERS, BONUS_NUMBER)
+
+        assert comparison.result_for(0)["grade"] == 0
+        assert comparison.page(0, 10) == [0]
@@ -4,55 +4,81 @@ Trains a new model using the latest lottery data
 """
 import sys
 import time
+import argparse
 from pathlib import Path
 
 # Add app directory to path
 sys.path.append(str(Path(__file__).parent))
 
+from app.config import settings
 from app.database import get_db
 from app.services.ml import data_preprocessor
 from app.services.ml import model_trainer
 from app.services.ml import model_utils
+from app.services.ml.feature_store import feature_store
 
 
 def main():
     """Train ML model with latest data"""
+    parser = argparse.ArgumentParser(description="Train ML model")
+    parser.add_argument(
+        "--mode",
+        choices=model_trainer.TRAINING_MODES,
+        default=settings.ml_training_mode,
+        help="Training mode (default: ML_TRAINING_MODE setting)"
+    )
+    parser.add_argument(
+        "--benchmark",
+        action="store_true",
+        help="Compare all training modes (train time, artifact size, load time, predict latency) before training"
+    )
+    args = parser.parse_args()
+
     start_time = time.time()
 
     print("="*60)
     print("ML Model Training Pipeline")
     print("="*60)
 
-    # Step 1: Load data
-    print("\n[1/6] Loading draw data from database...")
+    # Step 1: Sync feature store
+    print("\n[1/6] Syncing feature store with the database...")
     db = next(get_db())
-    draw_data = data_preprocessor.load_draw_data(db)
-    print(f"✓ Loaded {len(draw_data)} draws")
+    features, labels = feature_store.sync(db)
+    manifest = feature_store.load_manifest()
+    print(f"✓ Feature store: {manifest['rows']} draws (#{manifest['first_draw']}-#{manifest['last_draw']})")
 
-    # Step 2: Extract features
-    print("\n[2/6] Extracting features...")
-    features_df = data_preprocessor.extract_features(draw_data)
-    print(f"✓ Extracted {len(features_df.columns)} features")
+    # Step 2: Read features
+    print("\n[2/6] Reading stored features...")
+    print(f"✓ {features.shape[1]} features x {features.shape[0]} draws (schema v{manifest['schema_version']})")
 
     # Step 3: Prepare train/test split
     print("\n[3/6] Preparing train/test split...")
-    X_train, X_test, y_train, y_test = data_preprocessor.prepare_train_test_split(
-        features_df,
-        draw_data  # Pass original draw data for target label creation
-    )
+    X_train, X_test, y_train, y_test = data_preprocessor.split_training_arrays(features, labels)
     print(f"✓ Training samples: {len(X_train)}, Test samples: {len(X_test)}")
     print(f"✓ Multi-label targets: {y_train.shape[1]} labels per sample")
 
+    if args.benchmark:
+        print("\n[benchmark] Comparing training modes...")
+        results = model_trainer.benchmark_training_modes(X_train, y_train, X_test, y_test)
+        print(f"  {'mode':<20}{'trees':>7}{'train s':>10}{'size MB':>10}{'load s':>9}{'predict ms':>12}{'hamming':>9}")
+        for mode, result in results.items():
+            print(
+                f"  {mode:<20}{result['total_trees']:>7}{result['train_seconds']:>10.2f}"
+                f"{result['artifact_bytes'] / 1024 / 1024:>10.1f}{result['load_seconds']:>9.2f}"
+                f"{result['predict_ms']:>12.2f}{result['hamming_loss']:>9.4f}"
+            )
+
     # Step 4: Train model
-    print("\n[4/6] Training MultiOutputClassifier with Random Forest...")
+    print(f"\n[4/6] Training Random Forest ({args.mode})...")
     model = model_trainer.train_model(
         X_train,
         y_train,
         n_estimators=100,
-        random_state=42
+        random_state=42,
+        mode=args.mode
     )
-    n_trees = model.estimators_[0].n_estimators if model.estimators_ else 100
-    print(f"✓ Model trained with {n_trees} trees per classifier")
+    forest = model_trainer.get_forest_params(model)
+    print(f"✓ Model trained with {forest['n_forests']} forest(s), {forest['total_trees']} trees total")
 
     # Step 5: Evaluate model
     print("\n[5/6] Evaluating model...")
@@ -6,79 +6,86 @@ Tests for integrating ML prediction with existing recommendation_engine
 """
 
 import pytest
+import numpy as np
 from unittest.mock import Mock, MagicMock, patch
 from sqlalchemy.orm import Session
 from collections import namedtuple
 from backend.app.services.recommendation_engine import RecommendationEngine, Combination
+from backend.app.services.draw_snapshot import draw_history
+from backend.app.services.ml.feature_cache import inference_features
+from backend.app.services.ml.model_registry import LoadedModel
+from backend.app.services.ml.prediction_cache import prediction_cache
 from backend.app.schemas.recommendation import PreferenceSettings
 
 
-# Row-like objects for database query results
-FrequencyRow = namedtuple('FrequencyRow', ['number', 'total_appearances', 'frequency_percent', 'last_appearance', 'gap'])
-RecentTrendRow = namedtuple('RecentTrendRow', ['number_1', 'number_2', 'number_3', 'number_4', 'number_5', 'number_6'])
+# Row-like objects for the draw history snapshot query
+DrawRow = namedtuple('DrawRow', ['draw_number', 'number_1', 'number_2', 'number_3', 'number_4', 'number_5', 'number_6', 'bonus_number'])
+
+REGISTRY_PATH = 'backend.app.services.recommendation_engine.model_registry'
+
+
+def make_draw_rows(count=120):
+    """Deterministic draw history (draw_number, six sorted numbers, bonus)"""
+    rng = np.random.default_rng(1150)
+    rows = []
+    for draw_number in range(1, count + 1):
+        picked = rng.choice(np.arange(1, 46), size=7, replace=False)
+        rows.append(DrawRow(draw_number, *sorted(int(n) for n in picked[:6]), int(picked[6])))
+    return rows
+
+
+def registry_with(model, path='/fake/path/model.pkl'):
+    """model_registry stand-in serving `model` as the active artifact"""
+    registry = Mock()
+    registry.get_active = Mock(return_value=LoadedModel(model, path, 1))
+    return registry
 
 
 class TestMLIntegration:
     """Test ML integration with RecommendationEngine"""
 
+    @pytest.fixture(autouse=True)
+    def reset_draw_caches(self):
+        """Each test loads the draw snapshot from its own mock session"""
+        draw_history.invalidate()
+        inference_features.invalidate()
+        prediction_cache.invalidate()
+        yield
+        draw_history.invalidate()
+        inference_features.invalidate()
+        prediction_cache.invalidate()
+
     @pytest.fixture
     def mock_db_session(self):
-        """Mock database session with proper query result handling"""
+        """Mock database session serving the draw history snapshot"""
         mock_session = Mock(spec=Session)
-        
-        # Mock execute() to return different results based on query type
-        def mock_execute(query):
+        draw_rows = make_draw_rows()
+
+        # execute() only serves the DrawHistoryStore load query
+        def mock_execute(query, *args, **kwargs):
             mock_result = Mock()
-            query_str = str(query)
-            
-            if 'number_frequency' in query_str or 'total_appearances' in query_str:
-                # Frequency statistics query - return data for all 45 numbers
-                frequency_data = [
-                    FrequencyRow(
-                        number=num,
-                        total_appearances=150 + num,
-                        frequency_percent=13.5 + (num * 0.1),
-                        last_appearance=1100 - num,
-                        gap=50 + num
-                    )
-                    for num in range(1, 46)
-                ]
-                mock_result.fetchall = Mock(return_value=frequency_data)
-            else:
-                # Recent trends query (last 20 draws)
-                recent_data = [
-                    RecentTrendRow(1, 7, 12, 23, 34, 45),
-                    RecentTrendRow(3, 9, 15, 22, 28, 42),
-                    RecentTrendRow(2, 8, 18, 27, 33, 40),
-                    RecentTrendRow(5, 14, 21, 29, 36, 43),
-                    RecentTrendRow(11, 20, 30, 31, 38, 44),
-                ] * 4  # 20 rows total
-                mock_result.fetchall = Mock(return_value=recent_data[:20])
-            
+            mock_result.fetchall = Mock(return_value=draw_rows)
             return mock_result
-        
+
         mock_session.execute = Mock(side_effect=mock_execute)
-        
-        # Mock query() for count and order_by operations
+
+        # number_stats table is empty, so statistics are computed from the snapshot
         mock_query = Mock()
-        mock_query.count = Mock(return_value=1100)
         mock_query.order_by = Mock(return_value=mock_query)
-        mock_draw = Mock(draw_number=1150)
-        mock_query.first = Mock(return_value=mock_draw)
+        mock_query.all = Mock(return_value=[])
         mock_session.query = Mock(return_value=mock_query)
-        
+
         return mock_session
 
     @pytest.fixture
     def mock_ml_model(self):
-        """Mock ML model"""
-        import numpy as np
-        model = Mock()
+        """Mock ML model (MultiOutputClassifier-style predict_proba)"""
         # Return high probabilities for numbers 1-20
         probs = np.zeros(45)
-        probs[:20] = 0.04  # 80% total
-        probs[20:] = 0.008  # 20% total
-        model.predict_proba = Mock(return_value=probs / probs.sum())
+        probs[:20] = 0.4
+        probs[20:] = 0.08
+        model = Mock()
+        model.predict_proba = Mock(return_value=[np.array([[1 - p, p]]) for p in probs])
         return model
 
     def test_recommendation_engine_has_use_ml_model_param(self, mock_db_session):
@@ -107,76 +114,66 @@ class TestMLIntegration:
         # Initially None (lazy loading)
         assert engine.ml_engine is None
 
-    @patch('backend.app.services.recommendation_engine.get_latest_model_path')
-    @patch('backend.app.services.recommendation_engine.os.path.exists')
-    @patch('backend.app.services.recommendation_engine.load_model')
     def test_ml_mode_loads_model_on_first_use(
         self,
-        mock_load_model,
-        mock_exists,
-        mock_get_model_path,
         mock_db_session,
         mock_ml_model
     ):
         """ML mode should load model on first use (lazy loading)"""
         # @TEST:LOTTO-ML-INTEGRATE-001
-        mock_get_model_path.return_value = '/fake/path/model.pkl'
-        mock_exists.return_value = True
-        mock_load_model.return_value = mock_ml_model
+        registry = registry_with(mock_ml_model)
 
-        engine = RecommendationEngine(mock_db_session, use_ml_model=True)
+        with patch(REGISTRY_PATH, registry):
+            engine = RecommendationEngine(mock_db_session, use_ml_model=True)
 
-        # Model not loaded yet
-        assert engine.ml_engine is None
+            # Model not loaded yet
+            assert engine.ml_engine is None
+            registry.get_active.assert_not_called()
 
-        # Generate combinations (triggers model loading)
-        combinations = engine.generate_combinations(count=5)
+            # Generate combinations (triggers model loading)
+            combinations = engine.generate_combinations(count=5)
 
         # Model should now be loaded
-        assert engine.ml_engine is not None
-        mock_load_model.assert_called_once()
+        assert engine.ml_engine is mock_ml_model
+        registry.get_active.assert_called_once()
+        mock_ml_model.predict_proba.assert_called_once()
 
-    @patch('backend.app.services.recommendation_engine.get_latest_model_path')
-    @patch('backend.app.services.recommendation_engine.os.path.exists')
+    @patch(REGISTRY_PATH)
     def test_ml_mode_falls_back_when_model_not_found(
         self,
-        mock_exists,
-        mock_get_model_path,
+        mock_registry,
         mock_db_session
     ):
         """Should fall back to statistical mode when model file not found (AC-005)"""
         # @TEST:LOTTO-ML-INTEGRATE-001
-        mock_get_model_path.return_value = None
-        mock_exists.return_value = False
+        mock_registry.get_active.side_effect = FileNotFoundError("ML model not found")
 
         engine = RecommendationEngine(mock_db_session, use_ml_model=True)
 
         # Generate combinations
         combinations = engine.generate_combinations(count=5)
 
+        mock_registry.get_active.assert_called_once()
+
         # Should fall back to statistical mode
         assert len(combinations) == 5
         assert all(len(combo.numbers) == 6 for combo in combinations)
 
-    @patch('backend.app.services.recommendation_engine.get_latest_model_path')
-    @patch('backend.app.services.recommendation_engine.os.path.exists')
-    @patch('backend.app.services.recommendation_engine.load_model')
     def test_ml_mode_generates_combinations_using_ml(
         self,
-        mock_load_model,
-        mock_exists,
-        mock_get_model_path,
         mock_db_session,
         mock_ml_model
     ):
         """ML mode should use ML inference for combination generation"""
         # @TEST:LOTTO-ML-INTEGRATE-001
-        mock_get_model_path.return_value = '/fake/path/model.pkl'
-        mock_exists.return_value = True
-        mock_load_model.return_value = mock_ml_model
+        with patch(REGISTRY_PATH, registry_with(mock_ml_model)):
+            engine = RecommendationEngine(mock_db_session, use_ml_model=True)
+            with patch.object(engine, 'fallback_to_statistics') as mock_fallback:
+                combinations = engine.generate_combinations(count=5)
 
-        engine = RecommendationEngine(mock_db_session, use_ml_model=True)
-        combinations = engine.generate_combinations(count=5)
+        # ML path must not fall back
+        mock_fallback.assert_not_called()
+        mock_ml_model.predict_proba.assert_called_once()
 
         # Should return 5 combinations
         assert len(combinations) == 5
@@ -216,31 +213,21 @@ class TestMLIntegration:
             # Should return 5 combinations
             assert len(combinations) == 5
 
-    @patch('backend.app.services.recommendation_engine.get_latest_model_path')
-    @patch('backend.app.services.recommendation_engine.os.path.exists')
-    @patch('backend.app.services.recommendation_engine.load_model')
     def test_ml_mode_respects_user_preferences(
         self,
-        mock_load_model,
-        mock_exists,
-        mock_get_model_path,
         mock_db_session,
         mock_ml_model
     ):
         """ML mode should respect user include/exclude preferences"""
         # @TEST:LOTTO-ML-INTEGRATE-001
-        mock_get_model_path.return_value = '/fake/path/model.pkl'
-        mock_exists.return_value = True
-        mock_load_model.return_value = mock_ml_model
-
-        engine = RecommendationEngine(mock_db_session, use_ml_model=True)
-
         preferences = PreferenceSettings(
             include_numbers=[7, 23],
             exclude_numbers=[1, 2, 3]
         )
 
-        combinations = engine.generate_combinations(count=5, preferences=preferences)
+        with patch(REGISTRY_PATH, registry_with(mock_ml_model)):
+            engine = RecommendationEngine(mock_db_session, use_ml_model=True)
+            combinations = engine.generate_combinations(count=5, preferences=preferences)
 
         # All combinations should contain at least one of [7, 23]
         for combo in combinations:
@@ -252,30 +239,23 @@ class TestMLIntegration:
             has_excluded = any(num in combo.numbers for num in [1, 2, 3])
             assert not has_excluded
 
-    @patch('backend.app.services.recommendation_engine.get_latest_model_path')
-    @patch('backend.app.services.recommendation_engine.os.path.exists')
-    @patch('backend.app.services.recommendation_engine.load_model')
     def test_ml_mode_handles_model_inference_error(
         self,
-        mock_load_model,
-        mock_exists,
-        mock_get_model_path,
         mock_db_session
     ):
         """Should fall back to statistical mode when ML inference fails (AC-005)"""
         # @TEST:LOTTO-ML-INTEGRATE-001
-        mock_get_model_path.return_value = '/fake/path/model.pkl'
-        mock_exists.return_value = True
-
         # Mock model that raises error on predict_proba
         error_model = Mock()
         error_model.predict_proba = Mock(side_effect=Exception("Model inference failed"))
-        mock_load_model.return_value = error_model
 
-        engine = RecommendationEngine(mock_db_session, use_ml_model=True)
+        with patch(REGISTRY_PATH, registry_with(error_model)):
+            engine = RecommendationEngine(mock_db_session, use_ml_model=True)
 
-        # Should not raise exception (should fall back)
-        combinations = engine.generate_combinations(count=5)
+            # Should not raise exception (should fall back)
+            combinations = engine.generate_combinations(count=5)
+
+        error_model.predict_proba.assert_called_once()
 
         # Should still return valid combinations (via fallback)
         assert len(combinations) == 5
@@ -315,11 +295,10 @@ class TestMLIntegration:
         assert len(combinations) == 3
 
         # New code: RecommendationEngine(db_session, use_ml_model=True)
-        with patch('backend.app.services.recommendation_engine.get_latest_model_path') as mock_get_path:
-            with patch('backend.app.services.recommendation_engine.os.path.exists') as mock_exists:
-                mock_get_path.return_value = None  # Model path not found
-                mock_exists.return_value = False  # Model not found
-                engine_new = RecommendationEngine(mock_db_session, use_ml_model=True)
-
-                combinations_new = engine_new.generate_combinations(count=3)
-                assert len(combinations_new) == 3
+        with patch(REGISTRY_PATH) as mock_registry:
+            # Model not found
+            mock_registry.get_active.side_effect = FileNotFoundError("ML model not found")
+            engine_new = RecommendationEngine(mock_db_session, use_ml_model=True)
+
+            combinations_new = engine_new.generate_combinations(count=3)
+            assert len(combinations_new) == 3
@@ -16,6 +16,9 @@ from backend.app.services.ml.retraining_scheduler import RetrainingScheduler
 from backend.app.services.ml.retrain_metadata import RetrainMetadata
 
 
+FEATURE_STORE_PATH = 'backend.app.services.ml.retraining_scheduler.feature_store'
+
+
 # ============================================================================
 # Fixtures
 # ============================================================================
@@ -89,8 +92,8 @@ def test_perform_retraining_succeeds(scheduler, mock_db_session):
     Test that perform_retraining executes complete training cycle successfully.
 
     Complete cycle:
-    1. Load data from database
-    2. Preprocess and extract features
+    1. Sync feature store with the database
+    2. Split stored features and labels
     3. Train model
     4. Save model to disk
     5. Update metadata
@@ -98,21 +101,19 @@ def test_perform_retraining_succeeds(scheduler, mock_db_session):
     @TEST:LOTTO-ML-RETRAIN-001
     """
     # Arrange
-    with patch('backend.app.services.ml.data_preprocessor.load_draw_data') as mock_load, \
-         patch('backend.app.services.ml.data_preprocessor.extract_features') as mock_extract, \
-         patch('backend.app.services.ml.data_preprocessor.prepare_train_test_split') as mock_split, \
+    with patch(FEATURE_STORE_PATH) as mock_store, \
+         patch('backend.app.services.ml.data_preprocessor.split_training_arrays') as mock_split, \
          patch('backend.app.services.ml.model_trainer.train_model') as mock_train, \
          patch('backend.app.services.ml.model_trainer.evaluate_model') as mock_evaluate, \
          patch('backend.app.services.ml.model_trainer.save_trained_model') as mock_save:
 
-        # Mock data loading (must support len())
+        # Mock feature store sync (1000 draws -> 999 labeled rows)
+        import numpy as np
         import pandas as pd
-        mock_draw_data = pd.DataFrame({'draw_number': range(1, 1001)})
-        mock_load.return_value = mock_draw_data
-
-        # Mock feature extraction
-        mock_features = pd.DataFrame({'feature': range(1000)})
-        mock_extract.return_value = mock_features
+        mock_features = np.zeros((999, 145))
+        mock_labels = np.zeros((999, 45), dtype=np.uint8)
+        mock_store.sync.return_value = (mock_features, mock_labels)
+        mock_store.load_manifest.return_value = {'rows': 1000}
 
         # Mock train/test split
         mock_X_train = pd.DataFrame({'feature': range(800)})
@@ -136,9 +137,10 @@ def test_perform_retraining_succeeds(scheduler, mock_db_session):
 
         # Assert
         assert result is True
-        mock_load.assert_called_once_with(mock_db_session)
-        mock_extract.assert_called_once()
+        mock_store.sync.assert_called_once_with(mock_db_session)
         mock_split.assert_called_once()
+        assert mock_split.call_args[0][0] is mock_features
+        assert mock_split.call_args[0][1] is mock_labels
         mock_train.assert_called_once()
         mock_evaluate.assert_called_once()
         mock_save.assert_called_once()
@@ -162,11 +164,11 @@ def test_perform_retraining_handles_data_load_failure(scheduler):
     @TEST:LOTTO-ML-RETRAIN-001
     """
     # Arrange
-    with patch('backend.app.services.ml.data_preprocessor.load_draw_data') as mock_load, \
+    with patch(FEATURE_STORE_PATH) as mock_store, \
          patch.object(scheduler, 'handle_retraining_failure') as mock_handle_failure:
 
         # Mock data loading failure
-        mock_load.side_effect = Exception("Database connection error")
+        mock_store.sync.side_effect = Exception("Database connection error")
 
         # Act
         result = scheduler.perform_retraining()
@@ -197,15 +199,15 @@ def test_perform_retraining_handles_training_failure(scheduler):
     @TEST:LOTTO-ML-RETRAIN-001
     """
     # Arrange
-    with patch('backend.app.services.ml.data_preprocessor.load_draw_data') as mock_load, \
-         patch('backend.app.services.ml.data_preprocessor.extract_features') as mock_extract, \
-         patch('backend.app.services.ml.data_preprocessor.prepare_train_test_split') as mock_split, \
+    with patch(FEATURE_STORE_PATH) as mock_store, \
+         patch('backend.app.services.ml.data_preprocessor.split_training_arrays') as mock_split, \
          patch('backend.app.services.ml.model_trainer.train_model') as mock_train:
 
         # Mock successful data loading
+        import numpy as np
         import pandas as pd
-        mock_load.return_value = pd.DataFrame({'draw_number': range(1, 1001)})
-        mock_extract.return_value = pd.DataFrame({'feature': range(1000)})
+        mock_store.sync.return_value = (np.zeros((999, 145)), np.zeros((999, 45), dtype=np.uint8))
+        mock_store.load_manifest.return_value = {'rows': 1000}
 
         # Mock train/test split
         mock_X_train = pd.DataFrame({'feature': range(800)})
@@ -222,6 +224,7 @@ def test_perform_retraining_handles_training_failure(scheduler):
 
         # Assert
         assert result is False
+        mock_train.assert_called_once()
 
 
 # ============================================================================
@@ -448,12 +451,13 @@ def test_perform_retraining_handles_insufficient_data(scheduler):
     scheduler.metadata.set_status('success')
 
     # Arrange
-    with patch('backend.app.services.ml.data_preprocessor.load_draw_data') as mock_load:
+    with patch(FEATURE_STORE_PATH) as mock_store, \
+         patch('backend.app.services.ml.model_trainer.train_model') as mock_train:
 
         # Mock insufficient data (only 300 draws)
-        import pandas as pd
-        mock_draw_data = pd.DataFrame({'draw_number': range(1, 301)})
-        mock_load.return_value = mock_draw_data
+        import numpy as np
+        mock_store.sync.return_value = (np.zeros((299, 145)), np.zeros((299, 45), dtype=np.uint8))
+        mock_store.load_manifest.return_value = {'rows': 300}
 
         # Act
         result = scheduler.perform_retraining()
@@ -467,6 +471,7 @@ def test_perform_retraining_handles_insufficient_data(scheduler):
 
         assert status == 'failed'
         assert "insufficient" in error_msg.lower() or "500" in error_msg
+        mock_train.assert_not_called()
 
 
 # ============================================================================